@@ -0,0 +1,52 @@
+import os
+import sys
+import argparse
+from src.common.batch_scheduler import BatchJob, BatchScheduler
+from src.common.driver_session_manager import DriverSessionManager
+
+
+# === Function: main ===
+def main() -> int:
+  """
+  Entry point for the program.
+
+  Scrapes every novel in a job file without asking for any input, then saves a JSON summary of the results
+
+  Returns:
+    int: Exit code (0 if every job succeeded, 1 otherwise)
+  """
+
+  parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Scrape every novel in a job file, without prompts (See 'cfg/batch_jobs/example.ini')")
+  parser.add_argument("job_file", help="Path of the job file")
+  parser.add_argument("--workers", type=int, default=4, help="Most chapters scraped at the same time across every job (Default: 4)")
+  parser.add_argument("--jobs-per-site", type=int, default=1, help="Most jobs that scrape the same site at the same time (Default: 1)")
+  parser.add_argument("--summary", default="", help="Where to save the JSON summary (Default: downloaded_files/batch_results/batch_<date>_<time>.json)")
+  parser.add_argument("--headless", action="store_true", help="Run every browser without a window, whatever the settings files say")
+  args = parser.parse_args()
+
+  # Print some whitespace before starting
+  print()
+
+  try:
+    jobs: list[BatchJob] = BatchScheduler.loadJobFile(args.job_file)
+  except (FileNotFoundError, ValueError) as e:
+    print(e)
+    return 1
+
+  # Setup scraped novels directory, if not already done
+  os.makedirs(BatchScheduler.OUTPUT_DIRECTORY_ROOT, exist_ok=True)
+
+  batch_scheduler: BatchScheduler = BatchScheduler(jobs, max_workers=args.workers, max_jobs_per_host=args.jobs_per_site, headless=True if (args.headless) else None)
+  try:
+    summary: dict = batch_scheduler.run()
+    batch_scheduler.saveSummary(summary, args.summary)
+  finally:
+    # Close the browsers kept open for reuse
+    DriverSessionManager.closeAll()
+
+  return 0 if (summary["succeeded"]) else 1
+
+
+# Run the main script
+if __name__ == "__main__":
+  sys.exit(main())
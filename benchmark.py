@@ -0,0 +1,62 @@
+import os
+from src.common.scrape_benchmark import ScrapeBenchmark
+from src.common.fetch_backends import FetchBackends
+
+
+# === Function: main ===
+def main() -> None:
+  """
+  Entry point for the program.
+
+  Measures how fast the scrapers are against a local copy of a booktoki-like site, for every fetch backend and
+  concurrency level, and compares the results against an earlier run
+  """
+
+  # Print some whitespace before starting
+  print()
+
+  # Get the size of the fixture novel
+  chapter_count = "Uninitialized"
+  while not chapter_count.isdigit() and chapter_count != "":
+    chapter_count = input("Enter the number of chapters to scrape(Press ENTER for 50): ")
+
+  latency_ms = "Uninitialized"
+  while not latency_ms.isdigit() and latency_ms != "":
+    latency_ms = input("Enter the site's latency in milliseconds(Press ENTER for 50): ")
+
+  page_size_kb = "Uninitialized"
+  while not page_size_kb.isdigit() and page_size_kb != "":
+    page_size_kb = input("Enter the size of each chapter page in KB(Press ENTER for 8): ")
+
+  # Get the cases to run
+  fetch_backend = "Uninitialized"
+  while fetch_backend not in FetchBackends.ALL and fetch_backend != "":
+    fetch_backend = input(f"Enter the fetch backend to measure {FetchBackends.ALL}(Press ENTER for both): ")
+
+  concurrency_levels = "Uninitialized"
+  while not all(level.strip().isdigit() for level in concurrency_levels.split(",")) and concurrency_levels != "":
+    concurrency_levels = input("Enter the concurrency levels, separated by commas(Press ENTER for 1,2,4): ")
+
+  # Get an earlier run to compare against
+  baseline_path = "Uninitialized"
+  while not os.path.isfile(baseline_path) and baseline_path != "":
+    baseline_path = input("Enter the path of an earlier results file to compare against(Press ENTER to skip): ")
+
+  # Run the benchmark
+  scrape_benchmark: ScrapeBenchmark = ScrapeBenchmark(
+    int(chapter_count) if (chapter_count != "") else 50,
+    int(latency_ms) / 1000 if (latency_ms != "") else 0.05,
+    int(page_size_kb) if (page_size_kb != "") else 8,
+    (fetch_backend,) if (fetch_backend != "") else FetchBackends.ALL,
+    tuple(int(level) for level in concurrency_levels.split(",")) if (concurrency_levels != "") else (1, 2, 4)
+  )
+  benchmark: dict = scrape_benchmark.run()
+  scrape_benchmark.saveResults(benchmark)
+
+  if (baseline_path != ""):
+    ScrapeBenchmark.compareResults(benchmark, baseline_path)
+
+
+# Run the main script | NOTE: Needed so each benchmark case can start its own process
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,55 @@
+import os
+from src.common.novel_archive import NovelArchive
+from src.common.utils import printModuleSeparator
+
+
+# === Constants ===
+OUTPUT_DIRECTORY_ROOT: str = "scraped_novels"
+
+# === Function: main ===
+def main() -> None:
+  """
+  Entry point for the program.
+
+  Converts a scraped novel between one 'NNNN.txt' file per chapter and a single packed archive ('chapters.pack')
+  """
+
+  # Print some whitespace before starting
+  print()
+
+  running: bool = True # Is the application running
+
+  while running:
+    # Get the directory the novel was scraped to
+    output_directory: str = ""
+    while (output_directory == "" or not os.path.isdir(output_directory)):
+      output_directory = input("Enter the name of the novel's output directory: ")
+      output_directory = OUTPUT_DIRECTORY_ROOT + "/" + output_directory if (output_directory != "") else ""
+
+    # Get which way to convert
+    direction: str = ""
+    while (direction != "pack" and direction != "unpack"):
+      direction = input("Enter 'pack' to pack the chapter files into an archive OR 'unpack' to write the archive out as chapter files: ")
+
+    archive: NovelArchive = NovelArchive.getForDirectory(output_directory)
+
+    if (direction == "pack"):
+      remove_files: bool = input("Delete the chapter files once they are packed? (y/n): ") == "y"
+      chapter_nums: list[int] = archive.importChapterFiles(remove_files)
+      print(f"\nPacked {len(chapter_nums)} chapter(s) into {output_directory}/{NovelArchive.ARCHIVE_FILENAME}")
+    else:
+      chapter_nums: list[int] = archive.exportChapterFiles()
+      print(f"\nWrote {len(chapter_nums)} chapter(s) to {output_directory}. The archive can be deleted once you've checked them")
+
+    # Print module separator
+    printModuleSeparator()
+
+    continue_choice = input("Convert another novel? (y/n): ")
+
+    if (continue_choice != "y"):
+      running = False
+
+
+# Run the main script
+if __name__ == "__main__":
+  main()
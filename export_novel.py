@@ -0,0 +1,55 @@
+import os
+from src.common.volume_exporter import VolumeExporter
+
+
+# === Constants ===
+OUTPUT_DIRECTORY_ROOT: str = "scraped_novels"
+
+# === Function: main ===
+def main() -> None:
+  """
+  Entry point for the program.
+
+  Exports a scraped novel into EPUB and/or combined text volumes. Exporting the same novel again only rebuilds the
+  volumes whose chapters changed
+  """
+
+  # Print some whitespace before starting
+  print()
+
+  running: bool = True # Is the application running
+
+  while running:
+    # Get the directory the novel was scraped to
+    output_directory: str = ""
+    while (output_directory == "" or not os.path.isdir(output_directory)):
+      output_directory = input("Enter the name of the novel's output directory: ")
+      output_directory = OUTPUT_DIRECTORY_ROOT + "/" + output_directory if (output_directory != "") else ""
+
+    # Get how many chapters go in each volume
+    chapters_per_volume = "Uninitialized"
+    while not chapters_per_volume.isdigit() and chapters_per_volume != "":
+      chapters_per_volume = input("Enter the number of chapters per volume(Press ENTER for 100): ")
+
+    # Get which files to export
+    export_format = "Uninitialized"
+    while export_format not in VolumeExporter.Formats.ALL and export_format != "":
+      export_format = input(f"Enter the format to export {VolumeExporter.Formats.ALL}(Press ENTER for both): ")
+
+    # Export the novel
+    volume_exporter: VolumeExporter = VolumeExporter(
+      output_directory,
+      int(chapters_per_volume) if (chapters_per_volume != "") else 100,
+      (export_format,) if (export_format != "") else VolumeExporter.Formats.ALL
+    )
+    volume_exporter.export()
+
+    continue_choice = input("Export another novel? (y/n): ")
+
+    if (continue_choice != "y"):
+      running = False
+
+
+# Run the main script
+if __name__ == "__main__":
+  main()
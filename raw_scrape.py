@@ -1,51 +1,124 @@
 import asyncio
+import math
 import os
-import threading
-import random
-import time
 from src.common.scraper import Scraper
+from src.common.scraper_pool import ScraperPool
+from src.common.async_scraper import AsyncScraper
+from src.common.fetch_backends import FetchBackends
+from src.common.scrape_manifest import ScrapeManifest
+from src.common.driver_session_manager import DriverSessionManager
 from src.common.utils import (
   Limits,
-  createDirectory,
-  splitRangeIntoChunks
+  createDirectory
 )
 
 
 # === Constants ===
 OUTPUT_DIRECTORY_ROOT: str = "scraped_novels"
 
+# === Function: asyncInput ===
+async def asyncInput(prompt: str) -> str:
+  """
+  Get input from the user without blocking the event loop
+
+  Params:
+    prompt: Text to show the user
+
+  Returns:
+    str: What the user entered
+  """
+
+  return await asyncio.to_thread(input, prompt)
+
+
 # === Function: executeScrape ===
-def executeScrape(novel_url: str, scraper_settings_filename: str, start_idx: int, end_idx: int, output_directory: str) -> None:
+async def executeScrape(novel_url: str, scraper_settings_filename: str, start_idx: int, end_idx: int, output_directory: str, worker_count: int = 1) -> None:
   """
   Does the actual work for scraping a novel (no translation)
 
   Params:
+    novel_url: Url of the novel's chapter list
+    scraper_settings_filename: Name of the scraper settings file to use
     start_idx: Chapter to start on
     end_idx: Chapter to end on
     output_directory: Directory to save chapters to
+    worker_count: How many chapters should be scraped at the same time (browser tabs OR concurrent http requests)
   """
 
+  # Create the directory to save to | NOTE: A directory with a manifest is resumed instead
+  if (ScrapeManifest.existsInDirectory(output_directory)):
+    print(f"Resuming the scrape in '{output_directory}'. Chapters that were already saved are skipped.")
+
+  while not ScrapeManifest.existsInDirectory(output_directory) and not createDirectory(output_directory, False):
+    print("Invalid output directory name.")
+
+    output_directory = ""
+    while (output_directory == ""):
+      output_directory = await asyncInput("Enter a name for your output directory: ")
+    output_directory = OUTPUT_DIRECTORY_ROOT + "/" + output_directory
+
   # Create scraper object only
-  scraper: Scraper = Scraper()
+  scraper: Scraper = Scraper(novel_url)
+
+  try:
+    # Set the scraper settings
+    if (scraper_settings_filename != ""):
+      scraper.loadScraperSettings(scraper_settings_filename)
+
+    # NOTE: Only the pool claims chapters from the durable work queue
+    if (scraper.getFetchBackend() == FetchBackends.HTTP and not scraper.getUseWorkQueue()):
+      # Plain http requests can all run on the event loop
+      await AsyncScraper(scraper, max_concurrent_fetches=worker_count).scrape(start_idx=start_idx, end_idx=end_idx, format_text=True, output_directory=output_directory)
+      return
+
+    # NOTE: Each browser loads up to 'tabs' chapters at once
+    tab_count: int = min(scraper.getDriverSessionSettings().tabs, worker_count) if (scraper.getFetchBackend() != FetchBackends.HTTP) else 1
+  finally:
+    # NOTE: The pool creates a scraper for each worker, so this one is only used for its settings and closed first
+    scraper.close()
+
+  # Create a pool of scrapers, each with their own browser
+  scraper_pool: ScraperPool = ScraperPool(worker_count=math.ceil(worker_count / tab_count), scraper_settings_filename=scraper_settings_filename, tabs_per_worker=tab_count)
+
+  # Start the scrape with immediate saving | NOTE: Browsers block, so the pool runs off the event loop
+  try:
+    await asyncio.to_thread(scraper_pool.scrape, novel_url, start_idx=start_idx, end_idx=end_idx, format_text=True, output_directory=output_directory)
+  finally:
+    scraper_pool.close()
+
 
-  # Set the scraper settings
+# === Function: executeUpdate ===
+async def executeUpdate(novel_url: str, scraper_settings_filename: str, output_directory: str, worker_count: int = 1) -> None:
+  """
+  Scrape only the chapters released since a novel was last scraped into an output directory
+
+  Params:
+    novel_url: Url of the novel's chapter list
+    scraper_settings_filename: Name of the scraper settings file to use
+    output_directory: Directory the novel was scraped to
+    worker_count: How many chapters should be scraped at the same time (browsers OR concurrent http requests)
+  """
+
+  # Find the new chapters with one chapter list page
+  scraper: Scraper = Scraper(novel_url)
   if (scraper_settings_filename != ""):
     scraper.loadScraperSettings(scraper_settings_filename)
 
-  # Initialize values in the scraper
-  scraper.setNovelChapterListUrl(novel_url)
+  try:
+    new_chapters: list[Scraper.ChapterIndexEntry] | None = await asyncio.to_thread(scraper.getNewChapters, output_directory)
+  finally:
+    scraper.close()
 
-  # Create the directory to save to
-  while not createDirectory(output_directory, False):
-    print("Invalid output directory name.")
+  if (new_chapters == None):
+    print("Update failed, the chapter list couldn't be read.")
+    return
 
-    output_directory = ""
-    while (output_directory == ""):
-      output_directory = input("Enter a name for your output directory: ")
-    output_directory = OUTPUT_DIRECTORY_ROOT + "/" + output_directory
+  if (len(new_chapters) == 0):
+    print("The novel is up to date.")
+    return
 
-  # Start the scrape with immediate saving
-  scraper.scrape(start_idx=start_idx, end_idx=end_idx, format_text=True, output_directory=output_directory)
+  # NOTE: The new chapters' urls are in the manifest now, so the scrape doesn't load the chapter list again
+  await executeScrape(novel_url, scraper_settings_filename, new_chapters[0].chapter_num, new_chapters[-1].chapter_num, output_directory, worker_count)
 
 
 # === Function: main ===
@@ -68,19 +141,45 @@ async def main() -> None:
     scraper_settings_filename: str = "Uninitialized"
     while ".txt" not in scraper_settings_filename and scraper_settings_filename != "":
       scraper_settings_filename = ""
-      scraper_settings_filename = input("Enter the scraper settings filename (Press Enter for 'Booktoki'): ")
+      scraper_settings_filename = await asyncInput("Enter the scraper settings filename (Press Enter for 'Booktoki'): ")
     if (scraper_settings_filename == ""):
       scraper_settings_filename = "booktoki.ini"
 
+    # Update mode only scrapes the chapters released since the last scrape
+    update_mode: bool = (await asyncInput("Update a novel that was already scraped? (y/n): ")) == "y"
+    if (update_mode):
+      output_directory: str = ""
+      while (output_directory == "" or not ScrapeManifest.existsInDirectory(output_directory) and not os.path.isdir(output_directory)):
+        output_directory = await asyncInput("Enter the name of the novel's output directory: ")
+        output_directory = OUTPUT_DIRECTORY_ROOT + "/" + output_directory if (output_directory != "") else ""
+
+      # The manifest remembers the novel's url
+      novel_url: str = ScrapeManifest.getForDirectory(output_directory).getNovelUrl()
+      if (novel_url == ""):
+        novel_url = await asyncInput("Enter the novel URL: ")
+
+      worker_count = "Uninitialized"
+      while not worker_count.isdigit() and worker_count != "":
+        worker_count = ""
+        worker_count = await asyncInput("Enter the number of chapters to scrape at once(Press ENTER for 1): ")
+      if worker_count == "" or int(worker_count) < 1:
+        worker_count = "1"
+
+      await executeUpdate(novel_url, scraper_settings_filename, output_directory, int(worker_count))
+
+      continue_choice = await asyncInput("Scrape another novel? (y/n): ")
+      running = (continue_choice == "y")
+      continue
+
     # Get the novel URL
     # TODO: pip install validators and check if the url is a valid url before proceeding
-    novel_url: str = input("Enter the novel URL: ")
+    novel_url: str = await asyncInput("Enter the novel URL: ")
 
     # Get the starting chapter index
     start_idx = "Uninitialized"
     while not start_idx.isdigit() and start_idx != "":
       start_idx = ""
-      start_idx = input("Enter the starting chapter(Press ENTER for Chapter 1): ")
+      start_idx = await asyncInput("Enter the starting chapter(Press ENTER for Chapter 1): ")
     if start_idx == "":
       start_idx = "1"
     start_idx = int(start_idx)
@@ -89,7 +188,7 @@ async def main() -> None:
     end_idx = "Uninitialized"
     while not end_idx.isdigit() and end_idx != "":
       end_idx = ""
-      end_idx = input("Enter the ending chapter(Press ENTER for the Latest Chapter): ")
+      end_idx = await asyncInput("Enter the ending chapter(Press ENTER for the Latest Chapter): ")
     if end_idx == "":
       end_idx = Limits.INT_MAX
     end_idx = int(end_idx)
@@ -97,36 +196,31 @@ async def main() -> None:
     # Get the directory to save files to
     output_directory: str = ""
     while (output_directory == ""):
-      output_directory = input("Enter a name for your output directory: ")
+      output_directory = await asyncInput("Enter a name for your output directory: ")
     output_directory = OUTPUT_DIRECTORY_ROOT + "/" + output_directory
 
+    # Get how many chapters to scrape at once (browsers OR concurrent http requests)
+    worker_count = "Uninitialized"
+    while not worker_count.isdigit() and worker_count != "":
+      worker_count = ""
+      worker_count = await asyncInput("Enter the number of chapters to scrape at once(Press ENTER for 1): ")
+    if worker_count == "" or int(worker_count) < 1:
+      worker_count = "1"
+    worker_count = int(worker_count)
+
     # Scrape the novel
-    start = input("Start scrape? (y/n): ")
+    start = await asyncInput("Start scrape? (y/n): ")
     if (start == "y"):
-      # TODO: Fix the threading issues (can't safely create multiple browsers so only set threading for translation and writing to disk)
-      thread_count = 1
-
-      # How many chapters should each thread do?
-      thread_ranges: list[tuple[int]] = splitRangeIntoChunks(start_idx, end_idx, thread_count)
-
-      # Create threads
-      threads: list[threading.Thread] = [None] * thread_count
-      for i in range(thread_count):
-        threads[i] = threading.Thread(target=executeScrape, args=(novel_url, scraper_settings_filename, thread_ranges[i][0], thread_ranges[i][1], output_directory))
-      
-      # Start threads
-      for t in threads:
-        t.start()
-      
-      # Join threads
-      for t in threads:
-        t.join()
+      await executeScrape(novel_url, scraper_settings_filename, start_idx, end_idx, output_directory, worker_count)
     
-    continue_choice = input("Scrape another novel? (y/n): ")
+    continue_choice = await asyncInput("Scrape another novel? (y/n): ")
 
     if (continue_choice != "y"):
       running = False
 
+  # Close the browsers that were kept warm between novels
+  DriverSessionManager.closeAll()
+
 
 # Run the main script
-asyncio.run(main())
\ No newline at end of file
+asyncio.run(main())
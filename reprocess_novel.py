@@ -0,0 +1,52 @@
+import os
+from src.common.chapter_reprocessor import ChapterReprocessor
+
+
+# === Constants ===
+OUTPUT_DIRECTORY_ROOT: str = "scraped_novels"
+
+# === Function: main ===
+def main() -> None:
+  """
+  Entry point for the program.
+
+  Re-extracts and reformats a scraped novel from its saved chapter html, without scraping it again
+  """
+
+  # Print some whitespace before starting
+  print()
+
+  running: bool = True # Is the application running
+
+  while running:
+    scraper_settings_filename: str = input("Enter the scraper settings filename (Press Enter for 'Booktoki'): ")
+    if (scraper_settings_filename == ""):
+      scraper_settings_filename = "booktoki.ini"
+
+    # Get the directory the novel was scraped to
+    output_directory: str = ""
+    while (output_directory == "" or not os.path.isdir(output_directory)):
+      output_directory = input("Enter the name of the novel's output directory: ")
+      output_directory = OUTPUT_DIRECTORY_ROOT + "/" + output_directory if (output_directory != "") else ""
+
+    # Get how many processes to use
+    worker_count = "Uninitialized"
+    while not worker_count.isdigit() and worker_count != "":
+      worker_count = ""
+      worker_count = input(f"Enter the number of processes to use(Press ENTER for {os.cpu_count() or 1}): ")
+
+    # Reprocess the novel
+    start = input("Start reprocess? (y/n): ")
+    if (start == "y"):
+      chapter_reprocessor: ChapterReprocessor = ChapterReprocessor(scraper_settings_filename, int(worker_count) if (worker_count != "") else None)
+      chapter_reprocessor.reprocess(output_directory, format_text=True)
+
+    continue_choice = input("Reprocess another novel? (y/n): ")
+
+    if (continue_choice != "y"):
+      running = False
+
+
+# Run the main script | NOTE: Guarded, since worker processes import this file on Windows
+if __name__ == "__main__":
+  main()
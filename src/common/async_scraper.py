@@ -0,0 +1,440 @@
+# Imports
+import time
+import asyncio
+from typing import AsyncIterator
+from src.common.scraper import Scraper
+from src.common.fetch_backends import FetchBackends
+from src.common.rate_limiter import RateLimiter
+from src.common.scrape_manifest import ScrapeManifest
+from src.common.chapter_writer import ChapterWriter
+from src.common.scrape_metrics import ScrapeMetrics
+from src.common.metrics_server import LiveMetrics
+from src.common.utils import (
+  Limits,
+  printModuleSeparator,
+  formatNovelText
+)
+
+
+# === Class: AsyncScraper ===
+class AsyncScraper():
+  """
+  Scrapes a novel on an asyncio event loop. Chapters go through three stages linked by queues:
+    1. Fetch: Up to 'max_concurrent_fetches' pages load at once, within the host's rate limit
+    2. Parse/Format: The chapter text is pulled out of each page and formatted
+    3. Write: Chapters are saved to disk, then handed out by 'iterChapters'
+
+  Several AsyncScrapers (i.e. one per novel) can run on the same event loop. The rate limiter is shared per host, so
+  novels on the same site don't speed each other up.
+
+  NOTE: The browser can only load one page at a time, so only the http fetch backend fetches chapters concurrently
+  """
+
+
+  # ******************************************** #
+  # ****************** Private ***************** #
+  # ******************************************** #
+
+
+  # === Constants ===
+  """ How many chapters can wait between stages before the previous stage pauses """
+  _QUEUE_SIZE: int = 32
+
+
+  # === Function: _markFailed ===
+  def _markFailed(self, chapter_num: int, url: str, timings: dict[str, float] | None = None, reason: str = ScrapeMetrics.FailureReasons.OTHER) -> None:
+    """
+    Record that a chapter couldn't be scraped
+
+    Params:
+      chapter_num: Number of the chapter
+      url: Url of the chapter
+      timings: Seconds spent on each step before it failed
+      reason: Why it failed (ScrapeMetrics.FailureReasons.XXX)
+    """
+
+    self._failed_chapters.append(chapter_num)
+    self._metrics.recordFailure(chapter_num, url, timings, reason=reason)
+
+    if (self._manifest != None):
+      self._manifest.markFailed(chapter_num, url)
+
+
+  # === Function: _fetchStage ===
+  async def _fetchStage(self, fetch_queue: asyncio.Queue, parse_queue: asyncio.Queue) -> None:
+    """
+    Load chapter pages and pass them on to the parse stage
+
+    Params:
+      fetch_queue: Queue of chapter records (number, url and title) to load. Ends when it's empty
+      parse_queue: Queue of (chapter record, loaded page OR already extracted text, raw html) for the parse stage
+    """
+
+    while True:
+      try:
+        chapter_record: Scraper.ChapterRecord = fetch_queue.get_nowait()
+      except asyncio.QueueEmpty:
+        return
+
+      chapter_num: int = chapter_record.chapter_num
+      url: str = chapter_record.url
+      print(f"Scraping chapter #{chapter_num}...")
+
+      if (self._scraper.getFetchBackend() == FetchBackends.HTTP or self._scraper.isReplayingFromCache()):
+        # Replaying from the page cache never touches the network, so there is nothing to rate limit
+        rate_limiter: RateLimiter = self._scraper.getRateLimiter(url)
+        if (not self._scraper.isReplayingFromCache()):
+          chapter_record.timings["wait"] = await rate_limiter.acquireAsync()
+
+        start_time: float = time.perf_counter()
+        result = await asyncio.to_thread(self._scraper.fetchPage, url)
+        request_time: float = time.perf_counter() - start_time
+
+        if (result != None and result.isChallenge()):
+          rate_limiter.reportThrottled()
+          chapter_record.timings["challenge"] = request_time
+
+          # A bot check needs the browser, which can only be used by one chapter at a time
+          print(f"Challenge page detected for chapter #{chapter_num}, falling back to the web driver.")
+          async with self._driver_lock:
+            chapter_text: str | None = await asyncio.to_thread(self._scraper.scrapeChapter, url, False, chapter_record.timings)
+            page_html: str | None = self._scraper.getPageSource() if (chapter_text != None) else None
+            failure_reason: str = self._scraper.getLastFailureReason()
+
+          if (chapter_text == None):
+            print(f"No data received for chapter #{chapter_num}.")
+            self._markFailed(chapter_num, url, chapter_record.timings, failure_reason)
+          else:
+            await parse_queue.put((chapter_record, chapter_text, page_html))
+        elif (result == None or not result.isOk()):
+          if (result != None and result.isThrottled()):
+            rate_limiter.reportThrottled()
+
+          print(f"Failed to load chapter #{chapter_num}.")
+          chapter_record.timings["request"] = request_time
+          self._markFailed(chapter_num, url, chapter_record.timings, ScrapeMetrics.FailureReasons.FETCH)
+        else:
+          rate_limiter.reportSuccess()
+          chapter_record.timings["request"] = request_time
+          await parse_queue.put((chapter_record, result, result.html))
+
+      else:
+        # NOTE: 'scrapeChapter' waits for the rate limiter itself
+        async with self._driver_lock:
+          chapter_text: str | None = await asyncio.to_thread(self._scraper.scrapeChapter, url, False, chapter_record.timings)
+          page_html: str | None = self._scraper.getPageSource() if (chapter_text != None) else None
+          failure_reason: str = self._scraper.getLastFailureReason()
+
+        if (chapter_text == None):
+          print(f"No data received for chapter #{chapter_num}.")
+          self._markFailed(chapter_num, url, chapter_record.timings, failure_reason)
+        else:
+          await parse_queue.put((chapter_record, chapter_text, page_html))
+
+
+  # === Function: _parseStage ===
+  async def _parseStage(self, parse_queue: asyncio.Queue, write_queue: asyncio.Queue, format_text: bool) -> None:
+    """
+    Pull the chapter text out of loaded pages, format it and pass it on to the write stage
+
+    Params:
+      parse_queue: Queue of (chapter record, loaded page OR already extracted text, raw html). Ends at a None
+      write_queue: Queue of (chapter record with its text, raw html) for the write stage
+      format_text: Should the text be formatted into a more readable form?
+    """
+
+    while True:
+      item = await parse_queue.get()
+      if (item == None):
+        return
+
+      chapter_record, page, page_html = item
+
+      # Parsing is CPU work, so it's kept off the event loop
+      if (isinstance(page, str) or page == None):
+        chapter_text: str | None = page
+      else:
+        start_time: float = time.perf_counter()
+        chapter_text: str | None = await asyncio.to_thread(lambda: self._scraper.extractChapterText(page.getDocument()))
+        chapter_record.timings["extract"] = time.perf_counter() - start_time
+
+      if (chapter_text == None):
+        print(f"No data received for chapter #{chapter_record.chapter_num}.")
+        self._markFailed(chapter_record.chapter_num, chapter_record.url, chapter_record.timings, ScrapeMetrics.FailureReasons.NO_SUCH_ELEMENT)
+        continue
+
+      if (format_text):
+        start_time: float = time.perf_counter()
+        chapter_text = formatNovelText(chapter_text)
+        chapter_record.timings["format"] = time.perf_counter() - start_time
+
+      chapter_record.text = chapter_text
+      await write_queue.put((chapter_record, page_html))
+
+
+  # === Function: _writeStage ===
+  async def _writeStage(self, write_queue: asyncio.Queue, record_queue: asyncio.Queue, output_directory: str | None, chapter_writer: ChapterWriter | None) -> None:
+    """
+    Hand chapters to the chapter writer (if there is an output directory) and pass them on to 'iterChapters'
+
+    Params:
+      write_queue: Queue of (chapter record, raw html). Ends at a None
+      record_queue: Queue of finished chapter records, handed out by 'iterChapters'
+      output_directory: Directory to save chapters to. If None, chapters are only handed out
+      chapter_writer: Saves chapters in the background OR None if not saving to files
+    """
+
+    while True:
+      item = await write_queue.get()
+      if (item == None):
+        return
+
+      chapter_record, page_html = item
+
+      if (output_directory):
+        # NOTE: Only waits if the writer has fallen behind, but that wait must not block the event loop
+        start_time: float = time.perf_counter()
+        await asyncio.to_thread(
+          chapter_writer.write,
+          chapter_record.chapter_num,
+          chapter_record.text,
+          output_directory,
+          chapter_record.url,
+          page_html if (self._scraper.getKeepRawHtml()) else None
+        )
+        chapter_record.timings["save"] = time.perf_counter() - start_time
+
+      self._metrics.recordChapter(chapter_record.chapter_num, chapter_record.url, chapter_record.timings, len(chapter_record.text.encode("utf-8")))
+      await record_queue.put(chapter_record)
+
+
+  # === Function: _runPipeline ===
+  async def _runPipeline(self, fetch_queue: asyncio.Queue, record_queue: asyncio.Queue, format_text: bool, output_directory: str | None) -> None:
+    """
+    Run every stage until the fetch queue is empty, then let each later stage finish in order. A None is put on the
+    record queue once every chapter has gone through (OR a stage failed, see '_pipeline_error')
+
+    Params:
+      fetch_queue: Queue of chapter records to load
+      record_queue: Queue of finished chapter records, handed out by 'iterChapters'
+      format_text: Should the text be formatted into a more readable form?
+      output_directory: Directory to save chapters to. If None, chapters are only handed out
+    """
+
+    parse_queue: asyncio.Queue = asyncio.Queue(maxsize=self._QUEUE_SIZE)
+    write_queue: asyncio.Queue = asyncio.Queue(maxsize=self._QUEUE_SIZE)
+    chapter_writer: ChapterWriter | None = ChapterWriter(output_format=self._scraper.getOutputFormat()) if (output_directory) else None
+
+    # Report how full each stage's queue is on the metrics endpoint
+    queue_gauges: list[int] = [
+      LiveMetrics.registerGauge("rawscrape_queue_depth", fetch_queue.qsize, {"queue": "fetch"}),
+      LiveMetrics.registerGauge("rawscrape_queue_depth", parse_queue.qsize, {"queue": "parse"}),
+      LiveMetrics.registerGauge("rawscrape_queue_depth", write_queue.qsize, {"queue": "write"}),
+      LiveMetrics.registerGauge("rawscrape_queue_depth", record_queue.qsize, {"queue": "record"})
+    ]
+
+    # Start the later stages first so they are ready as soon as chapters come in
+    parse_task: asyncio.Task = asyncio.create_task(self._parseStage(parse_queue, write_queue, format_text))
+    write_task: asyncio.Task = asyncio.create_task(self._writeStage(write_queue, record_queue, output_directory, chapter_writer))
+
+    try:
+      await asyncio.gather(*[self._fetchStage(fetch_queue, parse_queue) for _ in range(self._max_concurrent_fetches)])
+      await parse_queue.put(None)
+      await parse_task
+      await write_queue.put(None)
+      await write_task
+    except Exception as e:
+      # Kept for 'iterChapters' to raise, so it isn't left waiting on the record queue
+      print(f"Error: [{e}]")
+      self._pipeline_error = e
+    finally:
+      parse_task.cancel()
+      write_task.cancel()
+
+      for queue_gauge in queue_gauges:
+        LiveMetrics.unregisterGauge(queue_gauge)
+
+      # Wait for the last chapters to be saved
+      if (chapter_writer != None):
+        try:
+          await asyncio.to_thread(chapter_writer.close)
+        except Exception as e:
+          print(f"Error: [{e}]")
+          if (self._pipeline_error == None):
+            self._pipeline_error = e
+        self._failed_chapters.extend(chapter_writer.getFailedChapters())
+
+    await record_queue.put(None)
+
+
+  # ******************************************** #
+  # ****************** Public ****************** #
+  # ******************************************** #
+
+
+  # === Function: __init__ ===
+  def __init__(self, scraper: Scraper, max_concurrent_fetches: int = 4) -> None:
+    """
+    Constructor -> Sets the scraper to use and how many chapters can load at once
+
+    Args:
+      scraper: Scraper with the novel url and scraper settings (including the rate limit) already set
+      max_concurrent_fetches: Most chapter pages that can be loading at the same time
+    """
+
+    self._scraper: Scraper = scraper
+    self._max_concurrent_fetches: int = max(max_concurrent_fetches, 1)
+
+    self._driver_lock: asyncio.Lock = asyncio.Lock()
+    self._manifest: ScrapeManifest | None = None
+    self._pipeline_error: Exception | None = None
+    self._failed_chapters: list[int] = []
+    self._metrics: ScrapeMetrics | None = None
+
+
+  # === Function: iterChapters ===
+  async def iterChapters(self, start_idx: int = 1, end_idx: int = Limits.INT_MAX, format_text: bool = True, output_directory: str = None) -> AsyncIterator[Scraper.ChapterRecord]:
+    """
+    Scrape a range of chapters, handing out each chapter as soon as it's scraped (and saved, if output_directory is
+    provided). At most a few queues' worth of chapters are held at once, so a slow consumer pauses the scrape instead
+    of piling chapters up in memory.
+
+    NOTE: Chapters load concurrently, so they are handed out in the order they finish (not always chapter order)
+
+    Args:
+      start_idx: Chapter number to start the scrape.    NOTE: Constraints: (start_idx <= end_idx)
+      end_idx: Chapter to end the scrape at.    NOTE: Constraints: (end_idx >= start_idx)
+      format_text: Should the text be formatted into a more readable form?
+      output_directory: Directory to save chapters to. If provided, chapters are queued to be saved before they are handed out.
+
+    Returns:
+      AsyncIterator[Scraper.ChapterRecord]: The scraped chapters
+    """
+
+    # Reset results from any previous scrape
+    self._failed_chapters = []
+
+    # Enforce index constraints
+    if (end_idx < start_idx):
+      end_idx = start_idx
+
+    # Chapters already in the output directory are skipped
+    self._manifest = None
+    if (output_directory):
+      self._manifest = ScrapeManifest.getForDirectory(output_directory)
+      self._manifest.setNovelUrl(self._scraper.getNovelChapterListUrl())
+
+    self._scraper.exposeMetrics()
+
+    # Times every chapter, unless the scraper's caller collects the timings itself
+    self._metrics = self._scraper.getMetrics() if (self._scraper.getMetrics() != None) else ScrapeMetrics(self._scraper.getMetricsLogPath(output_directory))
+
+    # Seed the fetch stage from the chapter list (or the manifest)
+    chapter_index: list[Scraper.ChapterIndexEntry] | None = await asyncio.to_thread(self._scraper.getPendingChapters, start_idx, end_idx, self._manifest)
+    if (chapter_index == None):
+      print("Couldn't read the chapter list. No chapters were queued.")
+      chapter_index = []
+
+    fetch_queue: asyncio.Queue = asyncio.Queue()
+    for entry in chapter_index:
+      if (entry.url == None):
+        print(f"No URL found for chapter #{entry.chapter_num}. Skipping.")
+        self._metrics.recordFailure(entry.chapter_num, None, reason=ScrapeMetrics.FailureReasons.MISSING_NEXT_URL)
+        continue
+
+      fetch_queue.put_nowait(Scraper.ChapterRecord(entry.chapter_num, entry.url, entry.title))
+
+    # Print module separator
+    printModuleSeparator()
+
+    # Log starting message
+    print(
+      "Starting Async Scrape With Parameters: \n"
+      "\tNovel Url: " + self._scraper.getNovelChapterListUrl() + "\n"
+      "\tChapters Queued: " + str(fetch_queue.qsize()) + "\n"
+      "\tConcurrent Fetches: " + str(self._max_concurrent_fetches) + "\n"
+      "\tFetch Backend: " + self._scraper.getFetchBackend() + "\n"
+      "\tOutput Directory: " + (output_directory if output_directory else "Not saving to files") + "\n"
+    )
+
+    record_queue: asyncio.Queue = asyncio.Queue(maxsize=self._QUEUE_SIZE)
+    self._pipeline_error = None
+    pipeline_task: asyncio.Task = asyncio.create_task(self._runPipeline(fetch_queue, record_queue, format_text, output_directory))
+
+    try:
+      while True:
+        chapter_record: Scraper.ChapterRecord | None = await record_queue.get()
+        if (chapter_record == None):
+          break
+
+        yield chapter_record
+
+      # Surface any error from the stages
+      if (self._pipeline_error != None):
+        raise self._pipeline_error
+    finally:
+      # Stops the stages if the consumer left early | NOTE: Waited on so the writer saves what it already has
+      pipeline_task.cancel()
+      await asyncio.gather(pipeline_task, return_exceptions=True)
+
+      # Close the browser if a challenge page started it
+      if (self._scraper.isWebDriverInitialized()):
+        await asyncio.to_thread(self._scraper.uninitializeWebDriver)
+
+      # Record the failed chapters too | NOTE: The writer already wrote the saved ones
+      if (self._manifest != None):
+        await asyncio.to_thread(self._manifest.flush)
+
+      # Log the run's summary
+      if (self._metrics is not self._scraper.getMetrics()):
+        self._metrics.close()
+
+    # Log the scrape's completion
+    if (len(self._failed_chapters) > 0):
+      print(f"\nFailed chapters: {sorted(self._failed_chapters)}")
+    print("\nScraping Complete!")
+
+    # Print module separator
+    printModuleSeparator()
+
+
+  # === Function: scrape ===
+  async def scrape(self, start_idx: int = 1, end_idx: int = Limits.INT_MAX, format_text: bool = True, output_directory: str = None) -> dict[int, str]:
+    """
+    Scrape a range of chapters
+
+    Args:
+      start_idx: Chapter number to start the scrape.    NOTE: Constraints: (start_idx <= end_idx)
+      end_idx: Chapter to end the scrape at.    NOTE: Constraints: (end_idx >= start_idx)
+      format_text: Should the text be formatted into a more readable form?
+      output_directory: Directory to save chapters to. If provided, chapters will be saved as soon as they are ready.
+
+    Returns:
+      dict[int, str]: Chapter number -> scraped text (if output_directory is None)
+    """
+
+    chapter_texts: dict[int, str] = {}
+
+    async for chapter_record in self.iterChapters(start_idx, end_idx, format_text, output_directory):
+      if (not output_directory):
+        chapter_texts[chapter_record.chapter_num] = chapter_record.text
+
+    # Return the chapter data (if not saving to files)
+    return dict(sorted(chapter_texts.items()))
+
+
+  # ******************************************** #
+  # ************** Getters/Setters ************* #
+  # ******************************************** #
+
+
+  # === Function: getFailedChapters ===
+  def getFailedChapters(self) -> list[int]:
+    """
+    Get the chapters that could not be scraped during the last scrape
+
+    Returns:
+      list[int]: Chapter numbers that failed, in order
+    """
+
+    return sorted(self._failed_chapters)
@@ -0,0 +1,476 @@
+# Imports
+import os
+import math
+import json
+import time
+import asyncio
+import threading
+import configparser
+from urllib.parse import urlsplit
+from src.common.scraper import Scraper
+from src.common.scraper_pool import ScraperPool
+from src.common.async_scraper import AsyncScraper
+from src.common.fetch_backends import FetchBackends
+from src.common.scrape_manifest import ScrapeManifest
+from src.common.utils import (
+  Limits,
+  printModuleSeparator
+)
+
+
+# === Class: BatchJob ===
+class BatchJob():
+  """
+  One novel to scrape in a batch. Loaded from a section of a job file (See 'BatchScheduler.loadJobFile'), where the
+  section's name is the job's name
+  """
+
+
+  # ******************************************** #
+  # ****************** Public ****************** #
+  # ******************************************** #
+
+
+  # === Constants ===
+  URL: str = "url"
+  SETTINGS: str = "settings"
+  START: str = "start"
+  END: str = "end"
+  OUTPUT: str = "output"
+  WORKERS: str = "workers"
+  UPDATE: str = "update"
+
+
+  # === Variables ===
+  novel_url: str = ""
+  scraper_settings_filename: str = "" # Name of the scraper settings file ("" for the default)
+  start_idx: int = 1
+  end_idx: int = Limits.INT_MAX
+  output_directory: str = "" # Directory in 'BatchScheduler.OUTPUT_DIRECTORY_ROOT' ("" to use the job's name)
+  worker_count: int = 1 # Chapters scraped at the same time (browser tabs OR concurrent http requests)
+  update: bool = False # Only scrape the chapters released since the output directory was last scraped
+
+
+  # === Function: __init__ ===
+  def __init__(self, name: str) -> None:
+    """
+    Constructor -> Starts with the default values
+
+    Params:
+      name: Name of the job (Used in the results summary)
+    """
+
+    self.name: str = name
+
+
+  # === Function: loadFromConfigSection ===
+  def loadFromConfigSection(self, section) -> None:
+    """
+    Load the job from a job file section. Missing values keep their defaults
+
+    Params:
+      section: configparser section ('[<job name>]')
+    """
+
+    self.novel_url = section.get(self.URL, self.novel_url).strip('"')
+    self.scraper_settings_filename = section.get(self.SETTINGS, self.scraper_settings_filename).strip('"')
+    self.start_idx = int(section.get(self.START, str(self.start_idx)).strip('"'))
+    self.end_idx = int(section.get(self.END, str(self.end_idx)).strip('"'))
+    self.output_directory = section.get(self.OUTPUT, self.output_directory).strip('"')
+    self.worker_count = max(int(section.get(self.WORKERS, str(self.worker_count)).strip('"')), 1)
+    self.update = section.get(self.UPDATE, str(self.update)).strip('"').lower() == "true"
+
+    if (self.output_directory == ""):
+      self.output_directory = self.name
+
+
+  # === Function: getOutputPath ===
+  def getOutputPath(self) -> str:
+    """
+    Get the path of the directory the job saves its chapters to
+
+    Returns:
+      str: '<BatchScheduler.OUTPUT_DIRECTORY_ROOT>/<output_directory>'
+    """
+
+    return BatchScheduler.OUTPUT_DIRECTORY_ROOT + "/" + self.output_directory
+
+
+  # === Function: getHost ===
+  def getHost(self) -> str:
+    """
+    Get the host the job scrapes from
+
+    Returns:
+      str: Host of the novel url
+    """
+
+    return urlsplit(self.novel_url).hostname or self.novel_url
+
+
+# === Class: BatchScheduler ===
+class BatchScheduler():
+  """
+  Scrapes every novel in a job file without asking for any input, so it can be run from cron or a container.
+
+  Jobs run at the same time while they fit in a global worker budget: a job takes 'workers' from the budget while it
+  runs and gives them back when it ends. Jobs are started in the order of the job file, but a job that doesn't fit
+  (or whose site is busy) doesn't hold back later jobs that do.
+
+  Jobs on the same site share the site's rate limiter (See 'RateLimiter.getForHost'), so its rate limit holds across
+  the whole batch, and at most 'max_jobs_per_host' of them run at once.
+
+  NOTE: The rate limit of a site comes from the settings file of the first job that scrapes it
+  """
+
+
+  # ******************************************** #
+  # ****************** Private ***************** #
+  # ******************************************** #
+
+
+  # === Constants ===
+  _RESULTS_DIRECTORY: str = "downloaded_files/batch_results"
+
+
+  # === Function: _countCompleteChapters ===
+  @staticmethod
+  def _countCompleteChapters(output_directory: str) -> int:
+    """
+    Count the chapters saved in an output directory's manifest
+
+    Params:
+      output_directory: Directory to count in
+
+    Returns:
+      int: Chapters marked complete (0 if the directory has no manifest)
+    """
+
+    if (not ScrapeManifest.existsInDirectory(output_directory)):
+      return 0
+
+    manifest: ScrapeManifest = ScrapeManifest.getForDirectory(output_directory)
+    return sum(1 for entry in manifest.getChapterEntries() if (entry["status"] == ScrapeManifest.Statuses.COMPLETE))
+
+
+  # === Function: _createScraper ===
+  def _createScraper(self, job: BatchJob) -> Scraper:
+    """
+    Create a scraper set up for a job
+
+    Params:
+      job: Job the scraper is for
+
+    Returns:
+      Scraper: The scraper
+    """
+
+    scraper: Scraper = Scraper(job.novel_url)
+    if (job.scraper_settings_filename != ""):
+      scraper.loadScraperSettings(job.scraper_settings_filename)
+    if (self._headless != None):
+      scraper.setHeadless(self._headless)
+
+    return scraper
+
+
+  # === Function: _scrapeJob ===
+  def _scrapeJob(self, job: BatchJob, worker_count: int, result: dict) -> None:
+    """
+    Scrape a job's chapters. The same as 'executeScrape'/'executeUpdate' in 'raw_scrape.py', without prompts
+
+    Params:
+      job: Job to scrape
+      worker_count: Workers the job was given from the budget
+      result: The job's result. 'failed_chapters' and 'status' are set here
+    """
+
+    output_directory: str = job.getOutputPath()
+    start_idx: int = job.start_idx
+    end_idx: int = job.end_idx
+
+    if (job.update):
+      if (not ScrapeManifest.existsInDirectory(output_directory)):
+        raise ValueError(f"'{output_directory}' has not been scraped before, so it can't be updated")
+
+      # Find the new chapters with one chapter list page | NOTE: Its browser is closed before the scrape starts its own
+      update_scraper: Scraper = self._createScraper(job)
+      try:
+        new_chapters: list[Scraper.ChapterIndexEntry] | None = update_scraper.getNewChapters(output_directory)
+      finally:
+        update_scraper.close()
+
+      if (new_chapters == None):
+        raise RuntimeError(f"The chapter list of '{job.novel_url}' couldn't be read, so the new chapters are unknown")
+
+      if (len(new_chapters) == 0):
+        result["status"] = self.Statuses.UP_TO_DATE
+        return
+
+      start_idx = new_chapters[0].chapter_num
+      end_idx = new_chapters[-1].chapter_num
+    else:
+      os.makedirs(output_directory, exist_ok=True)
+
+    scraper: Scraper = self._createScraper(job)
+    try:
+      # NOTE: Only the pool claims chapters from the durable work queue
+      if (scraper.getFetchBackend() == FetchBackends.HTTP and not scraper.getUseWorkQueue()):
+        # Plain http requests can all run on the event loop
+        async_scraper: AsyncScraper = AsyncScraper(scraper, max_concurrent_fetches=worker_count)
+        asyncio.run(async_scraper.scrape(start_idx=start_idx, end_idx=end_idx, format_text=True, output_directory=output_directory))
+        result["failed_chapters"] = async_scraper.getFailedChapters()
+      else:
+        # NOTE: Each browser loads up to 'tabs' chapters at once
+        tab_count: int = min(scraper.getDriverSessionSettings().tabs, worker_count) if (scraper.getFetchBackend() != FetchBackends.HTTP) else 1
+        scraper_pool: ScraperPool = ScraperPool(worker_count=math.ceil(worker_count / tab_count), scraper_settings_filename=job.scraper_settings_filename, headless=self._headless, tabs_per_worker=tab_count)
+        try:
+          scraper_pool.scrape(job.novel_url, start_idx=start_idx, end_idx=end_idx, format_text=True, output_directory=output_directory)
+          result["failed_chapters"] = scraper_pool.getFailedChapters()
+        finally:
+          scraper_pool.close()
+    finally:
+      scraper.close()
+
+    result["status"] = self.Statuses.OK if (len(result["failed_chapters"]) == 0) else self.Statuses.PARTIAL
+
+
+  # === Function: _runJob ===
+  def _runJob(self, job: BatchJob, worker_count: int, result: dict) -> None:
+    """
+    Run a job on its own thread, record its result, then give its workers back to the budget
+
+    Params:
+      job: Job to run
+      worker_count: Workers the job was given from the budget
+      result: The job's result, filled in here
+    """
+
+    start_time: float = time.perf_counter()
+    chapters_before: int = self._countCompleteChapters(job.getOutputPath())
+
+    try:
+      self._scrapeJob(job, worker_count, result)
+    except Exception as e:
+      result["status"] = self.Statuses.ERROR
+      result["error"] = f"{type(e).__name__}: {e}"
+      print(f"Batch job '{job.name}' failed: {result['error']}")
+
+    result["chapters_scraped"] = self._countCompleteChapters(job.getOutputPath()) - chapters_before
+    result["seconds"] = round(time.perf_counter() - start_time, 3)
+    print(f"Batch job '{job.name}' finished: {result['status']} ({result['chapters_scraped']} chapters in {result['seconds']}s)")
+
+    with self._condition:
+      self._free_workers += worker_count
+      self._host_job_counts[job.getHost()] -= 1
+      self._condition.notify_all()
+
+
+  # === Function: _findStartableJob ===
+  def _findStartableJob(self, pending_jobs: list[BatchJob]) -> BatchJob | None:
+    """
+    Find the first pending job that fits in the free workers and whose site isn't busy
+
+    NOTE: Call while holding '_condition'
+
+    Params:
+      pending_jobs: Jobs not started yet, in job file order
+
+    Returns:
+      BatchJob | None: Job to start next, or None if none can start yet
+    """
+
+    for job in pending_jobs:
+      if (self._getWorkerCount(job) <= self._free_workers and self._host_job_counts.get(job.getHost(), 0) < self._max_jobs_per_host):
+        return job
+
+    return None
+
+
+  # === Function: _getWorkerCount ===
+  def _getWorkerCount(self, job: BatchJob) -> int:
+    """
+    Get the workers a job takes from the budget
+
+    Params:
+      job: Job to check
+
+    Returns:
+      int: The job's workers, capped at the whole budget so every job can run
+    """
+
+    return min(job.worker_count, self._max_workers)
+
+
+  # ******************************************** #
+  # ****************** Public ****************** #
+  # ******************************************** #
+
+
+  # === Constants ===
+  """ Directory the jobs' output directories are in (The same as 'raw_scrape.py') """
+  OUTPUT_DIRECTORY_ROOT: str = "scraped_novels"
+
+
+  # === Subclass: Statuses ===
+  class Statuses():
+    """
+    Holds constants for how a job ended
+    """
+
+    PENDING: str = "pending" # The job never started
+    OK: str = "ok"
+    PARTIAL: str = "partial" # Some chapters couldn't be scraped (See 'failed_chapters')
+    UP_TO_DATE: str = "up_to_date" # An update job found no new chapters
+    ERROR: str = "error" # The job stopped early (See 'error')
+
+
+  # === Function: __init__ ===
+  def __init__(self, jobs: list[BatchJob], max_workers: int = 4, max_jobs_per_host: int = 1, headless: bool | None = None) -> None:
+    """
+    Constructor -> Sets the jobs to run and how much can run at once
+
+    Params:
+      jobs: Jobs to run, in order
+      max_workers: Most chapters scraped at the same time across every job
+      max_jobs_per_host: Most jobs that scrape the same site at the same time
+      headless: Should the browsers run without a window. If None, each settings file's headless mode is used
+    """
+
+    self._jobs: list[BatchJob] = jobs
+    self._max_workers: int = max(max_workers, 1)
+    self._max_jobs_per_host: int = max(max_jobs_per_host, 1)
+    self._headless: bool | None = headless
+
+    """ Guards the free workers and the running jobs of each site """
+    self._condition: threading.Condition = threading.Condition()
+    self._free_workers: int = self._max_workers
+    self._host_job_counts: dict[str, int] = {}
+
+
+  # === Function: loadJobFile ===
+  @staticmethod
+  def loadJobFile(path: str) -> list[BatchJob]:
+    """
+    Load the jobs in a job file. Every section is one job (See 'cfg/batch_jobs/example.ini')
+
+    Params:
+      path: Path of the job file
+
+    Returns:
+      list[BatchJob]: The jobs, in file order
+
+    Raises:
+      FileNotFoundError if the file doesn't exist
+      ValueError if a job has no url, or two jobs save to the same directory
+    """
+
+    if (not os.path.isfile(path)):
+      raise FileNotFoundError(f"Job file '{path}' doesn't exist")
+
+    config = configparser.ConfigParser()
+    config.read(path, encoding="utf-8")
+
+    jobs: list[BatchJob] = []
+    output_directories: set[str] = set()
+    for section_name in config.sections():
+      job: BatchJob = BatchJob(section_name)
+      job.loadFromConfigSection(config[section_name])
+
+      if (job.novel_url == ""):
+        raise ValueError(f"Job '{section_name}' has no {BatchJob.URL}")
+      if (job.output_directory in output_directories):
+        raise ValueError(f"Job '{section_name}' saves to '{job.output_directory}', which another job already saves to")
+
+      output_directories.add(job.output_directory)
+      jobs.append(job)
+
+    return jobs
+
+
+  # === Function: run ===
+  def run(self) -> dict:
+    """
+    Run every job, and wait for all of them to end
+
+    Returns:
+      dict: Summary of the batch, with one result per job (in job file order)
+    """
+
+    # Print a module separator
+    printModuleSeparator()
+    print(f"Running {len(self._jobs)} batch jobs with {self._max_workers} workers ({self._max_jobs_per_host} jobs per site at most)\n")
+
+    start_time: float = time.time()
+    results: list[dict] = [
+      {
+        "name": job.name,
+        "novel_url": job.novel_url,
+        "output_directory": job.getOutputPath(),
+        "status": self.Statuses.PENDING,
+        "chapters_scraped": 0,
+        "failed_chapters": [],
+        "seconds": 0.0,
+        "error": None
+      }
+      for job in self._jobs
+    ]
+
+    pending_jobs: list[BatchJob] = list(self._jobs)
+    threads: list[threading.Thread] = []
+    while (len(pending_jobs) > 0):
+      with self._condition:
+        job: BatchJob | None = self._findStartableJob(pending_jobs)
+        while (job == None):
+          self._condition.wait()
+          job = self._findStartableJob(pending_jobs)
+
+        worker_count: int = self._getWorkerCount(job)
+        self._free_workers -= worker_count
+        self._host_job_counts[job.getHost()] = self._host_job_counts.get(job.getHost(), 0) + 1
+
+      print(f"Starting batch job '{job.name}' with {worker_count} workers")
+      thread: threading.Thread = threading.Thread(target=self._runJob, args=(job, worker_count, results[self._jobs.index(job)]), name=f"BatchJob-{job.name}", daemon=True)
+      thread.start()
+      threads.append(thread)
+      pending_jobs.remove(job)
+
+    for thread in threads:
+      thread.join()
+
+    return {
+      "time": start_time,
+      "seconds": round(time.time() - start_time, 3),
+      "max_workers": self._max_workers,
+      "max_jobs_per_host": self._max_jobs_per_host,
+      "succeeded": all(result["status"] in (self.Statuses.OK, self.Statuses.UP_TO_DATE) for result in results),
+      "jobs": results
+    }
+
+
+  # === Function: saveSummary ===
+  def saveSummary(self, summary: dict, path: str = "") -> str:
+    """
+    Save a batch's summary as JSON. Written to a temporary file first, so a reader never sees half a summary
+
+    Params:
+      summary: What 'run' returned
+      path: Where to save it ("" for '<_RESULTS_DIRECTORY>/batch_<date>_<time>.json')
+
+    Returns:
+      str: Path of the saved file
+    """
+
+    if (path == ""):
+      path = os.path.join(self._RESULTS_DIRECTORY, time.strftime("batch_%Y%m%d_%H%M%S.json", time.localtime(summary["time"])))
+
+    if (os.path.dirname(path) != ""):
+      os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    temp_path: str = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+      json.dump(summary, f, indent=2)
+    os.replace(temp_path, path)
+
+    print(f"Saved batch summary to {path}")
+    return path
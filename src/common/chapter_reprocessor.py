@@ -0,0 +1,169 @@
+# Imports
+import os
+import re
+import gzip
+from concurrent.futures import ProcessPoolExecutor
+from selenium.common.exceptions import NoSuchElementException
+from src.common.html_document import HtmlDocument
+from src.common.scraper import Scraper
+from src.common.chapter_writer import ChapterWriter
+from src.common.novel_archive import NovelArchive, OutputFormats
+from src.common.utils import (
+  printModuleSeparator,
+  formatNovelText
+)
+
+
+# === Function: _extractChapterFile ===
+def _extractChapterFile(html_path: str, by: str, element: str, format_text: bool) -> str | None:
+  """
+  Pull the chapter text out of a saved chapter page. Runs in a worker process
+
+  NOTE: Module level so it can be sent to worker processes
+
+  Params:
+    html_path: Path of the gzipped chapter html ('NNNN.html.gz')
+    by: How to find the chapter text element (One of selenium's By.XXX)
+    element: Value to find the chapter text element with
+    format_text: Should the text be formatted into a more readable form?
+
+  Returns:
+    str | None: The chapter's text OR None if the html couldn't be read or has no chapter text
+  """
+
+  try:
+    with open(html_path, "rb") as f:
+      page_html: str = gzip.decompress(f.read()).decode("utf-8")
+
+    chapter_text: str = HtmlDocument(page_html).find_element(by, element).text
+  except NoSuchElementException:
+    print(f"No chapter text in {html_path}.")
+    return None
+  except Exception as e:
+    print(f"Error reading {html_path}: {e}")
+    return None
+
+  if (format_text and chapter_text):
+    chapter_text = formatNovelText(chapter_text)
+
+  return chapter_text
+
+
+# === Class: ChapterReprocessor ===
+class ChapterReprocessor():
+  """
+  Re-extracts and reformats a scraped novel from the raw chapter html saved next to it ('keep_raw_html' under
+  '[OutputSettings]'), without loading any page. Chapters are parsed in parallel across CPU cores, so fixing a
+  selector or a formatting bug only takes as long as the parsing.
+  """
+
+
+  # ******************************************** #
+  # ****************** Private ***************** #
+  # ******************************************** #
+
+
+  # === Constants ===
+  """ Name of a saved chapter page ('NNNN.html.gz') """
+  _CHAPTER_HTML_FILENAME_PATTERN: re.Pattern = re.compile(r"^(\d+)\.html\.gz$")
+
+  """ How many chapters are sent to a worker process at once """
+  _CHUNK_SIZE: int = 16
+
+
+  # ******************************************** #
+  # ****************** Public ****************** #
+  # ******************************************** #
+
+
+  # === Function: __init__ ===
+  def __init__(self, scraper_settings_filename: str = "", worker_count: int | None = None) -> None:
+    """
+    Constructor -> Sets the scraper settings (for the chapter text selector) and how many processes to use
+
+    Args:
+      scraper_settings_filename: Name of the scraper settings file to use. If "", the default settings are used
+      worker_count: How many worker processes to parse chapters with (Defaults to the number of CPU cores)
+    """
+
+    self._scraper: Scraper = Scraper()
+    if (scraper_settings_filename != ""):
+      self._scraper.loadScraperSettings(scraper_settings_filename)
+
+    self._worker_count: int = max(worker_count if (worker_count != None) else (os.cpu_count() or 1), 1)
+
+
+  # === Function: reprocess ===
+  def reprocess(self, output_directory: str, format_text: bool = True) -> list[int]:
+    """
+    Re-extract every chapter with saved html in an output directory and overwrite its text (in 'NNNN.txt' OR the
+    directory's archive, depending on the scraper settings' output format)
+
+    Params:
+      output_directory: Directory the novel was scraped to
+      format_text: Should the text be formatted into a more readable form?
+
+    Returns:
+      list[int]: Chapters that couldn't be reprocessed, in order
+    """
+
+    # Find every saved chapter page
+    chapter_nums: list[int] = []
+    for filename in os.listdir(output_directory):
+      filename_match = self._CHAPTER_HTML_FILENAME_PATTERN.match(filename)
+      if (filename_match != None):
+        chapter_nums.append(int(filename_match.group(1)))
+    chapter_nums.sort()
+
+    # Print module separator
+    printModuleSeparator()
+
+    # Log starting message
+    print(
+      "Starting Reprocess With Parameters: \n"
+      "\tOutput Directory: " + output_directory + "\n"
+      "\tChapters Found: " + str(len(chapter_nums)) + "\n"
+      "\tWorker Processes: " + str(self._worker_count) + "\n"
+      "\tText Formatting: " + str(format_text) + "\n"
+    )
+
+    text_body_params: Scraper.HtmlElementData = self._scraper.getChapterTextBodyHtmlData()
+    html_paths: list[str] = [f"{output_directory}/{str(chapter_num).zfill(4)}.html.gz" for chapter_num in chapter_nums]
+    failed_chapters: list[int] = []
+
+    # Parsing runs in the worker processes, saving stays in this process so the manifest only has one writer
+    chapter_writer: ChapterWriter = ChapterWriter(output_format=self._scraper.getOutputFormat())
+
+    with ProcessPoolExecutor(max_workers=self._worker_count) as executor:
+      chapter_texts = executor.map(
+        _extractChapterFile,
+        html_paths,
+        [text_body_params.by] * len(html_paths),
+        [text_body_params.element] * len(html_paths),
+        [format_text] * len(html_paths),
+        chunksize=self._CHUNK_SIZE
+      )
+
+      for chapter_num, chapter_text in zip(chapter_nums, chapter_texts):
+        if (chapter_text == None):
+          failed_chapters.append(chapter_num)
+        else:
+          chapter_writer.write(chapter_num, chapter_text, output_directory)
+
+    chapter_writer.close()
+    failed_chapters = sorted(failed_chapters + chapter_writer.getFailedChapters())
+
+    # Every chapter was appended again, so drop the old copies from the archive
+    if (self._scraper.getOutputFormat() == OutputFormats.ARCHIVE and NovelArchive.existsInDirectory(output_directory)):
+      freed_bytes: int = NovelArchive.getForDirectory(output_directory).compact()
+      print(f"Compacted the archive, freeing {freed_bytes} bytes.")
+
+    # Log the reprocess's completion
+    if (len(failed_chapters) > 0):
+      print(f"\nFailed chapters: {failed_chapters}")
+    print("\nReprocessing Complete!")
+
+    # Print module separator
+    printModuleSeparator()
+
+    return failed_chapters
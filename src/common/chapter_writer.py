@@ -0,0 +1,461 @@
+# Imports
+import os
+import gzip
+import time
+import queue
+import tempfile
+import threading
+import contextlib
+from src.common.scrape_manifest import ScrapeManifest
+from src.common.work_queue import WorkQueue
+from src.common.novel_archive import NovelArchive, OutputFormats
+from src.common.metrics_server import LiveMetrics
+
+
+# === Class: ChapterWriter ===
+class ChapterWriter():
+  """
+  Saves chapters on a background thread, so disk latency (i.e. on network storage) never holds up scraping.
+
+  Each chapter is written to a temporary file, then renamed over 'NNNN.txt' in one step, so a crash never leaves a cut
+  off chapter that looks complete. Chapters are committed in batches: the batch's files are fsynced, renamed, and
+  recorded in the output directory's manifest (and work queue, if one is open) together, with one directory fsync and
+  one manifest update per batch.
+
+  With 'OutputFormats.ARCHIVE', a batch's chapters are appended to the directory's 'NovelArchive' in one write
+  instead of being saved as separate files.
+
+  One writer can be shared by every worker of a scrape. Call 'close' when done so the last batch is committed.
+
+  If a batch can't be committed (i.e. its manifest or work queue can't be updated), its chapters are recorded as
+  failed and the writer keeps going. The error is raised by the next 'flush' or 'close'.
+  """
+
+
+  # ******************************************** #
+  # ****************** Private ***************** #
+  # ******************************************** #
+
+
+  # === Constants ===
+  """ Put on the queue to commit the current batch right away """
+  _FLUSH: object = object()
+
+  """ Put on the queue to commit the current batch and stop the thread """
+  _STOP: object = object()
+
+
+  # === Function: _writeTempFile ===
+  def _writeTempFile(self, path: str, data: bytes) -> str:
+    """
+    Write data to a temporary file next to its final path. Its name is unique, so writers in other processes never
+    write to the same one
+
+    Params:
+      path: Final path of the file
+      data: Data to write
+
+    Returns:
+      str: Path of the temporary file
+    """
+
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+      with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    except BaseException:
+      with contextlib.suppress(OSError):
+        os.remove(temp_path)
+      raise
+
+    return temp_path
+
+
+  # === Function: _removeTempFiles ===
+  def _removeTempFiles(self, files: list[tuple[str, str]]) -> None:
+    """
+    Remove a chapter's temporary files that weren't renamed into place
+
+    Params:
+      files: (Temporary path, final path) of each file
+    """
+
+    for temp_path, _ in files:
+      with contextlib.suppress(OSError):
+        os.remove(temp_path)
+
+
+  # === Function: _fsyncPath ===
+  def _fsyncPath(self, path: str, is_directory: bool = False) -> None:
+    """
+    Make sure a file (or a directory's entries) is on disk
+
+    Params:
+      path: Path of the file or directory
+      is_directory: True if the path is a directory | NOTE: Directories can't be fsynced on Windows, so this is skipped
+    """
+
+    if (is_directory and not hasattr(os, "O_DIRECTORY")):
+      return
+
+    fd: int = os.open(path, (os.O_RDONLY | os.O_DIRECTORY) if (is_directory) else os.O_RDWR)
+    try:
+      os.fsync(fd)
+    finally:
+      os.close(fd)
+
+
+  # === Function: _appendToArchives ===
+  def _appendToArchives(self, items: list[dict]) -> list[dict]:
+    """
+    Append chapters to their directories' archives, one append per directory
+
+    Params:
+      items: Chapters to append
+
+    Returns:
+      list[dict]: Chapters that were appended
+    """
+
+    appended: list[dict] = []
+
+    for output_directory in {item["output_directory"] for item in items}:
+      directory_items: list[dict] = [item for item in items if (item["output_directory"] == output_directory)]
+
+      try:
+        NovelArchive.getForDirectory(output_directory).appendMany(
+          [(item["chapter_num"], item["chapter_text"]) for item in directory_items],
+          fsync=self._fsync
+        )
+        appended.extend(directory_items)
+      except (OSError, ValueError) as e:
+        print(f"Error saving chapters to the archive in {output_directory}: {e}")
+        for item in directory_items:
+          self._recordFailure(item["chapter_num"])
+
+    return appended
+
+
+  # === Function: _commit ===
+  def _commit(self, batch: list[dict]) -> None:
+    """
+    Make a batch of written chapters final: fsync, rename into place, then record them in their manifests
+
+    Params:
+      batch: Chapters whose temporary files were written
+    """
+
+    if (len(batch) == 0):
+      return
+
+    # Rename every file into place once it's on disk
+    committed: list[dict] = []
+    for item in batch:
+      try:
+        for temp_path, path in item["files"]:
+          if (self._fsync):
+            self._fsyncPath(temp_path)
+          os.replace(temp_path, path)
+        committed.append(item)
+      except OSError as e:
+        print(f"Error saving chapter #{item['chapter_num']}: {e}")
+        self._removeTempFiles(item["files"])
+        self._recordFailure(item["chapter_num"])
+
+    # Packed chapters go into the archive together, after their html is in place
+    if (self._output_format == OutputFormats.ARCHIVE):
+      committed = self._appendToArchives(committed)
+
+    # The renames are only durable once each directory is synced
+    output_directories: set[str] = {item["output_directory"] for item in committed}
+    if (self._fsync):
+      for output_directory in output_directories:
+        try:
+          self._fsyncPath(output_directory, is_directory=True)
+        except OSError:
+          pass
+
+    # One manifest update per directory, per batch
+    for output_directory in output_directories:
+      # Chapters claimed from a work queue are only done once they're on disk | NOTE: The queue goes first, since the
+      # manifest is brought up to date from it (See 'ScrapeManifest.markCompleteEntries')
+      work_queue: WorkQueue | None = WorkQueue.getIfOpen(output_directory)
+      if (work_queue != None):
+        work_queue.markCompleteMany([
+          (item["chapter_num"], item["filename"], item["chapter_text"])
+          for item in committed if (item["output_directory"] == output_directory)
+        ])
+
+      ScrapeManifest.getForDirectory(output_directory).markCompleteMany([
+        (item["chapter_num"], item["url"], item["filename"], item["chapter_text"])
+        for item in committed if (item["output_directory"] == output_directory)
+      ])
+
+    for item in committed:
+      print(f"Saved chapter #{item['chapter_num']} to {item['path']}")
+
+    with self._lock:
+      self._saved_count += len(committed)
+      self._output_directories.update(output_directories)
+
+
+  # === Function: _failBatch ===
+  def _failBatch(self, batch: list[dict], error: Exception) -> None:
+    """
+    Record every chapter of a batch that couldn't be committed as failed, and keep the error for 'flush' or 'close'
+    to raise
+
+    Params:
+      batch: Chapters of the batch
+      error: Why the batch couldn't be committed
+    """
+
+    print(f"Error saving chapters #{batch[0]['chapter_num']}-#{batch[-1]['chapter_num']}: {error}")
+
+    with self._lock:
+      if (self._error == None):
+        self._error = error
+      self._output_directories.update(item["output_directory"] for item in batch)
+
+    for item in batch:
+      self._recordFailure(item["chapter_num"])
+
+      # NOTE: The manifest may be what failed
+      try:
+        ScrapeManifest.getForDirectory(item["output_directory"]).markFailed(item["chapter_num"], item["url"])
+      except Exception:
+        pass
+
+
+  # === Function: _raiseError ===
+  def _raiseError(self) -> None:
+    """
+    Raise the error a batch couldn't be committed with, if any (See '_failBatch'). It's only raised once
+    """
+
+    with self._lock:
+      error: Exception | None = self._error
+      self._error = None
+
+    if (error != None):
+      raise error
+
+
+  # === Function: _recordFailure ===
+  def _recordFailure(self, chapter_num: int) -> None:
+    """
+    Remember that a chapter couldn't be saved
+
+    Params:
+      chapter_num: Number of the chapter
+    """
+
+    with self._lock:
+      self._failed_chapters.append(chapter_num)
+
+
+  # === Function: _run ===
+  def _run(self) -> None:
+    """
+    Write chapters as they come in, committing a batch when it's full, when the oldest chapter in it has waited
+    'fsync_interval' seconds, or when asked to
+    """
+
+    batch: list[dict] = []
+    batch_deadline: float = 0.0
+
+    while True:
+      # Only wait as long as the current batch is allowed to
+      timeout: float | None = None
+      if (len(batch) > 0):
+        timeout = max(batch_deadline - time.monotonic(), 0.0)
+
+      # Nothing came in before the batch's deadline
+      try:
+        item = self._queue.get(timeout=timeout)
+      except queue.Empty:
+        item = None
+
+      is_marker: bool = item is self._FLUSH or item is self._STOP
+
+      if (item != None and not is_marker):
+        try:
+          chapter_num_str: str = str(item["chapter_num"]).zfill(4)
+          files: list[tuple[str, str]] = []
+
+          # The html goes first, so a committed chapter always has its html
+          if (item["page_html"] != None):
+            html_path: str = f"{item['output_directory']}/{chapter_num_str}.html.gz"
+            files.append((self._writeTempFile(html_path, gzip.compress(item["page_html"].encode("utf-8"), compresslevel=6)), html_path))
+
+          # Packed chapters are only written when their batch is committed
+          if (self._output_format == OutputFormats.ARCHIVE):
+            item["filename"] = NovelArchive.ARCHIVE_FILENAME
+          else:
+            text_path: str = f"{item['output_directory']}/{chapter_num_str}.txt"
+            files.append((self._writeTempFile(text_path, item["chapter_text"].encode("utf-8")), text_path))
+            item["filename"] = f"{chapter_num_str}.txt"
+
+          item["files"] = files
+          item["path"] = f"{item['output_directory']}/{item['filename']}"
+
+          if (len(batch) == 0):
+            batch_deadline = time.monotonic() + self._fsync_interval
+          batch.append(item)
+        except Exception as e:
+          print(f"Error saving chapter #{item['chapter_num']}: {e}")
+          self._removeTempFiles(files)
+          self._recordFailure(item["chapter_num"])
+          self._queue.task_done()
+
+      # Commit the batch once it's full, late, or asked for | NOTE: The thread keeps going if it fails, so 'write' and
+      # 'flush' never wait on a writer that is gone
+      if (item == None or is_marker or len(batch) >= self._fsync_batch_size or (len(batch) > 0 and time.monotonic() >= batch_deadline)):
+        try:
+          self._commit(batch)
+        except Exception as e:
+          self._failBatch(batch, e)
+        finally:
+          for _ in batch:
+            self._queue.task_done()
+        batch = []
+
+      if (is_marker):
+        self._queue.task_done()
+
+      if (item is self._STOP):
+        return
+
+
+  # ******************************************** #
+  # ****************** Public ****************** #
+  # ******************************************** #
+
+
+  # === Function: __init__ ===
+  def __init__(self, fsync_batch_size: int = 32, fsync_interval: float = 1.0, max_queue_size: int = 256, fsync: bool = True, output_format: str = OutputFormats.FILES) -> None:
+    """
+    Constructor -> Starts the writer thread
+
+    Args:
+      fsync_batch_size: Most chapters committed together
+      fsync_interval: Most seconds a written chapter waits before its batch is committed
+      max_queue_size: Most chapters that can wait to be written. 'write' blocks past this, so a slow disk slows the
+                      scrape down instead of piling chapters up in memory
+      fsync: Should files be fsynced before they are renamed into place (False trades durability on power loss for
+             speed. Renames stay atomic either way)
+      output_format: How chapters are stored (NOTE: Use OutputFormats.XXX)
+    """
+
+    self._fsync_batch_size: int = max(fsync_batch_size, 1)
+    self._fsync_interval: float = fsync_interval
+    self._fsync: bool = fsync
+    self._output_format: str = output_format
+
+    self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+    self._lock: threading.Lock = threading.Lock()
+    self._failed_chapters: list[int] = []
+    self._saved_count: int = 0
+
+    """ First error a batch couldn't be committed with, raised by 'flush' or 'close' """
+    self._error: Exception | None = None
+
+    """ Directories chapters were saved to, whose manifests are written on 'close' """
+    self._output_directories: set[str] = set()
+    self._closed: bool = False
+
+    # Report how far behind the writer is on the metrics endpoint
+    self._queue_gauge: int = LiveMetrics.registerGauge("rawscrape_queue_depth", self._queue.qsize, {"queue": "writer"})
+
+    self._thread: threading.Thread = threading.Thread(target=self._run, name="ChapterWriter", daemon=True)
+    self._thread.start()
+
+
+  # === Function: write ===
+  def write(self, chapter_num: int, chapter_text: str, output_directory: str, url: str | None = None, page_html: str | None = None) -> None:
+    """
+    Queue a chapter to be saved to '<output_directory>/NNNN.txt' or the directory's archive (and its html to
+    'NNNN.html.gz', if given). Returns right away unless the queue is full
+
+    Params:
+      chapter_num: Number of the chapter, used as the filename
+      chapter_text: Text to save
+      output_directory: Directory to save the chapter to
+      url: Url the chapter was scraped from
+      page_html: Raw html of the chapter page to save next to the text OR None to only save the text
+    """
+
+    self._queue.put({
+      "chapter_num": chapter_num,
+      "chapter_text": chapter_text,
+      "output_directory": output_directory,
+      "url": url,
+      "page_html": page_html
+    })
+
+
+  # === Function: flush ===
+  def flush(self) -> None:
+    """
+    Wait until every queued chapter is saved and recorded in its manifest
+
+    NOTE: Raises the error a batch couldn't be committed with, if any
+    """
+
+    self._queue.put(self._FLUSH)
+    self._queue.join()
+    self._raiseError()
+
+
+  # === Function: close ===
+  def close(self) -> None:
+    """
+    Save every queued chapter, then stop the writer thread
+
+    NOTE: Raises the error a batch couldn't be committed with, if any. The writer is closed either way
+    """
+
+    if (self._closed):
+      return
+
+    self._closed = True
+    self._queue.put(self._STOP)
+    self._thread.join()
+    LiveMetrics.unregisterGauge(self._queue_gauge)
+
+    # NOTE: Manifests are written every few seconds, so the last batches are written now
+    for output_directory in self._output_directories:
+      ScrapeManifest.getForDirectory(output_directory).flush()
+
+    self._raiseError()
+
+
+  # ******************************************** #
+  # ************** Getters/Setters ************* #
+  # ******************************************** #
+
+
+  # === Function: getFailedChapters ===
+  def getFailedChapters(self) -> list[int]:
+    """
+    Get the chapters that couldn't be saved
+
+    Returns:
+      list[int]: Chapter numbers that failed, in order
+    """
+
+    with self._lock:
+      return sorted(self._failed_chapters)
+
+
+  # === Function: getSavedCount ===
+  def getSavedCount(self) -> int:
+    """
+    Get how many chapters were saved
+
+    Returns:
+      int: Chapters committed so far
+    """
+
+    with self._lock:
+      return self._saved_count
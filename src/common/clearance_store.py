@@ -0,0 +1,245 @@
+# Imports
+import os
+import json
+import time
+import threading
+from urllib.parse import urlsplit
+
+
+# === Class: ClearanceStore ===
+class ClearanceStore():
+  """
+  The browser cookies (including the challenge clearance, i.e. 'cf_clearance') and user agent of one host, saved to
+  disk. Once a browser gets past a challenge, its cookies are stored here so that:
+    - Browsers started later (other workers, the next run) start with the clearance instead of solving it again
+    - The http fetch backend sends the same cookies and user agent, so it gets the real page instead of the challenge
+
+  One store is shared per host (see 'ClearanceStore.getForHost').
+  """
+
+
+  # ******************************************** #
+  # ****************** Private ***************** #
+  # ******************************************** #
+
+
+  # === Constants ===
+  _DIRECTORY: str = "downloaded_files/clearance"
+  _VERSION: int = 1
+
+
+  # === Variables ===
+  """ Host -> its store. Shared by every scraper """
+  _host_stores: dict = {}
+  _host_stores_lock: threading.Lock = threading.Lock()
+
+
+  # === Function: _load ===
+  def _load(self) -> None:
+    """
+    Load the store from disk, if it was saved before
+    """
+
+    if (not os.path.isfile(self._path)):
+      return
+
+    try:
+      with open(self._path, "r", encoding="utf-8") as f:
+        data: dict = json.load(f)
+    except (OSError, ValueError) as e:
+      print(f"Could not load the saved cookies for {self._host}: {e}")
+      return
+
+    if (data.get("version") != self._VERSION):
+      return
+
+    self._cookies = data.get("cookies", [])
+    self._user_agent = data.get("user_agent")
+    self._version = 1
+
+
+  # === Function: _save ===
+  def _save(self) -> None:
+    """
+    Save the store to disk
+
+    NOTE: Must hold '_lock'
+    """
+
+    data: dict = {
+      "version": self._VERSION,
+      "host": self._host,
+      "user_agent": self._user_agent,
+      "cookies": self._cookies
+    }
+
+    os.makedirs(self._DIRECTORY, exist_ok=True)
+    temp_path: str = self._path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+      json.dump(data, f, ensure_ascii=False, indent=1)
+    os.replace(temp_path, self._path)
+
+
+  # === Function: _getLiveCookies ===
+  def _getLiveCookies(self) -> list[dict]:
+    """
+    Get the cookies that haven't expired
+
+    NOTE: Must hold '_lock'
+
+    Returns:
+      list[dict]: Cookies, as selenium gives them ('name', 'value', 'domain', 'path', 'expiry', etc.)
+    """
+
+    now: float = time.time()
+    return [cookie for cookie in self._cookies if (cookie.get("expiry") == None or cookie["expiry"] > now)]
+
+
+  # ******************************************** #
+  # ****************** Public ****************** #
+  # ******************************************** #
+
+
+  # === Function: __init__ ===
+  def __init__(self, host: str) -> None:
+    """
+    Constructor -> Loads the host's saved cookies
+
+    NOTE: Use 'ClearanceStore.getForHost' so every scraper shares the same store
+
+    Args:
+      host: Host the cookies belong to
+    """
+
+    self._host: str = host
+    self._path: str = os.path.join(self._DIRECTORY, host.replace(":", "_") + ".json")
+    self._lock: threading.Lock = threading.Lock()
+    self._cookies: list[dict] = []
+    self._user_agent: str | None = None
+
+    """ Goes up every time the cookies change (1 once loaded from disk), so a browser can tell if it has the newest ones """
+    self._version: int = 0
+
+    self._load()
+
+
+  # === Function: getForHost ===
+  @staticmethod
+  def getForHost(url: str):
+    """
+    Get the shared store for a url's host, loading it if needed
+
+    Params:
+      url: Any url on the host (or the host itself)
+
+    Returns:
+      ClearanceStore: The host's store
+    """
+
+    host: str = urlsplit(url).hostname or url
+
+    with ClearanceStore._host_stores_lock:
+      if (host not in ClearanceStore._host_stores):
+        ClearanceStore._host_stores[host] = ClearanceStore(host)
+
+      return ClearanceStore._host_stores[host]
+
+
+  # === Function: updateFromDriver ===
+  def updateFromDriver(self, driver) -> None:
+    """
+    Save the cookies and user agent of a browser that is on one of the host's pages (i.e. right after it passed a
+    challenge)
+
+    Params:
+      driver: The web driver
+    """
+
+    try:
+      cookies: list[dict] = driver.get_cookies()
+      user_agent: str = driver.execute_script("return navigator.userAgent;")
+    except Exception as e:
+      print(f"Could not read the browser's cookies: {e}")
+      return
+
+    with self._lock:
+      self._cookies = cookies
+      self._user_agent = user_agent
+      self._version += 1
+      self._save()
+
+
+  # === Function: applyToDriver ===
+  def applyToDriver(self, driver) -> int:
+    """
+    Give a browser the saved cookies. Works before the browser has opened any of the host's pages
+
+    Params:
+      driver: The web driver
+
+    Returns:
+      int: The store's version that was applied (see 'getVersion') OR 0 if there was nothing to apply
+    """
+
+    with self._lock:
+      cookies: list[dict] = self._getLiveCookies()
+      version: int = self._version
+
+    if (len(cookies) == 0):
+      return 0
+
+    # Selenium's 'add_cookie' only works on a page of the cookie's domain, the devtools protocol doesn't need one
+    devtools_cookies: list[dict] = []
+    for cookie in cookies:
+      devtools_cookie: dict = {key: cookie[key] for key in ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite") if (key in cookie)}
+      if ("expiry" in cookie):
+        devtools_cookie["expires"] = cookie["expiry"]
+      devtools_cookies.append(devtools_cookie)
+
+    try:
+      driver.execute_cdp_cmd("Network.setCookies", {"cookies": devtools_cookies})
+    except Exception as e:
+      print(f"Could not give the browser the saved cookies: {e}")
+      return 0
+
+    return version
+
+
+  # ******************************************** #
+  # ************** Getters/Setters ************* #
+  # ******************************************** #
+
+
+  # === Function: getRequestHeaders ===
+  def getRequestHeaders(self) -> dict[str, str]:
+    """
+    Get the headers an http request needs to look like the browser that got the clearance
+
+    Returns:
+      dict[str, str]: 'Cookie' and 'User-Agent' headers OR {} if nothing is saved
+    """
+
+    with self._lock:
+      cookies: list[dict] = self._getLiveCookies()
+      user_agent: str | None = self._user_agent
+
+    headers: dict[str, str] = {}
+    if (len(cookies) > 0):
+      headers["Cookie"] = "; ".join(f"{cookie['name']}={cookie['value']}" for cookie in cookies)
+    if (user_agent != None):
+      headers["User-Agent"] = user_agent
+
+    return headers
+
+
+  # === Function: getVersion ===
+  def getVersion(self) -> int:
+    """
+    Get which version of the cookies the store has (0 if it has none yet)
+
+    Returns:
+      int: The version
+    """
+
+    with self._lock:
+      return self._version
@@ -0,0 +1,664 @@
+# Imports
+import os
+import re
+import time
+import atexit
+import threading
+from seleniumbase import Driver
+from selenium.common.exceptions import WebDriverException
+
+# psutil is optional. Without it, browsers are only recycled by page count
+try:
+  import psutil
+except ImportError:
+  psutil = None
+
+# Profile directories are locked with fcntl on POSIX and msvcrt on Windows, whichever is there
+try:
+  import fcntl
+except ImportError:
+  fcntl = None
+
+try:
+  import msvcrt
+except ImportError:
+  msvcrt = None
+
+
+# === Class: DriverSession ===
+class DriverSession():
+  """
+  One browser, along with how much it has been used. Handed out by 'DriverSessionManager'
+  """
+
+
+  # ******************************************** #
+  # ****************** Public ****************** #
+  # ******************************************** #
+
+
+  # === Function: __init__ ===
+  def __init__(self, settings, host: str | None = None, user_data_dir: str | None = None) -> None:
+    """
+    Constructor -> Starts the browser with a profile's options
+
+    Args:
+      settings: Headless mode, blocked resources, page load strategy and window size (DriverSessionManager.Settings)
+      host: Site the browser is used for (its cookies and profile belong to it) OR None
+      user_data_dir: Chrome profile directory to keep between runs OR None for a throwaway profile
+    """
+
+    self._driver: Driver = Driver(
+      uc=True,
+      headless=settings.headless == DriverSessionManager.HeadlessModes.ON,
+      headless2=settings.headless == DriverSessionManager.HeadlessModes.NEW,
+      block_images=settings.block_images,
+      page_load_strategy=settings.page_load_strategy,
+      user_data_dir=user_data_dir
+    )
+    self._profile_key: tuple = settings.getProfileKey()
+    self._host: str | None = host
+    self._user_data_dir: str | None = user_data_dir
+    self._page_count: int = 0
+    self._broken: bool = False
+    self._last_used_time: float = time.monotonic()
+
+    """ Version of the host's saved cookies this browser has (See 'ClearanceStore.getVersion') """
+    self._clearance_version: int = 0
+
+    # A smaller window means less to lay out and paint
+    if (settings.window_size != ""):
+      width, height = settings.window_size.split(",")
+      self._driver.set_window_size(int(width), int(height))
+
+    # Stop the browser from downloading what the scraper never reads | NOTE: Images are blocked by the driver itself
+    blocked_urls: list[str] = settings.getBlockedUrls()
+    if (len(blocked_urls) > 0):
+      try:
+        self._driver.execute_cdp_cmd("Network.enable", {})
+        self._driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_urls})
+      except Exception as e:
+        print(f"Could not block resources in the browser: {e}")
+
+
+  # === Function: countPage ===
+  def countPage(self) -> None:
+    """
+    Record that a page was opened in the browser
+    """
+
+    self._page_count += 1
+    self._last_used_time = time.monotonic()
+
+
+  # === Function: markBroken ===
+  def markBroken(self) -> None:
+    """
+    Record that the browser failed (i.e. it was closed or crashed), so it's closed instead of handed out again
+    """
+
+    self._broken = True
+
+
+  # === Function: isHealthy ===
+  def isHealthy(self) -> bool:
+    """
+    Check if the browser still responds
+
+    Returns:
+      bool: True if the browser can be used
+    """
+
+    if (self._broken):
+      return False
+
+    try:
+      self._driver.current_url
+      return True
+    except WebDriverException:
+      self._broken = True
+      return False
+
+
+  # === Function: needsRecycle ===
+  def needsRecycle(self, settings) -> bool:
+    """
+    Check if the browser should be replaced with a fresh one
+
+    Params:
+      settings: Page and memory limits (DriverSessionManager.Settings)
+
+    Returns:
+      bool: True if the browser failed, has opened 'max_pages' pages OR uses more than 'max_memory_mb'
+    """
+
+    if (self._broken):
+      return True
+
+    if (settings.max_pages > 0 and self._page_count >= settings.max_pages):
+      return True
+
+    memory_mb: float | None = self.getMemoryMb()
+    return settings.max_memory_mb > 0 and memory_mb != None and memory_mb > settings.max_memory_mb
+
+
+  # === Function: close ===
+  def close(self) -> None:
+    """
+    Quit the browser
+    """
+
+    try:
+      self._driver.quit()
+    except Exception as e:
+      print(f"Error closing browser: {e}")
+
+
+  # ******************************************** #
+  # ************** Getters/Setters ************* #
+  # ******************************************** #
+
+
+  # === Function: getDriver ===
+  def getDriver(self) -> Driver:
+    """
+    Get the browser
+
+    Returns:
+      Driver: The seleniumbase driver
+    """
+
+    return self._driver
+
+
+  # === Function: getProfileKey ===
+  def getProfileKey(self) -> tuple:
+    """
+    Get the options the browser was started with
+
+    Returns:
+      tuple: See 'DriverSessionManager.Settings.getProfileKey'
+    """
+
+    return self._profile_key
+
+
+  # === Function: getHost ===
+  def getHost(self) -> str | None:
+    """
+    Get the site the browser is used for
+
+    Returns:
+      str | None: The host OR None if it isn't tied to one
+    """
+
+    return self._host
+
+
+  # === Function: getUserDataDir ===
+  def getUserDataDir(self) -> str | None:
+    """
+    Get the Chrome profile directory the browser keeps between runs
+
+    Returns:
+      str | None: The directory OR None if the profile is thrown away
+    """
+
+    return self._user_data_dir
+
+
+  # === Function: setClearanceVersion ===
+  def setClearanceVersion(self, version: int) -> None:
+    """
+    Set which version of the host's saved cookies the browser has
+
+    Params:
+      version: 'ClearanceStore.getVersion' when the cookies were given to (OR taken from) the browser
+    """
+
+    self._clearance_version = version
+
+
+  # === Function: getClearanceVersion ===
+  def getClearanceVersion(self) -> int:
+    """
+    Get which version of the host's saved cookies the browser has
+
+    Returns:
+      int: The version (0 if it has none)
+    """
+
+    return self._clearance_version
+
+
+  # === Function: getPageCount ===
+  def getPageCount(self) -> int:
+    """
+    Get how many pages the browser has opened
+
+    Returns:
+      int: The page count
+    """
+
+    return self._page_count
+
+
+  # === Function: getIdleTime ===
+  def getIdleTime(self) -> float:
+    """
+    Get how long it has been since the browser opened a page (OR was started)
+
+    Returns:
+      float: Seconds
+    """
+
+    return time.monotonic() - self._last_used_time
+
+
+  # === Function: getMemoryMb ===
+  def getMemoryMb(self) -> float | None:
+    """
+    Get the memory used by the browser (the driver process and every browser process it started)
+
+    Returns:
+      float | None: Resident MB OR None if it can't be measured (psutil isn't installed)
+    """
+
+    service = getattr(self._driver, "service", None)
+    process = getattr(service, "process", None)
+    if (psutil == None or process == None):
+      return None
+
+    try:
+      driver_process = psutil.Process(process.pid)
+      total: int = driver_process.memory_info().rss
+      for child in driver_process.children(recursive=True):
+        total += child.memory_info().rss
+    except psutil.Error:
+      return None
+
+    return total / (1024 * 1024)
+
+
+# === Class: DriverSessionManager ===
+class DriverSessionManager():
+  """
+  Keeps browsers open between scrapes, so a new scrape (OR the next novel) gets a warm browser that already has its
+  cookies and challenge clearance, instead of paying for a browser start and a fresh challenge every time.
+
+  Scrapers take a browser with 'acquireSession' and give it back with 'releaseSession'. Browsers are health checked
+  before they are handed out, replaced after too many pages or too much memory, closed after sitting unused too long
+  and closed at shutdown.
+
+  Everything is class level, so every scraper and worker in the process shares the same browsers.
+  """
+
+
+  # === Subclass: HeadlessModes ===
+  class HeadlessModes():
+    """
+    Holds constants for how a browser shows its window
+    """
+
+    OFF: str = "false" # A normal window | NOTE: Clicking through a CAPTCHA needs a window
+    ON: str = "true" # Chrome's old headless mode
+    NEW: str = "new" # Chrome's new headless mode, which behaves like a normal browser (harder for sites to tell apart)
+
+    ALL: tuple[str] = (OFF, ON, NEW)
+
+
+  # === Subclass: PageLoadStrategies ===
+  class PageLoadStrategies():
+    """
+    Holds constants for when the browser says a page is loaded
+    """
+
+    NORMAL: str = "normal" # Everything on the page finished loading
+    EAGER: str = "eager" # The html is parsed, images and other resources may still be loading
+    NONE: str = "none" # Right after the html starts to arrive
+
+    ALL: tuple[str] = (NORMAL, EAGER, NONE)
+
+
+  # === Subclass: Settings ===
+  class Settings():
+    """
+    Holds the values used to manage browsers. Loaded from the '[DriverSettings]' section of a scraper settings file
+    """
+
+
+    # === Constants ===
+    MAX_PAGES: str = "max_pages"
+    MAX_MEMORY_MB: str = "max_memory_mb"
+    MAX_IDLE_SESSIONS: str = "max_idle_sessions"
+    IDLE_TIMEOUT: str = "idle_timeout"
+    PROFILE_DIRECTORY: str = "profile_directory"
+    HEADLESS: str = "headless"
+    BLOCK_IMAGES: str = "block_images"
+    BLOCK_CSS: str = "block_css"
+    BLOCK_FONTS: str = "block_fonts"
+    BLOCKED_DOMAINS: str = "blocked_domains"
+    PAGE_LOAD_STRATEGY: str = "page_load_strategy"
+    WINDOW_SIZE: str = "window_size"
+    TABS: str = "tabs"
+
+    """ Url patterns of font files """
+    FONT_URL_PATTERNS: tuple[str] = ("*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot")
+
+
+    # === Variables ===
+    max_pages: int = 500 # Pages a browser opens before it's replaced (0 means never)
+    max_memory_mb: float = 2048.0 # Memory a browser can use before it's replaced (0 means never) | NOTE: Needs psutil
+    max_idle_sessions: int = 4 # Most browsers kept open while no scrape is using them (0 closes them right away)
+    idle_timeout: float = 900.0 # Seconds an unused browser is kept open
+    profile_directory: str = "downloaded_files/browser_profiles" # Where each site's Chrome profiles are kept ("" to throw them away)
+    headless: str = "false" # NOTE: Use DriverSessionManager.HeadlessModes.XXX
+    block_images: bool = False
+    block_css: bool = False
+    block_fonts: bool = False
+    blocked_domains: tuple[str] = () # Domains (and their subdomains) the browser never loads anything from (i.e. ads)
+    page_load_strategy: str = "normal" # NOTE: Use DriverSessionManager.PageLoadStrategies.XXX
+    window_size: str = "" # "width,height" OR "" for the default size
+    tabs: int = 1 # Chapters one browser loads at the same time, each in its own tab (See 'ScraperPool')
+
+
+    # === Function: loadFromConfigSection ===
+    def loadFromConfigSection(self, section) -> None:
+      """
+      Load the settings from a config file section. Missing values keep their defaults
+
+      Params:
+        section: configparser section ('[DriverSettings]')
+      """
+
+      self.max_pages = int(section.get(self.MAX_PAGES, str(self.max_pages)).strip('"'))
+      self.max_memory_mb = float(section.get(self.MAX_MEMORY_MB, str(self.max_memory_mb)).strip('"'))
+      self.max_idle_sessions = int(section.get(self.MAX_IDLE_SESSIONS, str(self.max_idle_sessions)).strip('"'))
+      self.idle_timeout = float(section.get(self.IDLE_TIMEOUT, str(self.idle_timeout)).strip('"'))
+      self.profile_directory = section.get(self.PROFILE_DIRECTORY, self.profile_directory).strip('"')
+      self.headless = section.get(self.HEADLESS, self.headless).strip('"').lower()
+      self.block_images = section.get(self.BLOCK_IMAGES, str(self.block_images)).strip('"').lower() == "true"
+      self.block_css = section.get(self.BLOCK_CSS, str(self.block_css)).strip('"').lower() == "true"
+      self.block_fonts = section.get(self.BLOCK_FONTS, str(self.block_fonts)).strip('"').lower() == "true"
+      self.blocked_domains = tuple(domain.strip() for domain in section.get(self.BLOCKED_DOMAINS, ",".join(self.blocked_domains)).strip('"').split(",") if (domain.strip() != ""))
+      self.page_load_strategy = section.get(self.PAGE_LOAD_STRATEGY, self.page_load_strategy).strip('"').lower()
+      self.window_size = section.get(self.WINDOW_SIZE, self.window_size).strip('"').replace(" ", "")
+      self.tabs = max(int(section.get(self.TABS, str(self.tabs)).strip('"')), 1)
+
+      # Unknown values keep the browser's defaults instead of failing the scrape
+      if (self.headless not in DriverSessionManager.HeadlessModes.ALL):
+        print(f"Unknown headless mode '{self.headless}', defaulting to '{DriverSessionManager.HeadlessModes.OFF}'.")
+        self.headless = DriverSessionManager.HeadlessModes.OFF
+
+      if (self.page_load_strategy not in DriverSessionManager.PageLoadStrategies.ALL):
+        print(f"Unknown page load strategy '{self.page_load_strategy}', defaulting to '{DriverSessionManager.PageLoadStrategies.NORMAL}'.")
+        self.page_load_strategy = DriverSessionManager.PageLoadStrategies.NORMAL
+
+      if (self.window_size != "" and re.fullmatch(r"\d+,\d+", self.window_size) == None):
+        print(f"Invalid window size '{self.window_size}', using the default size.")
+        self.window_size = ""
+
+
+    # === Function: getBlockedUrls ===
+    def getBlockedUrls(self) -> list[str]:
+      """
+      Get the url patterns the browser shouldn't load
+
+      Returns:
+        list[str]: Patterns for the devtools protocol's 'Network.setBlockedURLs'
+      """
+
+      blocked_urls: list[str] = []
+      if (self.block_css):
+        blocked_urls.append("*.css")
+      if (self.block_fonts):
+        blocked_urls.extend(self.FONT_URL_PATTERNS)
+      for domain in self.blocked_domains:
+        blocked_urls.extend((f"*://{domain}/*", f"*://*.{domain}/*"))
+
+      return blocked_urls
+
+
+    # === Function: getProfileKey ===
+    def getProfileKey(self) -> tuple:
+      """
+      Get the options a browser is started with, so a warm browser is only handed to a scraper that wants the same ones
+
+      Returns:
+        tuple: Headless mode, blocked resources, page load strategy and window size
+      """
+
+      return (self.headless, self.block_images, self.block_css, self.block_fonts, self.blocked_domains, self.page_load_strategy, self.window_size)
+
+
+  # ******************************************** #
+  # ****************** Private ***************** #
+  # ******************************************** #
+
+
+  # === Variables ===
+  """ Browsers that are open, but not used by any scraper """
+  _idle_sessions: list[DriverSession] = []
+  _idle_sessions_lock: threading.Lock = threading.Lock()
+
+  """ Chrome profile directories used by an open browser in this process -> their open lock file. Chrome can't open
+      the same profile twice """
+  _profiles_in_use: dict[str, object] = {}
+
+
+  # === Function: _lockProfile ===
+  @staticmethod
+  def _lockProfile(user_data_dir: str):
+    """
+    Lock a profile directory, so a browser in another process doesn't open it too. The lock is held until its file is
+    closed, which the OS also does if the process dies
+
+    Params:
+      user_data_dir: The profile directory
+
+    Returns:
+      file | None: The open lock file OR None if another process holds the lock
+    """
+
+    os.makedirs(os.path.dirname(user_data_dir), exist_ok=True)
+    lock_file = open(user_data_dir + ".lock", "a+")
+
+    try:
+      if (fcntl != None):
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+      elif (msvcrt != None):
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+      lock_file.close()
+      return None
+
+    return lock_file
+
+
+  # === Function: _startSession ===
+  @staticmethod
+  def _startSession(host: str | None, settings: Settings) -> DriverSession:
+    """
+    Start a browser, with the first of the host's profiles that no open browser (in any process) is using
+
+    Params:
+      host: Site the browser is used for OR None
+      settings: The browser's options and where profiles are kept
+
+    Returns:
+      DriverSession: The new browser
+    """
+
+    user_data_dir: str | None = None
+    if (host != None and settings.profile_directory != ""):
+      with DriverSessionManager._idle_sessions_lock:
+        slot: int = 0
+        while True:
+          user_data_dir = os.path.join(settings.profile_directory, host, str(slot))
+          if (user_data_dir not in DriverSessionManager._profiles_in_use):
+            lock_file = DriverSessionManager._lockProfile(user_data_dir)
+            if (lock_file != None):
+              DriverSessionManager._profiles_in_use[user_data_dir] = lock_file
+              break
+
+          slot += 1
+
+    try:
+      return DriverSession(settings, host, user_data_dir)
+    except Exception:
+      DriverSessionManager._freeProfile(user_data_dir)
+      raise
+
+
+  # === Function: _freeProfile ===
+  @staticmethod
+  def _freeProfile(user_data_dir: str | None) -> None:
+    """
+    Let another browser use a profile directory
+
+    Params:
+      user_data_dir: The profile directory OR None
+    """
+
+    with DriverSessionManager._idle_sessions_lock:
+      lock_file = DriverSessionManager._profiles_in_use.pop(user_data_dir, None)
+
+    if (lock_file != None):
+      lock_file.close()
+
+
+  # === Function: _closeSession ===
+  @staticmethod
+  def _closeSession(session: DriverSession) -> None:
+    """
+    Quit a browser and free its profile
+
+    Params:
+      session: The browser
+    """
+
+    session.close()
+    DriverSessionManager._freeProfile(session.getUserDataDir())
+
+
+  # === Function: _closeExpiredSessions ===
+  @staticmethod
+  def _closeExpiredSessions(settings: Settings) -> None:
+    """
+    Close idle browsers that have been unused longer than 'idle_timeout'
+
+    Params:
+      settings: Idle timeout to use
+    """
+
+    with DriverSessionManager._idle_sessions_lock:
+      expired_sessions: list[DriverSession] = [session for session in DriverSessionManager._idle_sessions if (session.getIdleTime() > settings.idle_timeout)]
+      DriverSessionManager._idle_sessions = [session for session in DriverSessionManager._idle_sessions if (session not in expired_sessions)]
+
+    for session in expired_sessions:
+      DriverSessionManager._closeSession(session)
+
+
+  # ******************************************** #
+  # ****************** Public ****************** #
+  # ******************************************** #
+
+
+  # === Function: acquireSession ===
+  @staticmethod
+  def acquireSession(settings: Settings | None = None, host: str | None = None) -> DriverSession:
+    """
+    Get a browser for a scraper to use, reusing a warm one (for the same site, started with the same options) if there
+    is one
+
+    Params:
+      settings: The browser's options and limits (Defaults to 'DriverSessionManager.Settings()')
+      host: Site the browser will be used for, so it gets that site's profile OR None
+
+    Returns:
+      DriverSession: A browser only this scraper uses until it calls 'releaseSession'
+    """
+
+    settings = settings if (settings != None) else DriverSessionManager.Settings()
+    DriverSessionManager._closeExpiredSessions(settings)
+
+    while True:
+      session: DriverSession | None = None
+      with DriverSessionManager._idle_sessions_lock:
+        for idle_session in reversed(DriverSessionManager._idle_sessions):
+          if (idle_session.getProfileKey() == settings.getProfileKey() and idle_session.getHost() == host):
+            session = idle_session
+            DriverSessionManager._idle_sessions.remove(idle_session)
+            break
+
+      # No warm browser left, start one
+      if (session == None):
+        return DriverSessionManager._startSession(host, settings)
+
+      if (session.isHealthy()):
+        return session
+
+      print("Closing a warm browser that stopped responding.")
+      DriverSessionManager._closeSession(session)
+
+
+  # === Function: releaseSession ===
+  @staticmethod
+  def releaseSession(session: DriverSession, settings: Settings | None = None) -> None:
+    """
+    Give a browser back when a scraper is done with it. It's kept warm for the next scrape, unless it needs to be
+    replaced OR enough browsers are already waiting
+
+    Params:
+      session: Browser from 'acquireSession'
+      settings: Limits to use (Defaults to 'DriverSessionManager.Settings()')
+    """
+
+    settings = settings if (settings != None) else DriverSessionManager.Settings()
+
+    if (not session.needsRecycle(settings) and session.isHealthy()):
+      with DriverSessionManager._idle_sessions_lock:
+        if (len(DriverSessionManager._idle_sessions) < settings.max_idle_sessions):
+          DriverSessionManager._idle_sessions.append(session)
+          return
+
+    DriverSessionManager._closeSession(session)
+
+
+  # === Function: closeAll ===
+  @staticmethod
+  def closeAll() -> None:
+    """
+    Close every idle browser (i.e. at shutdown). Browsers still used by a scraper are closed when they are released
+    """
+
+    with DriverSessionManager._idle_sessions_lock:
+      idle_sessions: list[DriverSession] = DriverSessionManager._idle_sessions
+      DriverSessionManager._idle_sessions = []
+
+    for session in idle_sessions:
+      DriverSessionManager._closeSession(session)
+
+
+  # ******************************************** #
+  # ************** Getters/Setters ************* #
+  # ******************************************** #
+
+
+  # === Function: getIdleSessionCount ===
+  @staticmethod
+  def getIdleSessionCount() -> int:
+    """
+    Get how many warm browsers are waiting to be used
+
+    Returns:
+      int: The count
+    """
+
+    with DriverSessionManager._idle_sessions_lock:
+      return len(DriverSessionManager._idle_sessions)
+
+
+# Don't leave browsers running after the program exits
+atexit.register(DriverSessionManager.closeAll)
@@ -0,0 +1,428 @@
+# Imports
+import re
+import time
+import gzip
+import zlib
+import threading
+import http.client
+from urllib.parse import urljoin, urlsplit
+from src.common.html_document import HtmlDocument
+
+# Brotli is optional. Without it, servers are only asked for gzip/deflate
+try:
+  import brotli
+except ImportError:
+  brotli = None
+
+
+# === Class: FetchBackends ===
+class FetchBackends():
+  """
+  Defines constants for the ways a 'Scraper' can load pages.
+  """
+
+  # === Constants ===
+  DRIVER: str = "driver" # Every page is loaded in the seleniumbase browser
+  HTTP: str = "http" # Pages are loaded with plain http requests. The browser is only used when a challenge page shows up
+
+  ALL: tuple[str] = (DRIVER, HTTP)
+
+
+# === Function: isChallengePage ===
+def isChallengePage(page_html: str, status: int = 200, headers: dict[str, str] | None = None) -> bool:
+  """
+  Check if a page is a bot check (Cloudflare challenge, CAPTCHA, etc.) instead of the requested page
+
+  NOTE: Cloudflare's scripts and CAPTCHA widgets also show up on ordinary pages (i.e. comment or login forms), so
+        markers in the html only count when the request was refused
+
+  Params:
+    page_html: Html of the page
+    status: Http status code of the response (200 if unknown, i.e. when loaded in a browser)
+    headers: Response headers (names are lowercase) OR None if unknown
+
+  Returns:
+    bool: True if the page is a challenge page
+  """
+
+  # Cloudflare marks the challenges it serves
+  if (headers != None and headers.get("cf-mitigated", "").strip().lower() == "challenge"):
+    return True
+
+  # Only look at the start of the page, the title and challenge markers are always near the top
+  head: str = page_html[:20000]
+
+  title_match = re.search(r"<title[^>]*>(.*?)</title>", head, re.IGNORECASE | re.DOTALL)
+  if (title_match != None and isChallengeTitle(title_match.group(1))):
+    return True
+
+  if (status in FetchResult.CHALLENGE_STATUSES):
+    head = head.lower()
+    for marker in FetchResult.CHALLENGE_MARKERS:
+      if (marker in head):
+        return True
+
+  return False
+
+
+# === Function: isChallengeTitle ===
+def isChallengeTitle(title: str) -> bool:
+  """
+  Check if a page title belongs to a bot check. Cheaper than 'isChallengePage' when the page is open in a browser
+
+  Params:
+    title: Title of the page
+
+  Returns:
+    bool: True if the title is a challenge page's title
+  """
+
+  return title.strip().lower() in FetchResult.CHALLENGE_TITLES
+
+
+# === Class: FetchResult ===
+class FetchResult():
+  """
+  Holds a page that was loaded by a fetch backend
+  """
+
+
+  # === Constants ===
+  """ Titles (lowercase) of challenge pages """
+  CHALLENGE_TITLES: tuple[str] = (
+    "just a moment...",
+    "attention required! | cloudflare"
+  )
+
+  """ Strings (lowercase) in a challenge page's scripts. Only checked on a 'CHALLENGE_STATUSES' response """
+  CHALLENGE_MARKERS: tuple[str] = (
+    "cf_chl_opt",
+    "cf-browser-verification"
+  )
+
+  """ Statuses a challenge page is served with """
+  CHALLENGE_STATUSES: tuple[int] = (403, 503)
+
+  """ Statuses a site answers with when it wants requests to slow down (or refuses them) without a challenge page """
+  THROTTLED_STATUSES: tuple[int] = (403, 429, 503)
+
+
+  # === Function: __init__ ===
+  def __init__(self, url: str, status: int, headers: dict[str, str], page_html: str, elapsed: float) -> None:
+    """
+    Constructor -> Sets the loaded page's data
+
+    Args:
+      url: Final url of the page (after redirects)
+      status: Http status code
+      headers: Response headers (names are lowercase)
+      page_html: Decoded html of the page
+      elapsed: How long the page took to load, in seconds
+    """
+
+    self.url: str = url
+    self.status: int = status
+    self.headers: dict[str, str] = headers
+    self.html: str = page_html
+    self.elapsed: float = elapsed
+    self._document: HtmlDocument | None = None
+
+
+  # === Function: isOk ===
+  def isOk(self) -> bool:
+    """
+    Check if the page loaded successfully
+
+    Returns:
+      bool: True for a 2XX status code
+    """
+
+    return 200 <= self.status < 300
+
+
+  # === Function: isChallenge ===
+  def isChallenge(self) -> bool:
+    """
+    Check if the page is a bot check instead of the requested page
+
+    Returns:
+      bool: True if the page is a challenge page
+    """
+
+    return isChallengePage(self.html, self.status, self.headers)
+
+
+  # === Function: isThrottled ===
+  def isThrottled(self) -> bool:
+    """
+    Check if the site refused the request or is shedding load, so requests to it should slow down
+
+    Returns:
+      bool: True for a status in 'THROTTLED_STATUSES'
+    """
+
+    return self.status in self.THROTTLED_STATUSES
+
+
+  # === Function: getDocument ===
+  def getDocument(self) -> HtmlDocument:
+    """
+    Get the parsed page. The page is only parsed the first time this is called
+
+    Returns:
+      HtmlDocument: The parsed page, which can be searched with 'find_element' like a web driver
+    """
+
+    if (self._document == None):
+      self._document = HtmlDocument(self.html)
+
+    return self._document
+
+
+# === Class: HttpFetchBackend ===
+class HttpFetchBackend():
+  """
+  Loads pages with plain http requests instead of a browser. Connections are kept alive and pooled per host, so one
+  backend can be shared between many scrapers (and threads).
+  """
+
+
+  # ******************************************** #
+  # ****************** Private ***************** #
+  # ******************************************** #
+
+
+  # === Constants ===
+  _DEFAULT_USER_AGENT: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36"
+  _MAX_REDIRECTS: int = 5
+  _REDIRECT_STATUSES: tuple[int] = (301, 302, 303, 307, 308)
+
+  """ Request headers (lowercase) that only belong to the host they were made for, so they aren't sent on a redirect
+  to another host """
+  _HOST_BOUND_HEADERS: tuple[str] = ("cookie", "authorization", "if-none-match", "if-modified-since")
+
+  """ Errors that mean a kept-alive connection was closed by the server and the request should be retried """
+  _STALE_CONNECTION_ERRORS: tuple = (http.client.RemoteDisconnected, http.client.BadStatusLine, ConnectionResetError, BrokenPipeError)
+
+
+  # === Function: _getConnection ===
+  def _getConnection(self, scheme: str, netloc: str) -> tuple[http.client.HTTPConnection, bool]:
+    """
+    Get an idle pooled connection to a host, or open a new one
+
+    Params:
+      scheme: "http" or "https"
+      netloc: Host (and port) to connect to
+
+    Returns:
+      tuple[http.client.HTTPConnection, bool]: The connection and if it was reused from the pool
+    """
+
+    with self._lock:
+      idle_connections: list = self._idle_connections.get((scheme, netloc), [])
+      if (len(idle_connections) > 0):
+        return idle_connections.pop(), True
+
+    if (scheme == "https"):
+      return http.client.HTTPSConnection(netloc, timeout=self._timeout), False
+
+    return http.client.HTTPConnection(netloc, timeout=self._timeout), False
+
+
+  # === Function: _releaseConnection ===
+  def _releaseConnection(self, scheme: str, netloc: str, connection: http.client.HTTPConnection) -> None:
+    """
+    Put a connection back into the pool so the next request to the host can reuse it
+
+    Params:
+      scheme: "http" or "https"
+      netloc: Host (and port) the connection is for
+      connection: Connection to put back
+    """
+
+    with self._lock:
+      idle_connections: list = self._idle_connections.setdefault((scheme, netloc), [])
+
+      if (not self._closed and len(idle_connections) < self._max_connections_per_host):
+        idle_connections.append(connection)
+        return
+
+    # The pool is full, so this connection isn't needed anymore
+    connection.close()
+
+
+  # === Function: _decodeBody ===
+  def _decodeBody(self, body: bytes, headers: dict[str, str]) -> str:
+    """
+    Decompress and decode a response body
+
+    Params:
+      body: Raw response body
+      headers: Response headers (names are lowercase)
+
+    Returns:
+      str: The decoded body
+    """
+
+    # Decompress
+    content_encoding: str = headers.get("content-encoding", "").lower()
+    if (content_encoding == "gzip"):
+      body = gzip.decompress(body)
+    elif (content_encoding == "deflate"):
+      # Some servers send raw deflate data without the zlib header
+      try:
+        body = zlib.decompress(body)
+      except zlib.error:
+        body = zlib.decompress(body, -zlib.MAX_WBITS)
+    elif (content_encoding == "br" and brotli != None):
+      body = brotli.decompress(body)
+
+    # Find the charset from the headers, then the page's <meta> tag, then default to utf-8
+    charset_match = re.search(r"charset=[\"']?([\w-]+)", headers.get("content-type", ""), re.IGNORECASE)
+    if (charset_match == None):
+      charset_match = re.search(rb"<meta[^>]+charset=[\"']?([\w-]+)", body[:4096], re.IGNORECASE)
+
+    charset: str = "utf-8"
+    if (charset_match != None):
+      charset = charset_match.group(1)
+      charset = charset.decode("ascii") if isinstance(charset, bytes) else charset
+
+    try:
+      return body.decode(charset, errors="replace")
+    except LookupError:
+      return body.decode("utf-8", errors="replace")
+
+
+  # === Function: _request ===
+  def _request(self, url: str, headers: dict[str, str]) -> tuple[int, dict[str, str], bytes]:
+    """
+    Send one GET request (no redirects), retrying once if a kept-alive connection turned out to be closed
+
+    Params:
+      url: Url to request
+      headers: Request headers
+
+    Returns:
+      tuple[int, dict[str, str], bytes]: Status code, response headers (lowercase names) and the raw body
+    """
+
+    url_parts = urlsplit(url)
+    path: str = url_parts.path or "/"
+    if (url_parts.query):
+      path += "?" + url_parts.query
+
+    while True:
+      connection, reused = self._getConnection(url_parts.scheme, url_parts.netloc)
+
+      try:
+        connection.request("GET", path, headers=headers)
+        response: http.client.HTTPResponse = connection.getresponse()
+        body: bytes = response.read()
+      except self._STALE_CONNECTION_ERRORS:
+        connection.close()
+
+        # Only retry if the failed connection was an old one from the pool
+        if (reused):
+          continue
+        raise
+      except Exception:
+        connection.close()
+        raise
+
+      response_headers: dict[str, str] = {name.lower(): value for name, value in response.getheaders()}
+
+      # Reuse the connection unless the server is closing it
+      if (response.will_close):
+        connection.close()
+      else:
+        self._releaseConnection(url_parts.scheme, url_parts.netloc, connection)
+
+      return response.status, response_headers, body
+
+
+  # ******************************************** #
+  # ****************** Public ****************** #
+  # ******************************************** #
+
+
+  # === Function: __init__ ===
+  def __init__(self, max_connections_per_host: int = 4, timeout: float = 30.0, user_agent: str = None) -> None:
+    """
+    Constructor -> Sets up an empty connection pool
+
+    Args:
+      max_connections_per_host: How many idle connections to keep open per host
+      timeout: Seconds to wait on a connection before giving up
+      user_agent: User agent to send (Defaults to a desktop Chrome user agent)
+    """
+
+    self._max_connections_per_host: int = max_connections_per_host
+    self._timeout: float = timeout
+    self._user_agent: str = user_agent if (user_agent != None) else self._DEFAULT_USER_AGENT
+
+    self._lock: threading.Lock = threading.Lock()
+    self._idle_connections: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+    self._closed: bool = False
+
+
+  # === Function: fetch ===
+  def fetch(self, url: str, headers: dict[str, str] | None = None) -> FetchResult | None:
+    """
+    Load a page, following redirects
+
+    Params:
+      url: Url of the page to load
+      headers: Extra request headers
+
+    Returns:
+      FetchResult | None: The loaded page OR None if it couldn't be loaded (connection error, timeout, etc.)
+    """
+
+    request_headers: dict[str, str] = {
+      "User-Agent": self._user_agent,
+      "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+      "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+      "Accept-Encoding": "gzip, deflate, br" if (brotli != None) else "gzip, deflate",
+      "Connection": "keep-alive"
+    }
+    if (headers != None):
+      request_headers.update(headers)
+
+    start_time: float = time.perf_counter()
+
+    try:
+      for _ in range(self._MAX_REDIRECTS + 1):
+        status, response_headers, body = self._request(url, request_headers)
+
+        # Follow redirects | NOTE: Another host doesn't get this host's cookies or cached copy's validators
+        if (status in self._REDIRECT_STATUSES and "location" in response_headers):
+          redirect_url: str = urljoin(url, response_headers["location"])
+          if (urlsplit(redirect_url).netloc != urlsplit(url).netloc):
+            request_headers = {name: value for name, value in request_headers.items() if (name.lower() not in self._HOST_BOUND_HEADERS)}
+
+          url = redirect_url
+          continue
+
+        return FetchResult(url, status, response_headers, self._decodeBody(body, response_headers), time.perf_counter() - start_time)
+
+      print(f"Too many redirects for {url}")
+      return None
+
+    except Exception as e:
+      print(f"Error fetching {url}: {e}")
+      return None
+
+
+  # === Function: close ===
+  def close(self) -> None:
+    """
+    Close every pooled connection. The backend can't pool connections after this
+    """
+
+    with self._lock:
+      self._closed = True
+      idle_connections: list = [connection for connections in self._idle_connections.values() for connection in connections]
+      self._idle_connections = {}
+
+    for connection in idle_connections:
+      connection.close()
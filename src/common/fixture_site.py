@@ -0,0 +1,274 @@
+# Imports
+import time
+import threading
+from urllib.parse import urlsplit
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# === Class: _FixtureRequestHandler ===
+class _FixtureRequestHandler(BaseHTTPRequestHandler):
+  """
+  Serves the pages of the 'FixtureSite' that owns the server
+  """
+
+
+  # === Function: do_GET ===
+  def do_GET(self) -> None:
+    """
+    Send the chapter list ('/novel') OR a chapter ('/novel/<chapter_num>') after the site's latency
+    """
+
+    site: FixtureSite = self.server.fixture_site
+    time.sleep(site.getLatency())
+
+    page_html: str | None = site.renderPage(urlsplit(self.path).path)
+    if (page_html == None):
+      self.send_error(404)
+      return
+
+    body: bytes = page_html.encode("utf-8")
+    self.send_response(200)
+    self.send_header("Content-Type", "text/html; charset=utf-8")
+    self.send_header("Content-Length", str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+
+  # === Function: log_message ===
+  def log_message(self, format: str, *args) -> None:
+    """
+    Keep requests out of the console
+    """
+
+    pass
+
+
+# === Class: FixtureSite ===
+class FixtureSite():
+  """
+  A local http server with a synthetic novel, shaped like the pages 'cfg/scraper_settings/booktoki.ini' expects
+  (chapter list in 'ul.list-body > li.list-item', text in '#novel_content', a '.btn-next' button). Used to measure and
+  test the scrapers without touching the real site.
+
+  Runs on a daemon thread until 'close' is called.
+  """
+
+
+  # ******************************************** #
+  # ****************** Private ***************** #
+  # ******************************************** #
+
+
+  # === Constants ===
+  """ Url path of the chapter list. Chapters are at '<path>/<chapter_num>' """
+  _NOVEL_PATH: str = "/novel"
+
+  """ Filler text the chapters are made of """
+  _PARAGRAPH_TEXT: str = "그는 천천히 고개를 들어 하늘을 바라보았다. 끝없이 펼쳐진 구름 사이로 희미한 빛이 새어 나오고 있었다."
+
+
+  # === Function: _renderChapterList ===
+  def _renderChapterList(self) -> str:
+    """
+    Build the chapter list page (newest chapter first, like booktoki)
+
+    Returns:
+      str: Html of the page
+    """
+
+    items: str = "".join(
+      f'<li class="list-item"><a href="{self.getChapterUrl(chapter_num)}">Chapter {chapter_num}</a></li>'
+      for chapter_num in range(self._chapter_count, 0, -1)
+    )
+
+    return f'<html><head><title>Fixture Novel</title></head><body><ul class="list-body">{items}</ul></body></html>'
+
+
+  # === Function: _renderChapter ===
+  def _renderChapter(self, chapter_num: int) -> str:
+    """
+    Build a chapter page, padded with paragraphs until it is about 'page_size_kb' big
+
+    Params:
+      chapter_num: Number of the chapter
+
+    Returns:
+      str: Html of the page
+    """
+
+    next_button: str = f'<a href="{self.getChapterUrl(chapter_num + 1)}">다음화</a>' if (chapter_num < self._chapter_count) else ""
+    paragraph: str = f"<p>{chapter_num}화. {self._PARAGRAPH_TEXT}</p>"
+    paragraph_count: int = max(self._page_size_kb * 1024 // len(paragraph.encode("utf-8")), 1)
+
+    return (
+      f"<html><head><title>Chapter {chapter_num}</title></head><body>"
+      f'<div id="novel_content">{paragraph * paragraph_count}</div>'
+      f'<div class="btn-resource btn-next at-tip">{next_button}</div>'
+      "</body></html>"
+    )
+
+
+  # ******************************************** #
+  # ****************** Public ****************** #
+  # ******************************************** #
+
+
+  # === Function: __init__ ===
+  def __init__(self, chapter_count: int = 100, latency: float = 0.0, page_size_kb: int = 8, host: str = "127.0.0.1", port: int = 0) -> None:
+    """
+    Constructor -> Starts serving the novel
+
+    Args:
+      chapter_count: How many chapters the novel has
+      latency: Seconds every request waits before it is answered (i.e. to act like a slow site)
+      page_size_kb: About how big each chapter page is
+      host: Address to listen on
+      port: Port to listen on (0 picks a free port, see 'getPort')
+    """
+
+    self._chapter_count: int = max(chapter_count, 1)
+    self._latency: float = max(latency, 0.0)
+    self._page_size_kb: int = max(page_size_kb, 1)
+
+    """ Chapter number -> times its page was served, and chapters answered with a 404 (i.e. to test failures) """
+    self._chapter_hits: dict[int, int] = {}
+    self._missing_chapters: set[int] = set()
+    self._lock: threading.Lock = threading.Lock()
+
+    self._server: ThreadingHTTPServer = ThreadingHTTPServer((host, port), _FixtureRequestHandler)
+    self._server.daemon_threads = True
+    self._server.fixture_site = self
+
+    self._thread: threading.Thread = threading.Thread(target=self._server.serve_forever, name="FixtureSite", daemon=True)
+    self._thread.start()
+
+
+  # === Function: renderPage ===
+  def renderPage(self, path: str) -> str | None:
+    """
+    Build the page at a url path
+
+    Params:
+      path: Url path of the page
+
+    Returns:
+      str | None: Html of the page OR None if there is no such page
+    """
+
+    if (path.rstrip("/") == self._NOVEL_PATH):
+      return self._renderChapterList()
+
+    chapter_num: str = path[len(self._NOVEL_PATH) + 1:] if (path.startswith(self._NOVEL_PATH + "/")) else ""
+    if (not chapter_num.isdigit() or not 1 <= int(chapter_num) <= self._chapter_count):
+      return None
+
+    with self._lock:
+      self._chapter_hits[int(chapter_num)] = self._chapter_hits.get(int(chapter_num), 0) + 1
+      if (int(chapter_num) in self._missing_chapters):
+        return None
+
+    return self._renderChapter(int(chapter_num))
+
+
+  # === Function: close ===
+  def close(self) -> None:
+    """
+    Stop serving the novel
+    """
+
+    self._server.shutdown()
+    self._server.server_close()
+
+
+  # ******************************************** #
+  # ************** Getters/Setters ************* #
+  # ******************************************** #
+
+
+  # === Function: getNovelUrl ===
+  def getNovelUrl(self) -> str:
+    """
+    Get the url of the novel's chapter list (what a 'Scraper' is given)
+
+    Returns:
+      str: The url
+    """
+
+    return f"http://{self._server.server_address[0]}:{self.getPort()}{self._NOVEL_PATH}"
+
+
+  # === Function: getChapterUrl ===
+  def getChapterUrl(self, chapter_num: int) -> str:
+    """
+    Get the url of a chapter
+
+    Params:
+      chapter_num: Number of the chapter
+
+    Returns:
+      str: The url
+    """
+
+    return f"{self.getNovelUrl()}/{chapter_num}"
+
+
+  # === Function: getChapterCount ===
+  def getChapterCount(self) -> int:
+    """
+    Get how many chapters the novel has
+
+    Returns:
+      int: The chapter count
+    """
+
+    return self._chapter_count
+
+
+  # === Function: getChapterHits ===
+  def getChapterHits(self) -> dict[int, int]:
+    """
+    Get how many times each chapter's page was served (including 404s for missing chapters)
+
+    Returns:
+      dict[int, int]: Chapter number -> times served, for every chapter that was requested
+    """
+
+    with self._lock:
+      return dict(self._chapter_hits)
+
+
+  # === Function: setMissingChapters ===
+  def setMissingChapters(self, chapter_nums: set[int]) -> None:
+    """
+    Set the chapters whose pages are answered with a 404, as if they were taken down
+
+    Params:
+      chapter_nums: Numbers of the chapters
+    """
+
+    with self._lock:
+      self._missing_chapters = set(chapter_nums)
+
+
+  # === Function: getLatency ===
+  def getLatency(self) -> float:
+    """
+    Get how long every request waits before it is answered
+
+    Returns:
+      float: Seconds
+    """
+
+    return self._latency
+
+
+  # === Function: getPort ===
+  def getPort(self) -> int:
+    """
+    Get the port the novel is served on
+
+    Returns:
+      int: The port
+    """
+
+    return self._server.server_address[1]
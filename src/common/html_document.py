@@ -0,0 +1,639 @@
+# Imports
+import re
+import html
+from html.parser import HTMLParser
+from selenium.common.exceptions import NoSuchElementException
+
+
+# === Class: HtmlElement ===
+class HtmlElement():
+  """
+  A parsed html element. Supports the parts of selenium's WebElement that the scraper uses ('find_element',
+  'find_elements', 'text' and 'get_attribute') so it can be used in place of one.
+  """
+
+
+  # === Constants ===
+  """ Tags whose contents are never shown on the page """
+  HIDDEN_TAGS: set[str] = {"head", "script", "style", "noscript", "template", "title"}
+
+  """ Tags that start and end on their own line """
+  BLOCK_TAGS: set[str] = {
+    "address", "article", "aside", "blockquote", "dd", "div", "dl", "dt", "fieldset", "figcaption", "figure",
+    "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol", "p", "pre",
+    "section", "table", "tr", "ul"
+  }
+
+  """ Tags that never have children or a closing tag """
+  VOID_TAGS: set[str] = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+  """ Markers used while building an element's text """
+  _SOFT_BREAK: str = "\x00"
+  _HARD_BREAK: str = "\n"
+  _NBSP: str = "\x01"
+
+
+  # === Function: __init__ ===
+  def __init__(self, tag: str, attrs: dict[str, str] | None = None, parent = None) -> None:
+    """
+    Constructor -> Sets the element's tag and attributes
+
+    Args:
+      tag: Tag name of the element (lowercase)
+      attrs: Attributes of the element
+      parent: Parent 'HtmlElement' OR None for the root
+    """
+
+    self.tag: str = tag
+    self.attrs: dict[str, str] = attrs if (attrs != None) else {}
+    self.parent: HtmlElement | None = parent
+    self.children: list = [] # Child 'HtmlElement's and text strings, in document order
+
+
+  # === Function: _iterDescendants ===
+  def _iterDescendants(self):
+    """
+    Walk every element below this one in document order
+
+    Yields:
+      HtmlElement: Each descendant element
+    """
+
+    for child in self.children:
+      if (isinstance(child, HtmlElement)):
+        yield child
+        yield from child._iterDescendants()
+
+
+  # === Function: _collectText ===
+  def _collectText(self, tokens: list[str], in_pre: bool = False) -> None:
+    """
+    Add this element's visible text to a token list. Block boundaries are added as soft breaks
+
+    Params:
+      tokens: List to add text and break markers to
+      in_pre: Is this element inside a <pre> (whitespace is kept as-is)
+    """
+
+    # Hidden elements have no text
+    if (self.tag in self.HIDDEN_TAGS or "hidden" in self.attrs or "display:none" in self.attrs.get("style", "").replace(" ", "")):
+      return
+
+    if (self.tag == "br"):
+      tokens.append(self._HARD_BREAK)
+      return
+
+    is_block: bool = self.tag in self.BLOCK_TAGS
+    in_pre = in_pre or self.tag == "pre"
+
+    if (is_block):
+      tokens.append(self._SOFT_BREAK)
+
+    for child in self.children:
+      if (isinstance(child, HtmlElement)):
+        child._collectText(tokens, in_pre)
+      elif (in_pre):
+        tokens.append(child.replace("\xa0", self._NBSP))
+      else:
+        tokens.append(re.sub(r"[ \t\n\r\f]+", " ", child).replace("\xa0", self._NBSP))
+
+    if (is_block):
+      tokens.append(self._SOFT_BREAK)
+
+
+  # === Function: _serialize ===
+  def _serialize(self, parts: list[str]) -> None:
+    """
+    Add this element's html to a list of strings
+
+    Params:
+      parts: List to add html strings to
+    """
+
+    attrs: str = "".join(f' {name}="{html.escape(value, quote=True)}"' for name, value in self.attrs.items())
+    parts.append(f"<{self.tag}{attrs}>")
+
+    if (self.tag in self.VOID_TAGS):
+      return
+
+    self._serializeChildren(parts)
+    parts.append(f"</{self.tag}>")
+
+
+  # === Function: _serializeChildren ===
+  def _serializeChildren(self, parts: list[str]) -> None:
+    """
+    Add the html of this element's children to a list of strings
+
+    Params:
+      parts: List to add html strings to
+    """
+
+    for child in self.children:
+      if (isinstance(child, HtmlElement)):
+        child._serialize(parts)
+      elif (self.tag in ("script", "style")):
+        parts.append(child)
+      else:
+        parts.append(html.escape(child, quote=False))
+
+
+  # === Function: text ===
+  @property
+  def text(self) -> str:
+    """
+    Get the visible text of this element, laid out the same way selenium's 'WebElement.text' does (one line per
+    block element or <br>, whitespace collapsed, hidden elements skipped)
+
+    Returns:
+      str: The element's visible text
+    """
+
+    tokens: list[str] = []
+    self._collectText(tokens)
+
+    # Build the lines. Soft breaks only end a line that already has something on it
+    lines: list[str] = [""]
+    for token in tokens:
+      if (token == self._SOFT_BREAK):
+        if (lines[-1].strip(" ") != ""):
+          lines.append("")
+      elif (token == self._HARD_BREAK):
+        lines.append("")
+      else:
+        # NOTE: Only text inside a <pre> can span several lines
+        token_lines: list[str] = token.split("\n")
+        lines[-1] += token_lines[0]
+        lines.extend(token_lines[1:])
+
+    # Tidy each line and drop empty lines at the very start/end | NOTE: A line of only &nbsp; is kept as an empty line
+    lines = [re.sub(" +", " ", line.replace(self._NBSP, " ")).strip(" ") for line in lines]
+    while (len(lines) > 0 and lines[0] == ""):
+      lines.pop(0)
+    while (len(lines) > 0 and lines[-1] == ""):
+      lines.pop()
+
+    return "\n".join(lines)
+
+
+  # === Function: get_attribute ===
+  def get_attribute(self, name: str) -> str | None:
+    """
+    Get an attribute of this element, the same way selenium's 'WebElement.get_attribute' does
+
+    Params:
+      name: Name of the attribute. "innerHTML", "outerHTML" and "textContent" are also supported
+
+    Returns:
+      str | None: The attribute's value OR None if the element doesn't have it
+    """
+
+    parts: list[str] = []
+
+    if (name == "innerHTML"):
+      self._serializeChildren(parts)
+      return "".join(parts)
+
+    if (name == "outerHTML"):
+      self._serialize(parts)
+      return "".join(parts)
+
+    if (name == "textContent"):
+      return "".join(child if isinstance(child, str) else child.get_attribute("textContent") for child in self.children)
+
+    return self.attrs.get(name)
+
+
+  # === Function: find_elements ===
+  def find_elements(self, by: str, value: str) -> list:
+    """
+    Find every element below this one that matches a selector
+
+    Params:
+      by: Type of selector ("id", "class name", "css selector", "tag name")
+      value: The selector
+
+    Returns:
+      list[HtmlElement]: Matching elements in document order
+    """
+
+    selector: HtmlSelector = HtmlSelector.fromBy(by, value)
+    return [element for element in self._iterDescendants() if selector.matches(element)]
+
+
+  # === Function: find_element ===
+  def find_element(self, by: str, value: str):
+    """
+    Find the first element below this one that matches a selector
+
+    Params:
+      by: Type of selector ("id", "class name", "css selector", "tag name")
+      value: The selector
+
+    Returns:
+      HtmlElement: The first matching element
+
+    Raises:
+      NoSuchElementException: If no element matches
+    """
+
+    selector: HtmlSelector = HtmlSelector.fromBy(by, value)
+    for element in self._iterDescendants():
+      if (selector.matches(element)):
+        return element
+
+    raise NoSuchElementException(f"Unable to locate element: {by}={value}")
+
+
+# === Class: HtmlDocument ===
+class HtmlDocument(HtmlElement):
+  """
+  A parsed html page. Works like a seleniumbase driver for finding elements, without needing a browser.
+  """
+
+
+  # === Function: __init__ ===
+  def __init__(self, page_html: str) -> None:
+    """
+    Constructor -> Parses a page's html
+
+    Args:
+      page_html: Html of the whole page
+    """
+
+    super().__init__("#document")
+
+    """ The html as it was received, returned by 'page_source' """
+    self._page_html: str = page_html
+
+    parser: _HtmlTreeBuilder = _HtmlTreeBuilder(self)
+    parser.feed(page_html)
+    parser.close()
+
+
+  # === Function: title ===
+  @property
+  def title(self) -> str:
+    """
+    Get the page's <title>
+
+    Returns:
+      str: The title OR "" if the page doesn't have one
+    """
+
+    for element in self._iterDescendants():
+      if (element.tag == "title"):
+        return " ".join(element.get_attribute("textContent").split())
+
+    return ""
+
+
+  # === Function: page_source ===
+  @property
+  def page_source(self) -> str:
+    """
+    Get the html of the whole page, exactly as it was received (i.e. the 'FetchResult.html' it was parsed from), so
+    saved raw html can be parsed again the same way
+
+    Returns:
+      str: The page's html
+    """
+
+    return self._page_html
+
+
+# === Class: HtmlSelector ===
+class HtmlSelector():
+  """
+  A small css selector matcher. Supports tag, #id, .class, [attr], [attr=value], :first-child, :last-child and the
+  ' ', '>', '+' and '~' combinators, plus comma separated groups.
+  """
+
+
+  # === Subclass: UnsupportedSelectorError ===
+  class UnsupportedSelectorError(ValueError):
+    """
+    Raised for selectors that can only be evaluated by a real browser (i.e. xpath)
+    """
+
+
+  # === Constants ===
+  _TOKEN_REGEX = re.compile(r"""
+      (?P<tag>\*|[a-zA-Z][a-zA-Z0-9-]*)
+    | \#(?P<id>[\w-]+)
+    | \.(?P<class>[\w-]+)
+    | \[\s*(?P<attr>[\w-]+)\s*(?:(?P<op>[~|^$*]?=)\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<bare>[^\]\s]+)))?\s*\]
+    | :(?P<pseudo>first-child|last-child)
+    | (?P<comb>\s*[>+~]\s*|\s+)
+  """, re.VERBOSE)
+
+
+  # === Function: __init__ ===
+  def __init__(self, groups: list[list[tuple[str, dict]]]) -> None:
+    """
+    Constructor -> Sets the parsed selector
+
+    Args:
+      groups: One entry per comma separated group. Each group is a list of (combinator, compound) pairs
+    """
+
+    self._groups: list[list[tuple[str, dict]]] = groups
+
+
+  # === Function: fromBy ===
+  @staticmethod
+  def fromBy(by: str, value: str):
+    """
+    Build a selector from a selenium 'By' type and value
+
+    Params:
+      by: Type of selector ("id", "class name", "css selector", "tag name")
+      value: The selector
+
+    Returns:
+      HtmlSelector: The parsed selector
+
+    Raises:
+      HtmlSelector.UnsupportedSelectorError: If the selector type can't be evaluated without a browser
+    """
+
+    if (by == "id"):
+      return HtmlSelector([[(" ", {"id": value})]])
+    if (by == "class name"):
+      # NOTE: Selenium turns class names into '.name' css selectors, so 'a.b' means both classes
+      return HtmlSelector.parse("." + value.strip())
+    if (by == "tag name"):
+      return HtmlSelector([[(" ", {"tag": value.lower()})]])
+    if (by == "css selector"):
+      return HtmlSelector.parse(value)
+
+    raise HtmlSelector.UnsupportedSelectorError(f"Selector type '{by}' is not supported without a browser")
+
+
+  # === Function: parse ===
+  @staticmethod
+  def parse(selector: str):
+    """
+    Parse a css selector
+
+    Params:
+      selector: The css selector
+
+    Returns:
+      HtmlSelector: The parsed selector
+
+    Raises:
+      HtmlSelector.UnsupportedSelectorError: If the selector uses unsupported syntax
+    """
+
+    groups: list[list[tuple[str, dict]]] = []
+
+    for group_str in selector.split(","):
+      group: list[tuple[str, dict]] = []
+      combinator: str = " "
+      compound: dict = {}
+      position: int = 0
+      group_str = group_str.strip()
+
+      while (position < len(group_str)):
+        match = HtmlSelector._TOKEN_REGEX.match(group_str, position)
+        if (match == None):
+          raise HtmlSelector.UnsupportedSelectorError(f"Unsupported css selector: '{selector}'")
+        position = match.end()
+
+        if (match.group("comb") != None):
+          # Finish the current compound selector
+          group.append((combinator, compound))
+          combinator = match.group("comb").strip() or " "
+          compound = {}
+        elif (match.group("tag") != None):
+          compound["tag"] = match.group("tag").lower()
+        elif (match.group("id") != None):
+          compound["id"] = match.group("id")
+        elif (match.group("class") != None):
+          compound.setdefault("classes", []).append(match.group("class"))
+        elif (match.group("attr") != None):
+          attr_value = next((v for v in (match.group("dq"), match.group("sq"), match.group("bare")) if v != None), None)
+          compound.setdefault("attrs", []).append((match.group("attr"), match.group("op"), attr_value))
+        elif (match.group("pseudo") != None):
+          compound.setdefault("pseudos", []).append(match.group("pseudo"))
+
+      group.append((combinator, compound))
+      groups.append(group)
+
+    return HtmlSelector(groups)
+
+
+  # === Function: _matchesCompound ===
+  @staticmethod
+  def _matchesCompound(element: HtmlElement, compound: dict) -> bool:
+    """
+    Check if an element matches one compound selector (i.e. 'li.list-item[data-index]')
+
+    Params:
+      element: Element to check
+      compound: Parsed compound selector
+
+    Returns:
+      bool: True if the element matches
+    """
+
+    if (compound.get("tag", "*") not in ("*", element.tag)):
+      return False
+
+    if ("id" in compound and element.attrs.get("id") != compound["id"]):
+      return False
+
+    if ("classes" in compound):
+      element_classes: list[str] = element.attrs.get("class", "").split()
+      if (any(c not in element_classes for c in compound["classes"])):
+        return False
+
+    for name, op, value in compound.get("attrs", []):
+      attr_value: str | None = element.attrs.get(name)
+      if (attr_value == None):
+        return False
+      if (op == "=" and attr_value != value):
+        return False
+      if (op == "~=" and value not in attr_value.split()):
+        return False
+      if (op == "|=" and attr_value != value and not attr_value.startswith(value + "-")):
+        return False
+      if (op == "^=" and not attr_value.startswith(value)):
+        return False
+      if (op == "$=" and not attr_value.endswith(value)):
+        return False
+      if (op == "*=" and value not in attr_value):
+        return False
+
+    for pseudo in compound.get("pseudos", []):
+      siblings: list[HtmlElement] = HtmlSelector._elementSiblings(element)
+      if (pseudo == "first-child" and siblings[0] is not element):
+        return False
+      if (pseudo == "last-child" and siblings[-1] is not element):
+        return False
+
+    return True
+
+
+  # === Function: _elementSiblings ===
+  @staticmethod
+  def _elementSiblings(element: HtmlElement) -> list[HtmlElement]:
+    """
+    Get an element and its sibling elements (text is skipped)
+
+    Params:
+      element: Element to get the siblings of
+
+    Returns:
+      list[HtmlElement]: Every child element of the element's parent, including itself
+    """
+
+    if (element.parent == None):
+      return [element]
+
+    return [child for child in element.parent.children if isinstance(child, HtmlElement)]
+
+
+  # === Function: _matchesGroup ===
+  @staticmethod
+  def _matchesGroup(element: HtmlElement, group: list[tuple[str, dict]], index: int) -> bool:
+    """
+    Check if an element matches a selector group, from the compound at 'index' back to the start
+
+    Params:
+      element: Element to check against 'group[index]'
+      group: Parsed selector group
+      index: Index of the compound the element must match
+
+    Returns:
+      bool: True if the element (and its ancestors/siblings) match the group
+    """
+
+    combinator, compound = group[index]
+    if (not HtmlSelector._matchesCompound(element, compound)):
+      return False
+
+    if (index == 0):
+      return True
+
+    if (combinator == ">"):
+      return element.parent != None and HtmlSelector._matchesGroup(element.parent, group, index - 1)
+
+    if (combinator in ("+", "~")):
+      siblings: list[HtmlElement] = HtmlSelector._elementSiblings(element)
+      position: int = next(i for i, sibling in enumerate(siblings) if sibling is element)
+      previous_siblings: list[HtmlElement] = siblings[position - 1:position] if (combinator == "+") else siblings[:position]
+      return any(HtmlSelector._matchesGroup(sibling, group, index - 1) for sibling in previous_siblings)
+
+    # Descendant combinator
+    ancestor: HtmlElement | None = element.parent
+    while (ancestor != None):
+      if (HtmlSelector._matchesGroup(ancestor, group, index - 1)):
+        return True
+      ancestor = ancestor.parent
+
+    return False
+
+
+  # === Function: matches ===
+  def matches(self, element: HtmlElement) -> bool:
+    """
+    Check if an element matches this selector
+
+    Params:
+      element: Element to check
+
+    Returns:
+      bool: True if the element matches any of the selector's groups
+    """
+
+    return any(self._matchesGroup(element, group, len(group) - 1) for group in self._groups)
+
+
+# === Class: _HtmlTreeBuilder ===
+class _HtmlTreeBuilder(HTMLParser):
+  """
+  Builds a tree of 'HtmlElement's out of html, closing tags the way browsers do when the html leaves them open
+  """
+
+
+  # === Constants ===
+  """ Tags that close an open <p> when they start """
+  _CLOSES_P: set[str] = HtmlElement.BLOCK_TAGS - {"li", "dd", "dt", "tr"}
+
+  """ For tags that close an open tag of the same kind: the tags that stop the search for it """
+  _IMPLIED_END_SCOPES: dict[str, set[str]] = {
+    "li": {"ul", "ol"},
+    "dt": {"dl"},
+    "dd": {"dl"},
+    "option": {"select"},
+    "tr": {"table", "tbody", "thead", "tfoot"},
+    "td": {"tr"},
+    "th": {"tr"}
+  }
+
+
+  # === Function: __init__ ===
+  def __init__(self, root: HtmlElement) -> None:
+    """
+    Constructor -> Sets the element to build the tree under
+
+    Args:
+      root: Root element of the tree
+    """
+
+    super().__init__(convert_charrefs=True)
+    self._stack: list[HtmlElement] = [root]
+
+
+  # === Function: _closeTag ===
+  def _closeTag(self, tag: str, scope: set[str] | None = None) -> None:
+    """
+    Close the most recently opened tag with some name, along with anything left open inside it
+
+    Params:
+      tag: Tag to close
+      scope: If one of these tags is found first, nothing is closed
+    """
+
+    for i in range(len(self._stack) - 1, 0, -1):
+      if (self._stack[i].tag == tag):
+        del self._stack[i:]
+        return
+      if (scope != None and self._stack[i].tag in scope):
+        return
+
+
+  # === Function: handle_starttag ===
+  def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+    # Close tags that the html left open
+    if (tag in self._CLOSES_P):
+      self._closeTag("p", {"button", "table"} | self._IMPLIED_END_SCOPES["li"])
+    if (tag in self._IMPLIED_END_SCOPES):
+      self._closeTag(tag, self._IMPLIED_END_SCOPES[tag])
+
+    element: HtmlElement = HtmlElement(tag, {name: (value if value != None else "") for name, value in attrs}, self._stack[-1])
+    self._stack[-1].children.append(element)
+
+    if (tag not in HtmlElement.VOID_TAGS):
+      self._stack.append(element)
+
+
+  # === Function: handle_startendtag ===
+  def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+    self.handle_starttag(tag, attrs)
+
+    # Self-closing non-void tags (i.e. '<div/>') are closed right away
+    if (tag not in HtmlElement.VOID_TAGS):
+      self._closeTag(tag)
+
+
+  # === Function: handle_endtag ===
+  def handle_endtag(self, tag: str) -> None:
+    self._closeTag(tag)
+
+
+  # === Function: handle_data ===
+  def handle_data(self, data: str) -> None:
+    self._stack[-1].children.append(data)
@@ -0,0 +1,108 @@
+# Imports
+import threading
+from collections import deque
+from urllib.parse import urlsplit
+from src.common.utils import percentile
+
+
+# === Class: LatencyTracker ===
+class LatencyTracker():
+  """
+  Remembers how long a host's recent pages took to be ready, so waits can be sized from them instead of being fixed:
+  short for a fast site, longer for a slow one.
+
+  One tracker is shared per host (see 'LatencyTracker.getForHost'), so every scraper and worker learns from every
+  page loaded from the site.
+  """
+
+
+  # ******************************************** #
+  # ****************** Private ***************** #
+  # ******************************************** #
+
+
+  # === Constants ===
+  """ How many of the most recent pages are remembered """
+  _WINDOW_SIZE: int = 32
+
+
+  # === Variables ===
+  """ Host -> its tracker. Shared by every scraper """
+  _host_trackers: dict = {}
+  _host_trackers_lock: threading.Lock = threading.Lock()
+
+
+  # ******************************************** #
+  # ****************** Public ****************** #
+  # ******************************************** #
+
+
+  # === Function: __init__ ===
+  def __init__(self) -> None:
+    """
+    Constructor -> Starts with no pages recorded
+
+    NOTE: Use 'LatencyTracker.getForHost' so every scraper shares the same tracker
+    """
+
+    self._lock: threading.Lock = threading.Lock()
+    self._latencies: deque = deque(maxlen=self._WINDOW_SIZE)
+
+
+  # === Function: getForHost ===
+  @staticmethod
+  def getForHost(url: str):
+    """
+    Get the shared tracker for a url's host, creating it if needed
+
+    Params:
+      url: Any url on the host (or the host itself)
+
+    Returns:
+      LatencyTracker: The host's tracker
+    """
+
+    host: str = urlsplit(url).hostname or url
+
+    with LatencyTracker._host_trackers_lock:
+      if (host not in LatencyTracker._host_trackers):
+        LatencyTracker._host_trackers[host] = LatencyTracker()
+
+      return LatencyTracker._host_trackers[host]
+
+
+  # === Function: record ===
+  def record(self, seconds: float) -> None:
+    """
+    Record how long a page took to be ready
+
+    Params:
+      seconds: Time from starting to load the page until it was ready
+    """
+
+    with self._lock:
+      self._latencies.append(seconds)
+
+
+  # === Function: getWaitTime ===
+  def getWaitTime(self, percent: float, multiplier: float, min_seconds: float, max_seconds: float) -> float:
+    """
+    Get a wait time sized from the recent pages: a percentile of their latencies times a margin, within bounds
+
+    Params:
+      percent: Percentile of the recent latencies to use (0-100)
+      multiplier: Margin to multiply the percentile by
+      min_seconds: Shortest wait to give
+      max_seconds: Longest wait to give. Also used while no pages have been recorded
+
+    Returns:
+      float: Seconds to wait
+    """
+
+    with self._lock:
+      latencies: list[float] = sorted(self._latencies)
+
+    if (len(latencies) == 0):
+      return max_seconds
+
+    return min(max(percentile(latencies, percent) * multiplier, min_seconds), max_seconds)
@@ -0,0 +1,408 @@
+# Imports
+import bisect
+import threading
+from typing import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# === Class: LiveMetrics ===
+class LiveMetrics():
+  """
+  Process wide counters, histograms and gauges for every scrape running in this process, rendered in the Prometheus
+  text format by 'MetricsServer'. Everything is class level, so any scraper, worker or writer can report to it without
+  being handed an object.
+
+  Gauges are read when the endpoint is scraped, from functions registered by whatever owns the value (i.e. a queue's
+  length), so nothing has to be updated on the hot path.
+  """
+
+
+  # ******************************************** #
+  # ****************** Private ***************** #
+  # ******************************************** #
+
+
+  # === Constants ===
+  """ Upper bounds (seconds) of the latency histogram buckets """
+  _BUCKETS: tuple[float] = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+  # === Variables ===
+  _lock: threading.Lock = threading.Lock()
+
+  """ Metric name -> (type, help text) """
+  _descriptions: dict[str, tuple[str, str]] = {}
+
+  """ (name, labels) -> value """
+  _counters: dict[tuple[str, tuple], float] = {}
+
+  """ (name, labels) -> [count per bucket (+Inf last), sum, count] """
+  _histograms: dict[tuple[str, tuple], list] = {}
+
+  """ Handle -> (name, labels, function returning the current value) """
+  _gauge_functions: dict[int, tuple[str, tuple, Callable[[], float]]] = {}
+  _next_gauge_handle: int = 0
+
+
+  # === Function: _toLabels ===
+  @staticmethod
+  def _toLabels(labels: dict[str, str] | None) -> tuple:
+    """
+    Turn labels into a hashable, ordered key
+
+    Params:
+      labels: Label name -> value OR None
+
+    Returns:
+      tuple: Sorted (name, value) pairs
+    """
+
+    return tuple(sorted((labels or {}).items()))
+
+
+  # === Function: _formatLabels ===
+  @staticmethod
+  def _formatLabels(labels: tuple, extra: tuple = ()) -> str:
+    """
+    Format labels for the Prometheus text format
+
+    Params:
+      labels: Sorted (name, value) pairs
+      extra: More (name, value) pairs to add at the end (i.e. a histogram's 'le')
+
+    Returns:
+      str: i.e. '{host="booktoki.com",reason="fetch"}' OR "" if there are no labels
+    """
+
+    pairs: tuple = labels + extra
+    if (len(pairs) == 0):
+      return ""
+
+    escaped_pairs: list[str] = [
+      name + '="' + str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"' for name, value in pairs
+    ]
+    return "{" + ",".join(escaped_pairs) + "}"
+
+
+  # ******************************************** #
+  # ****************** Public ****************** #
+  # ******************************************** #
+
+
+  # === Function: describe ===
+  @staticmethod
+  def describe(name: str, metric_type: str, help_text: str) -> None:
+    """
+    Set a metric's type and help text, shown on the endpoint
+
+    Params:
+      name: Name of the metric
+      metric_type: "counter", "gauge" OR "histogram"
+      help_text: What the metric measures
+    """
+
+    with LiveMetrics._lock:
+      LiveMetrics._descriptions[name] = (metric_type, help_text)
+
+
+  # === Function: incrementCounter ===
+  @staticmethod
+  def incrementCounter(name: str, amount: float = 1.0, labels: dict[str, str] | None = None) -> None:
+    """
+    Add to a counter
+
+    Params:
+      name: Name of the counter
+      amount: How much to add
+      labels: Label name -> value
+    """
+
+    key: tuple = (name, LiveMetrics._toLabels(labels))
+
+    with LiveMetrics._lock:
+      LiveMetrics._counters[key] = LiveMetrics._counters.get(key, 0.0) + amount
+
+
+  # === Function: observeHistogram ===
+  @staticmethod
+  def observeHistogram(name: str, value: float, labels: dict[str, str] | None = None) -> None:
+    """
+    Add a value to a histogram
+
+    Params:
+      name: Name of the histogram
+      value: Value to add (seconds)
+      labels: Label name -> value
+    """
+
+    key: tuple = (name, LiveMetrics._toLabels(labels))
+
+    with LiveMetrics._lock:
+      histogram: list | None = LiveMetrics._histograms.get(key)
+      if (histogram == None):
+        histogram = [[0] * (len(LiveMetrics._BUCKETS) + 1), 0.0, 0]
+        LiveMetrics._histograms[key] = histogram
+
+      histogram[0][bisect.bisect_left(LiveMetrics._BUCKETS, value)] += 1
+      histogram[1] += value
+      histogram[2] += 1
+
+
+  # === Function: registerGauge ===
+  @staticmethod
+  def registerGauge(name: str, function: Callable[[], float], labels: dict[str, str] | None = None) -> int:
+    """
+    Report a gauge by calling a function whenever the endpoint is scraped. Gauges with the same name and labels (i.e.
+    the work queues of two pools) are added together
+
+    Params:
+      name: Name of the gauge
+      function: Returns the gauge's current value
+      labels: Label name -> value
+
+    Returns:
+      int: Handle to pass to 'unregisterGauge' once the value is gone
+    """
+
+    with LiveMetrics._lock:
+      handle: int = LiveMetrics._next_gauge_handle
+      LiveMetrics._next_gauge_handle += 1
+      LiveMetrics._gauge_functions[handle] = (name, LiveMetrics._toLabels(labels), function)
+
+    return handle
+
+
+  # === Function: unregisterGauge ===
+  @staticmethod
+  def unregisterGauge(handle: int) -> None:
+    """
+    Stop reporting a gauge
+
+    Params:
+      handle: Handle returned by 'registerGauge'
+    """
+
+    with LiveMetrics._lock:
+      LiveMetrics._gauge_functions.pop(handle, None)
+
+
+  # === Function: render ===
+  @staticmethod
+  def render() -> str:
+    """
+    Render every metric in the Prometheus text format (version 0.0.4)
+
+    Returns:
+      str: The metrics page
+    """
+
+    with LiveMetrics._lock:
+      descriptions: dict[str, tuple[str, str]] = dict(LiveMetrics._descriptions)
+      counters: dict[tuple[str, tuple], float] = dict(LiveMetrics._counters)
+      histograms: dict[tuple[str, tuple], list] = {key: [list(value[0]), value[1], value[2]] for key, value in LiveMetrics._histograms.items()}
+      gauge_functions: list[tuple[str, tuple, Callable[[], float]]] = list(LiveMetrics._gauge_functions.values())
+
+    # Gauge functions are called outside the lock, they may take locks of their own
+    gauges: dict[tuple[str, tuple], float] = {}
+    for name, labels, function in gauge_functions:
+      try:
+        gauges[(name, labels)] = gauges.get((name, labels), 0.0) + float(function())
+      except Exception:
+        continue
+
+    # Group every series under its metric name
+    lines_by_name: dict[str, list[str]] = {}
+
+    for (name, labels), value in list(counters.items()) + list(gauges.items()):
+      lines_by_name.setdefault(name, []).append(f"{name}{LiveMetrics._formatLabels(labels)} {value}")
+
+    for (name, labels), (bucket_counts, value_sum, count) in histograms.items():
+      lines: list[str] = lines_by_name.setdefault(name, [])
+      cumulative_count: int = 0
+      for upper_bound, bucket_count in zip(list(LiveMetrics._BUCKETS) + ["+Inf"], bucket_counts):
+        cumulative_count += bucket_count
+        lines.append(f"{name}_bucket{LiveMetrics._formatLabels(labels, (('le', upper_bound),))} {cumulative_count}")
+      lines.append(f"{name}_sum{LiveMetrics._formatLabels(labels)} {value_sum}")
+      lines.append(f"{name}_count{LiveMetrics._formatLabels(labels)} {count}")
+
+    output: list[str] = []
+    for name in sorted(lines_by_name):
+      if (name in descriptions):
+        output.append(f"# HELP {name} {descriptions[name][1]}")
+        output.append(f"# TYPE {name} {descriptions[name][0]}")
+      output.extend(sorted(lines_by_name[name]))
+
+    return "\n".join(output) + "\n"
+
+
+# === Class: _MetricsRequestHandler ===
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+  """
+  Serves 'LiveMetrics.render()' on '/metrics'
+  """
+
+
+  # === Function: do_GET ===
+  def do_GET(self) -> None:
+    if (self.path.split("?")[0] != "/metrics"):
+      self.send_error(404)
+      return
+
+    body: bytes = LiveMetrics.render().encode("utf-8")
+    self.send_response(200)
+    self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+    self.send_header("Content-Length", str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+
+  # === Function: log_message ===
+  def log_message(self, format: str, *args) -> None:
+    # Every scrape of the endpoint would otherwise be printed between the chapter logs
+    pass
+
+
+# === Class: MetricsServer ===
+class MetricsServer():
+  """
+  A small http server that exposes 'LiveMetrics' on 'http://<host>:<port>/metrics' for Prometheus (or anything that
+  reads its text format), so long unattended scrapes can be watched from a dashboard instead of their console.
+
+  Runs on a daemon thread. One server is shared per port (see 'MetricsServer.getForPort').
+  """
+
+
+  # === Subclass: Settings ===
+  class Settings():
+    """
+    Holds the values used to start the metrics server. Loaded from the '[MetricsSettings]' section of a scraper
+    settings file
+    """
+
+
+    # === Constants ===
+    HOST: str = "host"
+    PORT: str = "port"
+
+
+    # === Variables ===
+    host: str = "127.0.0.1" # NOTE: "0.0.0.0" lets other machines (i.e. a Prometheus server) read the endpoint
+    port: int = 0 # 0 means the endpoint is off
+
+
+    # === Function: loadFromConfigSection ===
+    def loadFromConfigSection(self, section) -> None:
+      """
+      Load the settings from a config file section. Missing values keep their defaults
+
+      Params:
+        section: configparser section ('[MetricsSettings]')
+      """
+
+      self.host = section.get(self.HOST, self.host).strip('"')
+      port: str = section.get(self.PORT, str(self.port)).strip('"')
+      self.port = int(port) if (port.isdigit()) else 0
+
+
+  # ******************************************** #
+  # ****************** Private ***************** #
+  # ******************************************** #
+
+
+  # === Variables ===
+  """ Port -> its running server. Shared by every scraper """
+  _port_servers: dict = {}
+  _port_servers_lock: threading.Lock = threading.Lock()
+
+
+  # ******************************************** #
+  # ****************** Public ****************** #
+  # ******************************************** #
+
+
+  # === Function: __init__ ===
+  def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+    """
+    Constructor -> Starts serving the metrics
+
+    NOTE: Use 'MetricsServer.getForPort' so a port is only served once per process
+
+    Args:
+      host: Address to listen on
+      port: Port to listen on (0 picks a free port, see 'getPort')
+    """
+
+    self._server: ThreadingHTTPServer = ThreadingHTTPServer((host, port), _MetricsRequestHandler)
+    self._server.daemon_threads = True
+    self._thread: threading.Thread = threading.Thread(target=self._server.serve_forever, name="MetricsServer", daemon=True)
+    self._thread.start()
+
+    print(f"Serving metrics on http://{host}:{self.getPort()}/metrics")
+
+
+  # === Function: getForPort ===
+  @staticmethod
+  def getForPort(settings: Settings):
+    """
+    Get the metrics server for the settings' port, starting it if needed
+
+    Params:
+      settings: Host and port to serve on
+
+    Returns:
+      MetricsServer | None: The running server OR None if the port is 0 (off) or couldn't be opened
+    """
+
+    if (settings.port == 0):
+      return None
+
+    with MetricsServer._port_servers_lock:
+      if (settings.port not in MetricsServer._port_servers):
+        try:
+          MetricsServer._port_servers[settings.port] = MetricsServer(settings.host, settings.port)
+        except OSError as e:
+          print(f"Could not serve metrics on port {settings.port}: {e}")
+          return None
+
+      return MetricsServer._port_servers[settings.port]
+
+
+  # === Function: close ===
+  def close(self) -> None:
+    """
+    Stop serving the metrics
+    """
+
+    self._server.shutdown()
+    self._server.server_close()
+
+
+  # ******************************************** #
+  # ************** Getters/Setters ************* #
+  # ******************************************** #
+
+
+  # === Function: getPort ===
+  def getPort(self) -> int:
+    """
+    Get the port the metrics are served on
+
+    Returns:
+      int: The port
+    """
+
+    return self._server.server_address[1]
+
+
+# Every metric the scrapers report
+LiveMetrics.describe("rawscrape_chapters_total", "counter", "Chapters scraped")
+LiveMetrics.describe("rawscrape_chapter_failures_total", "counter", "Chapters that could not be scraped, by reason")
+LiveMetrics.describe("rawscrape_challenges_total", "counter", "Chapters that ran into a challenge page")
+LiveMetrics.describe("rawscrape_text_bytes_total", "counter", "Bytes of chapter text scraped")
+LiveMetrics.describe("rawscrape_step_seconds_total", "counter", "Seconds spent on each step of scraping chapters")
+LiveMetrics.describe("rawscrape_fetch_seconds", "histogram", "Seconds to load a chapter page (rate limit sleeps not included)")
+LiveMetrics.describe("rawscrape_chapter_seconds", "histogram", "Seconds to scrape a chapter, every step included")
+LiveMetrics.describe("rawscrape_queue_depth", "gauge", "Chapters waiting in a queue")
+LiveMetrics.describe("rawscrape_rate_limit_rate", "gauge", "Requests per second the host's rate limiter allows")
+LiveMetrics.describe("rawscrape_rate_limit_tokens", "gauge", "Requests the host's rate limiter can send right away")
+LiveMetrics.describe("rawscrape_rate_limit_throttles_total", "counter", "Times the host throttled us (429 or a challenge page)")
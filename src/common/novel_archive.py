@@ -0,0 +1,561 @@
+# Imports
+import os
+import re
+import json
+import mmap
+import zlib
+import struct
+import threading
+
+
+# === Class: OutputFormats ===
+class OutputFormats():
+  """
+  Defines constants for how scraped chapters are stored in an output directory.
+  """
+
+  # === Constants ===
+  FILES: str = "files" # One 'NNNN.txt' file per chapter
+  ARCHIVE: str = "archive" # Every chapter packed into one 'NovelArchive' per novel
+
+  ALL: tuple[str] = (FILES, ARCHIVE)
+
+
+# === Class: NovelArchive ===
+class NovelArchive():
+  """
+  Stores every chapter of a novel in one file ('chapters.pack') instead of one small file per chapter, which is much
+  easier on inodes, backups and directory listings for a large library.
+
+  Each chapter is a compressed record appended to the end of the pack, so chapters can be added as they are scraped
+  without rewriting anything. An index ('chapters.idx') maps each chapter to its record's offset, and chapters are
+  read through a memory map, so reading chapter N never reads the rest of the pack. Saving a chapter again appends a
+  new record and the old one becomes dead space (see 'compact').
+
+  The index is only a shortcut: every record carries its chapter number, size and checksum, so if the index is lost or
+  behind the pack (i.e. after a crash), it is rebuilt from the records and any cut off record at the end is dropped.
+
+  One archive is shared per output directory (see 'NovelArchive.getForDirectory').
+  """
+
+
+  # ******************************************** #
+  # ****************** Private ***************** #
+  # ******************************************** #
+
+
+  # === Constants ===
+  _INDEX_FILENAME: str = "chapters.idx"
+  _VERSION: int = 1
+
+  """ Start of every pack file """
+  _FILE_MAGIC: bytes = b"RSPACK1\n"
+
+  """ Start of every record: magic, chapter number, compressed size, text size (utf-8 bytes), crc32 of the text """
+  _RECORD_MAGIC: bytes = b"CHAP"
+  _RECORD_HEADER: struct.Struct = struct.Struct("<4sIIII")
+
+  _COMPRESS_LEVEL: int = 6
+
+  """ Name of a saved chapter file ('NNNN.txt') """
+  _CHAPTER_FILENAME_PATTERN: re.Pattern = re.compile(r"^(\d+)\.txt$")
+
+  """ How many chapter files are packed per append when converting a directory """
+  _IMPORT_BATCH_SIZE: int = 256
+
+
+  # === Variables ===
+  """ Output directory (absolute path) -> its archive. Shared by every scraper """
+  _directory_archives: dict = {}
+  _directory_archives_lock: threading.Lock = threading.Lock()
+
+
+  # === Function: _scanRecords ===
+  def _scanRecords(self, start_offset: int) -> None:
+    """
+    Index every whole, valid record from an offset to the end of the pack, then cut off whatever is left (a record
+    that was being written when the scrape stopped)
+
+    NOTE: Must hold '_lock'
+
+    Params:
+      start_offset: Offset of the first record to read
+    """
+
+    recovered_count: int = 0
+    offset: int = start_offset
+
+    with open(self._pack_path, "r+b") as f:
+      pack_size: int = os.fstat(f.fileno()).st_size
+
+      # Not even the start of the pack made it to disk, so start it over
+      if (pack_size < len(self._FILE_MAGIC)):
+        f.truncate(0)
+        self._end_offset = 0
+        return
+
+      if (f.read(len(self._FILE_MAGIC)) != self._FILE_MAGIC):
+        raise ValueError(f"'{self._pack_path}' is not a novel archive")
+
+      while (offset + self._RECORD_HEADER.size <= pack_size):
+        f.seek(offset)
+        magic, chapter_num, stored_size, text_size, checksum = self._RECORD_HEADER.unpack(f.read(self._RECORD_HEADER.size))
+        data_offset: int = offset + self._RECORD_HEADER.size
+
+        if (magic != self._RECORD_MAGIC or data_offset + stored_size > pack_size):
+          break
+
+        # Only trust records whose text matches their checksum
+        try:
+          text_data: bytes = zlib.decompress(f.read(stored_size))
+        except zlib.error:
+          break
+        if (len(text_data) != text_size or zlib.crc32(text_data) != checksum):
+          break
+
+        self._entries[str(chapter_num)] = [data_offset, stored_size, text_size, checksum]
+        recovered_count += 1
+        offset = data_offset + stored_size
+
+      if (offset < pack_size):
+        print(f"Dropping {pack_size - offset} bytes of unreadable data at the end of '{self._pack_path}'.")
+        f.truncate(offset)
+
+    self._end_offset = offset
+
+    if (recovered_count > 0):
+      print(f"Recovered {recovered_count} chapter(s) missing from the index of '{self._pack_path}'.")
+    self._saveIndex()
+
+
+  # === Function: _saveIndex ===
+  def _saveIndex(self) -> None:
+    """
+    Write the index to disk. The file is replaced in one step, so a crash never leaves half an index
+
+    NOTE: Must hold '_lock'
+    """
+
+    data: dict = {
+      "version": self._VERSION,
+      "end_offset": self._end_offset,
+      "chapters": self._entries
+    }
+
+    temp_path: str = self._index_path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+      json.dump(data, f, separators=(",", ":"))
+    os.replace(temp_path, self._index_path)
+
+
+  # === Function: _closeMap ===
+  def _closeMap(self) -> None:
+    """
+    Close the memory map of the pack (i.e. before the pack is replaced, which Windows doesn't allow while it's mapped)
+
+    NOTE: Must hold '_lock'
+    """
+
+    if (self._map != None):
+      self._map.close()
+      self._map = None
+    if (self._map_file != None):
+      self._map_file.close()
+      self._map_file = None
+
+
+  # === Function: _getMap ===
+  def _getMap(self, end_offset: int) -> mmap.mmap:
+    """
+    Get a memory map of the pack that covers an offset, mapping it again if the pack grew since it was mapped
+
+    NOTE: Must hold '_lock'
+
+    Params:
+      end_offset: Offset the map has to reach
+
+    Returns:
+      mmap.mmap: Read only map of the pack
+    """
+
+    if (self._map == None or len(self._map) < end_offset):
+      self._closeMap()
+      self._map_file = open(self._pack_path, "rb")
+      self._map = mmap.mmap(self._map_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    return self._map
+
+
+  # ******************************************** #
+  # ****************** Public ****************** #
+  # ******************************************** #
+
+
+  # === Constants ===
+  """ Name of the pack file in an output directory """
+  ARCHIVE_FILENAME: str = "chapters.pack"
+
+
+  # === Function: __init__ ===
+  def __init__(self, output_directory: str) -> None:
+    """
+    Constructor -> Loads the archive in an output directory (or starts an empty one). Records missing from the index
+    are recovered from the pack
+
+    NOTE: Use 'NovelArchive.getForDirectory' so every scraper shares the same archive object
+
+    Args:
+      output_directory: Directory the novel is saved to
+    """
+
+    self._output_directory: str = output_directory
+    self._pack_path: str = os.path.join(output_directory, self.ARCHIVE_FILENAME)
+    self._index_path: str = os.path.join(output_directory, self._INDEX_FILENAME)
+    self._lock: threading.Lock = threading.Lock()
+    self._map: mmap.mmap | None = None
+    self._map_file = None
+
+    """ Chapter number (str) -> [offset, compressed size, text size, crc32] of its newest record """
+    self._entries: dict[str, list[int]] = {}
+
+    """ Offset the index covers the pack up to """
+    self._end_offset: int = 0
+
+    if (not os.path.exists(self._pack_path)):
+      return
+
+    if (os.path.exists(self._index_path)):
+      try:
+        with open(self._index_path, "r", encoding="utf-8") as f:
+          data: dict = json.load(f)
+
+        self._entries = data.get("chapters", {})
+        self._end_offset = data.get("end_offset", 0)
+      except (OSError, ValueError) as e:
+        print(f"Could not read archive index '{self._index_path}', rebuilding it: {e}")
+        self._entries = {}
+        self._end_offset = 0
+
+    # Rebuild the whole index if it's missing or claims more than the pack holds, otherwise only read what it missed
+    with self._lock:
+      pack_size: int = os.path.getsize(self._pack_path)
+      if (self._end_offset < len(self._FILE_MAGIC) or self._end_offset > pack_size):
+        self._entries = {}
+        self._scanRecords(len(self._FILE_MAGIC))
+      elif (self._end_offset < pack_size):
+        self._scanRecords(self._end_offset)
+
+
+  # === Function: getForDirectory ===
+  @staticmethod
+  def getForDirectory(output_directory: str):
+    """
+    Get the shared archive for an output directory, loading it if needed
+
+    Params:
+      output_directory: Directory the novel is saved to
+
+    Returns:
+      NovelArchive: The directory's archive
+    """
+
+    key: str = os.path.abspath(output_directory)
+
+    with NovelArchive._directory_archives_lock:
+      if (key not in NovelArchive._directory_archives):
+        NovelArchive._directory_archives[key] = NovelArchive(output_directory)
+
+      return NovelArchive._directory_archives[key]
+
+
+  # === Function: existsInDirectory ===
+  @staticmethod
+  def existsInDirectory(output_directory: str) -> bool:
+    """
+    Check if an output directory has an archive
+
+    Params:
+      output_directory: Directory to check
+
+    Returns:
+      bool: True if the directory has a pack file
+    """
+
+    return os.path.exists(os.path.join(output_directory, NovelArchive.ARCHIVE_FILENAME))
+
+
+  # === Function: append ===
+  def append(self, chapter_num: int, chapter_text: str, fsync: bool = True) -> None:
+    """
+    Add a chapter to the end of the archive, replacing any earlier copy of it
+
+    Params:
+      chapter_num: Number of the chapter
+      chapter_text: Text of the chapter
+      fsync: Should the pack be on disk before the chapter is indexed
+    """
+
+    self.appendMany([(chapter_num, chapter_text)], fsync)
+
+
+  # === Function: appendMany ===
+  def appendMany(self, chapters: list[tuple[int, str]], fsync: bool = True) -> None:
+    """
+    Add several chapters to the end of the archive with one write, one fsync and one index write
+
+    Params:
+      chapters: (chapter number, text) of each chapter
+      fsync: Should the pack be on disk before the chapters are indexed
+    """
+
+    # Compress outside the lock, it's the slow part
+    records: list[tuple[int, bytes, int, int]] = []
+    for chapter_num, chapter_text in chapters:
+      text_data: bytes = chapter_text.encode("utf-8")
+      records.append((chapter_num, zlib.compress(text_data, self._COMPRESS_LEVEL), len(text_data), zlib.crc32(text_data)))
+
+    with self._lock:
+      new_entries: dict[str, list[int]] = {}
+
+      with open(self._pack_path, "ab") as f:
+        offset: int = f.seek(0, os.SEEK_END)
+        if (offset == 0):
+          f.write(self._FILE_MAGIC)
+          offset = len(self._FILE_MAGIC)
+
+        for chapter_num, stored_data, text_size, checksum in records:
+          f.write(self._RECORD_HEADER.pack(self._RECORD_MAGIC, chapter_num, len(stored_data), text_size, checksum))
+          f.write(stored_data)
+
+          data_offset: int = offset + self._RECORD_HEADER.size
+          new_entries[str(chapter_num)] = [data_offset, len(stored_data), text_size, checksum]
+          offset = data_offset + len(stored_data)
+
+        f.flush()
+        if (fsync):
+          os.fsync(f.fileno())
+
+      self._entries.update(new_entries)
+      self._end_offset = offset
+      self._saveIndex()
+
+
+  # === Function: readChapter ===
+  def readChapter(self, chapter_num: int) -> str | None:
+    """
+    Read a chapter's text
+
+    Params:
+      chapter_num: Number of the chapter
+
+    Returns:
+      str | None: The chapter's text OR None if it isn't in the archive
+    """
+
+    with self._lock:
+      entry: list[int] | None = self._entries.get(str(chapter_num))
+      if (entry == None):
+        return None
+
+      offset, stored_size, text_size, checksum = entry
+      stored_data: bytes = self._getMap(offset + stored_size)[offset:offset + stored_size]
+
+    text_data: bytes = zlib.decompress(stored_data)
+    if (len(text_data) != text_size or zlib.crc32(text_data) != checksum):
+      print(f"Chapter #{chapter_num} in '{self._pack_path}' is damaged.")
+      return None
+
+    return text_data.decode("utf-8")
+
+
+  # === Function: compact ===
+  def compact(self) -> int:
+    """
+    Rewrite the pack with only the newest record of each chapter, in chapter order, dropping the space used by
+    chapters that were saved again (i.e. after a reprocess). The pack is replaced in one step
+
+    Returns:
+      int: Bytes freed
+    """
+
+    with self._lock:
+      if (not os.path.exists(self._pack_path)):
+        return 0
+
+      self._closeMap()
+
+      old_size: int = os.path.getsize(self._pack_path)
+      new_entries: dict[str, list[int]] = {}
+      temp_path: str = self._pack_path + ".tmp"
+
+      with open(self._pack_path, "rb") as old_f, open(temp_path, "wb") as new_f:
+        new_f.write(self._FILE_MAGIC)
+        offset: int = len(self._FILE_MAGIC)
+
+        for key in sorted(self._entries, key=int):
+          data_offset, stored_size, text_size, checksum = self._entries[key]
+          old_f.seek(data_offset)
+
+          new_f.write(self._RECORD_HEADER.pack(self._RECORD_MAGIC, int(key), stored_size, text_size, checksum))
+          new_f.write(old_f.read(stored_size))
+
+          new_entries[key] = [offset + self._RECORD_HEADER.size, stored_size, text_size, checksum]
+          offset += self._RECORD_HEADER.size + stored_size
+
+        new_f.flush()
+        os.fsync(new_f.fileno())
+
+      os.replace(temp_path, self._pack_path)
+      self._entries = new_entries
+      self._end_offset = offset
+      self._saveIndex()
+
+    return old_size - offset
+
+
+  # === Function: importChapterFiles ===
+  def importChapterFiles(self, remove_files: bool = False) -> list[int]:
+    """
+    Pack every chapter file ('NNNN.txt') in the output directory into the archive
+
+    Params:
+      remove_files: Should the chapter files be deleted once they are packed
+
+    Returns:
+      list[int]: Chapters that were packed, in order
+    """
+
+    chapter_filenames: dict[int, str] = {}
+    for filename in os.listdir(self._output_directory):
+      filename_match = self._CHAPTER_FILENAME_PATTERN.match(filename)
+      if (filename_match != None):
+        chapter_filenames[int(filename_match.group(1))] = filename
+
+    chapter_nums: list[int] = sorted(chapter_filenames)
+
+    # Pack in batches so a large novel is never in memory at once
+    for i in range(0, len(chapter_nums), self._IMPORT_BATCH_SIZE):
+      chapters: list[tuple[int, str]] = []
+      for chapter_num in chapter_nums[i:i + self._IMPORT_BATCH_SIZE]:
+        with open(os.path.join(self._output_directory, chapter_filenames[chapter_num]), "r", encoding="utf-8") as f:
+          chapters.append((chapter_num, f.read()))
+
+      self.appendMany(chapters)
+
+    # Only delete the files once every chapter is safely packed
+    if (remove_files):
+      for chapter_num in chapter_nums:
+        os.remove(os.path.join(self._output_directory, chapter_filenames[chapter_num]))
+
+    return chapter_nums
+
+
+  # === Function: exportChapterFiles ===
+  def exportChapterFiles(self, destination_directory: str | None = None) -> list[int]:
+    """
+    Write every chapter in the archive out as a chapter file ('NNNN.txt')
+
+    Params:
+      destination_directory: Directory to write the chapter files to (Defaults to the archive's output directory)
+
+    Returns:
+      list[int]: Chapters that were written, in order
+    """
+
+    destination_directory = destination_directory if (destination_directory != None) else self._output_directory
+    os.makedirs(destination_directory, exist_ok=True)
+
+    exported_nums: list[int] = []
+    for chapter_num in self.getChapterNums():
+      chapter_text: str | None = self.readChapter(chapter_num)
+      if (chapter_text == None):
+        continue
+
+      # Written in one step, like scraped chapters
+      path: str = os.path.join(destination_directory, f"{str(chapter_num).zfill(4)}.txt")
+      with open(path + ".tmp", "wb") as f:
+        f.write(chapter_text.encode("utf-8"))
+      os.replace(path + ".tmp", path)
+      exported_nums.append(chapter_num)
+
+    return exported_nums
+
+
+  # === Function: close ===
+  def close(self) -> None:
+    """
+    Release the archive's memory map. The archive can still be used afterwards, it's mapped again when needed
+    """
+
+    with self._lock:
+      self._closeMap()
+
+
+  # ******************************************** #
+  # ************** Getters/Setters ************* #
+  # ******************************************** #
+
+
+  # === Function: hasChapter ===
+  def hasChapter(self, chapter_num: int) -> bool:
+    """
+    Check if a chapter is in the archive
+
+    Params:
+      chapter_num: Number of the chapter
+
+    Returns:
+      bool: True if the chapter is in the archive
+    """
+
+    with self._lock:
+      return str(chapter_num) in self._entries
+
+
+  # === Function: getChapterSize ===
+  def getChapterSize(self, chapter_num: int) -> int | None:
+    """
+    Get the size of a chapter's text, without reading it
+
+    Params:
+      chapter_num: Number of the chapter
+
+    Returns:
+      int | None: Size of the chapter's text (utf-8 bytes) OR None if it isn't in the archive
+    """
+
+    with self._lock:
+      entry: list[int] | None = self._entries.get(str(chapter_num))
+
+    return entry[2] if (entry != None) else None
+
+
+  # === Function: getChapterChecksum ===
+  def getChapterChecksum(self, chapter_num: int) -> int | None:
+    """
+    Get the crc32 of a chapter's text, without reading it (i.e. to tell if the chapter changed)
+
+    Params:
+      chapter_num: Number of the chapter
+
+    Returns:
+      int | None: crc32 of the chapter's text OR None if it isn't in the archive
+    """
+
+    with self._lock:
+      entry: list[int] | None = self._entries.get(str(chapter_num))
+
+    return entry[3] if (entry != None) else None
+
+
+  # === Function: getChapterNums ===
+  def getChapterNums(self) -> list[int]:
+    """
+    Get every chapter in the archive
+
+    Returns:
+      list[int]: Chapter numbers, in order
+    """
+
+    with self._lock:
+      return sorted(int(key) for key in self._entries)
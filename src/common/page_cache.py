@@ -0,0 +1,479 @@
+# Imports
+import os
+import gzip
+import json
+import time
+import atexit
+import hashlib
+import tempfile
+import threading
+import contextlib
+from src.common.fetch_backends import FetchResult
+
+
+# === Class: PageCache ===
+class PageCache():
+  """
+  An on-disk cache of raw page html. Pages are stored by url, along with their ETag/Last-Modified headers so they can
+  be revalidated with a conditional request. The html itself is stored once per content hash (gzipped), so pages with
+  the same content share one file.
+
+  The cache is kept under a size limit by evicting the least recently used pages. In replay mode pages only come from
+  the cache and nothing is sent over the network, so a whole novel can be re-extracted or reformatted offline.
+
+  One cache is shared per directory (see 'PageCache.getForSettings'), so every scraper and worker can use it at once.
+  The index is written at most every '_SAVE_INTERVAL' seconds (and when the program exits, see 'flushAll'), not on
+  every page.
+  """
+
+
+  # === Subclass: Modes ===
+  class Modes():
+    """
+    Holds constants for how the page cache is used
+    """
+
+    OFF: str = "off" # Pages are never cached
+    ON: str = "on" # Pages are cached and revalidated with conditional requests
+    REPLAY: str = "replay" # Pages only come from the cache, nothing is loaded over the network
+
+    ALL: tuple[str] = (OFF, ON, REPLAY)
+
+
+  # === Subclass: Settings ===
+  class Settings():
+    """
+    Holds the values used to set up a page cache. Loaded from the '[CacheSettings]' section of a scraper settings file
+    """
+
+
+    # === Constants ===
+    MODE: str = "mode"
+    DIRECTORY: str = "directory"
+    MAX_SIZE_MB: str = "max_size_mb"
+
+
+    # === Variables ===
+    mode: str = "off" # NOTE: Use PageCache.Modes.XXX
+    directory: str = "downloaded_files/page_cache"
+    max_size_mb: float = 512.0 # Most disk space the cached pages can use before the least recently used are evicted
+
+
+    # === Function: loadFromConfigSection ===
+    def loadFromConfigSection(self, section) -> None:
+      """
+      Load the settings from a config file section. Missing values keep their defaults
+
+      Params:
+        section: configparser section ('[CacheSettings]')
+      """
+
+      self.mode = section.get(self.MODE, self.mode).strip('"')
+      self.directory = section.get(self.DIRECTORY, self.directory).strip('"')
+      self.max_size_mb = float(section.get(self.MAX_SIZE_MB, str(self.max_size_mb)).strip('"'))
+
+      # Unknown modes turn the cache off instead of failing the scrape
+      if (self.mode not in PageCache.Modes.ALL):
+        print(f"Unknown cache mode '{self.mode}', defaulting to '{PageCache.Modes.OFF}'.")
+        self.mode = PageCache.Modes.OFF
+
+
+  # ******************************************** #
+  # ****************** Private ***************** #
+  # ******************************************** #
+
+
+  # === Constants ===
+  _INDEX_FILENAME: str = "index.json"
+  _BLOB_DIRECTORY: str = "blobs"
+  _VERSION: int = 1
+
+  """ Gzip level for stored pages. Lower than the default since pages are written far more often than read """
+  _COMPRESS_LEVEL: int = 6
+
+  """ Fewest seconds between two writes of the index. A page cached since the last write is only lost on a crash """
+  _SAVE_INTERVAL: float = 2.0
+
+
+  # === Variables ===
+  """ Cache directory (absolute path) -> its cache. Shared by every scraper """
+  _directory_caches: dict = {}
+  _directory_caches_lock: threading.Lock = threading.Lock()
+
+
+  # === Function: _getBlobPath ===
+  def _getBlobPath(self, content_hash: str) -> str:
+    """
+    Get the path of the file that holds a page's html
+
+    Params:
+      content_hash: sha256 of the page's html
+
+    Returns:
+      str: Path of the gzipped html file
+    """
+
+    return os.path.join(self._directory, self._BLOB_DIRECTORY, content_hash[:2], content_hash + ".html.gz")
+
+
+  # === Function: _releaseBlob ===
+  def _releaseBlob(self, content_hash: str, size: int) -> None:
+    """
+    Drop one page's reference to an html file, deleting the file if no other page shares it
+
+    NOTE: Must hold '_lock'
+
+    Params:
+      content_hash: sha256 of the html
+      size: Size of the html file, in bytes
+    """
+
+    self._blob_references[content_hash] -= 1
+    if (self._blob_references[content_hash] > 0):
+      return
+
+    del self._blob_references[content_hash]
+    self._total_size -= size
+
+    try:
+      os.remove(self._getBlobPath(content_hash))
+    except OSError:
+      pass
+
+
+  # === Function: _removeEntry ===
+  def _removeEntry(self, url: str) -> None:
+    """
+    Remove a page from the cache
+
+    NOTE: Must hold '_lock'
+
+    Params:
+      url: Url of the page to remove
+    """
+
+    entry: dict = self._entries.pop(url)
+    self._releaseBlob(entry["hash"], entry["size"])
+
+
+  # === Function: _evict ===
+  def _evict(self) -> None:
+    """
+    Remove the least recently used pages until the cache fits in its size limit
+
+    NOTE: Must hold '_lock'
+    """
+
+    max_size: float = self._settings.max_size_mb * 1024 * 1024
+    if (self._total_size <= max_size):
+      return
+
+    # Oldest first
+    for url in sorted(self._entries, key=lambda key: self._entries[key]["last_access"]):
+      if (self._total_size <= max_size):
+        break
+
+      self._removeEntry(url)
+      self._eviction_count += 1
+
+
+  # === Function: _writeFile ===
+  def _writeFile(self, path: str, data: bytes) -> None:
+    """
+    Write a file in one step, through a temporary file with a unique name, so neither a crash nor another process
+    writing the same file at once ever leaves half of it
+
+    Params:
+      path: Path of the file
+      data: Data to write
+    """
+
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+      with os.fdopen(fd, "wb") as f:
+        f.write(data)
+      os.replace(temp_path, path)
+    except BaseException:
+      with contextlib.suppress(OSError):
+        os.remove(temp_path)
+      raise
+
+
+  # === Function: _save ===
+  def _save(self) -> None:
+    """
+    Write the index to disk. The file is replaced in one step, so a crash never leaves half an index
+
+    NOTE: Must hold '_lock'
+    """
+
+    data: dict = {
+      "version": self._VERSION,
+      "entries": self._entries
+    }
+
+    self._writeFile(self._index_path, json.dumps(data, ensure_ascii=False).encode("utf-8"))
+
+    self._dirty = False
+    self._last_save_time = time.monotonic()
+
+
+  # === Function: _changed ===
+  def _changed(self) -> None:
+    """
+    Record that a page was added or removed, writing the index if the last write was at least '_SAVE_INTERVAL'
+    seconds ago
+
+    NOTE: Must hold '_lock'
+    """
+
+    self._dirty = True
+
+    if (time.monotonic() - self._last_save_time >= self._SAVE_INTERVAL):
+      self._save()
+
+
+  # ******************************************** #
+  # ****************** Public ****************** #
+  # ******************************************** #
+
+
+  # === Function: __init__ ===
+  def __init__(self, settings: Settings | None = None) -> None:
+    """
+    Constructor -> Loads the cache index in the settings' directory (or starts an empty one)
+
+    NOTE: Use 'PageCache.getForSettings' so every scraper shares the same cache object
+
+    Args:
+      settings: Mode, directory and size limit to use (Defaults to 'PageCache.Settings()')
+    """
+
+    self._settings: PageCache.Settings = settings if (settings != None) else PageCache.Settings()
+    self._directory: str = self._settings.directory
+    self._index_path: str = os.path.join(self._directory, self._INDEX_FILENAME)
+    self._lock: threading.Lock = threading.Lock()
+
+    """ Unsaved changes, and when the index was last written (See '_changed') """
+    self._dirty: bool = False
+    self._last_save_time: float = 0.0
+
+    """ Url -> hash, size, etag, last_modified, content_type and last_access of the cached page """
+    self._entries: dict[str, dict] = {}
+
+    """ Content hash -> how many urls share that html file """
+    self._blob_references: dict[str, int] = {}
+    self._total_size: int = 0
+
+    self._hit_count: int = 0
+    self._miss_count: int = 0
+    self._eviction_count: int = 0
+
+    os.makedirs(os.path.join(self._directory, self._BLOB_DIRECTORY), exist_ok=True)
+
+    if (os.path.exists(self._index_path)):
+      try:
+        with open(self._index_path, "r", encoding="utf-8") as f:
+          self._entries = json.load(f).get("entries", {})
+      except (OSError, ValueError) as e:
+        print(f"Could not read page cache index '{self._index_path}', starting a new one: {e}")
+
+    for entry in self._entries.values():
+      if (entry["hash"] not in self._blob_references):
+        self._blob_references[entry["hash"]] = 0
+        self._total_size += entry["size"]
+      self._blob_references[entry["hash"]] += 1
+
+
+  # === Function: getForSettings ===
+  @staticmethod
+  def getForSettings(settings: Settings):
+    """
+    Get the shared page cache for the settings' directory, loading it if needed
+
+    NOTE: The mode isn't part of the shared cache, each scraper decides if it replays from the cache
+
+    Params:
+      settings: Settings to create the cache with. Only the directory is used if the cache already exists
+
+    Returns:
+      PageCache: The directory's page cache
+    """
+
+    key: str = os.path.abspath(settings.directory)
+
+    with PageCache._directory_caches_lock:
+      if (key not in PageCache._directory_caches):
+        PageCache._directory_caches[key] = PageCache(settings)
+
+      return PageCache._directory_caches[key]
+
+
+  # === Function: flushAll ===
+  @staticmethod
+  def flushAll() -> None:
+    """
+    Write the index of every cache with unsaved changes. Called when the program exits
+    """
+
+    with PageCache._directory_caches_lock:
+      caches: list[PageCache] = list(PageCache._directory_caches.values())
+
+    for cache in caches:
+      try:
+        cache.flush()
+      except OSError as e:
+        print(f"Could not save page cache index '{cache._index_path}': {e}")
+
+
+  # === Function: get ===
+  def get(self, url: str) -> FetchResult | None:
+    """
+    Get a cached page
+
+    Params:
+      url: Url of the page
+
+    Returns:
+      FetchResult | None: The cached page (with a 200 status) OR None if it isn't cached
+    """
+
+    with self._lock:
+      entry: dict | None = self._entries.get(url)
+
+      if (entry == None):
+        self._miss_count += 1
+        return None
+
+      entry["last_access"] = time.time()
+      self._dirty = True
+
+    try:
+      with open(self._getBlobPath(entry["hash"]), "rb") as f:
+        page_html: str = gzip.decompress(f.read()).decode("utf-8")
+    except (OSError, EOFError, gzip.BadGzipFile) as e:
+      # The html file went missing or is damaged, so forget the page
+      print(f"Cached page for {url} could not be read, removing it: {e}")
+      with self._lock:
+        if (url in self._entries):
+          self._removeEntry(url)
+        self._miss_count += 1
+        self._dirty = True
+      return None
+
+    with self._lock:
+      self._hit_count += 1
+
+    headers: dict[str, str] = {"content-type": entry.get("content_type") or "text/html; charset=utf-8"}
+    return FetchResult(url, 200, headers, page_html, 0.0)
+
+
+  # === Function: getRevalidationHeaders ===
+  def getRevalidationHeaders(self, url: str) -> dict[str, str]:
+    """
+    Get the headers for a conditional request, so the server can answer '304 Not Modified' if the cached page is
+    still current
+
+    Params:
+      url: Url of the page
+
+    Returns:
+      dict[str, str]: 'If-None-Match'/'If-Modified-Since' headers (Empty if the page isn't cached or has neither)
+    """
+
+    with self._lock:
+      entry: dict | None = self._entries.get(url)
+
+    headers: dict[str, str] = {}
+    if (entry != None and entry.get("etag")):
+      headers["If-None-Match"] = entry["etag"]
+    if (entry != None and entry.get("last_modified")):
+      headers["If-Modified-Since"] = entry["last_modified"]
+
+    return headers
+
+
+  # === Function: put ===
+  def put(self, url: str, result: FetchResult) -> None:
+    """
+    Cache a loaded page. Pages with the same html share one file
+
+    Params:
+      url: Url the page was requested with (Redirected pages are cached under the requested url)
+      result: The loaded page
+    """
+
+    encoded_html: bytes = result.html.encode("utf-8")
+    content_hash: str = hashlib.sha256(encoded_html).hexdigest()
+    blob_path: str = self._getBlobPath(content_hash)
+
+    # NOTE: The lock is held while writing, so an eviction can't delete the html file before it's referenced
+    with self._lock:
+      # Only write the html if no other page has the same content | NOTE: Written in one step, like the index
+      if (not os.path.exists(blob_path)):
+        os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+        self._writeFile(blob_path, gzip.compress(encoded_html, compresslevel=self._COMPRESS_LEVEL))
+
+      blob_size: int = os.path.getsize(blob_path)
+
+      # Reference the new html before letting go of the old one, in case they're the same file
+      if (content_hash not in self._blob_references):
+        self._blob_references[content_hash] = 0
+        self._total_size += blob_size
+      self._blob_references[content_hash] += 1
+
+      previous_entry: dict | None = self._entries.get(url)
+      if (previous_entry != None):
+        self._releaseBlob(previous_entry["hash"], previous_entry["size"])
+
+      self._entries[url] = {
+        "hash": content_hash,
+        "size": blob_size,
+        "etag": result.headers.get("etag"),
+        "last_modified": result.headers.get("last-modified"),
+        "content_type": result.headers.get("content-type"),
+        "last_access": time.time()
+      }
+
+      self._evict()
+      self._changed()
+
+
+  # === Function: flush ===
+  def flush(self) -> None:
+    """
+    Write the index to disk if it changed since the last write (i.e. pages were cached since, or only read, which
+    updates their last access time)
+    """
+
+    with self._lock:
+      if (self._dirty):
+        self._save()
+
+
+  # ******************************************** #
+  # ************** Getters/Setters ************* #
+  # ******************************************** #
+
+
+  # === Function: getState ===
+  def getState(self) -> dict:
+    """
+    Get a snapshot of the cache's state
+
+    Returns:
+      dict: Cached pages, bytes on disk, hits, misses and evictions
+    """
+
+    with self._lock:
+      return {
+        "page_count": len(self._entries),
+        "size_bytes": self._total_size,
+        "hit_count": self._hit_count,
+        "miss_count": self._miss_count,
+        "eviction_count": self._eviction_count
+      }
+
+
+# Save the last changes of every cache's index when the program exits
+atexit.register(PageCache.flushAll)
@@ -0,0 +1,261 @@
+# Imports
+import time
+import random
+import asyncio
+import threading
+from urllib.parse import urlsplit
+from src.common.metrics_server import LiveMetrics
+
+
+# === Class: RateLimiter ===
+class RateLimiter():
+  """
+  A token bucket that limits how often requests are sent to one host. Tokens refill continuously, so time spent
+  loading a page counts towards the wait before the next one.
+
+  The rate adapts to the site: it is cut every time a request is throttled (HTTP 429 or a challenge page) and slowly
+  raised again while requests keep succeeding.
+
+  One limiter is shared per host (see 'RateLimiter.getForHost'), so every scraper, worker and fetch backend that talks
+  to a site draws from the same budget.
+  """
+
+
+  # === Subclass: Settings ===
+  class Settings():
+    """
+    Holds the values used to set up a rate limiter. Loaded from the '[RateLimitSettings]' section of a scraper
+    settings file
+    """
+
+
+    # === Constants ===
+    RATE: str = "rate"
+    BURST: str = "burst"
+    JITTER: str = "jitter"
+    MIN_RATE: str = "min_rate"
+    MAX_RATE: str = "max_rate"
+
+
+    # === Variables ===
+    rate: float = 0.15 # Requests per second to start at (About one request every 6.7 seconds)
+    burst: float = 1.0 # Most requests that can be sent back to back after a quiet period
+    jitter: float = 0.3 # Extra random wait, as a fraction of the time between requests
+    min_rate: float = 0.02 # Slowest the rate can be cut to after being throttled
+    max_rate: float = 0.3 # Fastest the rate can be raised to while requests succeed
+
+
+    # === Function: loadFromConfigSection ===
+    def loadFromConfigSection(self, section) -> None:
+      """
+      Load the settings from a config file section. Missing values keep their defaults
+
+      Params:
+        section: configparser section ('[RateLimitSettings]')
+      """
+
+      self.rate = float(section.get(self.RATE, str(self.rate)).strip('"'))
+      self.burst = float(section.get(self.BURST, str(self.burst)).strip('"'))
+      self.jitter = float(section.get(self.JITTER, str(self.jitter)).strip('"'))
+      self.min_rate = float(section.get(self.MIN_RATE, str(self.min_rate)).strip('"'))
+      self.max_rate = float(section.get(self.MAX_RATE, str(self.max_rate)).strip('"'))
+
+
+  # ******************************************** #
+  # ****************** Private ***************** #
+  # ******************************************** #
+
+
+  # === Constants ===
+  """ How much the rate is multiplied by when a request is throttled """
+  _BACKOFF_FACTOR: float = 0.5
+
+  """ How much the rate is multiplied by after '_RECOVERY_STREAK' successful requests in a row """
+  _RECOVERY_FACTOR: float = 1.1
+  _RECOVERY_STREAK: int = 10
+
+
+  # === Variables ===
+  """ Host -> the rate limiter for that host. Shared by every scraper """
+  _host_limiters: dict = {}
+  _host_limiters_lock: threading.Lock = threading.Lock()
+
+
+  # === Function: _reserve ===
+  def _reserve(self) -> float:
+    """
+    Take a token from the bucket, going into debt if there isn't one yet
+
+    Returns:
+      float: How many seconds to wait before sending the request
+    """
+
+    with self._lock:
+      now: float = time.monotonic()
+
+      # Refill tokens for the time that passed since the last request (including time spent loading pages)
+      self._tokens = min(self._settings.burst, self._tokens + (now - self._last_refill_time) * self._rate)
+      self._last_refill_time = now
+      self._tokens -= 1.0
+
+      # Not enough tokens means waiting until the debt is paid off
+      wait_time: float = 0.0
+      if (self._tokens < 0.0):
+        wait_time = -self._tokens / self._rate
+
+      # Random extra wait, so requests don't come in at perfectly even intervals
+      if (self._settings.jitter > 0.0):
+        wait_time += random.uniform(0.0, self._settings.jitter / self._rate)
+
+      self._total_wait_time += wait_time
+      return wait_time
+
+
+  # ******************************************** #
+  # ****************** Public ****************** #
+  # ******************************************** #
+
+
+  # === Function: __init__ ===
+  def __init__(self, settings: Settings | None = None) -> None:
+    """
+    Constructor -> Sets up a full token bucket
+
+    Args:
+      settings: Rate, burst, jitter and rate bounds to use (Defaults to 'RateLimiter.Settings()')
+    """
+
+    self._settings: RateLimiter.Settings = settings if (settings != None) else RateLimiter.Settings()
+    self._rate: float = min(max(self._settings.rate, self._settings.min_rate), self._settings.max_rate)
+    self._tokens: float = self._settings.burst
+    self._last_refill_time: float = time.monotonic()
+    self._success_streak: int = 0
+    self._throttle_count: int = 0
+    self._total_wait_time: float = 0.0
+    self._lock: threading.Lock = threading.Lock()
+
+
+  # === Function: getForHost ===
+  @staticmethod
+  def getForHost(url: str, settings: Settings | None = None):
+    """
+    Get the shared rate limiter for a url's host, creating it if needed
+
+    Params:
+      url: Any url on the host (or the host itself)
+      settings: Settings to create the limiter with. Ignored if the host already has a limiter
+
+    Returns:
+      RateLimiter: The host's rate limiter
+    """
+
+    host: str = urlsplit(url).hostname or url
+
+    with RateLimiter._host_limiters_lock:
+      if (host not in RateLimiter._host_limiters):
+        limiter: RateLimiter = RateLimiter(settings)
+        RateLimiter._host_limiters[host] = limiter
+
+        # Report the limiter's state on the metrics endpoint | NOTE: The throttle count only goes up, so it's read the
+        # same way but declared a counter
+        LiveMetrics.registerGauge("rawscrape_rate_limit_rate", lambda: limiter.getState()["rate"], {"host": host})
+        LiveMetrics.registerGauge("rawscrape_rate_limit_tokens", lambda: limiter.getState()["tokens"], {"host": host})
+        LiveMetrics.registerGauge("rawscrape_rate_limit_throttles_total", lambda: limiter.getState()["throttle_count"], {"host": host})
+
+      return RateLimiter._host_limiters[host]
+
+
+  # === Function: acquire ===
+  def acquire(self) -> float:
+    """
+    Wait (blocking) until a request can be sent
+
+    Returns:
+      float: How many seconds were spent waiting
+    """
+
+    wait_time: float = self._reserve()
+    if (wait_time > 0.0):
+      time.sleep(wait_time)
+
+    return wait_time
+
+
+  # === Function: acquireAsync ===
+  async def acquireAsync(self) -> float:
+    """
+    Wait (without blocking the event loop) until a request can be sent
+
+    Returns:
+      float: How many seconds were spent waiting
+    """
+
+    wait_time: float = self._reserve()
+    if (wait_time > 0.0):
+      await asyncio.sleep(wait_time)
+
+    return wait_time
+
+
+  # === Function: reportSuccess ===
+  def reportSuccess(self) -> None:
+    """
+    Tell the limiter a request went through. Enough successes in a row raise the rate
+    """
+
+    with self._lock:
+      self._success_streak += 1
+
+      if (self._success_streak >= self._RECOVERY_STREAK):
+        self._success_streak = 0
+        self._rate = min(self._rate * self._RECOVERY_FACTOR, self._settings.max_rate)
+
+
+  # === Function: reportThrottled ===
+  def reportThrottled(self) -> None:
+    """
+    Tell the limiter a request was throttled (HTTP 429 or a challenge page). Cuts the rate and empties the bucket
+    """
+
+    with self._lock:
+      self._success_streak = 0
+      self._throttle_count += 1
+      self._rate = max(self._rate * self._BACKOFF_FACTOR, self._settings.min_rate)
+      self._tokens = min(self._tokens, 0.0)
+
+    print(f"Request throttled, slowing down to {self._rate:.3f} requests/second.")
+
+
+  # ******************************************** #
+  # ************** Getters/Setters ************* #
+  # ******************************************** #
+
+
+  # === Function: getRate ===
+  def getRate(self) -> float:
+    """
+    Get the current rate
+
+    Returns:
+      float: Requests per second the limiter currently allows
+    """
+
+    return self._rate
+
+
+  # === Function: getState ===
+  def getState(self) -> dict:
+    """
+    Get a snapshot of the limiter's state
+
+    Returns:
+      dict: The current rate, available tokens, times throttled and total seconds spent waiting
+    """
+
+    with self._lock:
+      return {
+        "rate": self._rate,
+        "tokens": self._tokens,
+        "throttle_count": self._throttle_count,
+        "total_wait_time": self._total_wait_time
+      }
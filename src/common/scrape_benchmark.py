@@ -0,0 +1,401 @@
+# Imports
+import io
+import os
+import json
+import time
+import queue
+import shutil
+import asyncio
+import tempfile
+import threading
+import tracemalloc
+import contextlib
+import multiprocessing
+from src.common.scraper import Scraper
+from src.common.scraper_pool import ScraperPool
+from src.common.async_scraper import AsyncScraper
+from src.common.fixture_site import FixtureSite
+from src.common.fetch_backends import FetchBackends
+from src.common.rate_limiter import RateLimiter
+from src.common.page_cache import PageCache
+from src.common.scrape_metrics import ScrapeMetrics
+from src.common.utils import printModuleSeparator
+
+# psutil is optional. Without it, only the python heap is measured (browsers aren't included)
+try:
+  import psutil
+except ImportError:
+  psutil = None
+
+
+# === Function: _getProcessTreeMemory ===
+def _getProcessTreeMemory() -> int:
+  """
+  Get the memory used by this process and every process it started (i.e. browsers)
+
+  NOTE: Needs psutil
+
+  Returns:
+    int: Resident bytes
+  """
+
+  process = psutil.Process()
+  total: int = process.memory_info().rss
+
+  for child in process.children(recursive=True):
+    try:
+      total += child.memory_info().rss
+    except psutil.Error:
+      pass # The child exited while being measured
+
+  return total
+
+
+# === Function: _runBenchmarkCase ===
+def _runBenchmarkCase(case: dict, result_queue) -> None:
+  """
+  Scrape the fixture novel once and report how it went. Runs in its own process, so memory and the shared rate
+  limiters, manifests and caches start fresh for every case
+
+  Params:
+    case: Novel url, chapter count, fetch backend, concurrency, settings filename and verbose (see 'ScrapeBenchmark._runCase')
+    result_queue: Queue to put the result dict on
+  """
+
+  output_directory: str = tempfile.mkdtemp(prefix="rawscrape_benchmark_")
+  metrics_log_path: str = os.path.join(output_directory, "benchmark_metrics.jsonl")
+  console = contextlib.nullcontext() if (case["verbose"]) else contextlib.redirect_stdout(io.StringIO())
+
+  # Peak memory is sampled in the background while the scrape runs
+  sampling: threading.Event = threading.Event()
+  peak_memory: list[int] = [0]
+
+  def sampleMemory() -> None:
+    while (not sampling.wait(0.05)):
+      peak_memory[0] = max(peak_memory[0], _getProcessTreeMemory())
+
+  try:
+    with console:
+      # Nothing is held back by the rate limiter, so the scraper itself is measured
+      rate_limit_settings: RateLimiter.Settings = RateLimiter.Settings()
+      rate_limit_settings.rate = 1000.0
+      rate_limit_settings.burst = 1000.0
+      rate_limit_settings.jitter = 0.0
+      rate_limit_settings.max_rate = 1000.0
+      RateLimiter.getForHost(case["novel_url"], rate_limit_settings)
+
+      metrics: ScrapeMetrics = ScrapeMetrics(metrics_log_path)
+
+      def createScraper() -> Scraper:
+        scraper: Scraper = Scraper(case["novel_url"])
+        if (case["scraper_settings_filename"] != ""):
+          scraper.loadScraperSettings(case["scraper_settings_filename"])
+
+        scraper.setFetchBackend(case["fetch_backend"])
+        scraper.setHeadless(True)
+        scraper.setPageCacheSettings(PageCache.Settings())
+        scraper.setMetrics(metrics)
+        return scraper
+
+      # Start measuring
+      if (psutil != None):
+        base_memory: int = _getProcessTreeMemory()
+        threading.Thread(target=sampleMemory, daemon=True).start()
+      else:
+        tracemalloc.start()
+      start_wall_time: float = time.time()
+      start_time: float = time.perf_counter()
+
+      # Scrape the same way 'raw_scrape.py' would for this backend and concurrency
+      if (case["concurrency"] == 1):
+        scraper: Scraper = createScraper()
+        scraper.scrape(1, case["chapter_count"], True, output_directory)
+        scraper.close()
+      elif (case["fetch_backend"] == FetchBackends.HTTP):
+        scraper: Scraper = createScraper()
+        asyncio.run(AsyncScraper(scraper, case["concurrency"]).scrape(1, case["chapter_count"], True, output_directory))
+        scraper.close()
+      else:
+        scraper_pool: ScraperPool = ScraperPool(case["concurrency"], headless=True, scraper_factory=createScraper)
+        scraper_pool.scrape(case["novel_url"], 1, case["chapter_count"], True, output_directory)
+        scraper_pool.close()
+
+      elapsed: float = time.perf_counter() - start_time
+
+      # Stop measuring
+      if (psutil != None):
+        sampling.set()
+        used_memory: int = max(peak_memory[0] - base_memory, 0)
+      else:
+        used_memory: int = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+      summary: dict = metrics.close()
+
+    # When each chapter finished, from the metrics log
+    chapter_times: list[float] = []
+    with open(metrics_log_path, "r", encoding="utf-8") as f:
+      for line in f:
+        event: dict = json.loads(line)
+        if (event["event"] == "chapter" and event["status"] == "ok"):
+          chapter_times.append(event["time"] - start_wall_time)
+    chapter_times.sort()
+
+    steady_time: float = chapter_times[-1] - chapter_times[0] if (len(chapter_times) > 1) else 0.0
+
+    result_queue.put({
+      "chapters": summary["chapters"],
+      "failed": summary["failed"],
+      "elapsed": round(elapsed, 3),
+      "chapters_per_sec": round(summary["chapters"] / elapsed, 3) if (elapsed > 0.0) else 0.0,
+      "steady_chapters_per_sec": round((len(chapter_times) - 1) / steady_time, 3) if (steady_time > 0.0) else 0.0,
+      "startup_seconds": round(chapter_times[0], 3) if (len(chapter_times) > 0) else None,
+      "chapter_p50": summary["chapter_p50"],
+      "chapter_p95": summary["chapter_p95"],
+      "memory_source": "process_tree" if (psutil != None) else "python_heap",
+      "memory_per_worker_mb": round(used_memory / case["concurrency"] / (1024 * 1024), 3),
+      "error": None
+    })
+
+  except Exception as e:
+    result_queue.put({"error": f"{type(e).__name__}: {e}"})
+
+  finally:
+    sampling.set()
+    shutil.rmtree(output_directory, ignore_errors=True)
+
+
+# === Class: ScrapeBenchmark ===
+class ScrapeBenchmark():
+  """
+  Measures how fast the scrapers are against a local 'FixtureSite', for every fetch backend and concurrency level:
+  end to end chapters/sec (and after the first chapter), time until the first chapter is saved (startup) and memory per
+  worker. Results are saved as JSON, so a later run (i.e. after an optimization) can be compared against them.
+
+  The rate limiter is opened all the way up for the fixture site, so the numbers show the scraper's own cost.
+  """
+
+
+  # ******************************************** #
+  # ****************** Private ***************** #
+  # ******************************************** #
+
+
+  # === Constants ===
+  """ Where benchmark results are saved """
+  _RESULTS_DIRECTORY: str = "downloaded_files/benchmarks"
+
+  """ How much slower (chapters/sec) a case can get compared to the baseline before it's called a regression """
+  _REGRESSION_THRESHOLD: float = 0.1
+
+
+  # === Function: _runCase ===
+  def _runCase(self, fixture_site: FixtureSite, fetch_backend: str, concurrency: int) -> dict:
+    """
+    Run one case in its own process
+
+    Params:
+      fixture_site: Site to scrape
+      fetch_backend: How pages are loaded (FetchBackends.XXX)
+      concurrency: How many chapters load at the same time (concurrent requests OR browsers)
+
+    Returns:
+      dict: The case's results (see '_runBenchmarkCase'), with its fetch backend and concurrency
+    """
+
+    case: dict = {
+      "novel_url": fixture_site.getNovelUrl(),
+      "chapter_count": fixture_site.getChapterCount(),
+      "fetch_backend": fetch_backend,
+      "concurrency": concurrency,
+      "scraper_settings_filename": self._scraper_settings_filename,
+      "verbose": self._verbose
+    }
+
+    # NOTE: "spawn" works the same on every platform, and doesn't copy this process' memory into the case
+    context = multiprocessing.get_context("spawn")
+    result_queue = context.Queue()
+    process = context.Process(target=_runBenchmarkCase, args=(case, result_queue), daemon=True)
+    process.start()
+
+    while True:
+      try:
+        result: dict = result_queue.get(timeout=1.0)
+        break
+      except queue.Empty:
+        if (not process.is_alive()):
+          result: dict = {"error": f"Benchmark process exited with code {process.exitcode}"}
+          break
+
+    process.join()
+
+    return dict({"fetch_backend": fetch_backend, "concurrency": concurrency}, **result)
+
+
+  # === Function: _printResult ===
+  def _printResult(self, result: dict) -> None:
+    """
+    Print one case's results
+
+    Params:
+      result: The case's results
+    """
+
+    if (result["error"] != None):
+      print(f"\t{result['fetch_backend']:>6} x{result['concurrency']:<3} Failed: {result['error']}")
+      return
+
+    print(
+      f"\t{result['fetch_backend']:>6} x{result['concurrency']:<3} "
+      f"{result['chapters_per_sec']:8.2f} ch/s "
+      f"({result['steady_chapters_per_sec']:.2f} after the first), "
+      f"startup {result['startup_seconds']}s, "
+      f"p50 {result['chapter_p50']:.3f}s, p95 {result['chapter_p95']:.3f}s, "
+      f"{result['memory_per_worker_mb']:.1f} MB/worker ({result['memory_source']}), "
+      f"{result['failed']} failed"
+    )
+
+
+  # ******************************************** #
+  # ****************** Public ****************** #
+  # ******************************************** #
+
+
+  # === Function: __init__ ===
+  def __init__(self, chapter_count: int = 50, latency: float = 0.05, page_size_kb: int = 8, fetch_backends: tuple[str] = FetchBackends.ALL, concurrency_levels: tuple[int] = (1, 2, 4), scraper_settings_filename: str = "", verbose: bool = False) -> None:
+    """
+    Constructor -> Sets the fixture novel and the cases to run
+
+    Args:
+      chapter_count: How many chapters the fixture novel has (every case scrapes all of them)
+      latency: Seconds the fixture site waits before answering each request
+      page_size_kb: About how big each chapter page is
+      fetch_backends: Fetch backends to measure (FetchBackends.XXX)
+      concurrency_levels: How many chapters load at the same time, for each case
+      scraper_settings_filename: Scraper settings file to load ("" for the default). Its selectors must match the fixture site
+      verbose: Show the scrapers' output
+    """
+
+    self._chapter_count: int = max(chapter_count, 1)
+    self._latency: float = max(latency, 0.0)
+    self._page_size_kb: int = max(page_size_kb, 1)
+    self._fetch_backends: tuple[str] = fetch_backends
+    self._concurrency_levels: tuple[int] = tuple(max(level, 1) for level in concurrency_levels)
+    self._scraper_settings_filename: str = scraper_settings_filename
+    self._verbose: bool = verbose
+
+
+  # === Function: run ===
+  def run(self) -> dict:
+    """
+    Run every case against a fresh fixture site
+
+    Returns:
+      dict: The benchmark's parameters and every case's results
+    """
+
+    # Print module separator
+    printModuleSeparator()
+
+    # Log starting message
+    print(
+      "Starting Benchmark With Parameters: \n"
+      "\tChapters: " + str(self._chapter_count) + "\n"
+      "\tLatency: " + str(self._latency) + "s\n"
+      "\tPage Size: " + str(self._page_size_kb) + " KB\n"
+      "\tFetch Backends: " + ", ".join(self._fetch_backends) + "\n"
+      "\tConcurrency Levels: " + ", ".join(str(level) for level in self._concurrency_levels) + "\n"
+      "\tMemory: " + ("Whole process tree (psutil)" if (psutil != None) else "Python heap only (install psutil to include browsers)") + "\n"
+    )
+
+    fixture_site: FixtureSite = FixtureSite(self._chapter_count, self._latency, self._page_size_kb)
+    results: list[dict] = []
+
+    try:
+      for fetch_backend in self._fetch_backends:
+        for concurrency in self._concurrency_levels:
+          result: dict = self._runCase(fixture_site, fetch_backend, concurrency)
+          self._printResult(result)
+          results.append(result)
+    finally:
+      fixture_site.close()
+
+    print("\nBenchmark Complete!")
+
+    # Print module separator
+    printModuleSeparator()
+
+    return {
+      "time": time.time(),
+      "chapter_count": self._chapter_count,
+      "latency": self._latency,
+      "page_size_kb": self._page_size_kb,
+      "results": results
+    }
+
+
+  # === Function: saveResults ===
+  def saveResults(self, benchmark: dict) -> str:
+    """
+    Save a benchmark's results to '<_RESULTS_DIRECTORY>/benchmark_<date>_<time>.json'
+
+    Params:
+      benchmark: What 'run' returned
+
+    Returns:
+      str: Path of the saved file
+    """
+
+    os.makedirs(self._RESULTS_DIRECTORY, exist_ok=True)
+    path: str = os.path.join(self._RESULTS_DIRECTORY, time.strftime("benchmark_%Y%m%d_%H%M%S.json", time.localtime(benchmark["time"])))
+
+    with open(path, "w", encoding="utf-8") as f:
+      json.dump(benchmark, f, indent=2)
+
+    print(f"Saved benchmark results to {path}")
+    return path
+
+
+  # === Function: compareResults ===
+  @staticmethod
+  def compareResults(benchmark: dict, baseline_path: str) -> list[dict]:
+    """
+    Compare a benchmark against an earlier one, and print the change in chapters/sec of every case both ran
+
+    NOTE: Only meaningful if both ran with the same chapters, latency and page size
+
+    Params:
+      benchmark: What 'run' returned
+      baseline_path: Results file saved by an earlier run
+
+    Returns:
+      list[dict]: The cases that got more than '_REGRESSION_THRESHOLD' slower
+    """
+
+    with open(baseline_path, "r", encoding="utf-8") as f:
+      baseline: dict = json.load(f)
+
+    if (any(benchmark[key] != baseline[key] for key in ("chapter_count", "latency", "page_size_kb"))):
+      print("WARNING: The baseline ran with different parameters, so the numbers may not be comparable.")
+
+    baseline_results: dict[tuple, dict] = {(result["fetch_backend"], result["concurrency"]): result for result in baseline["results"]}
+    regressions: list[dict] = []
+
+    print(f"Compared to {baseline_path}:")
+    for result in benchmark["results"]:
+      baseline_result: dict | None = baseline_results.get((result["fetch_backend"], result["concurrency"]))
+      if (baseline_result == None or result["error"] != None or baseline_result["error"] != None or baseline_result["chapters_per_sec"] == 0.0):
+        continue
+
+      change: float = result["chapters_per_sec"] / baseline_result["chapters_per_sec"] - 1.0
+      is_regression: bool = change < -ScrapeBenchmark._REGRESSION_THRESHOLD
+      if (is_regression):
+        regressions.append(result)
+
+      print(
+        f"\t{result['fetch_backend']:>6} x{result['concurrency']:<3} "
+        f"{baseline_result['chapters_per_sec']:.2f} -> {result['chapters_per_sec']:.2f} ch/s ({change:+.1%})"
+        f"{'  REGRESSION' if (is_regression) else ''}"
+      )
+
+    return regressions
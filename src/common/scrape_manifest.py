@@ -0,0 +1,506 @@
+# Imports
+import os
+import re
+import json
+import time
+import atexit
+import hashlib
+import tempfile
+import threading
+import contextlib
+from src.common.novel_archive import NovelArchive
+
+
+# === Class: ScrapeManifest ===
+class ScrapeManifest():
+  """
+  Keeps track of what has been scraped into an output directory, in a 'manifest.json' file inside it. For each
+  chapter it records the url, a hash and size of the saved text and if the chapter finished or failed. Chapter urls
+  that are known but not scraped yet (from the chapter list or a next chapter button) are kept too, so a scrape can
+  pick up where it left off without loading the chapter list again.
+
+  One manifest is shared per output directory (see 'ScrapeManifest.getForDirectory'), so several workers can save
+  chapters into the same directory.
+
+  Changes are written at most once every '_SAVE_INTERVAL' seconds (and by 'flush'), so a long novel isn't rewritten
+  for every chapter. A crash can only lose the last few seconds of changes, whose chapters are scraped again.
+  """
+
+
+  # === Subclass: Statuses ===
+  class Statuses():
+    """
+    Holds constants for a chapter's status in the manifest
+    """
+
+    PENDING: str = "pending" # The url is known, but the chapter hasn't been scraped
+    COMPLETE: str = "complete"
+    FAILED: str = "failed"
+
+
+  # ******************************************** #
+  # ****************** Private ***************** #
+  # ******************************************** #
+
+
+  # === Constants ===
+  _MANIFEST_FILENAME: str = "manifest.json"
+  _VERSION: int = 1
+
+  """ Most seconds a change waits before the manifest is written again """
+  _SAVE_INTERVAL: float = 2.0
+
+  """ Name of a saved chapter file ('NNNN.txt') """
+  _CHAPTER_FILENAME_PATTERN: re.Pattern = re.compile(r"^(\d+)\.txt$")
+
+
+  # === Variables ===
+  """ Output directory (absolute path) -> its manifest. Shared by every scraper """
+  _directory_manifests: dict = {}
+  _directory_manifests_lock: threading.Lock = threading.Lock()
+
+
+  # === Function: _getEntry ===
+  def _getEntry(self, chapter_num: int) -> dict:
+    """
+    Get a chapter's entry, creating a pending one if it doesn't exist
+
+    NOTE: Must hold '_lock'
+
+    Params:
+      chapter_num: Number of the chapter
+
+    Returns:
+      dict: The chapter's entry
+    """
+
+    key: str = str(chapter_num)
+    if (key not in self._chapters):
+      self._chapters[key] = {"chapter_num": chapter_num, "url": None, "status": ScrapeManifest.Statuses.PENDING}
+
+    return self._chapters[key]
+
+
+  # === Function: _save ===
+  def _save(self) -> None:
+    """
+    Write the manifest to disk. The file is replaced in one step, so a crash never leaves half a manifest
+
+    NOTE: Must hold '_lock'. The temporary file's name is unique, so processes sharing the directory never write over
+          (or rename) each other's half written file
+    """
+
+    data: dict = {
+      "version": self._VERSION,
+      "novel_url": self._novel_url,
+      "chapters": [self._chapters[key] for key in sorted(self._chapters, key=int)]
+    }
+
+    fd, temp_path = tempfile.mkstemp(dir=self._output_directory, prefix=self._MANIFEST_FILENAME + ".", suffix=".tmp")
+    try:
+      with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=1)
+      os.replace(temp_path, self._path)
+    except BaseException:
+      with contextlib.suppress(OSError):
+        os.remove(temp_path)
+      raise
+
+    self._dirty = False
+    self._last_save_time = time.monotonic()
+
+
+  # === Function: _changed ===
+  def _changed(self) -> None:
+    """
+    Record that the manifest changed, writing it if the last write was at least '_SAVE_INTERVAL' seconds ago
+
+    NOTE: Must hold '_lock'. Nothing is written while auto saving is off (See 'setAutoSave')
+    """
+
+    self._dirty = True
+
+    if (self._auto_save and time.monotonic() - self._last_save_time >= self._SAVE_INTERVAL):
+      self._save()
+
+
+  # ******************************************** #
+  # ****************** Public ****************** #
+  # ******************************************** #
+
+
+  # === Function: __init__ ===
+  def __init__(self, output_directory: str) -> None:
+    """
+    Constructor -> Loads the manifest in an output directory (or starts an empty one)
+
+    NOTE: Use 'ScrapeManifest.getForDirectory' so every scraper shares the same manifest object
+
+    Args:
+      output_directory: Directory the chapters are saved to
+    """
+
+    self._output_directory: str = output_directory
+    self._path: str = os.path.join(output_directory, self._MANIFEST_FILENAME)
+    self._lock: threading.Lock = threading.Lock()
+    self._novel_url: str = ""
+    self._chapters: dict[str, dict] = {}
+
+    """ Unsaved changes, if they are written on their own, and when the manifest was last written (See '_changed') """
+    self._dirty: bool = False
+    self._auto_save: bool = True
+    self._last_save_time: float = 0.0
+
+    if (os.path.exists(self._path)):
+      try:
+        with open(self._path, "r", encoding="utf-8") as f:
+          data: dict = json.load(f)
+
+        self._novel_url = data.get("novel_url", "")
+        self._chapters = {str(entry["chapter_num"]): entry for entry in data.get("chapters", [])}
+      except (OSError, ValueError, KeyError) as e:
+        print(f"Could not read manifest '{self._path}', starting a new one: {e}")
+
+
+  # === Function: getForDirectory ===
+  @staticmethod
+  def getForDirectory(output_directory: str):
+    """
+    Get the shared manifest for an output directory, loading it if needed
+
+    Params:
+      output_directory: Directory the chapters are saved to
+
+    Returns:
+      ScrapeManifest: The directory's manifest
+    """
+
+    key: str = os.path.abspath(output_directory)
+
+    with ScrapeManifest._directory_manifests_lock:
+      if (key not in ScrapeManifest._directory_manifests):
+        ScrapeManifest._directory_manifests[key] = ScrapeManifest(output_directory)
+
+      return ScrapeManifest._directory_manifests[key]
+
+
+  # === Function: flushAll ===
+  @staticmethod
+  def flushAll() -> None:
+    """
+    Write every manifest with unsaved changes. Called when the program exits
+
+    NOTE: Manifests with auto saving off are skipped (See 'flush')
+    """
+
+    with ScrapeManifest._directory_manifests_lock:
+      manifests: list[ScrapeManifest] = list(ScrapeManifest._directory_manifests.values())
+
+    for manifest in manifests:
+      try:
+        manifest.flush()
+      except OSError as e:
+        print(f"Could not save manifest '{manifest._path}': {e}")
+
+
+  # === Function: existsInDirectory ===
+  @staticmethod
+  def existsInDirectory(output_directory: str) -> bool:
+    """
+    Check if an output directory has a manifest (i.e. a scrape can be resumed there)
+
+    Params:
+      output_directory: Directory to check
+
+    Returns:
+      bool: True if the directory has a manifest file
+    """
+
+    return os.path.exists(os.path.join(output_directory, ScrapeManifest._MANIFEST_FILENAME))
+
+
+  # === Function: markComplete ===
+  def markComplete(self, chapter_num: int, url: str | None, filename: str, text: str) -> None:
+    """
+    Record that a chapter was saved
+
+    Params:
+      chapter_num: Number of the chapter
+      url: Url the chapter was scraped from
+      filename: Name of the saved file, inside the output directory
+      text: Text that was saved
+    """
+
+    self.markCompleteMany([(chapter_num, url, filename, text)])
+
+
+  # === Function: markCompleteMany ===
+  def markCompleteMany(self, chapters: list[tuple[int, str | None, str, str]]) -> None:
+    """
+    Record that several chapters were saved, as one change to the manifest
+
+    Params:
+      chapters: (chapter number, url, filename, text) of each saved chapter. See 'markComplete'
+    """
+
+    with self._lock:
+      for chapter_num, url, filename, text in chapters:
+        encoded_text: bytes = text.encode("utf-8")
+
+        entry: dict = self._getEntry(chapter_num)
+        entry["url"] = url if (url != None) else entry["url"]
+        entry["status"] = ScrapeManifest.Statuses.COMPLETE
+        entry["filename"] = filename
+        entry["sha256"] = hashlib.sha256(encoded_text).hexdigest()
+        entry["size"] = len(encoded_text)
+
+      self._changed()
+
+
+  # === Function: markCompleteEntries ===
+  def markCompleteEntries(self, entries: list[dict]) -> None:
+    """
+    Record chapters that were saved by other processes, as one change to the manifest (See 'WorkQueue.syncManifest')
+
+    Params:
+      entries: Entries (chapter_num, url, filename, sha256, size) of each saved chapter
+    """
+
+    with self._lock:
+      for saved_entry in entries:
+        entry: dict = self._getEntry(saved_entry["chapter_num"])
+        entry["url"] = saved_entry["url"] if (saved_entry["url"] != None) else entry["url"]
+        entry["status"] = ScrapeManifest.Statuses.COMPLETE
+        entry["filename"] = saved_entry["filename"]
+        entry["sha256"] = saved_entry["sha256"]
+        entry["size"] = saved_entry["size"]
+
+      self._changed()
+
+
+  # === Function: markFailed ===
+  def markFailed(self, chapter_num: int, url: str | None) -> None:
+    """
+    Record that a chapter couldn't be scraped, so the next run tries it again
+
+    Params:
+      chapter_num: Number of the chapter
+      url: Url the chapter was scraped from
+    """
+
+    with self._lock:
+      entry: dict = self._getEntry(chapter_num)
+
+      # A chapter that was saved before stays saved
+      if (entry["status"] == ScrapeManifest.Statuses.COMPLETE):
+        return
+
+      entry["url"] = url if (url != None) else entry["url"]
+      entry["status"] = ScrapeManifest.Statuses.FAILED
+      self._changed()
+
+
+  # === Function: flush ===
+  def flush(self, force: bool = False) -> None:
+    """
+    Write the manifest now if it has unsaved changes
+
+    Params:
+      force: Write even while auto saving is off | NOTE: Only 'WorkQueue.syncManifest' should, so processes sharing
+             the directory write the manifest one at a time
+    """
+
+    with self._lock:
+      if (self._dirty and (self._auto_save or force)):
+        self._save()
+
+
+  # === Function: adoptChapterFiles ===
+  def adoptChapterFiles(self) -> int:
+    """
+    Record chapter files that are in the output directory but not in the manifest (i.e. saved before manifests
+    existed) as complete. Their urls aren't known
+
+    Returns:
+      int: How many chapter files were added to the manifest
+    """
+
+    try:
+      filenames: list[str] = os.listdir(self._output_directory)
+    except OSError:
+      return 0
+
+    adopted_count: int = 0
+
+    with self._lock:
+      for filename in filenames:
+        filename_match = self._CHAPTER_FILENAME_PATTERN.match(filename)
+        if (filename_match == None):
+          continue
+
+        chapter_num: int = int(filename_match.group(1))
+        entry: dict = self._getEntry(chapter_num)
+        if (entry["status"] == ScrapeManifest.Statuses.COMPLETE):
+          continue
+
+        with open(os.path.join(self._output_directory, filename), "rb") as f:
+          file_data: bytes = f.read()
+
+        entry["status"] = ScrapeManifest.Statuses.COMPLETE
+        entry["filename"] = filename
+        entry["sha256"] = hashlib.sha256(file_data).hexdigest()
+        entry["size"] = len(file_data)
+        adopted_count += 1
+
+      if (adopted_count > 0):
+        self._changed()
+
+    return adopted_count
+
+
+  # === Function: setChapterUrls ===
+  def setChapterUrls(self, chapter_urls: dict[int, str | None]) -> None:
+    """
+    Record the urls of chapters (i.e. from the chapter list or a next chapter button) so they don't need to be looked
+    up again
+
+    Params:
+      chapter_urls: Chapter number -> url. Chapters without a url are skipped
+    """
+
+    with self._lock:
+      for chapter_num, url in chapter_urls.items():
+        if (url != None):
+          self._getEntry(chapter_num)["url"] = url
+      self._changed()
+
+
+  # === Function: isComplete ===
+  def isComplete(self, chapter_num: int) -> bool:
+    """
+    Check if a chapter was saved and is still there, with the size that was saved
+
+    NOTE: The chapter can be in its own file OR in the directory's archive, whichever it was saved to, since a novel
+          can be converted between the two after it's scraped
+
+    Params:
+      chapter_num: Number of the chapter
+
+    Returns:
+      bool: True if the chapter doesn't need to be scraped again
+    """
+
+    with self._lock:
+      entry: dict | None = self._chapters.get(str(chapter_num))
+
+    if (entry == None or entry["status"] != ScrapeManifest.Statuses.COMPLETE):
+      return False
+
+    # The file was deleted or cut short since it was saved
+    filename: str = entry["filename"] if (entry["filename"] != NovelArchive.ARCHIVE_FILENAME) else f"{str(chapter_num).zfill(4)}.txt"
+    file_path: str = os.path.join(self._output_directory, filename)
+    if (os.path.exists(file_path) and os.path.getsize(file_path) == entry["size"]):
+      return True
+
+    if (not NovelArchive.existsInDirectory(self._output_directory)):
+      return False
+
+    return NovelArchive.getForDirectory(self._output_directory).getChapterSize(chapter_num) == entry["size"]
+
+
+  # ******************************************** #
+  # ************** Getters/Setters ************* #
+  # ******************************************** #
+
+
+  # === Function: getChapterUrl ===
+  def getChapterUrl(self, chapter_num: int) -> str | None:
+    """
+    Get the known url of a chapter
+
+    Params:
+      chapter_num: Number of the chapter
+
+    Returns:
+      str | None: The chapter's url OR None if it isn't known
+    """
+
+    with self._lock:
+      entry: dict | None = self._chapters.get(str(chapter_num))
+
+    return entry["url"] if (entry != None) else None
+
+
+  # === Function: getLatestCompleteChapterNum ===
+  def getLatestCompleteChapterNum(self) -> int:
+    """
+    Get the number of the newest chapter that was saved
+
+    Returns:
+      int: The newest saved chapter's number OR 0 if no chapter was saved
+    """
+
+    with self._lock:
+      complete_chapter_nums: list[int] = [
+        entry["chapter_num"] for entry in self._chapters.values() if (entry["status"] == ScrapeManifest.Statuses.COMPLETE)
+      ]
+
+    return max(complete_chapter_nums, default=0)
+
+
+  # === Function: getChapterEntries ===
+  def getChapterEntries(self) -> list[dict]:
+    """
+    Get a copy of every chapter's entry
+
+    Returns:
+      list[dict]: Entries (chapter_num, url, status, and filename/sha256/size for saved chapters), in chapter order
+    """
+
+    with self._lock:
+      return [dict(self._chapters[key]) for key in sorted(self._chapters, key=int)]
+
+
+  # === Function: setNovelUrl ===
+  def setNovelUrl(self, novel_url: str) -> None:
+    """
+    Set the url of the novel's chapter list that this directory holds
+
+    Params:
+      novel_url: Url of the novel's chapter list
+    """
+
+    with self._lock:
+      if (self._novel_url != novel_url):
+        self._novel_url = novel_url
+        self._changed()
+
+
+  # === Function: getNovelUrl ===
+  def getNovelUrl(self) -> str:
+    """
+    Get the url of the novel's chapter list that this directory holds
+
+    Returns:
+      str: Url of the novel's chapter list OR "" if it was never set
+    """
+
+    return self._novel_url
+
+
+  # === Function: setAutoSave ===
+  def setAutoSave(self, value: bool) -> None:
+    """
+    Set if changes are written on their own. While off, the manifest is only written by 'WorkQueue.syncManifest',
+    since the queue shared by several processes decides what the manifest holds
+
+    Params:
+      value: True to write changes on their own
+    """
+
+    with self._lock:
+      self._auto_save = value
+
+
+# Save the last changes of every manifest when the program exits
+atexit.register(ScrapeManifest.flushAll)
@@ -0,0 +1,269 @@
+# Imports
+import json
+import time
+import threading
+from src.common.metrics_server import LiveMetrics
+from src.common.utils import percentile
+
+
+# === Class: ScrapeMetrics ===
+class ScrapeMetrics():
+  """
+  Collects how long each step of each chapter took during a scrape, and writes them as JSON lines (one object per
+  chapter, then one for the run's summary) so runs can be compared and tuned from data.
+
+  Steps (see 'Scraper.ChapterRecord.timings'):
+    wait: Sleeping for the host's rate limiter
+    request: Loading the page (http request OR opening it in the browser)
+    captcha: Clicking through the CAPTCHA in the browser
+    challenge: Loads that ended on a challenge page anyway, so had to be redone (or gave up)
+    extract: Finding the chapter text in the page
+    format: Formatting the text
+    save: Handing the chapter to the 'ChapterWriter'
+
+  Everything recorded is also added to the process wide 'LiveMetrics', for the metrics endpoint.
+
+  One object can be shared by every worker of a scrape.
+  """
+
+
+  # === Subclass: FailureReasons ===
+  class FailureReasons():
+    """
+    Holds constants for why a chapter couldn't be scraped
+    """
+
+    FETCH: str = "fetch" # The page didn't load (connection error, timeout, bad http status, not in the page cache)
+    NO_SUCH_ELEMENT: str = "no_such_element" # The page loaded, but the chapter text wasn't on it
+    WEB_DRIVER: str = "web_driver" # The browser was closed or crashed
+    MISSING_NEXT_URL: str = "missing_next_url" # No url was found for the chapter (chapter list or next button)
+    OTHER: str = "other"
+
+
+  # ******************************************** #
+  # ****************** Private ***************** #
+  # ******************************************** #
+
+
+  # === Constants ===
+  """ Steps that are time lost to the site slowing us down, instead of scraping """
+  _WAIT_PHASES: tuple[str] = ("wait",)
+  _CHALLENGE_PHASES: tuple[str] = ("captcha", "challenge")
+
+
+  # === Function: _writeLine ===
+  def _writeLine(self, data: dict) -> None:
+    """
+    Write one object to the metrics log (if there is one)
+
+    NOTE: Must hold '_lock'
+
+    Params:
+      data: Object to write
+    """
+
+    if (self._log_file == None):
+      return
+
+    self._log_file.write(json.dumps(data, ensure_ascii=False) + "\n")
+    self._log_file.flush()
+
+
+  # === Function: _addTimings ===
+  def _addTimings(self, timings: dict[str, float]) -> None:
+    """
+    Add a chapter's step times to the totals (scraped OR failed)
+
+    NOTE: Must hold '_lock'
+
+    Params:
+      timings: Seconds spent on each step
+    """
+
+    for phase, seconds in timings.items():
+      self._phase_times.setdefault(phase, []).append(seconds)
+      LiveMetrics.incrementCounter("rawscrape_step_seconds_total", seconds, {"step": phase})
+
+    if ("request" in timings):
+      LiveMetrics.observeHistogram("rawscrape_fetch_seconds", timings["request"])
+
+    if (timings.get("challenge", 0.0) > 0.0):
+      self._challenge_count += 1
+      LiveMetrics.incrementCounter("rawscrape_challenges_total")
+
+
+  # ******************************************** #
+  # ****************** Public ****************** #
+  # ******************************************** #
+
+
+  # === Function: __init__ ===
+  def __init__(self, log_path: str | None = None) -> None:
+    """
+    Constructor -> Starts the run's clock and opens the metrics log
+
+    Args:
+      log_path: JSON lines file to append to (i.e. '<output_directory>/metrics.jsonl') OR None to only keep the summary
+    """
+
+    self._lock: threading.Lock = threading.Lock()
+    self._start_time: float = time.monotonic()
+    self._log_file = open(log_path, "a", encoding="utf-8") if (log_path != None) else None
+
+    """ Step -> seconds it took, per chapter """
+    self._phase_times: dict[str, list[float]] = {}
+
+    """ Total seconds of each scraped chapter (Failed chapters aren't included) """
+    self._chapter_times: list[float] = []
+    self._chapter_count: int = 0
+    self._failed_count: int = 0
+    self._failure_reasons: dict[str, int] = {}
+    self._challenge_count: int = 0
+    self._text_bytes: int = 0
+
+    with self._lock:
+      self._writeLine({"event": "start", "time": time.time()})
+
+
+  # === Function: recordChapter ===
+  def recordChapter(self, chapter_num: int, url: str | None, timings: dict[str, float], text_bytes: int, worker_id: int | None = None) -> None:
+    """
+    Record a scraped chapter
+
+    Params:
+      chapter_num: Number of the chapter
+      url: Url the chapter was scraped from
+      timings: Seconds spent on each step
+      text_bytes: Size of the chapter's text (utf-8 bytes)
+      worker_id: Worker that scraped the chapter (If there are several)
+    """
+
+    with self._lock:
+      self._chapter_count += 1
+      self._text_bytes += text_bytes
+      self._chapter_times.append(sum(timings.values()))
+      self._addTimings(timings)
+
+      LiveMetrics.incrementCounter("rawscrape_chapters_total")
+      LiveMetrics.incrementCounter("rawscrape_text_bytes_total", text_bytes)
+      LiveMetrics.observeHistogram("rawscrape_chapter_seconds", sum(timings.values()))
+
+      self._writeLine({
+        "event": "chapter",
+        "time": time.time(),
+        "chapter_num": chapter_num,
+        "url": url,
+        "status": "ok",
+        "worker": worker_id,
+        "text_bytes": text_bytes,
+        "total": round(sum(timings.values()), 6),
+        "timings": {phase: round(seconds, 6) for phase, seconds in timings.items()}
+      })
+
+
+  # === Function: recordFailure ===
+  def recordFailure(self, chapter_num: int, url: str | None, timings: dict[str, float] | None = None, worker_id: int | None = None, reason: str = FailureReasons.OTHER) -> None:
+    """
+    Record a chapter that couldn't be scraped
+
+    Params:
+      chapter_num: Number of the chapter
+      url: Url the chapter was scraped from
+      timings: Seconds spent on each step before it failed
+      worker_id: Worker that scraped the chapter (If there are several)
+      reason: Why it failed (ScrapeMetrics.FailureReasons.XXX)
+    """
+
+    timings = timings if (timings != None) else {}
+
+    with self._lock:
+      self._failed_count += 1
+      self._failure_reasons[reason] = self._failure_reasons.get(reason, 0) + 1
+      self._addTimings(timings)
+
+      LiveMetrics.incrementCounter("rawscrape_chapter_failures_total", 1, {"reason": reason})
+
+      self._writeLine({
+        "event": "chapter",
+        "time": time.time(),
+        "chapter_num": chapter_num,
+        "url": url,
+        "status": "failed",
+        "reason": reason,
+        "worker": worker_id,
+        "total": round(sum(timings.values()), 6),
+        "timings": {phase: round(seconds, 6) for phase, seconds in timings.items()}
+      })
+
+
+  # === Function: getSummary ===
+  def getSummary(self) -> dict:
+    """
+    Get the run's summary so far
+
+    Returns:
+      dict: Chapter counts (and failures by reason), throughput, time lost to sleeps and challenges, and p50/p95/total of every step
+    """
+
+    with self._lock:
+      elapsed: float = time.monotonic() - self._start_time
+
+      phases: dict[str, dict] = {}
+      for phase, seconds_list in self._phase_times.items():
+        sorted_seconds: list[float] = sorted(seconds_list)
+        phases[phase] = {
+          "count": len(sorted_seconds),
+          "total": round(sum(sorted_seconds), 6),
+          "p50": round(percentile(sorted_seconds, 50), 6),
+          "p95": round(percentile(sorted_seconds, 95), 6)
+        }
+
+      sorted_chapter_times: list[float] = sorted(self._chapter_times)
+
+      return {
+        "chapters": self._chapter_count,
+        "failed": self._failed_count,
+        "failure_reasons": dict(self._failure_reasons),
+        "elapsed": round(elapsed, 3),
+        "chapters_per_min": round(self._chapter_count / elapsed * 60.0, 3) if (elapsed > 0.0) else 0.0,
+        "text_bytes": self._text_bytes,
+        "text_bytes_per_sec": round(self._text_bytes / elapsed, 3) if (elapsed > 0.0) else 0.0,
+        "wait_seconds": round(sum(phases[phase]["total"] for phase in self._WAIT_PHASES if (phase in phases)), 6),
+        "challenge_seconds": round(sum(phases[phase]["total"] for phase in self._CHALLENGE_PHASES if (phase in phases)), 6),
+        "challenges": self._challenge_count,
+        "chapter_p50": round(percentile(sorted_chapter_times, 50), 6),
+        "chapter_p95": round(percentile(sorted_chapter_times, 95), 6),
+        "phases": phases
+      }
+
+
+  # === Function: close ===
+  def close(self) -> dict:
+    """
+    Print the run's summary, write it to the metrics log and close the log
+
+    Returns:
+      dict: The run's summary (see 'getSummary')
+    """
+
+    summary: dict = self.getSummary()
+
+    print(
+      "\nScrape Metrics: \n"
+      f"\tChapters: {summary['chapters']} ({summary['failed']} failed{': ' + str(summary['failure_reasons']) if (summary['failed'] > 0) else ''}) in {summary['elapsed']:.1f}s\n"
+      f"\tThroughput: {summary['chapters_per_min']:.1f} chapters/min, {summary['text_bytes_per_sec'] / 1024:.1f} KiB/s of text\n"
+      f"\tPer Chapter: p50 {summary['chapter_p50']:.2f}s, p95 {summary['chapter_p95']:.2f}s\n"
+      f"\tRate Limit Sleeps: {summary['wait_seconds']:.1f}s\n"
+      f"\tChallenges: {summary['challenges']} ({summary['challenge_seconds']:.1f}s)"
+    )
+    for phase, phase_summary in summary["phases"].items():
+      print(f"\t  {phase}: p50 {phase_summary['p50']:.3f}s, p95 {phase_summary['p95']:.3f}s, total {phase_summary['total']:.1f}s")
+
+    with self._lock:
+      self._writeLine(dict({"event": "summary", "time": time.time()}, **summary))
+
+      if (self._log_file != None):
+        self._log_file.close()
+        self._log_file = None
+
+    return summary
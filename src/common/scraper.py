@@ -1,13 +1,38 @@
 # Imports
 import time
+import os
 import re
+import html
+import gzip
+import copy
+import json
+import tempfile
+import contextlib
 import configparser
+from urllib.parse import urljoin, urlsplit
 from enum import Enum
-from seleniumbase import Driver
+from typing import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException, WebDriverException
+from selenium.common.exceptions import NoSuchElementException, JavascriptException, WebDriverException
+from src.common.fetch_backends import (
+  FetchBackends,
+  FetchResult,
+  HttpFetchBackend,
+  isChallengeTitle
+)
+from src.common.rate_limiter import RateLimiter
+from src.common.page_cache import PageCache
+from src.common.scrape_manifest import ScrapeManifest
+from src.common.chapter_writer import ChapterWriter
+from src.common.novel_archive import OutputFormats
+from src.common.scrape_metrics import ScrapeMetrics
+from src.common.metrics_server import MetricsServer
+from src.common.driver_session_manager import DriverSession, DriverSessionManager
+from src.common.clearance_store import ClearanceStore
+from src.common.latency_tracker import LatencyTracker
 from src.common.utils import (
   Limits,
   printModuleSeparator,
@@ -99,6 +124,154 @@ class Scraper():
       self.by = self.BY_MAP.get(self.by)
 
 
+    # === Function: getJsLookup ===
+    def getJsLookup(self) -> str:
+      """
+      Get a javascript expression that finds the element on the open page (null if it isn't there), so several
+      elements can be checked in one 'execute_script' call instead of a 'find_element' round trip each
+
+      NOTE: Use after 'applyByMap'
+
+      Returns:
+        str: The expression
+      """
+
+      if (self.by == By.ID):
+        return f"document.getElementById({json.dumps(self.element)})"
+
+      if (self.by == By.XPATH):
+        return f"document.evaluate({json.dumps(self.element)}, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue"
+
+      # NOTE: Selenium turns class names into '.name' css selectors, so 'a.b' means both classes
+      if (self.by == By.CLASS_NAME):
+        return f"document.querySelector({json.dumps('.' + self.element)})"
+
+      return f"document.querySelector({json.dumps(self.element)})"
+
+
+  # === Subclass: ChapterIndexEntry ===
+  class ChapterIndexEntry():
+    """
+    Holds the data for one chapter on the chapter list page
+    """
+
+
+    # === Function: __init__ ===
+    def __init__(self, chapter_num: int, url: str | None, title: str) -> None:
+      """
+      Constructor -> Sets the chapter's data
+
+      Args:
+        chapter_num: Number of the chapter (1 is the oldest chapter)
+        url: Url to the chapter's reading page OR None if the list item has no link
+        title: Title of the chapter as shown on the chapter list
+      """
+
+      self.chapter_num: int = chapter_num
+      self.url: str | None = url
+      self.title: str = title
+
+
+    # === Function: __repr__ ===
+    def __repr__(self) -> str:
+      return f"ChapterIndexEntry({self.chapter_num}, {self.url!r}, {self.title!r})"
+
+
+  # === Subclass: ChapterRecord ===
+  class ChapterRecord():
+    """
+    Holds one scraped chapter, as handed out by 'iterChapters'
+    """
+
+
+    # === Function: __init__ ===
+    def __init__(self, chapter_num: int, url: str, title: str, text: str | None = None, timings: dict[str, float] | None = None) -> None:
+      """
+      Constructor -> Sets the chapter's data
+
+      Args:
+        chapter_num: Number of the chapter (1 is the oldest chapter)
+        url: Url the chapter was scraped from
+        title: Title of the chapter as shown on the chapter list (OR the page's title if the chapter list wasn't loaded)
+        text: The chapter's text
+        timings: Seconds spent on each step of scraping the chapter ("wait", "request", "captcha", "challenge",
+                 "extract", "format", "save"). See 'ScrapeMetrics' for what each step covers
+                 NOTE: "save" is how long the scrape waited to hand the chapter to the 'ChapterWriter', not the disk write
+      """
+
+      self.chapter_num: int = chapter_num
+      self.url: str = url
+      self.title: str = title
+      self.text: str | None = text
+      self.timings: dict[str, float] = timings if (timings != None) else {}
+
+
+    # === Function: getTotalTime ===
+    def getTotalTime(self) -> float:
+      """
+      Get how long the chapter took to scrape
+
+      Returns:
+        float: Seconds spent on every step combined
+      """
+
+      return sum(self.timings.values())
+
+
+    # === Function: __repr__ ===
+    def __repr__(self) -> str:
+      return f"ChapterRecord({self.chapter_num}, {self.url!r}, {self.title!r}, {len(self.text or '')} chars, {self.getTotalTime():.2f}s)"
+
+
+  # === Subclass: ChapterPage ===
+  class ChapterPage():
+    """
+    Holds everything read from one open chapter page (see 'extractChapterPage')
+    """
+
+
+    # === Subclass: Healths ===
+    class Healths():
+      """
+      Holds constants for what state a chapter page was in
+      """
+
+      OK: str = "ok"
+      CHALLENGE: str = "challenge" # Stuck on a bot check
+      NO_TEXT: str = "no_text" # The text body is missing (i.e. an error page OR the site's layout changed)
+
+
+    # === Function: __init__ ===
+    def __init__(self, url: str, text: str | None, title: str, next_url: str | None, prev_url: str | None) -> None:
+      """
+      Constructor -> Sets the page's data
+
+      Args:
+        url: Url of the page
+        text: The chapter's text OR None if the page doesn't have any
+        title: Title of the page
+        next_url: Url behind the next chapter button OR None if there isn't one
+        prev_url: Url behind the previous chapter button OR None if there isn't one (OR it isn't set up)
+      """
+
+      self.url: str = url
+      self.text: str | None = text
+      self.title: str = title
+      self.next_url: str | None = next_url
+      self.prev_url: str | None = prev_url
+
+      self.health: str = Scraper.ChapterPage.Healths.OK
+      if (isChallengeTitle(title)):
+        self.health = Scraper.ChapterPage.Healths.CHALLENGE
+      elif (text == None):
+        self.health = Scraper.ChapterPage.Healths.NO_TEXT
+
+
+    # === Function: __repr__ ===
+    def __repr__(self) -> str:
+      return f"ChapterPage({self.url!r}, {self.title!r}, {len(self.text or '')} chars, next={self.next_url!r}, {self.health})"
+
+
   # ******************************************** #
   # ****************** Private ***************** #
   # ******************************************** #
@@ -111,27 +284,155 @@ class Scraper():
   _SCRAPER_SETTINGS_CHAPTER_LIST_ITEM_HTMLDATA_HEADER: str = "ChapterListItemHtmlData"
   _SCRAPER_SETTINGS_NEXT_CHAPTER_BUTTON_HTMLDATA_HEADER: str = "NextChapterButtonHtmlData"
   _SCRAPER_SETTINGS_CHAPTER_TEXT_BODY_HTMLDATA_HEADER: str = "ChapterTextBodyHtmlData"
+  _SCRAPER_SETTINGS_CHAPTER_LIST_NEXT_PAGE_HTMLDATA_HEADER: str = "ChapterListNextPageHtmlData"
+  _SCRAPER_SETTINGS_PREV_CHAPTER_BUTTON_HTMLDATA_HEADER: str = "PrevChapterButtonHtmlData"
+  _SCRAPER_SETTINGS_FETCH_HEADER: str = "FetchSettings"
+  _SCRAPER_SETTINGS_FETCH_BACKEND_KEY: str = "backend"
+  _SCRAPER_SETTINGS_PREFETCH_KEY: str = "prefetch"
+  _SCRAPER_SETTINGS_RATE_LIMIT_HEADER: str = "RateLimitSettings"
+  _SCRAPER_SETTINGS_CACHE_HEADER: str = "CacheSettings"
+  _SCRAPER_SETTINGS_OUTPUT_HEADER: str = "OutputSettings"
+  _SCRAPER_SETTINGS_KEEP_RAW_HTML_KEY: str = "keep_raw_html"
+  _SCRAPER_SETTINGS_OUTPUT_FORMAT_KEY: str = "format"
+  _SCRAPER_SETTINGS_WORK_QUEUE_KEY: str = "work_queue"
+  _SCRAPER_SETTINGS_METRICS_HEADER: str = "MetricsSettings"
+  _SCRAPER_SETTINGS_DRIVER_HEADER: str = "DriverSettings"
+
+  """ Name of the JSON lines file, in the output directory, that each scrape's chapter timings are appended to """
+  _METRICS_LOG_FILENAME: str = "metrics.jsonl"
+
+  """ Upper limit on chapter list pages to follow, in case a site's 'next page' button never runs out """
+  _MAX_CHAPTER_LIST_PAGES: int = 500
 
   """ How long with nothing happening until the webpage attempts to reconnect """
   _RECONNECT_TIME: int = 6
 
+  """ Shortest reconnect time, used once the browser is past the challenge and the site loads fast """
+  _MIN_RECONNECT_TIME: float = 0.5
+
+  """ Bounds on how long to wait for a chapter's text to finish loading (sized from recent pages in between) """
+  _MIN_READY_TIMEOUT: float = 2.0
+  _MAX_READY_TIMEOUT: float = 20.0
+
+  """ How often a loading chapter page is checked """
+  _READY_POLL_INTERVAL: float = 0.1
+
+  """ Reads a chapter page in one round trip: [text (null if missing), title, next button's href, previous button's href] """
+  _CHAPTER_EXTRACT_SCRIPT: str = (
+    "var text = {text_lookup}; var next = {next_lookup}; var prev = {prev_lookup};"
+    " var getHref = function (element) {{"
+    " var link = element ? element.querySelector('[href]') : null; return link ? link.getAttribute('href') : null; }};"
+    " return [text ? text.innerText : null, document.title, getHref(next), getHref(prev)];"
+  )
+
+  """ Marks the page a tab is leaving, then starts loading the next one without waiting for it """
+  _TAB_NAVIGATE_SCRIPT: str = "window.rawScrapeLeaving = true; window.location.assign(arguments[0]);"
+
+  """ Put before '_CHAPTER_READY_SCRIPT' in a tab: returns null while the tab still shows the page it is leaving """
+  _TAB_LEAVING_CHECK: str = "if (window.rawScrapeLeaving) return null; "
+
+  """ Checks the text body and next button in one round trip: [text length (-1 if missing), has next button, document.readyState, seconds the page took to load (0 if unknown)] """
+  _CHAPTER_READY_SCRIPT: str = (
+    "var text = {text_lookup}; var next = {next_lookup};"
+    " var navigation = performance.getEntriesByType('navigation')[0];"
+    " return [text ? text.textContent.length : -1, next != null, document.readyState,"
+    " navigation ? navigation.domContentLoadedEventEnd / 1000 : 0];"
+  )
+
 
   # === Variables ===
+  # NOTE: These are only declared here. Every value is (re)assigned per instance in '__init__' so that several
+  #       scrapers (each with their own browser) can run side by side without sharing a driver or html data
   _wait = None
   _driver = None
+  _headless: bool | None = None # NOTE: None uses the headless mode from '[DriverSettings]'
+
+  """ The browser '_driver' belongs to. Borrowed from 'DriverSessionManager', so it stays warm between scrapes """
+  _driver_session: DriverSession = None
+
+  """ Should the next page get the full '_RECONNECT_TIME' (a new browser OR the last page was a challenge) """
+  _expect_challenge: bool = True
+
+  """ Window handles of the browser's tabs, when several chapters load at once (See 'openTabs') """
+  _tab_handles: list = None
+
+  """ Tab index -> the chapter loading in it ({"url", "start_time", "text_length", "done", "failed"}) """
+  _tab_loads: dict = None
+
+  """ Index of the tab the browser is on """
+  _current_tab: int = 0
+
+  """ Should the next chapter start loading while the current one is formatted and saved (See 'iterChapters') """
+  _prefetch_enabled: bool = False
+
+  """ The chapter loading in the background ({"url", "timings", and its "tab" OR http "future"}). None if there isn't one """
+  _prefetch: dict = None
+
+  """ Runs the http backend's background loads. Started on the first one """
+  _prefetch_executor: ThreadPoolExecutor = None
+
+  """ When browsers are replaced and how many are kept warm """
+  _driver_session_settings: DriverSessionManager.Settings = None
   _novel_chapter_list_url: str = ""
 
+  """ How pages are loaded | NOTE: Use FetchBackends.XXX """
+  _fetch_backend: str = FetchBackends.DRIVER
+
+  """ The http session used when '_fetch_backend' is 'FetchBackends.HTTP'. Can be shared between scrapers """
+  _http_fetch_backend: HttpFetchBackend = None
+  _owns_http_fetch_backend: bool = False
+
+  """ Settings for the rate limiter shared by every scraper that talks to the same host """
+  _rate_limit_settings: RateLimiter.Settings = None
+
+  """ Settings for the on-disk page cache shared by every scraper that uses the same cache directory """
+  _page_cache_settings: PageCache.Settings = None
+
+  """ Collects per-chapter timings. If None, each scrape makes its own (logged to '<output_directory>/metrics.jsonl') """
+  _metrics: ScrapeMetrics = None
+
+  """ Where the live metrics endpoint is served (Off unless a port is set) """
+  _metrics_server_settings: MetricsServer.Settings = None
+
+  """ Why the last chapter couldn't be scraped | NOTE: Use ScrapeMetrics.FailureReasons.XXX """
+  _last_failure_reason: str = ScrapeMetrics.FailureReasons.OTHER
+
+  """ Should each chapter page's raw html be saved (gzipped) next to its text, so it can be reprocessed offline """
+  _keep_raw_html: bool = False
+
+  """ How chapters are stored in the output directory | NOTE: Use OutputFormats.XXX """
+  _output_format: str = OutputFormats.FILES
+
+  """ Should pooled scrapes claim chapters from the output directory's durable work queue (See 'WorkQueue') """
+  _use_work_queue: bool = False
+
+  """ The page that is currently open: the web driver OR a parsed 'HtmlDocument' from the http backend """
+  _page = None
+  _page_url: str = ""
+
   """ The HTML data when you are on the chapter list webpage that corresponds the list of chapters """
-  _chapter_list_body_htmldata: HtmlElementData = HtmlElementData()
+  _chapter_list_body_htmldata: HtmlElementData = None
 
   """ The HTML data when you are on the chapter list webpage that corresponds to an actual item in the chapter list"""
-  _chapter_list_item_htmldata: HtmlElementData = HtmlElementData()
+  _chapter_list_item_htmldata: HtmlElementData = None
   
   """ The HTML data used to go to the next chapter when on the reading page for a chapter """
-  _next_chapter_button_htmldata: HtmlElementData = HtmlElementData()
+  _next_chapter_button_htmldata: HtmlElementData = None
 
   """ The HTML data for the actual text of a chapter """
-  _chapter_text_body_htmldata: HtmlElementData = HtmlElementData()
+  _chapter_text_body_htmldata: HtmlElementData = None
+
+  """ (Optional) The HTML data for the button that goes to the next page of the chapter list """
+  _chapter_list_next_page_htmldata: HtmlElementData = None
+
+  """ (Optional) The HTML data for the button that goes to the previous chapter when on the reading page for a chapter """
+  _prev_chapter_button_htmldata: HtmlElementData = None
+
+  """ What was read from the open chapter page. None until a chapter page is read """
+  _chapter_page: ChapterPage = None
+
+  """ Every chapter on the chapter list, oldest first. None until 'getChapterIndex' has loaded it """
+  _chapter_index: list = None
 
 
   # === Function: _getHrefFromHtmlElement ===
@@ -151,48 +452,350 @@ class Scraper():
     match = re.search(r'href="(.*?)"', html_content)
 
     # If there is some href element, then the button does contain a link!
+    # NOTE: innerHTML escapes the link ('&' -> '&amp;') and the link may be relative to the open page
     if match: 
-      return match.group(1)
+      return urljoin(self._page_url, html.unescape(match.group(1)))
     # Else, return None since it doesn't exist
     else:
       return None
 
 
-  # === Function: _getInitialChapterUrl ===
-  def _getInitialChapterUrl(self, chapter_num: int) -> str | None:
+  # === Function: _addTiming ===
+  def _addTiming(self, timings: dict[str, float] | None, phase: str, seconds: float) -> None:
     """
-    Get the url to the initial chapter to scrape
+    Add time to a step of a chapter's timings
 
     Params:
-      chapter_num: Chapter to start scraping on (If this chapter doesnt exist, this function will return None)
+      timings: Chapter's timings OR None if they aren't being kept
+      phase: Step the time was spent on (See 'ChapterRecord')
+      seconds: Seconds spent
+    """
+
+    if (timings != None):
+      timings[phase] = timings.get(phase, 0.0) + seconds
+
+
+  # === Function: _getReconnectTime ===
+  def _getReconnectTime(self, url: str) -> float:
+    """
+    Get how long the browser should stay disconnected while a page loads. The full '_RECONNECT_TIME' is only needed
+    when a challenge is likely; once past it, about as long as the host's pages usually take is enough
+
+    Params:
+      url: Url of the page about to be opened
 
     Returns:
-      str | None: The URL to the initial chapter to scrape OR None if the webpage doesn't exist
+      float: Seconds
+    """
+
+    if (self._expect_challenge):
+      return self._RECONNECT_TIME
+
+    return LatencyTracker.getForHost(url).getWaitTime(50, 1.0, self._MIN_RECONNECT_TIME, self._RECONNECT_TIME)
+
+
+  # === Function: _getChapterReadyScript ===
+  def _getChapterReadyScript(self) -> str:
+    """
+    Get the script that checks if a chapter page has loaded (See '_CHAPTER_READY_SCRIPT')
+
+    Returns:
+      str: The script, filled in with the text body and next button's lookups
+    """
+
+    return self._CHAPTER_READY_SCRIPT.format(
+      text_lookup=self.getChapterTextBodyHtmlData().getJsLookup(),
+      next_lookup=self.getNextChapterButtonHtmlData().getJsLookup()
+    )
+
+
+  # === Function: _getChapterReadyTimeout ===
+  def _getChapterReadyTimeout(self, url: str) -> float:
+    """
+    Get how long a chapter page may take to load, sized from the host's recent pages (see 'LatencyTracker')
+
+    Params:
+      url: Url of the chapter page
+
+    Returns:
+      float: Seconds
+    """
+
+    return LatencyTracker.getForHost(url).getWaitTime(90, 3.0, self._MIN_READY_TIMEOUT, self._MAX_READY_TIMEOUT)
+
+
+  # === Function: _isChapterPageReady ===
+  def _isChapterPageReady(self, text_length: int, has_next_button: bool, ready_state: str, last_text_length: int) -> bool:
+    """
+    Check a result of '_CHAPTER_READY_SCRIPT': the page finished loading with its text in, OR the text and next button
+    are in and the text stopped growing since the last check
+
+    Params:
+      text_length: Length of the text body's text (-1 if it's missing)
+      has_next_button: Is the next button on the page
+      ready_state: The page's 'document.readyState'
+      last_text_length: 'text_length' of the last check (-1 if there wasn't one)
+
+    Returns:
+      bool: True if the chapter's text can be read
+    """
+
+    is_loaded: bool = text_length > 0 and ready_state == "complete"
+    is_settled: bool = text_length > 0 and has_next_button and text_length == last_text_length
+    return is_loaded or is_settled
+
+
+  # === Function: _waitForChapterPage ===
+  def _waitForChapterPage(self, url: str) -> None:
+    """
+    Wait until the chapter page in the browser has its text, i.e. the text body exists and has stopped growing (or
+    the page finished loading). Returns right away for a page that is already loaded. How long it may take is sized
+    from the host's recent pages (see 'LatencyTracker'); if it runs out the page is read as it is
+
+    Params:
+      url: Url of the open chapter page
+    """
+
+    timeout: float = self._getChapterReadyTimeout(url)
+    script: str = self._getChapterReadyScript()
+
+    start_time: float = time.perf_counter()
+    last_text_length: int = -1
+    while True:
+      try:
+        text_length, has_next_button, ready_state, load_time = self._driver.execute_script(script)
+      # Bad selector, etc. | NOTE: 'find_element' will report it
+      except (JavascriptException, TypeError, ValueError):
+        return
+
+      elapsed_time: float = time.perf_counter() - start_time
+      if (self._isChapterPageReady(text_length, has_next_button, ready_state, last_text_length)):
+        LatencyTracker.getForHost(url).record(load_time if (load_time > 0) else elapsed_time)
+        return
+
+      if (elapsed_time >= timeout):
+        print(f"Chapter text still loading after {timeout:.1f}s, reading it as it is.")
+        return
+
+      last_text_length = text_length
+      time.sleep(self._READY_POLL_INTERVAL)
+
+
+  # === Function: _openPageWithWebDriver ===
+  def _openPageWithWebDriver(self, url: str, timings: dict[str, float] | None = None, is_chapter: bool = False, acquire: bool = True):
+    """
+    Open a page in the browser, solving the CAPTCHA if one shows up. The browser is started if it isn't already.
+    Cookies that got past a challenge are saved for the host (see 'ClearanceStore'), so other browsers and the http
+    backend can use them
+
+    Params:
+      url: Url of the page to open
+      timings: If given, the seconds spent on each step ("wait", "request", "captcha" OR "challenge") are added to it
+      is_chapter: Is it a chapter page (waits for the chapter's text to load, see '_waitForChapterPage')
+      acquire: Should the host's rate limiter be waited on (False when this load is the fallback of one that already
+               waited, i.e. a challenge page came back)
+
+    Returns:
+      The web driver, which is now on the page
+
+    Raises:
+      WebDriverException: If the browser was closed
+    """
+
+    if (not self.isWebDriverInitialized()):
+      self.initializeWebDriver()
+    # NOTE: A browser with tabs open is only replaced by 'startChapterInTab', once none of them are loading
+    elif (len(self._tab_handles) <= 1 and self._driver_session.needsRecycle(self._driver_session_settings)):
+      print("Replacing the browser (it reached its page or memory limit).")
+      self.uninitializeWebDriver()
+      self.initializeWebDriver()
+
+    rate_limiter: RateLimiter = self.getRateLimiter(url)
+    if (acquire):
+      self._addTiming(timings, "wait", rate_limiter.acquire())
+
+    self._driver_session.countPage()
+    start_time: float = time.perf_counter()
+    self._driver.uc_open_with_reconnect(url, reconnect_time=self._getReconnectTime(url))
+    opened_time: float = time.perf_counter()
+
+    # Only click through the CAPTCHA if there is one
+    on_challenge: bool = isChallengeTitle(self._driver.title)
+    self._expect_challenge = on_challenge
+    if (on_challenge):
+      clearance_store: ClearanceStore = ClearanceStore.getForHost(url)
+
+      # Another browser may have passed the challenge since this one got its cookies, so try those first
+      if (clearance_store.getVersion() > self._driver_session.getClearanceVersion()):
+        clearance_version: int = clearance_store.applyToDriver(self._driver)
+        if (clearance_version > 0):
+          self._driver_session.setClearanceVersion(clearance_version)
+          self._driver.uc_open_with_reconnect(url, reconnect_time=self._RECONNECT_TIME)
+          on_challenge = isChallengeTitle(self._driver.title)
+
+      if (on_challenge):
+        self._driver.uc_gui_click_captcha()
+        on_challenge = isChallengeTitle(self._driver.title)
+
+      # Share the clearance
+      if (not on_challenge):
+        clearance_store.updateFromDriver(self._driver)
+        self._driver_session.setClearanceVersion(clearance_store.getVersion())
+
+    clicked_time: float = time.perf_counter()
+
+    # Still stuck on the challenge page means the site wants us to slow down | NOTE: The whole load was lost to it
+    if (on_challenge):
+      rate_limiter.reportThrottled()
+      self._addTiming(timings, "challenge", clicked_time - start_time)
+    else:
+      rate_limiter.reportSuccess()
+      self._addTiming(timings, "request", opened_time - start_time)
+      self._addTiming(timings, "captcha", clicked_time - opened_time)
+
+      # The browser can hand the page back before the chapter's text is in
+      if (is_chapter):
+        self._waitForChapterPage(url)
+        self._addTiming(timings, "request", time.perf_counter() - clicked_time)
+
+    self._page = self._driver
+    self._page_url = url
+    return self._page
+
+
+  # === Function: _openFetchResult ===
+  def _openFetchResult(self, url: str, result: FetchResult | None, request_time: float, timings: dict[str, float] | None = None, is_chapter: bool = False):
+    """
+    Open a page the http backend loaded. A challenge page falls back to the browser
+
+    Params:
+      url: Url of the page
+      result: What 'fetchPage' returned
+      request_time: Seconds 'fetchPage' took
+      timings: If given, the seconds spent on each step of loading the page are added to it (See 'ChapterRecord')
+      is_chapter: Is it a chapter page (the browser waits for the chapter's text to load)
+
+    Returns:
+      The open page (the web driver OR an 'HtmlDocument') OR None if the page couldn't be loaded
+
+    Raises:
+      WebDriverException: If the browser was closed
+    """
+
+    rate_limiter: RateLimiter = self.getRateLimiter(url)
+
+    # Connection error, timeout, etc.
+    if (result == None):
+      self._addTiming(timings, "request", request_time)
+      return None
+
+    # A bot check needs a real browser to get past
+    if (result.isChallenge()):
+      rate_limiter.reportThrottled()
+      self._addTiming(timings, "challenge", request_time)
+      print(f"Challenge page detected for {url}, falling back to the web driver.")
+      return self._openPageWithWebDriver(url, timings, is_chapter, acquire=False)
+
+    self._addTiming(timings, "request", request_time)
+
+    # Only a page that loaded counts as a success | NOTE: Other errors (i.e. 404) say nothing about the rate
+    if (result.isOk()):
+      rate_limiter.reportSuccess()
+    elif (result.isThrottled()):
+      rate_limiter.reportThrottled()
+
+    if (not result.isOk()):
+      print(f"Received HTTP {result.status} for {url}.")
+      return None
+
+    self._page = result.getDocument()
+    self._page_url = result.url
+    return self._page
+
+
+  # === Function: _openPage ===
+  def _openPage(self, url: str, timings: dict[str, float] | None = None, is_chapter: bool = False):
+    """
+    Open a page with the scraper's fetch backend. The http backend falls back to the browser when it gets a
+    challenge page
+
+    Params:
+      url: Url of the page to open
+      timings: If given, the seconds spent on each step of loading the page are added to it (See 'ChapterRecord')
+      is_chapter: Is it a chapter page (the browser waits for the chapter's text to load)
+
+    Returns:
+      The open page (the web driver OR an 'HtmlDocument') OR None if the page couldn't be loaded
+
+    Raises:
+      WebDriverException: If the browser was closed
+    """
+
+    # Replaying from the page cache never touches the network
+    if (self.isReplayingFromCache()):
+      start_time: float = time.perf_counter()
+      result: FetchResult | None = self.fetchPage(url)
+      self._addTiming(timings, "request", time.perf_counter() - start_time)
+      if (result == None):
+        return None
+
+      self._page = result.getDocument()
+      self._page_url = result.url
+      return self._page
+
+    if (self._fetch_backend == FetchBackends.HTTP):
+      self._addTiming(timings, "wait", self.getRateLimiter(url).acquire())
+
+      start_time: float = time.perf_counter()
+      result: FetchResult | None = self.fetchPage(url)
+      return self._openFetchResult(url, result, time.perf_counter() - start_time, timings, is_chapter)
+
+    self._openPageWithWebDriver(url, timings, is_chapter)
+
+    # Cache what the browser loaded, unless it's stuck on a challenge page
+    page_cache: PageCache | None = self.getPageCache()
+    if (page_cache != None and not isChallengeTitle(self._driver.title)):
+      page_cache.put(url, FetchResult(url, 200, {}, self._driver.page_source, 0.0))
+
+    return self._page
+
+
+  # === Function: _getChapterListPageItems ===
+  def _getChapterListPageItems(self, page_url: str) -> tuple[list[tuple[str | None, str]], str | None] | None:
+    """
+    Open one page of the chapter list and get the link and title of every chapter on it
+
+    Params:
+      page_url: Url of the chapter list page to open
+
+    Returns:
+      tuple | None: ([(href, title), ...] in the order shown on the page, url of the next chapter list page OR None)
+                    OR None if the webpage doesn't exist
     """
 
     # Open web novel chapter list page
     try:
-      self._driver.uc_open_with_reconnect(self.getNovelChapterListUrl(), reconnect_time=self._RECONNECT_TIME)
-      self._driver.uc_gui_click_captcha()
-
-      # # Loop through each <li> element and print its data-index attribute and text
-      # for i, li in enumerate(list_items):
-      #   data_index = li.get_attribute("data-index")
-      #   text = li.text
-      #   print(f"Item {i} - data-")
+      page = self._openPage(page_url)
+      if (page == None):
+        return None
 
       try:
-        # Get the target <ul> element on the chapter list page
+        # Get the target <ul> element on the chapter list page | NOTE: Only the browser needs to wait for it to load
         list_body_params: Scraper.HtmlElementData = self.getChapterListBodyHtmlData()
-        ul_element = self._wait.until(EC.presence_of_element_located((list_body_params.by, list_body_params.element)))
+        if (page is self._driver):
+          ul_element = self._wait.until(EC.presence_of_element_located((list_body_params.by, list_body_params.element)))
+        else:
+          ul_element = page.find_element(list_body_params.by, list_body_params.element)
 
         # Find all <li> elements inside that <ul>
         list_item_params: Scraper.HtmlElementData = self.getChapterListItemHtmlData()
         list_items = ul_element.find_elements(list_item_params.by, list_item_params.element)
 
-        # Return the link OR 'None' if it doesn't exist | NOTE: Get the Nth from the end chapter num
-        # TODO: Get the ending chapter number by taking the size of the list_items array (only if it was assigned 'Limits.INT_MAX' ofc)
-        return self._getHrefFromHtmlElement(list_items[-chapter_num])
+        # Get the link and title of each chapter | NOTE: Whitespace is collapsed since list items span several lines
+        page_items: list[tuple[str | None, str]] = [
+          (self._getHrefFromHtmlElement(li), " ".join(li.text.split()))
+          for li in list_items
+        ]
 
       # Element not found
       except NoSuchElementException:
@@ -203,6 +806,19 @@ class Scraper():
       except Exception as e:
         print(f"Error: [{e}]")
         return None
+
+      # Get the next page of the chapter list, if the site paginates it
+      next_page_url: str | None = None
+      next_page_params: Scraper.HtmlElementData = self.getChapterListNextPageHtmlData()
+      if (next_page_params.element != None):
+        try:
+          next_page_element = page.find_element(next_page_params.by, next_page_params.element)
+          next_page_url = self._getHrefFromHtmlElement(next_page_element)
+        except NoSuchElementException:
+          # No next page button means this is the last page
+          pass
+
+      return page_items, next_page_url
     
     # Web driver was closed
     except WebDriverException:
@@ -210,21 +826,22 @@ class Scraper():
       return None
 
 
-  # === Function: _findNextChapterUrl ===
-  def _findNextChapterUrl(self) -> str | None:
+  # === Function: _findButtonUrl ===
+  def _findButtonUrl(self, page, data_params: HtmlElementData) -> str | None:
     """
-    Get the URL for the next chapter button. Use when on a chapter page.
+    Get the URL behind a button on a page, with one 'find_element' call
+
+    Params:
+      page: The web driver OR an 'HtmlDocument'
+      data_params: HTML data of the button
 
     Returns:
-      str | None: The URL to the initial chapter to scrape OR None if the webpage doesn't exist
+      str | None: The button's URL OR None if the button (or its link) doesn't exist
     """
 
-    # Get the params to be used in 'find_element'
-    data_params: Scraper.HtmlElementData = self.getNextChapterButtonHtmlData()
-
     try:
-      # Get the target element
-      target_element = self._driver.find_element(data_params.by, data_params.element)
+      # Get the target element on the open page
+      target_element = page.find_element(data_params.by, data_params.element)
 
       # Return the link OR 'None' if it doesn't exist
       return self._getHrefFromHtmlElement(target_element)
@@ -239,340 +856,1976 @@ class Scraper():
       return None
 
 
-  # === Function: _scrapeChapter ===
-  def _scrapeChapter(self, url: str) -> str | None:
+  # === Function: _findNextChapterUrl ===
+  def _findNextChapterUrl(self) -> str | None:
     """
-    Does the actual scraping of chapter data. Utilizes '_chapter_text_body_htmldata'
+    Get the URL for the next chapter button. Use when on a chapter page.
 
-    Params:
-      url: Url to scrape data from
+    NOTE: Uses what 'extractChapterPage' already read off the open page, if it was read
 
     Returns:
-      str OR None: The URL to the initial chapter to scrape OR None if the webpage doesn't exist
+      str | None: The URL to the initial chapter to scrape OR None if the webpage doesn't exist
     """
-    
-    try:
-      self._driver.uc_open_with_reconnect(url, reconnect_time=self._RECONNECT_TIME)
-      self._driver.uc_gui_click_captcha()
-      
-      # Get the params to be used in 'find_element'
-      data_params: Scraper.HtmlElementData = self.getChapterTextBodyHtmlData()
 
-      try:
-        # Get the target element
-        element = self._driver.find_element(data_params.by, data_params.element)
-      
-        # Return the element's text if possible
-        return element.text
+    if (self._chapter_page != None and self._chapter_page.url == self._page_url):
+      return self._chapter_page.next_url
 
-      # Element not found
-      except NoSuchElementException:
-        print("No such element.")
-        return None
+    return self._findButtonUrl(self._page, self.getNextChapterButtonHtmlData())
 
 
-      except Exception as e:
-        # If there is no such element, print the error and return 'None'
-        print(f"Error: {e}")
-        return None
-    
-    # Web driver was closed
-    except WebDriverException:
-      print("Exited WebDriver early, returning None.")
+  # === Function: _extractChapterPageWithWebDriver ===
+  def _extractChapterPageWithWebDriver(self) -> ChapterPage | None:
+    """
+    Read the chapter page open in the browser with one script call, instead of a round trip (and an innerHTML
+    transfer) per element
+
+    Returns:
+      ChapterPage | None: What was read OR None if the script failed (i.e. a selector the browser rejects)
+    """
+
+    prev_params: Scraper.HtmlElementData = self.getPrevChapterButtonHtmlData()
+    script: str = self._CHAPTER_EXTRACT_SCRIPT.format(
+      text_lookup=self.getChapterTextBodyHtmlData().getJsLookup(),
+      next_lookup=self.getNextChapterButtonHtmlData().getJsLookup(),
+      prev_lookup=prev_params.getJsLookup() if (prev_params.element != None) else "null"
+    )
+
+    try:
+      text, title, next_href, prev_href = self._driver.execute_script(script)
+    except (JavascriptException, TypeError, ValueError) as e:
+      print(f"Could not read the page in one call, falling back to 'find_element': {e}")
       return None
-  
 
-  # ******************************************** #
-  # ****************** Public ****************** #
-  # ******************************************** #
+    # NOTE: The hrefs are as written in the page, so they may be relative to it
+    return Scraper.ChapterPage(
+      self._page_url,
+      text.strip() if (text != None) else None,
+      (title or "").strip(),
+      urljoin(self._page_url, next_href) if (next_href) else None,
+      urljoin(self._page_url, prev_href) if (prev_href) else None
+    )
 
 
-  # === Function: __init__ ===
-  def __init__(self, novel_url: str = "") -> None:
+  # === Function: _replaceFile ===
+  def _replaceFile(self, path: str, data: bytes) -> None:
     """
-    Constructor -> Sets novel chapter list url and elements to check now
+    Write a file in one step, through a uniquely named temporary file next to it, so a crash never leaves a cut off
+    file and writers in other processes never share a temporary file
 
-    Args:
-      novel_url: Url of the novel's chapter list to scrape
+    Params:
+      path: Path of the file
+      data: Data to write
     """
 
-    # Load the default settings
-    # TODO: Eventually add some actual '_default_settings' variable that can be used to change the default sraper settings
-    self.loadScraperSettings("booktoki.ini")
-
-    self.setNovelChapterListUrl(novel_url)
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+      with os.fdopen(fd, "wb") as f:
+        f.write(data)
+      os.replace(temp_path, path)
+    except BaseException:
+      with contextlib.suppress(OSError):
+        os.remove(temp_path)
+      raise
 
 
-  # === Function: initializeWebDriver ===
-  def initializeWebDriver(self) -> None:
+  # === Function: _loadChapterUrls ===
+  def _loadChapterUrls(self, manifest: ScrapeManifest | None) -> dict[int, str | None]:
     """
-    Initialize the web driver object
+    Load the chapter list and remember every chapter's url in the manifest
+
+    Params:
+      manifest: Manifest of the output directory OR None if not saving to files
+
+    Returns:
+      dict[int, str | None]: Chapter number -> url, for every chapter on the chapter list (Empty if the chapter list
+                             couldn't be read)
+    """
+
+    chapter_index: list[Scraper.ChapterIndexEntry] | None = self.getChapterIndex()
+    if (chapter_index == None):
+      return {}
+
+    chapter_urls: dict[int, str | None] = {entry.chapter_num: entry.url for entry in chapter_index}
+
+    if (manifest != None):
+      manifest.setChapterUrls(chapter_urls)
+
+    return chapter_urls
+
+
+  # === Function: _getChapterTitle ===
+  def _getChapterTitle(self, chapter_num: int) -> str:
+    """
+    Get a chapter's title from the chapter list if it was loaded, otherwise from the page that is open
+
+    Params:
+      chapter_num: Number of the chapter
+
+    Returns:
+      str: The chapter's title OR "" if it isn't known
+    """
+
+    if (self._chapter_index != None and 1 <= chapter_num <= len(self._chapter_index)):
+      return self._chapter_index[chapter_num - 1].title
+
+    if (self._chapter_page != None and self._chapter_page.url == self._page_url):
+      return self._chapter_page.title
+
+    if (self._page != None):
+      return self._page.title.strip()
+
+    return ""
+
+
+  # === Function: _fetchInBackground ===
+  def _fetchInBackground(self, url: str, timings: dict[str, float]) -> tuple[FetchResult | None, float]:
+    """
+    Load a page with the http backend, on the prefetch thread (See '_prefetchChapter')
+
+    Params:
+      url: Url of the page
+      timings: The seconds spent waiting for the rate limiter ("wait") are added to it
+
+    Returns:
+      tuple[FetchResult | None, float]: What 'fetchPage' returned and how many seconds it took
+    """
+
+    self._addTiming(timings, "wait", self.getRateLimiter(url).acquire())
+
+    start_time: float = time.perf_counter()
+    result: FetchResult | None = self.fetchPage(url)
+    return (result, time.perf_counter() - start_time)
+
+
+  # === Function: _prefetchChapter ===
+  def _prefetchChapter(self, url: str) -> None:
+    """
+    Start loading a chapter in the background, so it loads while the current one is formatted and saved. The next
+    '_scrapeChapter' for the url picks it up. The browser loads it in a second tab, the http backend on a thread
+
+    NOTE: Waits for the rate limiter before it starts loading
+
+    Params:
+      url: Url of the chapter page
+    """
+
+    self._cancelPrefetch()
+    timings: dict[str, float] = {}
+
+    if (self._fetch_backend == FetchBackends.HTTP):
+      if (self._prefetch_executor == None):
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="Prefetch")
+
+      self._prefetch = {"url": url, "timings": timings, "future": self._prefetch_executor.submit(self._fetchInBackground, url, timings)}
+      return
+
+    if (self.getTabCount() < 2):
+      self.openTabs(2)
+
+    # Load it in the tab that isn't showing the current chapter
+    tab: int = (self._current_tab + 1) % self.getTabCount()
+    self.startChapterInTab(tab, url, timings)
+    self._prefetch = {"url": url, "timings": timings, "tab": tab}
+
+
+  # === Function: _cancelPrefetch ===
+  def _cancelPrefetch(self) -> None:
+    """
+    Forget the chapter loading in the background, if there is one | NOTE: An http load already started still finishes
+    """
+
+    if (self._prefetch != None and "tab" in self._prefetch):
+      self._tab_loads.pop(self._prefetch["tab"], None)
+
+    self._prefetch = None
+
+
+  # === Function: _finishPrefetch ===
+  def _finishPrefetch(self, timings: dict[str, float] | None = None) -> str | None:
+    """
+    Wait for the chapter loading in the background and read it (See '_prefetchChapter')
+
+    Params:
+      timings: If given, the seconds spent loading and reading the page are added to it
+
+    Returns:
+      str | None: The chapter's text OR None if no data was received (See 'getLastFailureReason')
+    """
+
+    prefetch: dict = self._prefetch
+    self._prefetch = None
+
+    for phase, seconds in prefetch["timings"].items():
+      self._addTiming(timings, phase, seconds)
+
+    if ("tab" in prefetch):
+      while (not self.isChapterInTabReady(prefetch["tab"])):
+        time.sleep(self._READY_POLL_INTERVAL)
+
+      return self.finishChapterInTab(prefetch["tab"], False, timings)
+
+    try:
+      result, request_time = prefetch["future"].result()
+      self._chapter_page = None
+      page = self._openFetchResult(prefetch["url"], result, request_time, timings, is_chapter=True)
+      if (page == None):
+        self._last_failure_reason = ScrapeMetrics.FailureReasons.FETCH
+        return None
+
+      return self._readChapterPage(page, timings)
+
+    # Web driver was closed (while getting past a challenge)
+    except WebDriverException:
+      self._markWebDriverFailed()
+      return None
+
+
+  # === Function: _readChapterPage ===
+  def _readChapterPage(self, page, timings: dict[str, float] | None = None) -> str | None:
+    """
+    Read the chapter off a loaded chapter page, remembering why if it can't be (See 'getLastFailureReason')
+
+    Params:
+      page: The web driver (on a chapter page) OR an 'HtmlDocument' of a chapter page
+      timings: If given, the seconds spent reading ("extract") the page are added to it
+
+    Returns:
+      str | None: The chapter's text OR None if the page doesn't have any
+    """
+
+    start_time: float = time.perf_counter()
+    self._chapter_page = self.extractChapterPage(page)
+    self._addTiming(timings, "extract", time.perf_counter() - start_time)
+
+    # Never got past the bot check
+    if (self._chapter_page.health == Scraper.ChapterPage.Healths.CHALLENGE):
+      self._last_failure_reason = ScrapeMetrics.FailureReasons.FETCH
+      return None
+
+    if (self._chapter_page.text == None):
+      self._last_failure_reason = ScrapeMetrics.FailureReasons.NO_SUCH_ELEMENT
+
+    return self._chapter_page.text
+
+
+  # === Function: _formatChapterText ===
+  def _formatChapterText(self, chapter_text: str | None, format_text: bool, timings: dict[str, float] | None = None) -> str | None:
+    """
+    Format a chapter's text, if set
+
+    Params:
+      chapter_text: The chapter's text OR None if it couldn't be scraped
+      format_text: Should the text be formatted into a more readable form?
+      timings: If given, the seconds spent formatting ("format") are added to it
+
+    Returns:
+      str | None: The (formatted) text OR None if there was none
+    """
+
+    if (format_text and chapter_text):
+      start_time: float = time.perf_counter()
+      chapter_text = formatNovelText(chapter_text)
+      self._addTiming(timings, "format", time.perf_counter() - start_time)
+
+    return chapter_text
+
+
+  # === Function: _scrapeChapter ===
+  def _scrapeChapter(self, url: str, timings: dict[str, float] | None = None) -> str | None:
+    """
+    Does the actual scraping of chapter data. Utilizes '_chapter_text_body_htmldata'
+
+    Params:
+      url: Url to scrape data from
+      timings: If given, the seconds spent loading (See '_openPage') and reading ("extract") the page are added to it
+
+    Returns:
+      str OR None: The URL to the initial chapter to scrape OR None if the webpage doesn't exist
+    """
+
+    # The chapter may already be loading in the background
+    if (self._prefetch != None):
+      if (self._prefetch["url"] == url):
+        return self._finishPrefetch(timings)
+      self._cancelPrefetch()
+    
+    try:
+      self._chapter_page = None
+      page = self._openPage(url, timings, is_chapter=True)
+      if (page == None):
+        self._last_failure_reason = ScrapeMetrics.FailureReasons.FETCH
+        return None
+
+      return self._readChapterPage(page, timings)
+    
+    # Web driver was closed
+    except WebDriverException:
+      self._markWebDriverFailed()
+      return None
+
+
+  # === Function: _markWebDriverFailed ===
+  def _markWebDriverFailed(self) -> None:
+    """
+    Record that the browser failed (i.e. it was closed) while scraping a chapter
+    """
+
+    print("Exited WebDriver early, returning None.")
+    self._last_failure_reason = ScrapeMetrics.FailureReasons.WEB_DRIVER
+
+    # Don't hand a dead browser to the next scrape
+    if (self.isWebDriverInitialized()):
+      self._driver_session.markBroken()
+  
+
+  # ******************************************** #
+  # ****************** Public ****************** #
+  # ******************************************** #
+
+
+  # === Function: __init__ ===
+  def __init__(self, novel_url: str = "") -> None:
+    """
+    Constructor -> Sets novel chapter list url and elements to check now
+
+    Args:
+      novel_url: Url of the novel's chapter list to scrape
+    """
+
+    # Give this scraper its own browser session and html data
+    self._wait = None
+    self._driver = None
+    self._driver_session = None
+    self._expect_challenge = True
+    self._tab_handles = []
+    self._tab_loads = {}
+    self._current_tab = 0
+    self._prefetch = None
+    self._prefetch_executor = None
+    self._page = None
+    self._http_fetch_backend = None
+    self._owns_http_fetch_backend = False
+    self._chapter_list_body_htmldata = Scraper.HtmlElementData()
+    self._chapter_list_item_htmldata = Scraper.HtmlElementData()
+    self._next_chapter_button_htmldata = Scraper.HtmlElementData()
+    self._chapter_text_body_htmldata = Scraper.HtmlElementData()
+    self._chapter_list_next_page_htmldata = Scraper.HtmlElementData()
+    self._prev_chapter_button_htmldata = Scraper.HtmlElementData()
+    self._chapter_page = None
+    self._chapter_index = None
+    self._rate_limit_settings = RateLimiter.Settings()
+    self._page_cache_settings = PageCache.Settings()
+    self._metrics_server_settings = MetricsServer.Settings()
+    self._driver_session_settings = DriverSessionManager.Settings()
+
+    # Load the default settings
+    # TODO: Eventually add some actual '_default_settings' variable that can be used to change the default sraper settings
+    self.loadScraperSettings("booktoki.ini")
+
+    self.setNovelChapterListUrl(novel_url)
+
+
+  # === Function: initializeWebDriver ===
+  def initializeWebDriver(self, headless: bool | None = None) -> None:
+    """
+    Initialize the web driver object. A warm browser left by an earlier scrape is reused if there is one, otherwise a
+    new one starts with the site's saved cookies (so it doesn't have to pass the challenge again)
+
+    Params:
+      headless: Should the browser run without a window (useful when running against a local test site). If None,
+                the value from 'setHeadless' (OR the settings file) is used
+    """
+
+    if (headless != None):
+      self._headless = headless
+
+    # The browser's options come from '[DriverSettings]', unless headless was set in code
+    driver_session_settings: DriverSessionManager.Settings = self._driver_session_settings
+    if (self._headless != None):
+      driver_session_settings = copy.copy(driver_session_settings)
+      driver_session_settings.headless = DriverSessionManager.HeadlessModes.ON if (self._headless) else DriverSessionManager.HeadlessModes.OFF
+
+    host: str | None = urlsplit(self.getNovelChapterListUrl()).hostname
+    self._driver_session = DriverSessionManager.acquireSession(driver_session_settings, host)
+    self._driver = self._driver_session.getDriver()
+    self._wait = WebDriverWait(self._driver, self._RECONNECT_TIME)
+    self._expect_challenge = self._driver_session.getPageCount() == 0
+
+    if (host != None and self._driver_session.getClearanceVersion() == 0):
+      self._driver_session.setClearanceVersion(ClearanceStore.getForHost(host).applyToDriver(self._driver))
+  
+
+  # === Function: uninitializeWebDriver ===
+  def uninitializeWebDriver(self) -> None:
+    """
+    Reset the driver object to null and give the browser back to 'DriverSessionManager' (which keeps it warm for the
+    next scrape OR closes it)
+    """
+    
+    # The open page goes away with the browser
+    if (self._page is self._driver):
+      self._page = None
+
+    # A warm browser is handed out with one tab
+    self.closeTabs()
+
+    DriverSessionManager.releaseSession(self._driver_session, self._driver_session_settings)
+    self._driver_session = None
+    self._driver = None
+    self._wait = None
+
+
+  # === Function: close ===
+  def close(self) -> None:
+    """
+    Close the browser (if open) and the http session (if this scraper created it)
+    """
+
+    if (self.isWebDriverInitialized()):
+      self.uninitializeWebDriver()
+
+    self._cancelPrefetch()
+    if (self._prefetch_executor != None):
+      self._prefetch_executor.shutdown()
+      self._prefetch_executor = None
+
+    if (self._owns_http_fetch_backend and self._http_fetch_backend != None):
+      self._http_fetch_backend.close()
+      self._http_fetch_backend = None
+      self._owns_http_fetch_backend = False
+
+    # Save the page cache's last access times, so eviction knows which pages were used
+    page_cache: PageCache | None = self.getPageCache()
+    if (page_cache != None):
+      page_cache.flush()
+  
+
+  # === Function: isWebDriverInitialized ===
+  def isWebDriverInitialized(self) -> bool:
+    """
+    Check if this scraper currently has a browser session
+
+    Returns:
+      bool: True if 'initializeWebDriver' has been called without a matching 'uninitializeWebDriver'
+    """
+
+    return self._driver != None
+
+
+  # === Function: loadScraperSettings ===
+  def loadScraperSettings(self, filename: str, path_override: bool = False) -> None:
+    """
+    Loads in settings from a file
+
+    Params:
+      filename: Name of the file to load from
+      path_override: If this value is "True" then the filename is assumed to be the full path
+    """
+    
+    # Print a module separator
+    printModuleSeparator()
+
+    # Log filename
+    print(f'Loading Scraper Settings: "{filename}"\n')
+
+    # Get full file path
+    full_file_path: str = ""
+    if (path_override):
+      # If true, then the filename is the full path
+      full_file_path += filename
+    else:
+      # If false(default value), then the filename is just the name of the file that is in the expected location
+      full_file_path += self._SCRAPER_SETTINGS_DIRECTORY_PATH + "/" + filename
+
+    # Get the line data of the file
+    config = configparser.ConfigParser()
+    config.read(full_file_path)
+
+    # Get sections
+    chapter_list_body_section = config[Scraper._SCRAPER_SETTINGS_CHAPTER_LIST_BODY_HTMLDATA_HEADER]
+    chapter_list_item_section = config[Scraper._SCRAPER_SETTINGS_CHAPTER_LIST_ITEM_HTMLDATA_HEADER]
+    next_chapter_button_section = config[Scraper._SCRAPER_SETTINGS_NEXT_CHAPTER_BUTTON_HTMLDATA_HEADER]
+    text_body_section = config[Scraper._SCRAPER_SETTINGS_CHAPTER_TEXT_BODY_HTMLDATA_HEADER]
+
+    # Optional sections
+    next_page_section = config[Scraper._SCRAPER_SETTINGS_CHAPTER_LIST_NEXT_PAGE_HTMLDATA_HEADER] if (config.has_section(Scraper._SCRAPER_SETTINGS_CHAPTER_LIST_NEXT_PAGE_HTMLDATA_HEADER)) else None
+    prev_chapter_section = config[Scraper._SCRAPER_SETTINGS_PREV_CHAPTER_BUTTON_HTMLDATA_HEADER] if (config.has_section(Scraper._SCRAPER_SETTINGS_PREV_CHAPTER_BUTTON_HTMLDATA_HEADER)) else None
+    fetch_section = config[Scraper._SCRAPER_SETTINGS_FETCH_HEADER] if (config.has_section(Scraper._SCRAPER_SETTINGS_FETCH_HEADER)) else None
+    rate_limit_section = config[Scraper._SCRAPER_SETTINGS_RATE_LIMIT_HEADER] if (config.has_section(Scraper._SCRAPER_SETTINGS_RATE_LIMIT_HEADER)) else None
+    cache_section = config[Scraper._SCRAPER_SETTINGS_CACHE_HEADER] if (config.has_section(Scraper._SCRAPER_SETTINGS_CACHE_HEADER)) else None
+    output_section = config[Scraper._SCRAPER_SETTINGS_OUTPUT_HEADER] if (config.has_section(Scraper._SCRAPER_SETTINGS_OUTPUT_HEADER)) else None
+    metrics_section = config[Scraper._SCRAPER_SETTINGS_METRICS_HEADER] if (config.has_section(Scraper._SCRAPER_SETTINGS_METRICS_HEADER)) else None
+    driver_section = config[Scraper._SCRAPER_SETTINGS_DRIVER_HEADER] if (config.has_section(Scraper._SCRAPER_SETTINGS_DRIVER_HEADER)) else None
+
+    # List body
+    self._chapter_list_body_htmldata.by = chapter_list_body_section.get(Scraper.HtmlElementData.BY).strip('"')
+    self._chapter_list_body_htmldata.element = chapter_list_body_section.get(Scraper.HtmlElementData.ELEMENT).strip('"')
+
+    # List item
+    self._chapter_list_item_htmldata.by = chapter_list_item_section.get(Scraper.HtmlElementData.BY).strip('"')
+    self._chapter_list_item_htmldata.element = chapter_list_item_section.get(Scraper.HtmlElementData.ELEMENT).strip('"')
+
+    # Next chapter button
+    self._next_chapter_button_htmldata.by = next_chapter_button_section.get(Scraper.HtmlElementData.BY).strip('"')
+    self._next_chapter_button_htmldata.element = next_chapter_button_section.get(Scraper.HtmlElementData.ELEMENT).strip('"')
+
+    # Text body
+    self._chapter_text_body_htmldata.by = text_body_section.get(Scraper.HtmlElementData.BY).strip('"')
+    self._chapter_text_body_htmldata.element = text_body_section.get(Scraper.HtmlElementData.ELEMENT).strip('"')
+
+    # Chapter list next page button (Optional, only needed if the chapter list is split into pages)
+    if (next_page_section != None):
+      self._chapter_list_next_page_htmldata.by = next_page_section.get(Scraper.HtmlElementData.BY).strip('"')
+      self._chapter_list_next_page_htmldata.element = next_page_section.get(Scraper.HtmlElementData.ELEMENT).strip('"')
+    else:
+      self._chapter_list_next_page_htmldata.by = None
+      self._chapter_list_next_page_htmldata.element = None
+
+    # Previous chapter button (Optional, only read off chapter pages for callers that want it)
+    if (prev_chapter_section != None):
+      self._prev_chapter_button_htmldata.by = prev_chapter_section.get(Scraper.HtmlElementData.BY).strip('"')
+      self._prev_chapter_button_htmldata.element = prev_chapter_section.get(Scraper.HtmlElementData.ELEMENT).strip('"')
+    else:
+      self._prev_chapter_button_htmldata.by = None
+      self._prev_chapter_button_htmldata.element = None
+
+    # Print results
+    print(f"[{Scraper._SCRAPER_SETTINGS_CHAPTER_LIST_BODY_HTMLDATA_HEADER}]: "
+          f'\n{Scraper.HtmlElementData.BY} = "{self._chapter_list_body_htmldata.by}"'
+          f'\n{Scraper.HtmlElementData.ELEMENT} = "{self._chapter_list_body_htmldata.element}"'
+           "\n")
+    
+    print(f"[{Scraper._SCRAPER_SETTINGS_CHAPTER_LIST_ITEM_HTMLDATA_HEADER}]: "
+          f'\n{Scraper.HtmlElementData.BY} = "{self._chapter_list_item_htmldata.by}"'
+          f'\n{Scraper.HtmlElementData.ELEMENT} = "{self._chapter_list_item_htmldata.element}"'
+          "\n")
+    
+    print(f"[{Scraper._SCRAPER_SETTINGS_NEXT_CHAPTER_BUTTON_HTMLDATA_HEADER}]: "
+          f'\n{Scraper.HtmlElementData.BY} = "{self._next_chapter_button_htmldata.by}"'
+          f'\n{Scraper.HtmlElementData.ELEMENT} = "{self._next_chapter_button_htmldata.element}"'
+          "\n")
+    
+    print(f"[{Scraper._SCRAPER_SETTINGS_CHAPTER_TEXT_BODY_HTMLDATA_HEADER}]: "
+          f'\n{Scraper.HtmlElementData.BY} = "{self._chapter_text_body_htmldata.by}"'
+          f'\n{Scraper.HtmlElementData.ELEMENT} = "{self._chapter_text_body_htmldata.element}"'
+          "")
+
+    if (next_page_section != None):
+      print(f"\n[{Scraper._SCRAPER_SETTINGS_CHAPTER_LIST_NEXT_PAGE_HTMLDATA_HEADER}]: "
+            f'\n{Scraper.HtmlElementData.BY} = "{self._chapter_list_next_page_htmldata.by}"'
+            f'\n{Scraper.HtmlElementData.ELEMENT} = "{self._chapter_list_next_page_htmldata.element}"'
+            "")
+
+    if (prev_chapter_section != None):
+      print(f"\n[{Scraper._SCRAPER_SETTINGS_PREV_CHAPTER_BUTTON_HTMLDATA_HEADER}]: "
+            f'\n{Scraper.HtmlElementData.BY} = "{self._prev_chapter_button_htmldata.by}"'
+            f'\n{Scraper.HtmlElementData.ELEMENT} = "{self._prev_chapter_button_htmldata.element}"'
+            "")
+    
+    # Fetch backend (Optional, defaults to the browser without prefetching)
+    fetch_backend: str = FetchBackends.DRIVER
+    self._prefetch_enabled = False
+    if (fetch_section != None):
+      fetch_backend = fetch_section.get(Scraper._SCRAPER_SETTINGS_FETCH_BACKEND_KEY, FetchBackends.DRIVER).strip('"')
+      self._prefetch_enabled = fetch_section.get(Scraper._SCRAPER_SETTINGS_PREFETCH_KEY, "false").strip('"').lower() == "true"
+    self.setFetchBackend(fetch_backend)
+
+    print(f"\n[{Scraper._SCRAPER_SETTINGS_FETCH_HEADER}]: "
+          f'\n{Scraper._SCRAPER_SETTINGS_FETCH_BACKEND_KEY} = "{self._fetch_backend}"'
+          f'\n{Scraper._SCRAPER_SETTINGS_PREFETCH_KEY} = "{str(self._prefetch_enabled).lower()}"'
+          "")
+
+    # Rate limit (Optional, missing values keep their defaults)
+    self._rate_limit_settings = RateLimiter.Settings()
+    if (rate_limit_section != None):
+      self._rate_limit_settings.loadFromConfigSection(rate_limit_section)
+
+    print(f"\n[{Scraper._SCRAPER_SETTINGS_RATE_LIMIT_HEADER}]: "
+          f'\n{RateLimiter.Settings.RATE} = "{self._rate_limit_settings.rate}"'
+          f'\n{RateLimiter.Settings.BURST} = "{self._rate_limit_settings.burst}"'
+          f'\n{RateLimiter.Settings.JITTER} = "{self._rate_limit_settings.jitter}"'
+          f'\n{RateLimiter.Settings.MIN_RATE} = "{self._rate_limit_settings.min_rate}"'
+          f'\n{RateLimiter.Settings.MAX_RATE} = "{self._rate_limit_settings.max_rate}"'
+          "")
+
+    # Page cache (Optional, off by default)
+    self._page_cache_settings = PageCache.Settings()
+    if (cache_section != None):
+      self._page_cache_settings.loadFromConfigSection(cache_section)
+
+    print(f"\n[{Scraper._SCRAPER_SETTINGS_CACHE_HEADER}]: "
+          f'\n{PageCache.Settings.MODE} = "{self._page_cache_settings.mode}"'
+          f'\n{PageCache.Settings.DIRECTORY} = "{self._page_cache_settings.directory}"'
+          f'\n{PageCache.Settings.MAX_SIZE_MB} = "{self._page_cache_settings.max_size_mb}"'
+          "")
+
+    # Output (Optional, only the text is saved by default)
+    self._keep_raw_html = False
+    self._use_work_queue = False
+    output_format: str = OutputFormats.FILES
+    if (output_section != None):
+      self._keep_raw_html = output_section.get(Scraper._SCRAPER_SETTINGS_KEEP_RAW_HTML_KEY, "false").strip('"').lower() == "true"
+      output_format = output_section.get(Scraper._SCRAPER_SETTINGS_OUTPUT_FORMAT_KEY, OutputFormats.FILES).strip('"')
+      self._use_work_queue = output_section.get(Scraper._SCRAPER_SETTINGS_WORK_QUEUE_KEY, "false").strip('"').lower() == "true"
+    self.setOutputFormat(output_format)
+
+    print(f"\n[{Scraper._SCRAPER_SETTINGS_OUTPUT_HEADER}]: "
+          f'\n{Scraper._SCRAPER_SETTINGS_KEEP_RAW_HTML_KEY} = "{str(self._keep_raw_html).lower()}"'
+          f'\n{Scraper._SCRAPER_SETTINGS_OUTPUT_FORMAT_KEY} = "{self._output_format}"'
+          f'\n{Scraper._SCRAPER_SETTINGS_WORK_QUEUE_KEY} = "{str(self._use_work_queue).lower()}"'
+          "")
+
+    # Metrics endpoint (Optional, off by default)
+    self._metrics_server_settings = MetricsServer.Settings()
+    if (metrics_section != None):
+      self._metrics_server_settings.loadFromConfigSection(metrics_section)
+
+    print(f"\n[{Scraper._SCRAPER_SETTINGS_METRICS_HEADER}]: "
+          f'\n{MetricsServer.Settings.HOST} = "{self._metrics_server_settings.host}"'
+          f'\n{MetricsServer.Settings.PORT} = "{self._metrics_server_settings.port}"'
+          "")
+
+    # Browser sessions (Optional, missing values keep their defaults)
+    self._driver_session_settings = DriverSessionManager.Settings()
+    if (driver_section != None):
+      self._driver_session_settings.loadFromConfigSection(driver_section)
+
+    print(f"\n[{Scraper._SCRAPER_SETTINGS_DRIVER_HEADER}]: "
+          f'\n{DriverSessionManager.Settings.MAX_PAGES} = "{self._driver_session_settings.max_pages}"'
+          f'\n{DriverSessionManager.Settings.MAX_MEMORY_MB} = "{self._driver_session_settings.max_memory_mb}"'
+          f'\n{DriverSessionManager.Settings.MAX_IDLE_SESSIONS} = "{self._driver_session_settings.max_idle_sessions}"'
+          f'\n{DriverSessionManager.Settings.IDLE_TIMEOUT} = "{self._driver_session_settings.idle_timeout}"'
+          f'\n{DriverSessionManager.Settings.PROFILE_DIRECTORY} = "{self._driver_session_settings.profile_directory}"'
+          f'\n{DriverSessionManager.Settings.HEADLESS} = "{self._driver_session_settings.headless}"'
+          f'\n{DriverSessionManager.Settings.BLOCK_IMAGES} = "{str(self._driver_session_settings.block_images).lower()}"'
+          f'\n{DriverSessionManager.Settings.BLOCK_CSS} = "{str(self._driver_session_settings.block_css).lower()}"'
+          f'\n{DriverSessionManager.Settings.BLOCK_FONTS} = "{str(self._driver_session_settings.block_fonts).lower()}"'
+          f'\n{DriverSessionManager.Settings.BLOCKED_DOMAINS} = "{",".join(self._driver_session_settings.blocked_domains)}"'
+          f'\n{DriverSessionManager.Settings.PAGE_LOAD_STRATEGY} = "{self._driver_session_settings.page_load_strategy}"'
+          f'\n{DriverSessionManager.Settings.WINDOW_SIZE} = "{self._driver_session_settings.window_size}"'
+          f'\n{DriverSessionManager.Settings.TABS} = "{self._driver_session_settings.tabs}"'
+          "")
+
+    # Apply the by map
+    self._chapter_list_body_htmldata.applyByMap()
+    self._chapter_list_item_htmldata.applyByMap()
+    self._next_chapter_button_htmldata.applyByMap()
+    self._chapter_text_body_htmldata.applyByMap()
+    self._chapter_list_next_page_htmldata.applyByMap()
+    self._prev_chapter_button_htmldata.applyByMap()
+
+    # Print a module separator
+    printModuleSeparator()
+
+
+  # === Function: saveScraperSettings ===
+  def saveScraperSettings(self, filename: str) -> None:
+    """
+    Saves scraper settings into a file
+
+    Params:
+      filename: Name of the file that contains the scraper settings. This will be located in the 'self._SCRAPER_SETTINGS_FOLDER' directory
+    """
+
+    full_file_path: str = self._SCRAPER_SETTINGS_DIRECTORY_PATH + "/" + filename
+
+    # TODO: Implment -> Save the current element data in the file
+
+
+  # === Function: getChapterIndex ===
+  def getChapterIndex(self, start_idx: int = 1, end_idx: int = Limits.INT_MAX, reload: bool = False) -> list[ChapterIndexEntry] | None:
+    """
+    Get the number, url and title of every chapter in a range. The chapter list (including every page of it, if
+    'ChapterListNextPageHtmlData' is set) is only loaded the first time this is called unless 'reload' is True.
+
+    NOTE: The web driver must be initialized if the chapter list hasn't been loaded yet
+    NOTE: Chapters are numbered from the oldest one, which is on the last page. If the last page isn't reached (a page
+          fails to load, a page links back to one already read or there are too many pages), nothing is numbered
+
+    Params:
+      start_idx: First chapter number to get
+      end_idx: Last chapter number to get (Clamped to the latest chapter)
+      reload: Should the chapter list be loaded again, even if it was already loaded
+
+    Returns:
+      list[ChapterIndexEntry] | None: The chapters in the range, oldest first OR None if the chapter list couldn't be
+                                      read to its last page
+    """
+
+    # Load the chapter list, one page at a time
+    if (self._chapter_index == None or reload):
+      # Every chapter, in the order shown on the site (newest first)
+      list_page_items: list[tuple[str | None, str]] = []
+      visited_page_urls: set[str] = set()
+      page_url: str | None = self.getNovelChapterListUrl()
+
+      while (page_url != None):
+        if (page_url in visited_page_urls):
+          print(f"The chapter list links back to {page_url}. Not numbering the chapters.")
+          return None
+
+        if (len(visited_page_urls) >= self._MAX_CHAPTER_LIST_PAGES):
+          print(f"The chapter list has more than {self._MAX_CHAPTER_LIST_PAGES} pages. Not numbering the chapters.")
+          return None
+
+        visited_page_urls.add(page_url)
+
+        page_result = self._getChapterListPageItems(page_url)
+        if (page_result == None):
+          print(f"Couldn't read chapter list page {page_url}. Not numbering the chapters.")
+          return None
+
+        page_items, page_url = page_result
+        list_page_items.extend(page_items)
+
+      # Number the chapters from oldest to newest, now that the last page was read
+      self._chapter_index = [
+        Scraper.ChapterIndexEntry(chapter_num, url, title)
+        for chapter_num, (url, title) in enumerate(reversed(list_page_items), start=1)
+      ]
+
+      print(f"Found {len(self._chapter_index)} chapters on the chapter list.")
+
+    # Clamp the range to the chapters that actually exist
+    start_idx = max(start_idx, 1)
+    end_idx = min(end_idx, len(self._chapter_index))
+
+    return self._chapter_index[start_idx - 1:end_idx]
+
+
+  # === Function: getLatestChapterNum ===
+  def getLatestChapterNum(self) -> int | None:
+    """
+    Get the number of the newest chapter on the chapter list
+
+    Returns:
+      int | None: The latest chapter number (0 if the chapter list has no chapters) OR None if the chapter list
+                  couldn't be read
+    """
+
+    chapter_index: list[Scraper.ChapterIndexEntry] | None = self.getChapterIndex()
+    if (chapter_index == None):
+      return None
+
+    return len(chapter_index)
+
+
+  # === Function: scrapeChapter ===
+  def scrapeChapter(self, url: str, format_text: bool = True, timings: dict[str, float] | None = None) -> str | None:
+    """
+    Scrape a single chapter page
+
+    NOTE: The web driver must be initialized
+
+    Params:
+      url: Url of the chapter to scrape
+      format_text: Should the text be formatted into a more readable form?
+      timings: If given, the seconds spent on each step are added to it (See 'ChapterRecord')
+
+    Returns:
+      str | None: The chapter's text OR None if no data was received
+    """
+
+    chapter_text: str | None = self._scrapeChapter(url, timings)
+    return self._formatChapterText(chapter_text, format_text, timings)
+
+
+  # === Function: openTabs ===
+  def openTabs(self, tab_count: int) -> int:
+    """
+    Open tabs in the scraper's browser (starting it if needed), so several chapters can load at once. The tabs share
+    the browser's process, cookies and challenge clearance
+
+    NOTE: Tabs are referred to by index (0 to tab_count - 1) in 'startChapterInTab', 'isChapterInTabReady' and
+          'finishChapterInTab'
+
+    Params:
+      tab_count: How many tabs the browser should have
+
+    Returns:
+      int: How many tabs are open
+    """
+
+    if (not self.isWebDriverInitialized()):
+      self.initializeWebDriver()
+
+    handles: list[str] = self._driver.window_handles
+    while (len(handles) < tab_count):
+      self._driver.switch_to.new_window("tab")
+      handles = self._driver.window_handles
+
+    self._tab_handles = list(handles[:max(tab_count, 1)])
+    self._tab_loads = {}
+    self._driver.switch_to.window(self._tab_handles[0])
+    self._current_tab = 0
+    return len(self._tab_handles)
+
+
+  # === Function: closeTabs ===
+  def closeTabs(self) -> None:
+    """
+    Close every tab but the first (See 'openTabs')
+    """
+
+    tab_handles: list[str] = self._tab_handles
+    self._tab_handles = []
+    self._tab_loads = {}
+    self._current_tab = 0
+
+    # A chapter loading in a tab goes away with it
+    if (self._prefetch != None and "tab" in self._prefetch):
+      self._prefetch = None
+
+    if (not self.isWebDriverInitialized() or len(tab_handles) <= 1):
+      return
+
+    if (self._page is self._driver):
+      self._page = None
+
+    try:
+      for handle in tab_handles[1:]:
+        self._driver.switch_to.window(handle)
+        self._driver.close()
+      self._driver.switch_to.window(tab_handles[0])
+    except WebDriverException as e:
+      print(f"Error closing tabs: {e}")
+      self._driver_session.markBroken()
+
+
+  # === Function: startChapterInTab ===
+  def startChapterInTab(self, tab: int, url: str, timings: dict[str, float] | None = None) -> None:
+    """
+    Start loading a chapter page in one of the browser's tabs, without waiting for it to load (See
+    'isChapterInTabReady' and 'finishChapterInTab')
+
+    NOTE: Waits for the rate limiter. Pages load with the browser connected (no reconnect trick), relying on the
+          clearance the browser already has. So a new browser (OR one that just hit a challenge) loads the page
+          the usual way instead, solving the challenge before the other tabs use its clearance
+
+    Params:
+      tab: Index of the tab (See 'openTabs')
+      url: Url of the chapter page
+      timings: If given, the seconds spent waiting for the rate limiter ("wait") are added to it
+    """
+
+    # Replace a worn out browser once none of its tabs are loading
+    if (len(self._tab_loads) == 0 and self._driver_session.needsRecycle(self._driver_session_settings)):
+      print("Replacing the browser (it reached its page or memory limit).")
+      tab_count: int = len(self._tab_handles)
+      self.uninitializeWebDriver()
+      self.openTabs(tab_count)
+
+    load: dict = {"url": url, "start_time": time.perf_counter(), "text_length": -1, "done": False, "failed": False}
+    self._tab_loads[tab] = load
+
+    try:
+      self._driver.switch_to.window(self._tab_handles[tab])
+      self._current_tab = tab
+
+      if (self._expect_challenge):
+        self._openPageWithWebDriver(url, timings, is_chapter=True)
+        load["done"] = True
+        return
+
+      self._addTiming(timings, "wait", self.getRateLimiter(url).acquire())
+      load["start_time"] = time.perf_counter()
+      self._driver_session.countPage()
+      self._driver.execute_script(self._TAB_NAVIGATE_SCRIPT, url)
+
+    except WebDriverException:
+      load["failed"] = True
+
+
+  # === Function: isChapterInTabReady ===
+  def isChapterInTabReady(self, tab: int) -> bool:
+    """
+    Check once, without waiting, if the chapter loading in a tab can be read: its text is in, the page finished
+    loading without it (i.e. a challenge), OR it ran out of time (See '_getChapterReadyTimeout')
+
+    Params:
+      tab: Index of the tab (See 'openTabs')
+
+    Returns:
+      bool: True if 'finishChapterInTab' should be called for the tab
+    """
+
+    load: dict = self._tab_loads[tab]
+    if (load["done"] or load["failed"]):
+      return True
+
+    try:
+      self._driver.switch_to.window(self._tab_handles[tab])
+      self._current_tab = tab
+      state: list | None = self._driver.execute_script(self._TAB_LEAVING_CHECK + self._getChapterReadyScript())
+      if (state != None):
+        text_length, has_next_button, ready_state, load_time = state
+    # Bad selector, etc. | NOTE: 'find_element' will report it
+    except (JavascriptException, TypeError, ValueError):
+      return True
+    except WebDriverException:
+      load["failed"] = True
+      return True
+
+    elapsed_time: float = time.perf_counter() - load["start_time"]
+    if (state != None):
+
+      if (self._isChapterPageReady(text_length, has_next_button, ready_state, load["text_length"])):
+        LatencyTracker.getForHost(load["url"]).record(load_time if (load_time > 0) else elapsed_time)
+        return True
+
+      # Loaded without the text, i.e. a challenge page
+      if (ready_state == "complete"):
+        return True
+
+      load["text_length"] = text_length
+
+    return elapsed_time >= self._getChapterReadyTimeout(load["url"])
+
+
+  # === Function: finishChapterInTab ===
+  def finishChapterInTab(self, tab: int, format_text: bool = True, timings: dict[str, float] | None = None) -> str | None:
+    """
+    Read the chapter a tab loaded, once 'isChapterInTabReady' says it can be. A tab stuck on a challenge is reopened
+    the usual way (reconnect trick and CAPTCHA click), like 'scrapeChapter' would
+
+    Params:
+      tab: Index of the tab (See 'openTabs')
+      format_text: Should the text be formatted into a more readable form?
+      timings: If given, the seconds spent on each step are added to it (See 'ChapterRecord')
+
+    Returns:
+      str | None: The chapter's text OR None if no data was received (See 'getLastFailureReason')
+    """
+
+    load: dict = self._tab_loads.pop(tab)
+    url: str = load["url"]
+
+    if (load["failed"]):
+      self._markWebDriverFailed()
+      return None
+
+    try:
+      self._driver.switch_to.window(self._tab_handles[tab])
+      self._current_tab = tab
+      self._page = self._driver
+      self._page_url = url
+      self._chapter_page = None
+
+      # Loaded in the background by 'startChapterInTab'
+      if (not load["done"]):
+        rate_limiter: RateLimiter = self.getRateLimiter(url)
+        load_time: float = time.perf_counter() - load["start_time"]
+
+        if (isChallengeTitle(self._driver.title)):
+          rate_limiter.reportThrottled()
+          self._addTiming(timings, "challenge", load_time)
+          self._expect_challenge = True
+          self._openPageWithWebDriver(url, timings, is_chapter=True, acquire=False)
+        else:
+          rate_limiter.reportSuccess()
+          self._addTiming(timings, "request", load_time)
+
+      # Cache what the browser loaded, unless it's stuck on a challenge page
+      page_cache: PageCache | None = self.getPageCache()
+      if (page_cache != None and not isChallengeTitle(self._driver.title)):
+        page_cache.put(url, FetchResult(url, 200, {}, self._driver.page_source, 0.0))
+
+      chapter_text: str | None = self._readChapterPage(self._driver, timings)
+
+    # Web driver was closed
+    except WebDriverException:
+      self._markWebDriverFailed()
+      return None
+
+    return self._formatChapterText(chapter_text, format_text, timings)
+
+
+  # === Function: fetchPage ===
+  def fetchPage(self, url: str) -> FetchResult | None:
+    """
+    Load a page with the http fetch backend, going through the page cache (if it's on). A cached page is revalidated
+    with a conditional request, and the cached copy is used if the server says it hasn't changed. In replay mode the
+    page only comes from the cache.
+
+    NOTE: Doesn't wait for the rate limiter, the caller does that (unless replaying from the cache)
+
+    Params:
+      url: Url of the page to load
+
+    Returns:
+      FetchResult | None: The loaded page OR None if it couldn't be loaded (or isn't cached, in replay mode)
+    """
+
+    page_cache: PageCache | None = self.getPageCache()
+
+    # Look like the browser that got past the challenge (if one did)
+    clearance_headers: dict[str, str] = ClearanceStore.getForHost(url).getRequestHeaders() if (not self.isReplayingFromCache()) else {}
+
+    if (page_cache == None):
+      return self.getHttpFetchBackend().fetch(url, clearance_headers)
+
+    if (self.isReplayingFromCache()):
+      result: FetchResult | None = page_cache.get(url)
+      if (result == None):
+        print(f"{url} is not in the page cache.")
+      return result
+
+    result: FetchResult | None = self.getHttpFetchBackend().fetch(url, dict(clearance_headers, **page_cache.getRevalidationHeaders(url)))
+    if (result == None):
+      return None
+
+    # Not modified, so the cached copy is still current
+    if (result.status == 304):
+      cached_result: FetchResult | None = page_cache.get(url)
+      if (cached_result != None):
+        return cached_result
+
+      # The cached copy went missing since the request was sent, so load the page again without revalidating
+      return self.getHttpFetchBackend().fetch(url, clearance_headers)
+
+    if (result.isOk() and not result.isChallenge()):
+      page_cache.put(url, result)
+
+    return result
+
+
+  # === Function: getPendingChapters ===
+  def getPendingChapters(self, start_idx: int = 1, end_idx: int = Limits.INT_MAX, manifest: ScrapeManifest | None = None) -> list[ChapterIndexEntry] | None:
+    """
+    Get the chapters in a range that still need to be scraped. If the manifest already knows the url of every one of
+    them, the chapter list isn't loaded at all.
+
+    Params:
+      start_idx: First chapter number to get
+      end_idx: Last chapter number to get (Clamped to the latest chapter)
+      manifest: Manifest of the output directory. Chapters it has as complete are left out. None to get every chapter
+
+    Returns:
+      list[ChapterIndexEntry] | None: The chapters that still need to be scraped, oldest first OR None if the chapter
+                                      list was needed but couldn't be read
+    """
+
+    # Resume straight from the manifest | NOTE: The latest chapter is only known from the chapter list
+    if (manifest != None and end_idx != Limits.INT_MAX):
+      pending_chapter_nums: list[int] = [n for n in range(start_idx, end_idx + 1) if not manifest.isComplete(n)]
+
+      if (all(manifest.getChapterUrl(n) != None for n in pending_chapter_nums)):
+        print(f"Resuming from the manifest, {len(pending_chapter_nums)} chapters left.")
+        return [Scraper.ChapterIndexEntry(n, manifest.getChapterUrl(n), "") for n in pending_chapter_nums]
+
+    chapter_index: list[Scraper.ChapterIndexEntry] | None = self.getChapterIndex(start_idx, end_idx)
+
+    if (chapter_index == None or manifest == None):
+      return chapter_index
+
+    # Remember every url on the chapter list for next time
+    manifest.setChapterUrls({entry.chapter_num: entry.url for entry in self.getChapterIndex()})
+
+    return [entry for entry in chapter_index if not manifest.isComplete(entry.chapter_num)]
+
+
+  # === Function: getNewChapters ===
+  def getNewChapters(self, output_directory: str) -> list[ChapterIndexEntry] | None:
+    """
+    Get the chapters released since the newest chapter saved in an output directory. The chapter list is read from its
+    first page (newest chapters first) only until the newest saved chapter shows up, so an up to date novel costs one
+    chapter list page. The whole chapter list is only loaded if the newest saved chapter's url isn't known.
+
+    NOTE: Only the missing tail is found. Gaps before the newest saved chapter are left to 'scrape', which resumes them
+
+    Params:
+      output_directory: Directory the novel was scraped to
+
+    Returns:
+      list[ChapterIndexEntry] | None: The new chapters, oldest first (Empty if the novel is up to date) OR None if the
+                                      chapter list couldn't be read
+    """
+
+    manifest: ScrapeManifest = ScrapeManifest.getForDirectory(output_directory)
+
+    # Directories scraped before manifests existed only have their chapter files
+    adopted_count: int = manifest.adoptChapterFiles()
+    if (adopted_count > 0):
+      print(f"Added {adopted_count} existing chapter files to the manifest.")
+
+    latest_local_num: int = manifest.getLatestCompleteChapterNum()
+    latest_local_url: str | None = manifest.getChapterUrl(latest_local_num)
+
+    if (latest_local_url != None):
+      # Chapters above the newest saved one, in the order shown on the site (newest first)
+      new_page_items: list[tuple[str | None, str]] = []
+      visited_page_urls: set[str] = set()
+      page_url: str | None = self.getNovelChapterListUrl()
+      found_latest_local: bool = False
+
+      while (page_url != None and page_url not in visited_page_urls and len(visited_page_urls) < self._MAX_CHAPTER_LIST_PAGES):
+        visited_page_urls.add(page_url)
+
+        page_result = self._getChapterListPageItems(page_url)
+        if (page_result == None):
+          break
+
+        page_items, page_url = page_result
+        for href, title in page_items:
+          if (href == latest_local_url):
+            found_latest_local = True
+            break
+          new_page_items.append((href, title))
+
+        if (found_latest_local):
+          break
+
+      if (found_latest_local):
+        new_chapters: list[Scraper.ChapterIndexEntry] = [
+          Scraper.ChapterIndexEntry(chapter_num, url, title)
+          for chapter_num, (url, title) in enumerate(reversed(new_page_items), start=latest_local_num + 1)
+        ]
+        manifest.setChapterUrls({entry.chapter_num: entry.url for entry in new_chapters})
+        manifest.flush()
+
+        print(f"Found {len(new_chapters)} new chapters after chapter #{latest_local_num}.")
+        return new_chapters
+
+      print(f"Chapter #{latest_local_num} is not on the chapter list anymore, loading the whole chapter list.")
+
+    # Compare against the whole chapter list
+    chapter_index: list[Scraper.ChapterIndexEntry] | None = self.getChapterIndex(latest_local_num + 1, reload=True)
+    if (chapter_index == None):
+      print("Couldn't read the chapter list, so the new chapters are unknown.")
+      return None
+
+    manifest.setChapterUrls({entry.chapter_num: entry.url for entry in self.getChapterIndex()})
+    manifest.flush()
+
+    print(f"Found {len(chapter_index)} new chapters after chapter #{latest_local_num}.")
+    return chapter_index
+
+
+  # === Function: extractChapterPage ===
+  def extractChapterPage(self, page) -> ChapterPage:
+    """
+    Read everything the scraper needs off a loaded chapter page: its text, title, next/previous chapter links and
+    whether it is healthy. Utilizes '_chapter_text_body_htmldata', '_next_chapter_button_htmldata' and (if set)
+    '_prev_chapter_button_htmldata'
+
+    NOTE: The browser is read with a single script call. An 'HtmlDocument' is already local, so it is read element
+          by element
+
+    Params:
+      page: The web driver (on a chapter page) OR an 'HtmlDocument' of a chapter page
+
+    Returns:
+      ChapterPage: What was read
+    """
+
+    if (page is self._driver):
+      chapter_page: Scraper.ChapterPage | None = self._extractChapterPageWithWebDriver()
+      if (chapter_page != None):
+        return chapter_page
+
+    prev_params: Scraper.HtmlElementData = self.getPrevChapterButtonHtmlData()
+    return Scraper.ChapterPage(
+      self._page_url,
+      self.extractChapterText(page),
+      page.title.strip(),
+      self._findButtonUrl(page, self.getNextChapterButtonHtmlData()),
+      self._findButtonUrl(page, prev_params) if (prev_params.element != None) else None
+    )
+
+
+  # === Function: extractChapterText ===
+  def extractChapterText(self, page) -> str | None:
+    """
+    Get a chapter's text from a loaded chapter page. Utilizes '_chapter_text_body_htmldata'
+
+    Params:
+      page: The web driver (on a chapter page) OR an 'HtmlDocument' of a chapter page
+
+    Returns:
+      str | None: The chapter's text OR None if the page doesn't have any
+    """
+
+    # Get the params to be used in 'find_element'
+    data_params: Scraper.HtmlElementData = self.getChapterTextBodyHtmlData()
+
+    try:
+      # Get the target element
+      element = page.find_element(data_params.by, data_params.element)
+    
+      # Return the element's text if possible
+      return element.text
+
+    # Element not found
+    except NoSuchElementException:
+      print("No such element.")
+      return None
+
+    except Exception as e:
+      # If there is no such element, print the error and return 'None'
+      print(f"Error: {e}")
+      return None
+
+
+  # === Function: saveChapter ===
+  def saveChapter(self, chapter_num: int, chapter_text: str, output_directory: str, url: str | None = None) -> bool:
+    """
+    Save a chapter's text to '<output_directory>/NNNN.txt' and record it in the directory's manifest
+
+    NOTE: Saves on the calling thread. Scrapes save through a 'ChapterWriter' instead, so the disk never holds them up
+
+    Params:
+      chapter_num: Number of the chapter, used as the filename
+      chapter_text: Text to save
+      output_directory: Directory to save the chapter to
+      url: Url the chapter was scraped from
+
+    Returns:
+      bool: True if the chapter was saved
+    """
+
+    chapter_num_str: str = str(chapter_num).zfill(4)
+    filename: str = f"{output_directory}/{chapter_num_str}.txt"
+    
+    try:
+      # NOTE: Encoded by hand so the file's size matches what the manifest records on every OS
+      self._replaceFile(filename, chapter_text.encode("utf-8"))
+      ScrapeManifest.getForDirectory(output_directory).markComplete(chapter_num, url, f"{chapter_num_str}.txt", chapter_text)
+      print(f"Saved chapter #{chapter_num} to {filename}")
+      return True
+    except Exception as e:
+      print(f"Error saving chapter #{chapter_num}: {e}")
+      return False
+
+
+  # === Function: saveChapterHtml ===
+  def saveChapterHtml(self, chapter_num: int, page_html: str, output_directory: str) -> bool:
+    """
+    Save a chapter page's raw html to '<output_directory>/NNNN.html.gz', so the chapter can be re-extracted and
+    reformatted later without loading it again (see 'ChapterReprocessor')
+
+    Params:
+      chapter_num: Number of the chapter, used as the filename
+      page_html: Html of the chapter page
+      output_directory: Directory to save the html to
+
+    Returns:
+      bool: True if the html was saved
+    """
+
+    filename: str = f"{output_directory}/{str(chapter_num).zfill(4)}.html.gz"
+
+    try:
+      self._replaceFile(filename, gzip.compress(page_html.encode("utf-8"), compresslevel=6))
+      return True
+    except Exception as e:
+      print(f"Error saving the html of chapter #{chapter_num}: {e}")
+      return False
+
+
+  # === Function: iterChapters ===
+  def iterChapters(self, start_idx: int = 1, end_idx: int = Limits.INT_MAX, format_text: bool = True, output_directory: str = None) -> Iterator[ChapterRecord]:
+    """
+    Scrape a range of chapters, handing out each chapter as soon as it's scraped (and saved, if output_directory is
+    provided). Only one chapter is held at a time, so a whole novel can be streamed with constant memory.
+
+    NOTE: Must have called these functions:
+      'setNovelUrl()'
+
+    NOTE: The browser is closed when the scrape finishes OR the generator is closed early
+
+    Args:
+      start_idx: Chapter number to start the scrape.    NOTE: Constraints: (start_idx <= end_idx)
+      end_idx: Chapter to end the scrape at.    NOTE: Constraints: (end_idx >= start_idx)
+      format_text: Should the text be formatted into a more readable form (extra whitespaces, replace some characters, etc.)?
+      output_directory: Directory to save chapters to. If provided, chapters are queued to be saved before they are handed out.
+
+    Returns:
+      Iterator[ChapterRecord]: The scraped chapters, in order
+    """
+
+    # Check if the proper variables have been instantiated
+    if (self.getNovelChapterListUrl() == ""):
+      return
+
+    # Setup driver, unless one is already running (i.e. from 'update') | NOTE: The http backend only starts the browser
+    # if it runs into a challenge page
+    if (self.needsWebDriver() and not self.isWebDriverInitialized()):
+      self.initializeWebDriver()
+
+    self.exposeMetrics()
+
+    # Enforce index constraints
+    if (end_idx < start_idx):
+      end_idx = start_idx
+
+    # Chapters already in the output directory are skipped
+    manifest: ScrapeManifest | None = None
+    if (output_directory):
+      manifest = ScrapeManifest.getForDirectory(output_directory)
+      manifest.setNovelUrl(self.getNovelChapterListUrl())
+
+    # Find the first chapter that still needs to be scraped
+    first_pending_num: int = start_idx
+    while (manifest != None and first_pending_num <= end_idx and manifest.isComplete(first_pending_num)):
+      first_pending_num += 1
+
+    # Chapter number -> url
+    chapter_urls: dict[int, str | None] = {}
+    chapter_list_loaded: bool = False
+
+    if (manifest != None and manifest.getChapterUrl(first_pending_num) != None):
+      # Resume from the urls in the manifest, without loading the chapter list
+      chapter_urls = {entry["chapter_num"]: entry["url"] for entry in manifest.getChapterEntries()}
+      print(f"Resuming from the manifest at chapter #{first_pending_num}.")
+    else:
+      # Get the url of every chapter from the chapter list
+      chapter_urls = self._loadChapterUrls(manifest)
+      chapter_list_loaded = True
+
+    # Resolve the latest chapter now that the chapter list is loaded | NOTE: Left open if it couldn't be read
+    if (end_idx == Limits.INT_MAX and chapter_list_loaded and self._chapter_index != None):
+      end_idx = self.getLatestChapterNum()
+
+    # Print module separator
+    printModuleSeparator()
+
+    # Log starting message
+    print(
+      "Starting Scrape With Parameters: \n"
+      "\tNovel Url: " + self.getNovelChapterListUrl() + "\n"
+      "\tStarting Chapter: " + str(start_idx) + "\n"
+      "\tEnding Chapter: " + str(end_idx) + "\n"
+      "\tText Formatting: " + str(format_text) + "\n"
+      "\tFetch Backend: " + self._fetch_backend + "\n"
+      "\tOutput Directory: " + (output_directory if output_directory else "Not saving to files") + "\n"
+    )
+
+    # Url of the chapter currently being scraped
+    curr_url: str | None = None
+
+    # Saves chapters in the background
+    chapter_writer: ChapterWriter | None = ChapterWriter(output_format=self._output_format) if (output_directory) else None
+
+    # Times every chapter, unless the caller collects the timings itself
+    metrics: ScrapeMetrics = self._metrics if (self._metrics != None) else ScrapeMetrics(self.getMetricsLogPath(output_directory))
+
+    try:
+      # Scrape each chapter in the specified range
+      for chapter_num in range (int(start_idx), int(end_idx) + 1):
+        # Skip chapters that were already saved
+        if (manifest != None and manifest.isComplete(chapter_num)):
+          print(f"Chapter #{chapter_num} was already scraped. Skipping.")
+          curr_url = None
+          continue
+
+        # Prefer the chapter list's link. Otherwise, use the link from the previous chapter's next button
+        if (chapter_urls.get(chapter_num) != None):
+          curr_url = chapter_urls[chapter_num]
+
+        # The manifest didn't know this chapter, so fall back to the chapter list
+        if (curr_url == None and not chapter_list_loaded):
+          chapter_urls.update(self._loadChapterUrls(manifest))
+          chapter_list_loaded = True
+          curr_url = chapter_urls.get(chapter_num)
+
+        # Without a last chapter to stop at, the scrape ends after the newest chapter it knows a url for | NOTE: Only
+        # chapters past every known url, so a gap in the chapter list is still recorded as a failure
+        if (curr_url == None and end_idx == Limits.INT_MAX):
+          latest_known_num: int = max((n for n, url in chapter_urls.items() if (url != None)), default=0)
+          if (0 < latest_known_num < chapter_num):
+            print(f"No chapters after chapter #{chapter_num - 1}. Stopping.")
+            break
+
+        # If the chapter url doesn't exist, leave loop to prevent errors
+        if (curr_url == None): 
+          print(f"No URL found for chapter #{chapter_num}. Stopping.")
+          metrics.recordFailure(chapter_num, None, reason=ScrapeMetrics.FailureReasons.MISSING_NEXT_URL)
+          break
+
+        # Log chapter scraping progress
+        print(f"Scraping chapter #{chapter_num}...")
+
+        # Get the text for this chapter | NOTE: It's formatted below, after the next chapter starts loading
+        chapter_timings: dict[str, float] = {}
+        curr_chapter_text: str = self.scrapeChapter(curr_url, False, chapter_timings)
+
+        # Check if we got data
+        if (curr_chapter_text == None): 
+          print(f"No data received for chapter #{chapter_num}. Stopping.")
+          metrics.recordFailure(chapter_num, curr_url, chapter_timings, reason=self._last_failure_reason)
+          if (manifest != None):
+            manifest.markFailed(chapter_num, curr_url)
+          break
+
+        # Read everything needed off the open page before the next chapter starts loading
+        chapter_url: str = curr_url
+        chapter_title: str = self._getChapterTitle(chapter_num)
+        page_html: str | None = self.getPageSource() if (output_directory and self._keep_raw_html) else None
+
+        # Get the next chapter's URL from the page, only if the chapter list didn't have it
+        if (chapter_urls.get(chapter_num + 1) == None):
+          curr_url = self._findNextChapterUrl()
+
+          # Remember it, so a resumed scrape can continue from here
+          if (manifest != None and curr_url != None):
+            manifest.setChapterUrls({chapter_num + 1: curr_url})
+
+        # Start loading the next chapter, so it loads while this one is formatted and saved | NOTE: The host's rate
+        # limiter still spaces out the page loads
+        next_url: str | None = chapter_urls.get(chapter_num + 1) or curr_url
+        if (self._prefetch_enabled and not self.isReplayingFromCache() and chapter_num < end_idx and next_url != None and not (manifest != None and manifest.isComplete(chapter_num + 1))):
+          self._prefetchChapter(next_url)
+
+        curr_chapter_text = self._formatChapterText(curr_chapter_text, format_text, chapter_timings)
+
+        # A chapter without text isn't saved, so it's recorded as failed instead of being left unrecorded
+        if (not curr_chapter_text):
+          print(f"No text found for chapter #{chapter_num}.")
+          metrics.recordFailure(chapter_num, chapter_url, chapter_timings, reason=ScrapeMetrics.FailureReasons.NO_SUCH_ELEMENT)
+          if (manifest != None):
+            manifest.markFailed(chapter_num, chapter_url)
+          continue
+
+        # Title from the chapter list if it was loaded, otherwise from the page
+        chapter_record: Scraper.ChapterRecord = Scraper.ChapterRecord(chapter_num, chapter_url, chapter_title, curr_chapter_text, chapter_timings)
+
+        # Save chapter immediately if output_directory is provided | NOTE: The writer saves it in the background
+        if output_directory and curr_chapter_text:
+          start_time: float = time.perf_counter()
+          chapter_writer.write(chapter_num, curr_chapter_text, output_directory, chapter_url, page_html)
+          chapter_timings["save"] = time.perf_counter() - start_time
+
+        metrics.recordChapter(chapter_num, chapter_url, chapter_timings, len(curr_chapter_text.encode("utf-8")))
+      
+        # NOTE: There is no fixed delay between chapters. The host's rate limiter spaces out page loads in '_openPage'
+
+        # Hand the chapter out | NOTE: The next chapter's url was found first, since the open page changes after this
+        yield chapter_record
+
+    finally:
+      # A chapter past where the scrape stopped may still be loading
+      self._cancelPrefetch()
+
+      # Close driver
+      if (self.isWebDriverInitialized()):
+        self.uninitializeWebDriver()
+
+      # Wait for the last chapters to be saved | NOTE: An error saving them is raised once the run is wrapped up
+      writer_error: Exception | None = None
+      if (chapter_writer != None):
+        try:
+          chapter_writer.close()
+        except Exception as e:
+          writer_error = e
+
+      # Record the failed chapters and the urls found along the way too
+      if (manifest != None):
+        manifest.flush()
+
+      # Log the run's summary
+      if (metrics is not self._metrics):
+        metrics.close()
+
+      if (writer_error != None):
+        raise writer_error
+
+    # Log the scrape's completion
+    print("\nScraping Complete!")
+
+    # Print module separator
+    printModuleSeparator()
+
+
+  # === Function: scrape ===
+  def scrape(self, start_idx: int = 0, end_idx: int = Limits.INT_MAX, format_text: bool = True, output_directory: str = None) -> list[str]:
+    """
+    Starts the scraping of a booktoki novel.
+
+    NOTE: Must have called these functions:
+      'setNovelUrl()'
+
+    Args:
+      start_idx: Chapter number to start the scrape.    NOTE: Constraints: (start_idx <= end_idx)
+      end_idx: Chapter to end the scrape at.    NOTE: Constraints: (end_idx >= start_idx)
+      format_text: Should the text be formatted into a more readable form (extra whitespaces, replace some characters, etc.)?
+      output_directory: Directory to save chapters to. If provided, chapters will be saved immediately.
+
+    Returns:
+      list[str]: List of the scraped novel chapters (if output_directory is None)
+    """
+
+    # Create empty container for each chapter's text data (if returning list)
+    chapter_text: list[str] = []
+
+    for chapter_record in self.iterChapters(start_idx, end_idx, format_text, output_directory):
+      if (not output_directory):
+        chapter_text.append(chapter_record.text)
+
+    # Return the chapter data (if not saving to files)
+    return chapter_text
+  
+
+  # === Function: update ===
+  def update(self, output_directory: str, format_text: bool = True) -> list[int] | None:
+    """
+    Scrape only the chapters released since the last scrape into an output directory (see 'getNewChapters')
+
+    NOTE: Must have called these functions:
+      'setNovelUrl()'
+
+    Args:
+      output_directory: Directory the novel was scraped to
+      format_text: Should the text be formatted into a more readable form?
+
+    Returns:
+      list[int] | None: Numbers of the new chapters that were found OR None if the chapter list couldn't be read
+    """
+
+    # Check if the proper variables have been instantiated
+    if (self.getNovelChapterListUrl() == ""):
+      return []
+
+    # NOTE: The browser is started when the chapter list is loaded, and kept for the scrape
+    new_chapters: list[Scraper.ChapterIndexEntry] | None = self.getNewChapters(output_directory)
+
+    if (new_chapters == None or len(new_chapters) == 0):
+      if (self.isWebDriverInitialized()):
+        self.uninitializeWebDriver()
+
+      if (new_chapters == None):
+        print("Update failed, the chapter list couldn't be read.")
+        return None
+
+      print("The novel is up to date.")
+      return []
+
+    # NOTE: The new chapters' urls are in the manifest now, so the chapter list isn't loaded again
+    self.scrape(new_chapters[0].chapter_num, new_chapters[-1].chapter_num, format_text, output_directory)
+
+    return [entry.chapter_num for entry in new_chapters]
+  
+
+  # ******************************************** #
+  # ************** Getters/Setters ************* #
+  # ******************************************** #
+
+
+  # === Function: setNovelChapterListUrl ===
+  def setNovelChapterListUrl(self, value: str) -> None:
+    """
+    Sets the url to the booktoki novel you want to scrape chapter data from
+
+    Args:
+      value: Url to the booktoki novel you wish to scrape
+    """
+    # The loaded chapter list belongs to the old novel
+    if (value != self._novel_chapter_list_url):
+      self._chapter_index = None
+
+    self._novel_chapter_list_url = value
+  
+
+  # === Function: getNovelChapterListUrl ===
+  def getNovelChapterListUrl(self) -> str:
+    """
+    Gets the novel url set in a 'Scraper' object
+
+    Returns:
+      str: Url to the booktoki novel you wish to scrape
+    """
+    return self._novel_chapter_list_url
+
+
+  # # === Function: setThreadCount ===
+  # def setThreadCount(self, thread_count: int = None) -> None:
+  #   """
+  #   Set the number of threads to be used when scraping the novel
+
+  #   Params:
+  #     thread_count: New thread count for the scraper
+  #   """
+  #   self._thread_count = thread_count
+
+
+  # # === Function: getThreadCount ===
+  # def getThreadCount(self) -> int:
+  #   """
+  #   Get the number of threads to be used when scraping the novel
+
+  #   Returns:
+  #     int: The thread count for the scraper
+  #   """
+  #   return self._thread_count
+
+
+  # === Function: setFetchBackend ===
+  def setFetchBackend(self, fetch_backend: str, http_fetch_backend: HttpFetchBackend | None = None) -> None:
+    """
+    Set how the scraper loads pages
+
+    Params:
+      fetch_backend: FetchBackends.DRIVER (browser only) OR FetchBackends.HTTP (plain http, browser only for challenges)
+      http_fetch_backend: An http session to use, so several scrapers can share one connection pool. If None, the
+                          scraper creates its own when it needs one
+    """
+
+    if (fetch_backend not in FetchBackends.ALL):
+      print(f'Unknown fetch backend "{fetch_backend}", using "{FetchBackends.DRIVER}".')
+      fetch_backend = FetchBackends.DRIVER
+
+    self._fetch_backend = fetch_backend
+
+    if (http_fetch_backend != None):
+      # Close the session this scraper made, it's being replaced
+      if (self._owns_http_fetch_backend and self._http_fetch_backend != None):
+        self._http_fetch_backend.close()
+
+      self._http_fetch_backend = http_fetch_backend
+      self._owns_http_fetch_backend = False
+
+
+  # === Function: getFetchBackend ===
+  def getFetchBackend(self) -> str:
+    """
+    Get how the scraper loads pages
+
+    Returns:
+      str: One of FetchBackends.XXX
+    """
+
+    return self._fetch_backend
+
+
+  # === Function: setPrefetch ===
+  def setPrefetch(self, value: bool) -> None:
+    """
+    Set if the next chapter should start loading while the current one is formatted and saved (See 'iterChapters')
+
+    Params:
+      value: True to prefetch the next chapter
+    """
+
+    self._prefetch_enabled = value
+
+
+  # === Function: getPrefetch ===
+  def getPrefetch(self) -> bool:
+    """
+    Get if the next chapter starts loading while the current one is formatted and saved
+
+    Returns:
+      bool: True if the next chapter is prefetched
+    """
+
+    return self._prefetch_enabled
+
+
+  # === Function: getHttpFetchBackend ===
+  def getHttpFetchBackend(self) -> HttpFetchBackend:
+    """
+    Get the http session used by the http fetch backend, creating one for this scraper if none was given
+
+    Returns:
+      HttpFetchBackend: The http session used to load pages
+    """
+
+    if (self._http_fetch_backend == None):
+      self._http_fetch_backend = HttpFetchBackend()
+      self._owns_http_fetch_backend = True
+
+    return self._http_fetch_backend
+
+
+  # === Function: getPageSource ===
+  def getPageSource(self) -> str | None:
+    """
+    Get the html of the page that is currently open
+
+    Returns:
+      str | None: The open page's html OR None if no page is open
+    """
+
+    if (self._page == None):
+      return None
+
+    return self._page.page_source
+
+
+  # === Function: setKeepRawHtml ===
+  def setKeepRawHtml(self, value: bool) -> None:
+    """
+    Set if each chapter page's raw html should be saved (gzipped) next to its text
+
+    Params:
+      value: True to save the raw html
+    """
+
+    self._keep_raw_html = value
+
+
+  # === Function: getKeepRawHtml ===
+  def getKeepRawHtml(self) -> bool:
+    """
+    Get if each chapter page's raw html is saved (gzipped) next to its text
+
+    Returns:
+      bool: True if the raw html is saved
+    """
+
+    return self._keep_raw_html
+
+
+  # === Function: setOutputFormat ===
+  def setOutputFormat(self, output_format: str) -> None:
+    """
+    Set how chapters are stored in the output directory
+
+    Params:
+      output_format: OutputFormats.FILES (one 'NNNN.txt' per chapter) OR OutputFormats.ARCHIVE (one packed archive)
+    """
+
+    if (output_format not in OutputFormats.ALL):
+      print(f'Unknown output format "{output_format}", using "{OutputFormats.FILES}".')
+      output_format = OutputFormats.FILES
+
+    self._output_format = output_format
+
+
+  # === Function: getOutputFormat ===
+  def getOutputFormat(self) -> str:
     """
+    Get how chapters are stored in the output directory
 
-    self._driver = Driver(uc=True, headless=False)
-    self._wait = WebDriverWait(self._driver, self._RECONNECT_TIME)
-  
+    Returns:
+      str: One of OutputFormats.XXX
+    """
 
-  # === Function: uninitializeWebDriver ===
-  def uninitializeWebDriver(self) -> None:
+    return self._output_format
+
+
+  # === Function: setUseWorkQueue ===
+  def setUseWorkQueue(self, value: bool) -> None:
     """
-    Reset the driver object to null to reset/close the browser session
+    Set if pooled scrapes should claim chapters from the output directory's durable work queue, so several processes
+    can scrape the same novel and a crashed run loses nothing (See 'WorkQueue')
+
+    Params:
+      value: True to use the work queue
     """
-    
-    self._driver.close()
-    self._driver = None
-    self._wait = None
-  
 
-  # === Function: loadScraperSettings ===
-  def loadScraperSettings(self, filename: str, path_override: bool = False) -> None:
+    self._use_work_queue = value
+
+
+  # === Function: getUseWorkQueue ===
+  def getUseWorkQueue(self) -> bool:
     """
-    Loads in settings from a file
+    Get if pooled scrapes claim chapters from the output directory's durable work queue
+
+    Returns:
+      bool: True if the work queue is used
+    """
+
+    return self._use_work_queue
+
+
+  # === Function: setMetrics ===
+  def setMetrics(self, metrics: ScrapeMetrics | None) -> None:
+    """
+    Set where chapter timings are collected, i.e. to share one 'ScrapeMetrics' across several scrapes
+
+    NOTE: The caller closes it. If None, each scrape makes (and closes) its own
 
     Params:
-      filename: Name of the file to load from
-      path_override: If this value is "True" then the filename is assumed to be the full path
+      metrics: Metrics to record chapters in OR None
     """
-    
-    # Print a module separator
-    printModuleSeparator()
 
-    # Log filename
-    print(f'Loading Scraper Settings: "{filename}"\n')
+    self._metrics = metrics
 
-    # Get full file path
-    full_file_path: str = ""
-    if (path_override):
-      # If true, then the filename is the full path
-      full_file_path += filename
-    else:
-      # If false(default value), then the filename is just the name of the file that is in the expected location
-      full_file_path += self._SCRAPER_SETTINGS_DIRECTORY_PATH + "/" + filename
 
-    # Get the line data of the file
-    config = configparser.ConfigParser()
-    config.read(full_file_path)
+  # === Function: getMetrics ===
+  def getMetrics(self) -> ScrapeMetrics | None:
+    """
+    Get where chapter timings are collected
 
-    # Get sections
-    chapter_list_body_section = config[Scraper._SCRAPER_SETTINGS_CHAPTER_LIST_BODY_HTMLDATA_HEADER]
-    chapter_list_item_section = config[Scraper._SCRAPER_SETTINGS_CHAPTER_LIST_ITEM_HTMLDATA_HEADER]
-    next_chapter_button_section = config[Scraper._SCRAPER_SETTINGS_NEXT_CHAPTER_BUTTON_HTMLDATA_HEADER]
-    text_body_section = config[Scraper._SCRAPER_SETTINGS_CHAPTER_TEXT_BODY_HTMLDATA_HEADER]
+    Returns:
+      ScrapeMetrics | None: The metrics set with 'setMetrics' OR None if each scrape makes its own
+    """
 
-    # List body
-    self._chapter_list_body_htmldata.by = chapter_list_body_section.get(Scraper.HtmlElementData.BY).strip('"')
-    self._chapter_list_body_htmldata.element = chapter_list_body_section.get(Scraper.HtmlElementData.ELEMENT).strip('"')
+    return self._metrics
 
-    # List item
-    self._chapter_list_item_htmldata.by = chapter_list_item_section.get(Scraper.HtmlElementData.BY).strip('"')
-    self._chapter_list_item_htmldata.element = chapter_list_item_section.get(Scraper.HtmlElementData.ELEMENT).strip('"')
 
-    # Next chapter button
-    self._next_chapter_button_htmldata.by = next_chapter_button_section.get(Scraper.HtmlElementData.BY).strip('"')
-    self._next_chapter_button_htmldata.element = next_chapter_button_section.get(Scraper.HtmlElementData.ELEMENT).strip('"')
+  # === Function: getMetricsLogPath ===
+  def getMetricsLogPath(self, output_directory: str | None) -> str | None:
+    """
+    Get where a scrape into an output directory logs its metrics
 
-    # Text body
-    self._chapter_text_body_htmldata.by = text_body_section.get(Scraper.HtmlElementData.BY).strip('"')
-    self._chapter_text_body_htmldata.element = text_body_section.get(Scraper.HtmlElementData.ELEMENT).strip('"')
+    Params:
+      output_directory: Directory the chapters are saved to
 
-    # Print results
-    print(f"[{Scraper._SCRAPER_SETTINGS_CHAPTER_LIST_BODY_HTMLDATA_HEADER}]: "
-          f'\n{Scraper.HtmlElementData.BY} = "{self._chapter_list_body_htmldata.by}"'
-          f'\n{Scraper.HtmlElementData.ELEMENT} = "{self._chapter_list_body_htmldata.element}"'
-           "\n")
-    
-    print(f"[{Scraper._SCRAPER_SETTINGS_CHAPTER_LIST_ITEM_HTMLDATA_HEADER}]: "
-          f'\n{Scraper.HtmlElementData.BY} = "{self._chapter_list_item_htmldata.by}"'
-          f'\n{Scraper.HtmlElementData.ELEMENT} = "{self._chapter_list_item_htmldata.element}"'
-          "\n")
-    
-    print(f"[{Scraper._SCRAPER_SETTINGS_NEXT_CHAPTER_BUTTON_HTMLDATA_HEADER}]: "
-          f'\n{Scraper.HtmlElementData.BY} = "{self._next_chapter_button_htmldata.by}"'
-          f'\n{Scraper.HtmlElementData.ELEMENT} = "{self._next_chapter_button_htmldata.element}"'
-          "\n")
-    
-    print(f"[{Scraper._SCRAPER_SETTINGS_CHAPTER_TEXT_BODY_HTMLDATA_HEADER}]: "
-          f'\n{Scraper.HtmlElementData.BY} = "{self._chapter_text_body_htmldata.by}"'
-          f'\n{Scraper.HtmlElementData.ELEMENT} = "{self._chapter_text_body_htmldata.element}"'
-          "")
-    
-    # Apply the by map
-    self._chapter_list_body_htmldata.applyByMap()
-    self._chapter_list_item_htmldata.applyByMap()
-    self._next_chapter_button_htmldata.applyByMap()
-    self._chapter_text_body_htmldata.applyByMap()
+    Returns:
+      str | None: Path of the JSON lines log OR None if not saving to files
+    """
 
-    # Print a module separator
-    printModuleSeparator()
+    if (not output_directory):
+      return None
 
+    os.makedirs(output_directory, exist_ok=True)
+    return os.path.join(output_directory, self._METRICS_LOG_FILENAME)
 
-  # === Function: saveScraperSettings ===
-  def saveScraperSettings(self, filename: str) -> None:
+
+  # === Function: needsWebDriver ===
+  def needsWebDriver(self) -> bool:
     """
-    Saves scraper settings into a file
+    Check if this scraper loads every page in the browser, so the browser should be started before scraping
+
+    Returns:
+      bool: True for the browser fetch backend, unless pages are replayed from the page cache
+    """
+
+    return self._fetch_backend == FetchBackends.DRIVER and not self.isReplayingFromCache()
+
+
+  # === Function: setPageCacheSettings ===
+  def setPageCacheSettings(self, settings: PageCache.Settings) -> None:
+    """
+    Set how pages are cached (i.e. to switch to replay mode without editing the settings file)
 
     Params:
-      filename: Name of the file that contains the scraper settings. This will be located in the 'self._SCRAPER_SETTINGS_FOLDER' directory
+      settings: Mode, directory and size limit of the page cache
     """
 
-    full_file_path: str = self._SCRAPER_SETTINGS_DIRECTORY_PATH + "/" + filename
+    self._page_cache_settings = settings
 
-    # TODO: Implment -> Save the current element data in the file
 
+  # === Function: getPageCache ===
+  def getPageCache(self) -> PageCache | None:
+    """
+    Get the page cache shared by every scraper that uses the same cache directory
 
-  # === Function: scrape ===
-  def scrape(self, start_idx: int = 0, end_idx: int = Limits.INT_MAX, format_text: bool = True, output_directory: str = None) -> list[str]:
+    Returns:
+      PageCache | None: The page cache OR None if caching is off
     """
-    Starts the scraping of a booktoki novel.
 
-    NOTE: Must have called these functions:
-      'setNovelUrl()'
+    if (self._page_cache_settings.mode == PageCache.Modes.OFF):
+      return None
 
-    Args:
-      start_idx: Chapter number to start the scrape.    NOTE: Constraints: (start_idx <= end_idx)
-      end_idx: Chapter to end the scrape at.    NOTE: Constraints: (end_idx >= start_idx)
-      format_text: Should the text be formatted into a more readable form (extra whitespaces, replace some characters, etc.)?
-      output_directory: Directory to save chapters to. If provided, chapters will be saved immediately.
+    return PageCache.getForSettings(self._page_cache_settings)
+
+
+  # === Function: isReplayingFromCache ===
+  def isReplayingFromCache(self) -> bool:
+    """
+    Check if pages only come from the page cache, without touching the network
 
     Returns:
-      list[str]: List of the scraped novel chapters (if output_directory is None)
+      bool: True if the page cache is in replay mode
     """
-    
-    # Setup driver
-    self.initializeWebDriver()
 
-    # Check if the proper variables have been instantiated
-    if (self.getNovelChapterListUrl() == ""):
-      return []
+    return self._page_cache_settings.mode == PageCache.Modes.REPLAY
 
-    # Enforce index constraints
-    if (end_idx < start_idx):
-      end_idx = start_idx
 
-    # Print module separator
-    printModuleSeparator()
+  # === Function: getRateLimiter ===
+  def getRateLimiter(self, url: str | None = None) -> RateLimiter:
+    """
+    Get the rate limiter shared by every scraper that talks to a host
 
-    # Log starting message
-    print(
-      "Starting Scrape With Parameters: \n"
-      "\tNovel Url: " + self.getNovelChapterListUrl() + "\n"
-      "\tStarting Chapter: " + str(start_idx) + "\n"
-      "\tEnding Chapter: " + str(end_idx) + "\n"
-      "\tText Formatting: " + str(format_text) + "\n"
-      "\tOutput Directory: " + (output_directory if output_directory else "Not saving to files") + "\n"
-    )
+    Params:
+      url: Any url on the host. If None, the novel's chapter list url is used
 
-    # Create empty container for each chapter's text data (if returning list)
-    chapter_text: list[str] = []
-    
-    # Get the url for the first chapter
-    curr_url: str = self._getInitialChapterUrl(start_idx)
-
-    # Scrape each chapter in the specified range
-    for chapter_num in range (int(start_idx), int(end_idx) + 1):
-      # If the chapter url doesn't exist, leave loop to prevent errors
-      if (curr_url == None): 
-        print(f"No URL found for chapter #{chapter_num}. Stopping.")
-        break
-
-      # Log chapter scraping progress
-      print(f"Scraping chapter #{chapter_num}...")
-
-      # Get the text for this chapter
-      curr_chapter_text: str = self._scrapeChapter(curr_url)
-
-      # Format text, if set
-      if (format_text and curr_chapter_text):
-        curr_chapter_text = formatNovelText(curr_chapter_text)
-
-      # Check if we got data
-      if (curr_chapter_text == None): 
-        print(f"No data received for chapter #{chapter_num}. Stopping.")
-        break
-
-      # Save chapter immediately if output_directory is provided
-      if output_directory and curr_chapter_text:
-        chapter_num_str: str = str(chapter_num).zfill(4)
-        filename: str = f"{output_directory}/{chapter_num_str}.txt"
-        
-        try:
-          with open(filename, "w", encoding="utf-8") as f:
-            f.write(curr_chapter_text)
-          print(f"Saved chapter #{chapter_num} to {filename}")
-        except Exception as e:
-          print(f"Error saving chapter #{chapter_num}: {e}")
-      
-      # Add random delay between chapters (5.00 to 10.00 seconds)
-      if chapter_num < end_idx:  # Don't wait after the last chapter
-        import random
-        import time
-        wait_time = random.uniform(5.0, 10.0)
-        print(f"Waiting {wait_time:.2f} seconds before next chapter...")
-        time.sleep(wait_time)
+    Returns:
+      RateLimiter: The host's rate limiter. It is created with this scraper's rate limit settings if it doesn't exist
+    """
 
-      # Get the next chapter's URL
-      curr_url = self._findNextChapterUrl()
+    if (url == None):
+      url = self.getNovelChapterListUrl()
 
-    # Close driver
-    self.uninitializeWebDriver()
+    return RateLimiter.getForHost(url, self._rate_limit_settings)
 
-    # Log the scrape's completion
-    print("\nScraping Complete!")
 
-    # Print module separator
-    printModuleSeparator()
+  # === Function: exposeMetrics ===
+  def exposeMetrics(self) -> MetricsServer | None:
+    """
+    Start serving the live metrics (Prometheus text format) if the settings file gives a port. Every scraper in the
+    process shares the same server
 
-    # Return the chapter data (if not saving to files)
-    return chapter_text
-  
+    Returns:
+      MetricsServer | None: The running server OR None if the endpoint is off
+    """
 
-  # ******************************************** #
-  # ************** Getters/Setters ************* #
-  # ******************************************** #
+    return MetricsServer.getForPort(self._metrics_server_settings)
 
 
-  # === Function: setNovelChapterListUrl ===
-  def setNovelChapterListUrl(self, value: str) -> None:
+  # === Function: setMetricsServerSettings ===
+  def setMetricsServerSettings(self, settings: MetricsServer.Settings) -> None:
     """
-    Sets the url to the booktoki novel you want to scrape chapter data from
+    Set where the live metrics are served (i.e. to turn the endpoint on without editing the settings file)
 
-    Args:
-      value: Url to the booktoki novel you wish to scrape
+    Params:
+      settings: Host and port of the metrics endpoint
     """
-    self._novel_chapter_list_url = value
-  
 
-  # === Function: getNovelChapterListUrl ===
-  def getNovelChapterListUrl(self) -> str:
+    self._metrics_server_settings = settings
+
+
+  # === Function: setDriverSessionSettings ===
+  def setDriverSessionSettings(self, settings: DriverSessionManager.Settings) -> None:
     """
-    Gets the novel url set in a 'Scraper' object
+    Set when browsers are replaced and how many are kept warm between scrapes
+
+    Params:
+      settings: Page, memory and idle limits of the browsers
+    """
+
+    self._driver_session_settings = settings
+
+
+  # === Function: getTabCount ===
+  def getTabCount(self) -> int:
+    """
+    Get how many tabs the browser has open for loading chapters at once
 
     Returns:
-      str: Url to the booktoki novel you wish to scrape
+      int: The tab count (0 if 'openTabs' wasn't called)
     """
-    return self._novel_chapter_list_url
 
+    return len(self._tab_handles)
 
-  # # === Function: setThreadCount ===
-  # def setThreadCount(self, thread_count: int = None) -> None:
-  #   """
-  #   Set the number of threads to be used when scraping the novel
 
-  #   Params:
-  #     thread_count: New thread count for the scraper
-  #   """
-  #   self._thread_count = thread_count
+  # === Function: getDriverSessionSettings ===
+  def getDriverSessionSettings(self) -> DriverSessionManager.Settings:
+    """
+    Get how the scraper's browser is started and managed
 
+    Returns:
+      DriverSessionManager.Settings: The '[DriverSettings]' values
+    """
 
-  # # === Function: getThreadCount ===
-  # def getThreadCount(self) -> int:
-  #   """
-  #   Get the number of threads to be used when scraping the novel
+    return self._driver_session_settings
 
-  #   Returns:
-  #     int: The thread count for the scraper
-  #   """
-  #   return self._thread_count
+
+  # === Function: getLastFailureReason ===
+  def getLastFailureReason(self) -> str:
+    """
+    Get why the last chapter that returned None couldn't be scraped
+
+    Returns:
+      str: ScrapeMetrics.FailureReasons.XXX
+    """
+
+    return self._last_failure_reason
+
+
+  # === Function: setHeadless ===
+  def setHeadless(self, value: bool) -> None:
+    """
+    Set if the browser should run without a window the next time it starts (instead of the settings file's
+    headless mode)
+
+    Params:
+      value: True to run the browser without a window
+    """
+
+    self._headless = value
 
 
   # === Function: setChapterListBodyHtmlData ===
@@ -675,4 +2928,56 @@ class Scraper():
     Returns:
       HtmlElementData: Data structure that outlines the html element that corresponds to the 'chapter text body'
     """
-    return self._chapter_text_body_htmldata 
\ No newline at end of file
+    return self._chapter_text_body_htmldata 
+
+
+  # === Function: setChapterListNextPageHtmlData ===
+  def setChapterListNextPageHtmlData(self, by, element: str | None) -> None:
+    """
+    Set the HTML data that points to the button that goes to the next page of the chapter list
+
+    Params:
+      by: The element type to search for
+      element: The element's name ('button.open-menu', 'db.cs-rm', etc.) OR None if the chapter list has only one page
+    """
+
+    self._chapter_list_next_page_htmldata.by = by
+    self._chapter_list_next_page_htmldata.element = element
+
+
+  # === Function: getChapterListNextPageHtmlData ===
+  def getChapterListNextPageHtmlData(self) -> HtmlElementData:
+    """
+    Get the HTML data that points to the button that goes to the next page of the chapter list
+
+    Returns:
+      HtmlElementData: Data structure that outlines the html element that corresponds to the 'chapter list next page button'
+    """
+
+    return self._chapter_list_next_page_htmldata
+
+
+  # === Function: setPrevChapterButtonHtmlData ===
+  def setPrevChapterButtonHtmlData(self, by, element: str | None) -> None:
+    """
+    Set the HTML data that points to the button that goes to the previous chapter, when on a chapter page
+
+    Params:
+      by: The element type to search for
+      element: The element's name ('button.open-menu', 'db.cs-rm', etc.) OR None to not read it
+    """
+
+    self._prev_chapter_button_htmldata.by = by
+    self._prev_chapter_button_htmldata.element = element
+
+
+  # === Function: getPrevChapterButtonHtmlData ===
+  def getPrevChapterButtonHtmlData(self) -> HtmlElementData:
+    """
+    Get the HTML data that points to the button that goes to the previous chapter, when on a chapter page
+
+    Returns:
+      HtmlElementData: Data structure that outlines the html element that corresponds to the 'previous chapter button'
+    """
+
+    return self._prev_chapter_button_htmldata
@@ -0,0 +1,600 @@
+# Imports
+import time
+import queue
+import threading
+from typing import Callable
+from src.common.scraper import Scraper
+from src.common.scrape_manifest import ScrapeManifest
+from src.common.work_queue import WorkQueue
+from src.common.novel_archive import OutputFormats
+from src.common.chapter_writer import ChapterWriter
+from src.common.scrape_metrics import ScrapeMetrics
+from src.common.metrics_server import LiveMetrics
+from src.common.fetch_backends import (
+  FetchBackends,
+  HttpFetchBackend
+)
+from src.common.utils import (
+  Limits,
+  printModuleSeparator
+)
+
+
+# === Class: ScraperPool ===
+class ScraperPool():
+  """
+  Runs several 'Scraper' workers at once, each with their own browser.
+
+  The chapter list page is loaded once to seed a shared work queue with every chapter url in the range, then each
+  worker pulls chapters off that queue until it is empty. With more than one tab per worker, each browser keeps that
+  many chapters loading at once (one per tab), so more chapters are in flight without starting more browsers.
+
+  With 'work_queue' on in the scraper settings, chapters are claimed from the output directory's durable 'WorkQueue'
+  instead, so several processes (on one or more hosts) can scrape the same novel at once and a crashed run loses
+  nothing.
+  """
+
+
+  # ******************************************** #
+  # ****************** Private ***************** #
+  # ******************************************** #
+
+
+  # === Constants ===
+  """ How many times a chapter is attempted before it is given up on """
+  _MAX_CHAPTER_ATTEMPTS: int = 2
+
+  """ How often a worker with tabs checks on the chapters loading in them """
+  _TAB_POLL_INTERVAL: float = 0.05
+
+  """ How often a worker with nothing to claim checks the durable work queue again, while other processes still hold
+      chapters (in case one of them dies) """
+  _WORK_QUEUE_POLL_INTERVAL: float = 2.0
+
+
+  # === Function: _createScraper ===
+  def _createScraper(self) -> Scraper:
+    """
+    Create a scraper for a worker, using the scraper factory if one was given
+
+    Returns:
+      Scraper: A new scraper with the pool's settings loaded
+    """
+
+    # Let the caller decide how scrapers are built (i.e. pointing them at a local test site)
+    if (self._scraper_factory != None):
+      scraper: Scraper = self._scraper_factory()
+    else:
+      scraper: Scraper = Scraper()
+
+      # Set the scraper settings
+      if (self._scraper_settings_filename != ""):
+        scraper.loadScraperSettings(self._scraper_settings_filename)
+
+    if (self._headless != None):
+      scraper.setHeadless(self._headless)
+
+    # Every worker using plain http shares one connection pool
+    if (scraper.getFetchBackend() == FetchBackends.HTTP):
+      scraper.setFetchBackend(FetchBackends.HTTP, self._http_fetch_backend)
+
+    return scraper
+
+
+  # === Function: _takeChapter ===
+  def _takeChapter(self) -> tuple[int, str, int] | None:
+    """
+    Take the next chapter off the work queue (OR claim it from the durable work queue)
+
+    Returns:
+      tuple[int, str, int] | None: (chapter number, url, attempts before this one) OR None if there is nothing to take
+    """
+
+    if (self._durable_queue != None):
+      return self._durable_queue.claim(self._start_idx, self._end_idx)
+
+    try:
+      return self._work_queue.get_nowait()
+    except queue.Empty:
+      return None
+
+
+  # === Function: _finishChapter ===
+  def _finishChapter(self) -> None:
+    """
+    Mark a chapter taken off the work queue as handled. The durable work queue tracks this itself
+    """
+
+    if (self._durable_queue == None):
+      self._work_queue.task_done()
+
+
+  # === Function: _hasChaptersLeft ===
+  def _hasChaptersLeft(self) -> bool:
+    """
+    Check if chapters could still be taken, i.e. a retried chapter was put back OR another process still holds
+    chapters of the durable work queue
+
+    Returns:
+      bool: True if a worker with nothing to do should keep waiting
+    """
+
+    if (self._durable_queue != None):
+      return self._durable_queue.hasOtherWork(self._start_idx, self._end_idx)
+
+    return not self._work_queue.empty()
+
+
+  # === Function: _getChaptersLeftCount ===
+  def _getChaptersLeftCount(self) -> int:
+    """
+    Count the chapters not handled yet, reported on the metrics endpoint
+
+    Returns:
+      int: Chapters on the work queue OR pending and leased chapters of the durable work queue (across every process)
+    """
+
+    if (self._durable_queue != None):
+      status_counts: dict[str, int] = self._durable_queue.getStatusCounts(self._start_idx, self._end_idx)
+      return status_counts[WorkQueue.Statuses.PENDING] + status_counts[WorkQueue.Statuses.LEASED]
+
+    return self._work_queue.qsize()
+
+
+  # === Function: _abandonChapters ===
+  def _abandonChapters(self, worker_id: int, in_flight: dict[int, tuple[str, int]], manifest: ScrapeManifest | None) -> None:
+    """
+    Deal with the chapters a worker was on when it stopped on an error. With the durable work queue they're handed
+    back, so their leases don't have to run out before another worker (or process) can retry them. Otherwise (OR once
+    they're out of attempts) they're marked failed
+
+    Params:
+      worker_id: Id of the worker, used for logging
+      in_flight: Chapter number -> (url, attempt) of each chapter the worker took but didn't handle
+      manifest: Manifest of the output directory OR None if not saving to files
+    """
+
+    for chapter_num, (url, attempt) in in_flight.items():
+      if (self._durable_queue != None):
+        try:
+          if (self._durable_queue.release(chapter_num, ScrapeMetrics.FailureReasons.OTHER)):
+            continue
+        except Exception as e:
+          print(f"[Worker {worker_id}] Could not hand back chapter #{chapter_num}: {e}")
+
+      print(f"[Worker {worker_id}] Chapter #{chapter_num} failed.")
+      with self._results_lock:
+        self._failed_chapters.append(chapter_num)
+      self._metrics.recordFailure(chapter_num, url, worker_id=worker_id, reason=ScrapeMetrics.FailureReasons.OTHER)
+
+      if (manifest != None):
+        manifest.markFailed(chapter_num, url)
+
+
+  # === Function: _handleChapter ===
+  def _handleChapter(self, worker_id: int, scraper: Scraper, chapter_num: int, url: str, attempt: int, chapter_text: str | None, chapter_timings: dict[str, float], output_directory: str | None, manifest: ScrapeManifest | None) -> None:
+    """
+    Save a scraped chapter OR put it back on the work queue to be retried (giving up after '_MAX_CHAPTER_ATTEMPTS')
+
+    Params:
+      worker_id: Id of the worker that scraped it, used for logging
+      scraper: Scraper that scraped it
+      chapter_num: Number of the chapter
+      url: Url of the chapter
+      attempt: How many times the chapter was attempted before
+      chapter_text: The chapter's text OR None if no data was received
+      chapter_timings: Seconds spent on each step of scraping the chapter
+      output_directory: Directory to save chapters to. If None, chapters are kept in memory
+      manifest: Manifest of the output directory OR None if not saving to files
+    """
+
+    if (chapter_text == None):
+      # Put the chapter back on the queue so it can be retried (possibly by another worker or process)
+      if (self._durable_queue != None):
+        retry: bool = self._durable_queue.release(chapter_num, scraper.getLastFailureReason())
+      else:
+        retry: bool = attempt + 1 < self._MAX_CHAPTER_ATTEMPTS
+        if (retry):
+          self._work_queue.put((chapter_num, url, attempt + 1))
+
+      if (retry):
+        print(f"[Worker {worker_id}] No data received for chapter #{chapter_num}. Retrying later.")
+      else:
+        print(f"[Worker {worker_id}] No data received for chapter #{chapter_num}. Giving up.")
+        with self._results_lock:
+          self._failed_chapters.append(chapter_num)
+        self._metrics.recordFailure(chapter_num, url, chapter_timings, worker_id, scraper.getLastFailureReason())
+
+        if (manifest != None):
+          manifest.markFailed(chapter_num, url)
+
+    # Save chapter immediately if output_directory is provided | NOTE: The writer saves it in the background
+    elif (output_directory):
+      start_time: float = time.perf_counter()
+      self._chapter_writer.write(chapter_num, chapter_text, output_directory, url, scraper.getPageSource() if (scraper.getKeepRawHtml()) else None)
+      chapter_timings["save"] = time.perf_counter() - start_time
+    else:
+      with self._results_lock:
+        self._chapter_texts[chapter_num] = chapter_text
+
+    if (chapter_text != None):
+      self._metrics.recordChapter(chapter_num, url, chapter_timings, len(chapter_text.encode("utf-8")), worker_id)
+
+
+  # === Function: _runTabs ===
+  def _runTabs(self, worker_id: int, scraper: Scraper, format_text: bool, output_directory: str | None, manifest: ScrapeManifest | None, in_flight: dict[int, tuple[str, int]]) -> None:
+    """
+    Pull chapters off the work queue and scrape several at once, each in its own tab of the worker's browser, until
+    the queue is empty. A tab gets the next chapter as soon as the one it loaded has been read
+
+    Params:
+      worker_id: Id of this worker, used for logging
+      scraper: Scraper owned by this worker, with its tabs open (See 'Scraper.openTabs')
+      format_text: Should the text be formatted into a more readable form?
+      output_directory: Directory to save chapters to. If None, chapters are kept in memory
+      manifest: Manifest of the output directory OR None if not saving to files
+      in_flight: Chapter number -> (url, attempt) of each chapter taken but not handled yet, kept up to date here
+    """
+
+    # Tab index -> (chapter_num, url, attempt, timings) of the chapter loading in it
+    loading: dict[int, tuple[int, str, int, dict[str, float]]] = {}
+
+    # NOTE: Only set with the durable work queue, so an empty queue isn't asked again on every poll
+    next_claim_time: float = 0.0
+
+    while True:
+      # Read every chapter that finished loading
+      for tab in list(loading.keys()):
+        if (not scraper.isChapterInTabReady(tab)):
+          continue
+
+        chapter_num, url, attempt, chapter_timings = loading.pop(tab)
+        chapter_text: str | None = scraper.finishChapterInTab(tab, format_text, chapter_timings)
+        self._handleChapter(worker_id, scraper, chapter_num, url, attempt, chapter_text, chapter_timings, output_directory, manifest)
+        self._finishChapter()
+        in_flight.pop(chapter_num)
+
+      # Give the free tabs the next chapters
+      for tab in range(scraper.getTabCount()):
+        if (tab in loading):
+          continue
+
+        if (time.monotonic() < next_claim_time):
+          break
+
+        next_chapter: tuple[int, str, int] | None = self._takeChapter()
+        if (next_chapter == None):
+          if (self._durable_queue != None):
+            next_claim_time = time.monotonic() + self._WORK_QUEUE_POLL_INTERVAL
+          break
+
+        chapter_num, url, attempt = next_chapter
+        in_flight[chapter_num] = (url, attempt)
+
+        print(f"[Worker {worker_id}] Scraping chapter #{chapter_num} (tab {tab + 1})...")
+        chapter_timings: dict[str, float] = {}
+        scraper.startChapterInTab(tab, url, chapter_timings)
+        loading[tab] = (chapter_num, url, attempt, chapter_timings)
+
+      # Leave once nothing is loading and there is nothing left | NOTE: A retried chapter goes back on the queue
+      if (len(loading) == 0 and not self._hasChaptersLeft()):
+        break
+
+      time.sleep(self._TAB_POLL_INTERVAL if (len(loading) > 0) else max(next_claim_time - time.monotonic(), self._TAB_POLL_INTERVAL))
+
+
+  # === Function: _runWorker ===
+  def _runWorker(self, worker_id: int, scraper: Scraper, format_text: bool, output_directory: str | None, manifest: ScrapeManifest | None) -> None:
+    """
+    Pull chapters off the work queue and scrape them until the queue is empty
+
+    Params:
+      worker_id: Id of this worker, used for logging
+      scraper: Scraper owned by this worker. Its web driver is initialized here if it isn't already
+      format_text: Should the text be formatted into a more readable form?
+      output_directory: Directory to save chapters to. If None, chapters are kept in memory
+      manifest: Manifest of the output directory OR None if not saving to files
+    """
+
+    # Chapter number -> (url, attempt) of each chapter this worker took but hasn't handled yet
+    in_flight: dict[int, tuple[str, int]] = {}
+
+    try:
+      # Each worker needs its own browser | NOTE: The http backend only starts one if it runs into a challenge page
+      if (scraper.needsWebDriver() and not scraper.isWebDriverInitialized()):
+        scraper.initializeWebDriver()
+
+      # One browser can load several chapters at once, in tabs
+      tab_count: int = self._tabs_per_worker if (self._tabs_per_worker != None) else scraper.getDriverSessionSettings().tabs
+      if (scraper.needsWebDriver() and tab_count > 1):
+        scraper.openTabs(tab_count)
+        self._runTabs(worker_id, scraper, format_text, output_directory, manifest, in_flight)
+        return
+
+      while True:
+        # Get the next chapter to scrape, leave once there is nothing left
+        next_chapter: tuple[int, str, int] | None = self._takeChapter()
+        if (next_chapter == None):
+          # Wait in case a process holding chapters of the durable work queue dies, so they can be taken over
+          if (self._durable_queue != None and self._hasChaptersLeft()):
+            time.sleep(self._WORK_QUEUE_POLL_INTERVAL)
+            continue
+          break
+
+        chapter_num, url, attempt = next_chapter
+        in_flight[chapter_num] = (url, attempt)
+
+        # Log chapter scraping progress
+        print(f"[Worker {worker_id}] Scraping chapter #{chapter_num}...")
+
+        # Get the text for this chapter
+        chapter_timings: dict[str, float] = {}
+        chapter_text: str | None = scraper.scrapeChapter(url, format_text, chapter_timings)
+        self._handleChapter(worker_id, scraper, chapter_num, url, attempt, chapter_text, chapter_timings, output_directory, manifest)
+
+        # NOTE: Workers don't sleep between chapters. Every worker shares the host's rate limiter, which spaces out
+        #       page loads across the whole pool
+        self._finishChapter()
+        in_flight.pop(chapter_num)
+
+    except Exception as e:
+      print(f"[Worker {worker_id}] Error: {e}")
+      self._abandonChapters(worker_id, in_flight, manifest)
+
+    finally:
+      # Close this worker's browser
+      scraper.close()
+
+
+  # ******************************************** #
+  # ****************** Public ****************** #
+  # ******************************************** #
+
+
+  # === Function: __init__ ===
+  def __init__(self, worker_count: int = 1, scraper_settings_filename: str = "", headless: bool | None = None, scraper_factory: Callable[[], Scraper] | None = None, tabs_per_worker: int | None = None) -> None:
+    """
+    Constructor -> Sets how many workers to run and how to build their scrapers
+
+    Args:
+      worker_count: How many browsers should scrape at the same time
+      scraper_settings_filename: Name of the scraper settings file each worker should load ("" for the default)
+      headless: Should the workers' browsers run without a window. If None, the settings file's headless mode is used
+      scraper_factory: Optional function that returns a new, configured 'Scraper' for each worker
+      tabs_per_worker: How many chapters each worker's browser loads at once, in tabs. If None, the settings file's
+                       'tabs' is used
+    """
+
+    self._worker_count: int = max(worker_count, 1)
+    self._scraper_settings_filename: str = scraper_settings_filename
+    self._headless: bool | None = headless
+    self._scraper_factory: Callable[[], Scraper] | None = scraper_factory
+    self._tabs_per_worker: int | None = max(tabs_per_worker, 1) if (tabs_per_worker != None) else None
+    self._http_fetch_backend: HttpFetchBackend = HttpFetchBackend(max_connections_per_host=self._worker_count)
+
+    self._work_queue: queue.Queue = queue.Queue()
+    self._results_lock: threading.Lock = threading.Lock()
+    self._chapter_texts: dict[int, str] = {}
+    self._failed_chapters: list[int] = []
+
+    """ Saves every worker's chapters in the background. Only set while a scrape with an output directory runs """
+    self._chapter_writer: ChapterWriter | None = None
+
+    """ Times every worker's chapters. Only set while a scrape runs """
+    self._metrics: ScrapeMetrics | None = None
+
+    """ Output directory's durable work queue, and the range claimed from it. Only set while a scrape with
+        'work_queue' on runs """
+    self._durable_queue: WorkQueue | None = None
+    self._start_idx: int = 1
+    self._end_idx: int = Limits.INT_MAX
+
+
+  # === Function: scrape ===
+  def scrape(self, novel_url: str, start_idx: int = 1, end_idx: int = Limits.INT_MAX, format_text: bool = True, output_directory: str = None) -> dict[int, str]:
+    """
+    Scrape a range of chapters using every worker in the pool
+
+    Args:
+      novel_url: Url of the novel's chapter list
+      start_idx: Chapter number to start the scrape.    NOTE: Constraints: (start_idx <= end_idx)
+      end_idx: Chapter to end the scrape at.    NOTE: Constraints: (end_idx >= start_idx)
+      format_text: Should the text be formatted into a more readable form?
+      output_directory: Directory to save chapters to. If provided, chapters will be saved immediately.
+
+    Returns:
+      dict[int, str]: Chapter number -> scraped text (if output_directory is None)
+    """
+
+    # Reset results from any previous scrape
+    self._work_queue = queue.Queue()
+    self._chapter_texts = {}
+    self._failed_chapters = []
+
+    # Enforce index constraints
+    if (end_idx < start_idx):
+      end_idx = start_idx
+
+    # Chapters already in the output directory are skipped
+    manifest: ScrapeManifest | None = None
+    if (output_directory):
+      manifest = ScrapeManifest.getForDirectory(output_directory)
+      manifest.setNovelUrl(novel_url)
+
+    # The first worker's browser is used to seed the work queue from the chapter list page (or the manifest)
+    seed_scraper: Scraper = self._createScraper()
+    seed_scraper.setNovelChapterListUrl(novel_url)
+    seed_scraper.exposeMetrics()
+
+    # Every worker times its chapters into one log, unless the scraper's caller collects the timings itself
+    owns_metrics: bool = seed_scraper.getMetrics() == None
+    self._metrics = ScrapeMetrics(seed_scraper.getMetricsLogPath(output_directory)) if (owns_metrics) else seed_scraper.getMetrics()
+
+    # Several processes can share the output directory's durable work queue
+    if (output_directory and seed_scraper.getUseWorkQueue()):
+      self._durable_queue = WorkQueue.getForDirectory(output_directory)
+
+      # The queue decides what the manifest holds, so the manifest is only written from it | NOTE: Chapters other
+      # processes saved are skipped, even if they aren't in this process's manifest yet
+      manifest.setAutoSave(False)
+      self._durable_queue.syncManifest(manifest)
+
+    pending_chapters: list[Scraper.ChapterIndexEntry] | None = seed_scraper.getPendingChapters(start_idx, end_idx, manifest)
+    chapter_list_read: bool = pending_chapters != None
+    if (not chapter_list_read):
+      print("Couldn't read the chapter list. No chapters were queued.")
+      pending_chapters = []
+
+    durable_chapter_urls: dict[int, str] = {}
+    for entry in pending_chapters:
+      if (entry.url == None):
+        print(f"No URL found for chapter #{entry.chapter_num}. Skipping.")
+        self._metrics.recordFailure(entry.chapter_num, None, reason=ScrapeMetrics.FailureReasons.MISSING_NEXT_URL)
+        continue
+
+      if (self._durable_queue != None):
+        durable_chapter_urls[entry.chapter_num] = entry.url
+      else:
+        self._work_queue.put((entry.chapter_num, entry.url, 0))
+
+    # Resolve the latest chapter now that the chapter list is loaded | NOTE: Only INT_MAX if the chapter list was used
+    if (end_idx == Limits.INT_MAX and chapter_list_read):
+      end_idx = seed_scraper.getLatestChapterNum()
+
+    self._start_idx = start_idx
+    self._end_idx = end_idx
+
+    # NOTE: Chapters another process already claimed or saved keep their status
+    queued_count: int = self._work_queue.qsize()
+    if (self._durable_queue != None):
+      self._durable_queue.addChapters(durable_chapter_urls)
+      status_counts: dict[str, int] = self._durable_queue.getStatusCounts(start_idx, end_idx)
+      queued_count = status_counts[WorkQueue.Statuses.PENDING] + status_counts[WorkQueue.Statuses.LEASED]
+
+    # Print module separator
+    printModuleSeparator()
+
+    # Log starting message
+    print(
+      "Starting Pooled Scrape With Parameters: \n"
+      "\tNovel Url: " + novel_url + "\n"
+      "\tStarting Chapter: " + str(start_idx) + "\n"
+      "\tEnding Chapter: " + str(end_idx) + "\n"
+      "\tChapters Queued: " + str(queued_count) + "\n"
+      "\tWorkers: " + str(self._worker_count) + "\n"
+      "\tTabs Per Worker: " + str(self._tabs_per_worker if (self._tabs_per_worker != None) else seed_scraper.getDriverSessionSettings().tabs) + "\n"
+      "\tOutput Directory: " + (output_directory if output_directory else "Not saving to files") + "\n"
+      "\tWork Queue: " + (f"Durable ({self._durable_queue.getWorkerId()})" if (self._durable_queue != None) else "In memory") + "\n"
+    )
+
+    # Create workers | NOTE: Never start more workers than there are chapters
+    worker_count: int = max(min(self._worker_count, queued_count), 1)
+    threads: list[threading.Thread] = []
+    for i in range(worker_count):
+      scraper: Scraper = seed_scraper if (i == 0) else self._createScraper()
+      scraper.setNovelChapterListUrl(novel_url)
+      threads.append(threading.Thread(target=self._runWorker, args=(i, scraper, format_text, output_directory, manifest)))
+
+    # Every worker hands its chapters to one writer
+    if (output_directory):
+      output_format: str = seed_scraper.getOutputFormat()
+      if (self._durable_queue != None and output_format == OutputFormats.ARCHIVE):
+        print(f'Saving chapters as "{OutputFormats.FILES}", since several processes can\'t append to one archive.')
+        output_format = OutputFormats.FILES
+
+      self._chapter_writer = ChapterWriter(output_format=output_format)
+
+    # Report how many chapters are left on the metrics endpoint
+    queue_gauge: int = LiveMetrics.registerGauge("rawscrape_queue_depth", self._getChaptersLeftCount, {"queue": "work"})
+
+    # Start workers
+    for t in threads:
+      t.start()
+
+    # Join workers
+    for t in threads:
+      t.join()
+
+    LiveMetrics.unregisterGauge(queue_gauge)
+
+    # Wait for the last chapters to be saved | NOTE: An error saving them is raised once the scrape is wrapped up
+    writer_error: Exception | None = None
+    if (self._chapter_writer != None):
+      try:
+        self._chapter_writer.close()
+      except Exception as e:
+        writer_error = e
+      self._failed_chapters.extend(self._chapter_writer.getFailedChapters())
+      self._chapter_writer = None
+
+    # Record the failed chapters too
+    if (manifest != None):
+      manifest.flush()
+
+    # Bring the manifest up to date with the chapters other processes saved
+    if (self._durable_queue != None):
+      self._durable_queue.syncManifest(manifest)
+      manifest.setAutoSave(True)
+
+      status_counts: dict[str, int] = self._durable_queue.getStatusCounts(start_idx, end_idx)
+      print(f"\nWork queue: {status_counts[WorkQueue.Statuses.COMPLETE]} complete, {status_counts[WorkQueue.Statuses.FAILED]} failed, {status_counts[WorkQueue.Statuses.LEASED]} still leased")
+
+      self._durable_queue.close()
+      self._durable_queue = None
+
+    # Log the run's summary
+    if (owns_metrics):
+      self._metrics.close()
+    self._metrics = None
+
+    # Log the scrape's completion
+    if (len(self._failed_chapters) > 0):
+      print(f"\nFailed chapters: {sorted(self._failed_chapters)}")
+    print("\nScraping Complete!")
+
+    # Print module separator
+    printModuleSeparator()
+
+    if (writer_error != None):
+      raise writer_error
+
+    # Return the chapter data (if not saving to files)
+    return dict(sorted(self._chapter_texts.items()))
+
+
+  # === Function: close ===
+  def close(self) -> None:
+    """
+    Close the http session shared by the workers
+    """
+
+    self._http_fetch_backend.close()
+
+
+  # ******************************************** #
+  # ************** Getters/Setters ************* #
+  # ******************************************** #
+
+
+  # === Function: getFailedChapters ===
+  def getFailedChapters(self) -> list[int]:
+    """
+    Get the chapters that could not be scraped during the last scrape
+
+    Returns:
+      list[int]: Chapter numbers that failed, in order
+    """
+
+    return sorted(self._failed_chapters)
+
+
+  # === Function: getWorkerCount ===
+  def getWorkerCount(self) -> int:
+    """
+    Get the number of workers used when scraping
+
+    Returns:
+      int: How many browsers scrape at the same time
+    """
+
+    return self._worker_count
@@ -1,6 +1,7 @@
 # Imports
 import sys
 import os
+import math
 import configparser
 
 
@@ -178,6 +179,26 @@ def filterKeysFromSet(set, exclude_list: list) -> list:
 
   return [v for v in set if v not in exclude_list]
 
+# === Function: percentile ===
+def percentile(sorted_values: list[float], percent: float) -> float:
+  """
+  Get a percentile of some values (nearest rank)
+
+  Params:
+    sorted_values: Values, sorted from smallest to largest
+    percent: Percentile to get (0-100)
+
+  Returns:
+    float: The percentile OR 0.0 if there are no values
+  """
+
+  if (len(sorted_values) == 0):
+    return 0.0
+
+  rank: int = max(math.ceil(percent / 100.0 * len(sorted_values)) - 1, 0)
+  return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
 # === Function: printModuleSeparator ===
 def printModuleSeparator() -> None:
   """
@@ -0,0 +1,442 @@
+# Imports
+import os
+import re
+import html
+import json
+import zlib
+import uuid
+import hashlib
+import zipfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from src.common.novel_archive import NovelArchive
+from src.common.scrape_manifest import ScrapeManifest
+from src.common.utils import printModuleSeparator
+
+
+# === Class: VolumeExporter ===
+class VolumeExporter():
+  """
+  Exports a scraped novel into readable volumes (EPUB and/or one combined text file per volume), next to its chapters
+  in '<output_directory>/export/'.
+
+  Chapters are streamed one at a time from their 'NNNN.txt' files or the novel's archive straight into the volume
+  being written, so memory use doesn't grow with the size of the novel. Volumes are built in parallel, which also
+  spreads the EPUB compression across CPU cores (zlib releases the GIL).
+
+  Each volume covers a fixed range of chapter numbers, and a fingerprint of its chapters is kept in the export
+  directory, so exporting again only rebuilds the volumes whose chapters changed (i.e. the last volume after an update).
+  """
+
+
+  # === Subclass: Formats ===
+  class Formats():
+    """
+    Holds constants for the kinds of volume files that can be exported
+    """
+
+    TEXT: str = "txt" # Every chapter of the volume in one text file
+    EPUB: str = "epub"
+
+    ALL: tuple[str] = (TEXT, EPUB)
+
+
+  # ******************************************** #
+  # ****************** Private ***************** #
+  # ******************************************** #
+
+
+  # === Constants ===
+  _EXPORT_DIRECTORY: str = "export"
+  _STATE_FILENAME: str = "export_state.json"
+  _VERSION: int = 1
+
+  """ Name of a saved chapter file ('NNNN.txt') """
+  _CHAPTER_FILENAME_PATTERN: re.Pattern = re.compile(r"^(\d+)\.txt$")
+
+  _EPUB_CONTAINER_XML: str = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">\n'
+    '  <rootfiles>\n'
+    '    <rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>\n'
+    '  </rootfiles>\n'
+    '</container>\n'
+  )
+
+
+  # === Function: _findChapters ===
+  def _findChapters(self) -> dict[int, str]:
+    """
+    Find every saved chapter, in its own file or the novel's archive, without reading any of them
+
+    Returns:
+      dict[int, str]: Chapter number -> signature that changes whenever the chapter's text does
+    """
+
+    chapter_signatures: dict[int, str] = {}
+
+    if (NovelArchive.existsInDirectory(self._output_directory)):
+      archive: NovelArchive = NovelArchive.getForDirectory(self._output_directory)
+      for chapter_num in archive.getChapterNums():
+        chapter_signatures[chapter_num] = f"archive:{archive.getChapterSize(chapter_num)}:{archive.getChapterChecksum(chapter_num)}"
+
+    # Chapter files win over the archive, the same as when a scrape checks what's saved
+    for filename in os.listdir(self._output_directory):
+      filename_match = self._CHAPTER_FILENAME_PATTERN.match(filename)
+      if (filename_match == None):
+        continue
+
+      file_stat = os.stat(os.path.join(self._output_directory, filename))
+      chapter_signatures[int(filename_match.group(1))] = f"file:{file_stat.st_size}:{file_stat.st_mtime_ns}"
+
+    return chapter_signatures
+
+
+  # === Function: _readChapterText ===
+  def _readChapterText(self, chapter_num: int) -> str | None:
+    """
+    Read a chapter's text from its own file OR the novel's archive. A chapter that can't be read (i.e. a damaged
+    archive entry) is recorded as skipped (See 'getSkippedChapters')
+
+    Params:
+      chapter_num: Number of the chapter
+
+    Returns:
+      str | None: The chapter's text OR None if it can't be read
+    """
+
+    try:
+      file_path: str = os.path.join(self._output_directory, f"{str(chapter_num).zfill(4)}.txt")
+      if (os.path.exists(file_path)):
+        with open(file_path, "r", encoding="utf-8") as f:
+          return f.read()
+
+      if (NovelArchive.existsInDirectory(self._output_directory)):
+        chapter_text: str | None = NovelArchive.getForDirectory(self._output_directory).readChapter(chapter_num)
+        if (chapter_text != None):
+          return chapter_text
+
+      print(f"Chapter #{chapter_num} could not be read, skipping it.")
+    except (OSError, zlib.error, UnicodeDecodeError) as e:
+      print(f"Chapter #{chapter_num} could not be read, skipping it: {e}")
+
+    with self._skipped_chapters_lock:
+      self._skipped_chapters.add(chapter_num)
+
+    return None
+
+
+  # === Function: _getVolumeFilename ===
+  def _getVolumeFilename(self, volume_num: int, export_format: str) -> str:
+    """
+    Get the filename of a volume
+
+    Params:
+      volume_num: Number of the volume (Starts at 1)
+      export_format: One of VolumeExporter.Formats.XXX
+
+    Returns:
+      str: i.e. 'Novel - Volume 003 (0201-0300).epub'
+    """
+
+    first_chapter_num: int = (volume_num - 1) * self._chapters_per_volume + 1
+    last_chapter_num: int = volume_num * self._chapters_per_volume
+    return f"{self._novel_title} - Volume {str(volume_num).zfill(3)} ({str(first_chapter_num).zfill(4)}-{str(last_chapter_num).zfill(4)}).{export_format}"
+
+
+  # === Function: _writeTextVolume ===
+  def _writeTextVolume(self, path: str, chapter_nums: list[int]) -> None:
+    """
+    Write a volume's chapters into one text file, one chapter at a time
+
+    Params:
+      path: Path of the volume file
+      chapter_nums: Chapters in the volume, in order
+    """
+
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+      for chapter_num in chapter_nums:
+        chapter_text: str | None = self._readChapterText(chapter_num)
+        if (chapter_text == None):
+          continue
+
+        f.write(f"Chapter {chapter_num}\n\n")
+        f.write(chapter_text.strip("\n"))
+        f.write("\n\n\n")
+
+    os.replace(path + ".tmp", path)
+
+
+  # === Function: _writeEpubVolume ===
+  def _writeEpubVolume(self, path: str, volume_num: int, chapter_nums: list[int]) -> None:
+    """
+    Write a volume's chapters into an EPUB 3 file, one chapter at a time
+
+    Params:
+      path: Path of the volume file
+      volume_num: Number of the volume
+      chapter_nums: Chapters in the volume, in order
+    """
+
+    book_title: str = html.escape(f"{self._novel_title} - Volume {volume_num}")
+    book_id: str = str(uuid.uuid5(uuid.NAMESPACE_URL, f"{self._novel_id}#volume-{volume_num}"))
+
+    # NOTE: Only the chapters that could be read are listed in the table of contents and package file
+    written_chapter_nums: list[int] = []
+    chapter_filenames: list[str] = []
+
+    with zipfile.ZipFile(path + ".tmp", "w", compression=zipfile.ZIP_DEFLATED) as epub:
+      # The mimetype has to come first, uncompressed
+      epub.writestr("mimetype", "application/epub+zip", compress_type=zipfile.ZIP_STORED)
+      epub.writestr("META-INF/container.xml", self._EPUB_CONTAINER_XML)
+
+      for chapter_num in chapter_nums:
+        chapter_text: str | None = self._readChapterText(chapter_num)
+        if (chapter_text == None):
+          continue
+
+        chapter_filename: str = f"chapter_{str(chapter_num).zfill(4)}.xhtml"
+        written_chapter_nums.append(chapter_num)
+        chapter_filenames.append(chapter_filename)
+
+        paragraphs: str = "\n".join(
+          f"<p>{html.escape(line)}</p>" for line in chapter_text.splitlines() if (line.strip() != "")
+        )
+        epub.writestr(
+          f"OEBPS/{chapter_filename}",
+          '<?xml version="1.0" encoding="UTF-8"?>\n'
+          f'<html xmlns="http://www.w3.org/1999/xhtml" xml:lang="{self._language}" lang="{self._language}">\n'
+          f"<head><title>Chapter {chapter_num}</title></head>\n"
+          f"<body>\n<h1>Chapter {chapter_num}</h1>\n{paragraphs}\n</body>\n</html>\n"
+        )
+
+      # Table of contents
+      nav_items: str = "\n".join(
+        f'<li><a href="{chapter_filename}">Chapter {chapter_num}</a></li>' for chapter_num, chapter_filename in zip(written_chapter_nums, chapter_filenames)
+      )
+      epub.writestr(
+        "OEBPS/nav.xhtml",
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        f'<html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops" xml:lang="{self._language}" lang="{self._language}">\n'
+        f"<head><title>{book_title}</title></head>\n"
+        f'<body>\n<nav epub:type="toc" id="toc"><h1>{book_title}</h1>\n<ol>\n{nav_items}\n</ol></nav>\n</body>\n</html>\n'
+      )
+
+      # Package file
+      manifest_items: str = "\n".join(
+        f'    <item id="c{chapter_num}" href="{chapter_filename}" media-type="application/xhtml+xml"/>' for chapter_num, chapter_filename in zip(written_chapter_nums, chapter_filenames)
+      )
+      spine_items: str = "\n".join(f'    <itemref idref="c{chapter_num}"/>' for chapter_num in written_chapter_nums)
+      epub.writestr(
+        "OEBPS/content.opf",
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="book-id">\n'
+        '  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">\n'
+        f'    <dc:identifier id="book-id">urn:uuid:{book_id}</dc:identifier>\n'
+        f"    <dc:title>{book_title}</dc:title>\n"
+        f"    <dc:language>{self._language}</dc:language>\n"
+        '    <meta property="dcterms:modified">2000-01-01T00:00:00Z</meta>\n'
+        "  </metadata>\n"
+        "  <manifest>\n"
+        '    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>\n'
+        f"{manifest_items}\n"
+        "  </manifest>\n"
+        "  <spine>\n"
+        f"{spine_items}\n"
+        "  </spine>\n"
+        "</package>\n"
+      )
+
+    os.replace(path + ".tmp", path)
+
+
+  # === Function: _buildVolume ===
+  def _buildVolume(self, volume_num: int, chapter_nums: list[int]) -> bool:
+    """
+    Write every format of a volume. Runs in a worker thread
+
+    Params:
+      volume_num: Number of the volume
+      chapter_nums: Chapters in the volume, in order
+
+    Returns:
+      bool: True if every format was written
+    """
+
+    try:
+      for export_format in self._formats:
+        path: str = os.path.join(self._export_directory, self._getVolumeFilename(volume_num, export_format))
+        if (export_format == VolumeExporter.Formats.EPUB):
+          self._writeEpubVolume(path, volume_num, chapter_nums)
+        else:
+          self._writeTextVolume(path, chapter_nums)
+    except OSError as e:
+      print(f"Error exporting volume {volume_num}: {e}")
+      return False
+
+    print(f"Exported volume {volume_num} ({len(chapter_nums)} chapters)")
+    return True
+
+
+  # === Function: _loadState ===
+  def _loadState(self) -> dict[str, str]:
+    """
+    Load the fingerprints of the volumes built by the last export
+
+    Returns:
+      dict[str, str]: Volume number (str) -> fingerprint (Empty if there was no export or it can't be read)
+    """
+
+    state_path: str = os.path.join(self._export_directory, self._STATE_FILENAME)
+    if (not os.path.exists(state_path)):
+      return {}
+
+    try:
+      with open(state_path, "r", encoding="utf-8") as f:
+        return json.load(f).get("volumes", {})
+    except (OSError, ValueError) as e:
+      print(f"Could not read '{state_path}', exporting every volume: {e}")
+      return {}
+
+
+  # === Function: _saveState ===
+  def _saveState(self, volume_fingerprints: dict[str, str]) -> None:
+    """
+    Save the fingerprints of the exported volumes. The file is replaced in one step
+
+    Params:
+      volume_fingerprints: Volume number (str) -> fingerprint
+    """
+
+    state_path: str = os.path.join(self._export_directory, self._STATE_FILENAME)
+    with open(state_path + ".tmp", "w", encoding="utf-8") as f:
+      json.dump({"version": self._VERSION, "volumes": volume_fingerprints}, f, indent=1)
+    os.replace(state_path + ".tmp", state_path)
+
+
+  # ******************************************** #
+  # ****************** Public ****************** #
+  # ******************************************** #
+
+
+  # === Function: __init__ ===
+  def __init__(self, output_directory: str, chapters_per_volume: int = 100, formats: tuple[str] = Formats.ALL, worker_count: int | None = None, language: str = "ko") -> None:
+    """
+    Constructor -> Sets which novel to export and how
+
+    Args:
+      output_directory: Directory the novel was scraped to
+      chapters_per_volume: How many chapters go in each volume. NOTE: Changing it rebuilds every volume
+      formats: Which volume files to write (VolumeExporter.Formats.XXX)
+      worker_count: How many volumes to build at once (Defaults to the number of CPU cores)
+      language: Language code written into the EPUB files
+    """
+
+    self._output_directory: str = output_directory
+    self._export_directory: str = os.path.join(output_directory, self._EXPORT_DIRECTORY)
+    self._chapters_per_volume: int = max(chapters_per_volume, 1)
+    self._formats: tuple[str] = tuple(export_format for export_format in formats if (export_format in VolumeExporter.Formats.ALL))
+    self._worker_count: int = max(worker_count if (worker_count != None) else (os.cpu_count() or 1), 1)
+    self._language: str = language
+
+    self._novel_title: str = os.path.basename(os.path.normpath(output_directory))
+
+    """ Chapters left out of the last export because they couldn't be read """
+    self._skipped_chapters: set[int] = set()
+    self._skipped_chapters_lock: threading.Lock = threading.Lock()
+
+    # Used to give each volume a stable EPUB identifier
+    self._novel_id: str = self._novel_title
+    if (ScrapeManifest.existsInDirectory(output_directory)):
+      self._novel_id = ScrapeManifest.getForDirectory(output_directory).getNovelUrl() or self._novel_title
+
+
+  # === Function: export ===
+  def export(self, rebuild_all: bool = False) -> list[int]:
+    """
+    Export the novel, only rebuilding the volumes whose chapters (or export settings) changed since the last export
+
+    Params:
+      rebuild_all: Rebuild every volume, even unchanged ones
+
+    Returns:
+      list[int]: Volumes that were rebuilt, in order
+    """
+
+    os.makedirs(self._export_directory, exist_ok=True)
+    self._skipped_chapters = set()
+
+    # Group the chapters into volumes by chapter number, so new chapters only ever change the last volumes
+    chapter_signatures: dict[int, str] = self._findChapters()
+    volume_chapter_nums: dict[int, list[int]] = {}
+    for chapter_num in sorted(chapter_signatures):
+      volume_chapter_nums.setdefault((chapter_num - 1) // self._chapters_per_volume + 1, []).append(chapter_num)
+
+    # A volume's fingerprint covers its chapters and everything that changes what its files look like
+    volume_fingerprints: dict[str, str] = {}
+    for volume_num, chapter_nums in volume_chapter_nums.items():
+      fingerprint = hashlib.sha256(f"{self._VERSION}|{self._chapters_per_volume}|{self._language}|{self._novel_id}".encode("utf-8"))
+      for chapter_num in chapter_nums:
+        fingerprint.update(f"|{chapter_num}={chapter_signatures[chapter_num]}".encode("utf-8"))
+      volume_fingerprints[str(volume_num)] = fingerprint.hexdigest()
+
+    previous_fingerprints: dict[str, str] = {} if (rebuild_all) else self._loadState()
+    stale_volume_nums: list[int] = [
+      volume_num for volume_num in sorted(volume_chapter_nums)
+      if (previous_fingerprints.get(str(volume_num)) != volume_fingerprints[str(volume_num)] or not all(
+        os.path.exists(os.path.join(self._export_directory, self._getVolumeFilename(volume_num, export_format))) for export_format in self._formats
+      ))
+    ]
+
+    # Print module separator
+    printModuleSeparator()
+
+    # Log starting message
+    print(
+      "Starting Export With Parameters: \n"
+      "\tOutput Directory: " + self._output_directory + "\n"
+      "\tChapters Found: " + str(len(chapter_signatures)) + "\n"
+      "\tChapters Per Volume: " + str(self._chapters_per_volume) + "\n"
+      "\tFormats: " + ", ".join(self._formats) + "\n"
+      "\tVolumes To Rebuild: " + str(len(stale_volume_nums)) + " of " + str(len(volume_chapter_nums)) + "\n"
+    )
+
+    # Each worker streams one volume at a time, so memory only grows with the number of workers
+    with ThreadPoolExecutor(max_workers=self._worker_count) as executor:
+      results: list[bool] = list(executor.map(lambda volume_num: self._buildVolume(volume_num, volume_chapter_nums[volume_num]), stale_volume_nums))
+
+    # Volumes that failed keep their old fingerprint (if any), so they're rebuilt next time
+    rebuilt_volume_nums: list[int] = [volume_num for volume_num, result in zip(stale_volume_nums, results) if (result)]
+    saved_fingerprints: dict[str, str] = {
+      key: fingerprint for key, fingerprint in volume_fingerprints.items()
+      if (int(key) not in stale_volume_nums or int(key) in rebuilt_volume_nums)
+    }
+    self._saveState(saved_fingerprints)
+
+    # Log the export's completion
+    if (len(self._skipped_chapters) > 0):
+      print(f"\nSkipped chapters that could not be read: {sorted(self._skipped_chapters)}")
+    print(f"\nExport Complete! Files are in {self._export_directory}")
+
+    # Print module separator
+    printModuleSeparator()
+
+    return rebuilt_volume_nums
+
+
+  # ******************************************** #
+  # ************** Getters/Setters ************* #
+  # ******************************************** #
+
+
+  # === Function: getSkippedChapters ===
+  def getSkippedChapters(self) -> list[int]:
+    """
+    Get the chapters left out of the last export because they couldn't be read (i.e. a damaged archive entry)
+
+    Returns:
+      list[int]: Chapter numbers that were skipped, in order
+    """
+
+    with self._skipped_chapters_lock:
+      return sorted(self._skipped_chapters)
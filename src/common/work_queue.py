@@ -0,0 +1,407 @@
+# Imports
+import os
+import time
+import socket
+import sqlite3
+import hashlib
+import threading
+import contextlib
+from src.common.scrape_manifest import ScrapeManifest
+
+
+# === Class: WorkQueue ===
+class WorkQueue():
+  """
+  Durable queue of the chapters to scrape into an output directory, kept in a SQLite database next to the chapters
+  ('work_queue.db'), so a crash or a killed browser never loses a run.
+
+  Each chapter is a task that a worker claims with a lease. A chapter is only marked complete once it's saved, and a
+  complete chapter is never handed out again. If a worker dies, its leases run out and its chapters are handed to
+  another worker. A chapter is given up on after 'max_attempts' tries.
+
+  Several processes (on one or more hosts sharing the output directory's filesystem) can work through the same queue
+  at once: every claim is made in its own write transaction, so no two workers get the same chapter.
+
+  NOTE: The database keeps SQLite's default rollback journal, since WAL mode doesn't work over network filesystems
+  """
+
+
+  # === Subclass: Statuses ===
+  class Statuses():
+    """
+    Holds constants for a task's status in the queue
+    """
+
+    PENDING: str = "pending" # Waiting to be claimed
+    LEASED: str = "leased" # Claimed by a worker until its lease runs out
+    COMPLETE: str = "complete" # Saved. Never handed out again
+    FAILED: str = "failed" # Given up on after 'max_attempts' tries
+
+
+  # ******************************************** #
+  # ****************** Private ***************** #
+  # ******************************************** #
+
+
+  # === Constants ===
+  _DATABASE_FILENAME: str = "work_queue.db"
+
+  """ Seconds a claimed chapter is kept for its worker. Long enough to get through a challenge and be saved """
+  _LEASE_SECONDS: float = 600.0
+
+  """ How many times a chapter is claimed before it is given up on (Including claims lost to a crash) """
+  _MAX_ATTEMPTS: int = 3
+
+  """ Seconds to wait for another process's transaction before giving up """
+  _BUSY_TIMEOUT: float = 60.0
+
+  _SCHEMA: str = (
+    "CREATE TABLE IF NOT EXISTS tasks ("
+    "  chapter_num INTEGER PRIMARY KEY,"
+    "  url TEXT,"
+    "  status TEXT NOT NULL,"
+    "  attempts INTEGER NOT NULL DEFAULT 0,"
+    "  lease_owner TEXT,"
+    "  lease_expires REAL,"
+    "  error TEXT,"
+    "  filename TEXT,"
+    "  sha256 TEXT,"
+    "  size INTEGER,"
+    "  updated REAL NOT NULL"
+    ")"
+  )
+
+
+  # === Variables ===
+  """ Output directory (absolute path) -> its open queue. Shared by every worker in this process """
+  _directory_queues: dict = {}
+  _directory_queues_lock: threading.Lock = threading.Lock()
+
+
+  # === Function: _transaction ===
+  @contextlib.contextmanager
+  def _transaction(self):
+    """
+    Run statements in one write transaction, holding the database's write lock from the start so two workers can't
+    both read the same pending chapter. Rolled back if anything fails
+
+    Yields:
+      sqlite3.Connection: Connection to run the statements on
+    """
+
+    with self._lock:
+      self._connection.execute("BEGIN IMMEDIATE")
+      try:
+        yield self._connection
+        self._connection.execute("COMMIT")
+      except BaseException:
+        self._connection.execute("ROLLBACK")
+        raise
+
+
+  # ******************************************** #
+  # ****************** Public ****************** #
+  # ******************************************** #
+
+
+  # === Function: __init__ ===
+  def __init__(self, output_directory: str, lease_seconds: float = _LEASE_SECONDS, max_attempts: int = _MAX_ATTEMPTS) -> None:
+    """
+    Constructor -> Opens the queue in an output directory (or creates an empty one)
+
+    NOTE: Use 'WorkQueue.getForDirectory' so every worker in the process shares the same connection
+
+    Args:
+      output_directory: Directory the chapters are saved to
+      lease_seconds: Seconds a claimed chapter is kept for its worker
+      max_attempts: How many times a chapter is claimed before it is given up on
+    """
+
+    self._output_directory: str = output_directory
+    self._path: str = os.path.join(output_directory, self._DATABASE_FILENAME)
+    self._lease_seconds: float = lease_seconds
+    self._max_attempts: int = max(max_attempts, 1)
+
+    """ Identifies this process's leases, across every host sharing the queue """
+    self._worker_id: str = f"{socket.gethostname()}:{os.getpid()}"
+
+    # NOTE: Transactions are started by hand (See '_transaction'), and the lock lets every worker thread share them
+    self._lock: threading.Lock = threading.Lock()
+    self._connection: sqlite3.Connection = sqlite3.connect(self._path, timeout=self._BUSY_TIMEOUT, isolation_level=None, check_same_thread=False)
+    self._connection.execute(self._SCHEMA)
+
+
+  # === Function: getForDirectory ===
+  @staticmethod
+  def getForDirectory(output_directory: str):
+    """
+    Get the shared queue for an output directory, opening it if needed
+
+    Params:
+      output_directory: Directory the chapters are saved to
+
+    Returns:
+      WorkQueue: The directory's queue
+    """
+
+    key: str = os.path.abspath(output_directory)
+
+    with WorkQueue._directory_queues_lock:
+      if (key not in WorkQueue._directory_queues):
+        WorkQueue._directory_queues[key] = WorkQueue(output_directory)
+
+      return WorkQueue._directory_queues[key]
+
+
+  # === Function: getIfOpen ===
+  @staticmethod
+  def getIfOpen(output_directory: str):
+    """
+    Get the queue for an output directory only if this process has it open (i.e. a pooled scrape is using it)
+
+    Params:
+      output_directory: Directory the chapters are saved to
+
+    Returns:
+      WorkQueue | None: The directory's queue OR None if it isn't open
+    """
+
+    with WorkQueue._directory_queues_lock:
+      return WorkQueue._directory_queues.get(os.path.abspath(output_directory))
+
+
+  # === Function: addChapters ===
+  def addChapters(self, chapter_urls: dict[int, str]) -> int:
+    """
+    Queue chapters to be scraped. Chapters already in the queue keep their status (so a complete chapter stays
+    complete and a claimed one stays claimed), except failed ones, which get a fresh set of attempts
+
+    Params:
+      chapter_urls: Chapter number -> url
+
+    Returns:
+      int: How many chapters were new to the queue
+    """
+
+    now: float = time.time()
+
+    with self._transaction() as connection:
+      added_count: int = 0
+      for chapter_num, url in chapter_urls.items():
+        cursor = connection.execute(
+          "INSERT OR IGNORE INTO tasks (chapter_num, url, status, updated) VALUES (?, ?, ?, ?)",
+          (chapter_num, url, WorkQueue.Statuses.PENDING, now)
+        )
+        added_count += cursor.rowcount
+
+        if (cursor.rowcount == 0):
+          connection.execute("UPDATE tasks SET url = ? WHERE chapter_num = ? AND url IS NULL", (url, chapter_num))
+          connection.execute(
+            "UPDATE tasks SET status = ?, attempts = 0, updated = ? WHERE chapter_num = ? AND status = ?",
+            (WorkQueue.Statuses.PENDING, now, chapter_num, WorkQueue.Statuses.FAILED)
+          )
+
+    return added_count
+
+
+  # === Function: claim ===
+  def claim(self, start_idx: int, end_idx: int) -> tuple[int, str, int] | None:
+    """
+    Claim the first pending chapter in a range, OR one whose lease ran out (its worker died). Chapters whose lease
+    ran out on their last attempt are given up on here
+
+    Params:
+      start_idx: First chapter of the range
+      end_idx: Last chapter of the range
+
+    Returns:
+      tuple[int, str, int] | None: (chapter number, url, attempts before this one) OR None if nothing can be claimed
+    """
+
+    now: float = time.time()
+
+    with self._transaction() as connection:
+      connection.execute(
+        "UPDATE tasks SET status = ?, lease_owner = NULL, lease_expires = NULL, error = ?, updated = ? "
+        "WHERE status = ? AND lease_expires < ? AND attempts >= ?",
+        (WorkQueue.Statuses.FAILED, "Lease expired", now, WorkQueue.Statuses.LEASED, now, self._max_attempts)
+      )
+
+      row = connection.execute(
+        "SELECT chapter_num, url, attempts FROM tasks "
+        "WHERE chapter_num BETWEEN ? AND ? AND (status = ? OR (status = ? AND lease_expires < ?)) "
+        "ORDER BY chapter_num LIMIT 1",
+        (start_idx, end_idx, WorkQueue.Statuses.PENDING, WorkQueue.Statuses.LEASED, now)
+      ).fetchone()
+
+      if (row == None):
+        return None
+
+      chapter_num, url, attempts = row
+      connection.execute(
+        "UPDATE tasks SET status = ?, attempts = attempts + 1, lease_owner = ?, lease_expires = ?, updated = ? WHERE chapter_num = ?",
+        (WorkQueue.Statuses.LEASED, self._worker_id, now + self._lease_seconds, now, chapter_num)
+      )
+
+    return (chapter_num, url, attempts)
+
+
+  # === Function: release ===
+  def release(self, chapter_num: int, error: str) -> bool:
+    """
+    Give back a chapter that couldn't be scraped, so it can be claimed again (OR give up on it after its last attempt)
+
+    NOTE: Does nothing if this process's lease ran out and another worker claimed the chapter
+
+    Params:
+      chapter_num: Number of the chapter
+      error: Why it couldn't be scraped
+
+    Returns:
+      bool: True if the chapter will be tried again
+    """
+
+    with self._transaction() as connection:
+      row = connection.execute(
+        "SELECT attempts FROM tasks WHERE chapter_num = ? AND status = ? AND lease_owner = ?",
+        (chapter_num, WorkQueue.Statuses.LEASED, self._worker_id)
+      ).fetchone()
+
+      if (row == None):
+        return False
+
+      retry: bool = row[0] < self._max_attempts
+      connection.execute(
+        "UPDATE tasks SET status = ?, lease_owner = NULL, lease_expires = NULL, error = ?, updated = ? WHERE chapter_num = ?",
+        (WorkQueue.Statuses.PENDING if (retry) else WorkQueue.Statuses.FAILED, error, time.time(), chapter_num)
+      )
+
+    return retry
+
+
+  # === Function: markCompleteMany ===
+  def markCompleteMany(self, chapters: list[tuple[int, str, str]]) -> None:
+    """
+    Record that several chapters were saved, in one transaction. They are never handed out again
+
+    NOTE: Whoever saved a chapter completes it, even if its lease ran out, since the file is already in place
+
+    Params:
+      chapters: (chapter number, filename, text) of each saved chapter
+    """
+
+    now: float = time.time()
+
+    with self._transaction() as connection:
+      for chapter_num, filename, text in chapters:
+        encoded_text: bytes = text.encode("utf-8")
+        connection.execute(
+          "UPDATE tasks SET status = ?, lease_owner = NULL, lease_expires = NULL, error = NULL, filename = ?, sha256 = ?, size = ?, updated = ? "
+          "WHERE chapter_num = ?",
+          (WorkQueue.Statuses.COMPLETE, filename, hashlib.sha256(encoded_text).hexdigest(), len(encoded_text), now, chapter_num)
+        )
+
+
+  # === Function: hasOtherWork ===
+  def hasOtherWork(self, start_idx: int, end_idx: int) -> bool:
+    """
+    Check if chapters in a range are still pending OR leased by another process. A worker with nothing to claim keeps
+    waiting while this is true, so it can take over the chapters of a process that dies
+
+    NOTE: This process's own leases aren't counted, since its other workers are already on them
+
+    Params:
+      start_idx: First chapter of the range
+      end_idx: Last chapter of the range
+
+    Returns:
+      bool: True if chapters in the range could still be handed out
+    """
+
+    with self._lock:
+      row = self._connection.execute(
+        "SELECT COUNT(*) FROM tasks WHERE chapter_num BETWEEN ? AND ? AND (status = ? OR (status = ? AND lease_owner != ?))",
+        (start_idx, end_idx, WorkQueue.Statuses.PENDING, WorkQueue.Statuses.LEASED, self._worker_id)
+      ).fetchone()
+
+    return row[0] > 0
+
+
+  # === Function: syncManifest ===
+  def syncManifest(self, manifest: ScrapeManifest) -> None:
+    """
+    Record every complete chapter (including those saved by other processes) in the directory's manifest, and write it
+
+    NOTE: Done inside a write transaction, so processes sharing the directory write the manifest one at a time, each
+          from the queue's latest state. Keep the manifest's auto saving off while the queue is in use (See
+          'ScrapeManifest.setAutoSave')
+
+    Params:
+      manifest: Manifest of the output directory
+    """
+
+    with self._transaction() as connection:
+      rows = connection.execute(
+        "SELECT chapter_num, url, filename, sha256, size FROM tasks WHERE status = ? ORDER BY chapter_num",
+        (WorkQueue.Statuses.COMPLETE,)
+      ).fetchall()
+
+      manifest.markCompleteEntries([
+        {"chapter_num": row[0], "url": row[1], "filename": row[2], "sha256": row[3], "size": row[4]}
+        for row in rows
+      ])
+      manifest.flush(force=True)
+
+
+  # === Function: close ===
+  def close(self) -> None:
+    """
+    Close the database connection, and stop sharing the queue
+    """
+
+    with WorkQueue._directory_queues_lock:
+      WorkQueue._directory_queues.pop(os.path.abspath(self._output_directory), None)
+
+    with self._lock:
+      self._connection.close()
+
+
+  # ******************************************** #
+  # ************** Getters/Setters ************* #
+  # ******************************************** #
+
+
+  # === Function: getStatusCounts ===
+  def getStatusCounts(self, start_idx: int, end_idx: int) -> dict[str, int]:
+    """
+    Count the chapters of a range in each status
+
+    Params:
+      start_idx: First chapter of the range
+      end_idx: Last chapter of the range
+
+    Returns:
+      dict[str, int]: Status (WorkQueue.Statuses.XXX) -> chapters in it
+    """
+
+    with self._lock:
+      rows = self._connection.execute(
+        "SELECT status, COUNT(*) FROM tasks WHERE chapter_num BETWEEN ? AND ? GROUP BY status",
+        (start_idx, end_idx)
+      ).fetchall()
+
+    status_counts: dict[str, int] = {status: 0 for status in (WorkQueue.Statuses.PENDING, WorkQueue.Statuses.LEASED, WorkQueue.Statuses.COMPLETE, WorkQueue.Statuses.FAILED)}
+    status_counts.update(dict(rows))
+    return status_counts
+
+
+  # === Function: getWorkerId ===
+  def getWorkerId(self) -> str:
+    """
+    Get the id this process's leases are held under
+
+    Returns:
+      str: '<hostname>:<pid>'
+    """
+
+    return self._worker_id
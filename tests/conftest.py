@@ -0,0 +1,109 @@
+# Imports
+import os
+import sys
+import json
+import shutil
+import pytest
+
+
+""" Root of the repository, so the tests can import 'src' and scrapers can load 'cfg/' """
+REPO_ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if (REPO_ROOT not in sys.path):
+  sys.path.insert(0, REPO_ROOT)
+
+from src.common.fixture_site import FixtureSite
+from src.common.rate_limiter import RateLimiter
+from src.common.metrics_server import LiveMetrics
+
+# The scrapers import seleniumbase. Tests that use them skip themselves without it (see 'pytest.importorskip')
+try:
+  from src.common.scraper import Scraper
+  from src.common.fetch_backends import FetchBackends
+except ImportError:
+  Scraper = None
+
+
+# === Fixture: workingDirectory ===
+@pytest.fixture(autouse=True)
+def workingDirectory(tmp_path, monkeypatch) -> str:
+  """
+  Run each test in its own directory with a copy of 'cfg/', so whatever a scrape writes next to it (i.e.
+  'downloaded_files/clearance') stays out of the repository
+  """
+
+  shutil.copytree(os.path.join(REPO_ROOT, "cfg"), tmp_path / "cfg")
+  monkeypatch.chdir(tmp_path)
+  return str(tmp_path)
+
+
+# === Fixture: fixtureSite ===
+@pytest.fixture
+def fixtureSite(monkeypatch):
+  """
+  A local novel with 12 chapters. Its host gets a rate limiter that never waits, which is dropped after the test along
+  with its gauges, so no test sees another test's limiter
+  """
+
+  monkeypatch.setattr(RateLimiter, "_host_limiters", {})
+  monkeypatch.setattr(LiveMetrics, "_gauge_functions", {})
+
+  site: FixtureSite = FixtureSite(chapter_count=12, latency=0.02, page_size_kb=1)
+
+  # Nothing is held back by the rate limiter, so the tests don't wait on it
+  RateLimiter.getForHost(site.getNovelUrl(), createFastRateLimitSettings())
+
+  yield site
+
+  site.close()
+
+
+# === Function: createFastRateLimitSettings ===
+def createFastRateLimitSettings() -> RateLimiter.Settings:
+  """
+  Get rate limiter settings that never make a request wait
+
+  Returns:
+    RateLimiter.Settings: The settings
+  """
+
+  rate_limit_settings: RateLimiter.Settings = RateLimiter.Settings()
+  rate_limit_settings.rate = 1000.0
+  rate_limit_settings.burst = 1000.0
+  rate_limit_settings.jitter = 0.0
+  rate_limit_settings.max_rate = 1000.0
+  return rate_limit_settings
+
+
+# === Function: createScraper ===
+def createScraper(novel_url: str, use_work_queue: bool = False) -> Scraper:
+  """
+  Create a scraper that loads the fixture site with plain http requests
+
+  Params:
+    novel_url: Url of the fixture site's chapter list
+    use_work_queue: Should the pool claim chapters from the output directory's durable work queue
+
+  Returns:
+    Scraper: The scraper
+  """
+
+  scraper: Scraper = Scraper(novel_url)
+  scraper.setFetchBackend(FetchBackends.HTTP)
+  scraper.setUseWorkQueue(use_work_queue)
+  return scraper
+
+
+# === Function: readChapterStatuses ===
+def readChapterStatuses(output_directory: str) -> dict[int, str]:
+  """
+  Read the status of every chapter in an output directory's manifest
+
+  Params:
+    output_directory: Directory the novel was scraped to
+
+  Returns:
+    dict[int, str]: Chapter number -> status (ScrapeManifest.Statuses.XXX)
+  """
+
+  with open(os.path.join(output_directory, "manifest.json"), "r", encoding="utf-8") as f:
+    return {entry["chapter_num"]: entry["status"] for entry in json.load(f)["chapters"]}
@@ -0,0 +1,41 @@
+# Imports
+import os
+import asyncio
+import pytest
+
+# NOTE: The scrapers import seleniumbase, even when they only use plain http
+pytest.importorskip("seleniumbase")
+
+from conftest import createScraper, readChapterStatuses
+from src.common.scraper import Scraper
+from src.common.async_scraper import AsyncScraper
+from src.common.scrape_manifest import ScrapeManifest
+
+
+def test_async_scraper_resumes_and_marks_failures(fixtureSite, tmp_path):
+  output_directory: str = str(tmp_path / "novel")
+  os.makedirs(output_directory)
+  fixtureSite.setMissingChapters({9})
+
+  scraper: Scraper = createScraper(fixtureSite.getNovelUrl())
+  asyncio.run(AsyncScraper(scraper, max_concurrent_fetches=4).scrape(1, 6, True, output_directory))
+
+  async_scraper: AsyncScraper = AsyncScraper(scraper, max_concurrent_fetches=4)
+  asyncio.run(async_scraper.scrape(1, 12, True, output_directory))
+  scraper.close()
+
+  assert async_scraper.getFailedChapters() == [9]
+  assert all(fixtureSite.getChapterHits()[chapter_num] == 1 for chapter_num in range(1, 13))
+
+  chapter_statuses: dict[int, str] = readChapterStatuses(output_directory)
+  assert chapter_statuses[9] == ScrapeManifest.Statuses.FAILED
+  assert all(chapter_statuses[chapter_num] == ScrapeManifest.Statuses.COMPLETE for chapter_num in range(1, 13) if (chapter_num != 9))
+
+
+def test_async_scraper_returns_texts_without_output_directory(fixtureSite):
+  scraper: Scraper = createScraper(fixtureSite.getNovelUrl())
+  chapter_texts: dict[int, str] = asyncio.run(AsyncScraper(scraper, max_concurrent_fetches=4).scrape(3, 5, True))
+  scraper.close()
+
+  assert sorted(chapter_texts) == [3, 4, 5]
+  assert all(f"{chapter_num}화." in chapter_texts[chapter_num] for chapter_num in chapter_texts)
@@ -0,0 +1,89 @@
+# Imports
+import os
+import time
+import pytest
+from conftest import readChapterStatuses
+from src.common.chapter_writer import ChapterWriter
+from src.common.scrape_manifest import ScrapeManifest
+
+
+def test_chapters_are_committed_in_batches(tmp_path, monkeypatch):
+  output_directory: str = str(tmp_path)
+  batch_sizes: list[int] = []
+
+  commit = ChapterWriter._commit
+  def recordCommit(self, batch: list[dict]) -> None:
+    if (len(batch) > 0):
+      batch_sizes.append(len(batch))
+    commit(self, batch)
+  monkeypatch.setattr(ChapterWriter, "_commit", recordCommit)
+
+  chapter_writer: ChapterWriter = ChapterWriter(fsync_batch_size=4, fsync_interval=60.0)
+  for chapter_num in range(1, 11):
+    chapter_writer.write(chapter_num, f"Chapter {chapter_num}", output_directory, f"http://127.0.0.1/novel/{chapter_num}")
+  chapter_writer.close()
+
+  assert batch_sizes == [4, 4, 2]
+  assert chapter_writer.getSavedCount() == 10
+  assert set(readChapterStatuses(output_directory).values()) == {ScrapeManifest.Statuses.COMPLETE}
+  assert not any(filename.endswith(".tmp") for filename in os.listdir(output_directory))
+
+  with open(os.path.join(output_directory, "0007.txt"), "r", encoding="utf-8") as f:
+    assert f.read() == "Chapter 7"
+
+
+def test_batch_is_committed_after_its_interval(tmp_path):
+  chapter_writer: ChapterWriter = ChapterWriter(fsync_batch_size=100, fsync_interval=0.05)
+  chapter_writer.write(1, "Chapter 1", str(tmp_path))
+
+  # Nothing else comes in, so only the deadline commits the batch
+  deadline: float = time.monotonic() + 5.0
+  while (not os.path.exists(os.path.join(str(tmp_path), "0001.txt")) and time.monotonic() < deadline):
+    time.sleep(0.01)
+
+  assert os.path.exists(os.path.join(str(tmp_path), "0001.txt"))
+  chapter_writer.close()
+
+
+def test_chapter_that_cant_be_renamed_fails_alone(tmp_path):
+  output_directory: str = str(tmp_path)
+
+  # A directory is in the way of chapter 2's file
+  os.makedirs(os.path.join(output_directory, "0002.txt"))
+
+  chapter_writer: ChapterWriter = ChapterWriter(fsync_batch_size=4)
+  for chapter_num in range(1, 4):
+    chapter_writer.write(chapter_num, f"Chapter {chapter_num}", output_directory)
+  chapter_writer.close()
+
+  assert chapter_writer.getFailedChapters() == [2]
+  assert chapter_writer.getSavedCount() == 2
+  assert not any(filename.endswith(".tmp") for filename in os.listdir(output_directory))
+
+
+def test_batch_that_cant_be_recorded_fails_and_raises_once(tmp_path, monkeypatch):
+  output_directory: str = str(tmp_path)
+
+  mark_complete_many = ScrapeManifest.markCompleteMany
+  def failOnce(self, *args, **kwargs) -> None:
+    monkeypatch.setattr(ScrapeManifest, "markCompleteMany", mark_complete_many)
+    raise OSError("disk full")
+  monkeypatch.setattr(ScrapeManifest, "markCompleteMany", failOnce)
+
+  chapter_writer: ChapterWriter = ChapterWriter()
+  chapter_writer.write(1, "Chapter 1", output_directory)
+  chapter_writer.write(2, "Chapter 2", output_directory)
+
+  with pytest.raises(OSError):
+    chapter_writer.flush()
+
+  # The writer keeps going, and the error isn't raised again
+  chapter_writer.write(3, "Chapter 3", output_directory)
+  chapter_writer.close()
+
+  assert chapter_writer.getFailedChapters() == [1, 2]
+
+  chapter_statuses: dict[int, str] = readChapterStatuses(output_directory)
+  assert chapter_statuses[1] == ScrapeManifest.Statuses.FAILED
+  assert chapter_statuses[2] == ScrapeManifest.Statuses.FAILED
+  assert chapter_statuses[3] == ScrapeManifest.Statuses.COMPLETE
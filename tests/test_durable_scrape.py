@@ -0,0 +1,56 @@
+# Imports
+import os
+import multiprocessing
+import pytest
+
+# NOTE: The scrapers import seleniumbase, even when they only use plain http
+pytest.importorskip("seleniumbase")
+
+from conftest import createScraper, readChapterStatuses, createFastRateLimitSettings
+from src.common.scraper_pool import ScraperPool
+from src.common.rate_limiter import RateLimiter
+from src.common.scrape_manifest import ScrapeManifest
+from src.common.work_queue import WorkQueue
+
+
+# === Function: scrapeWithDurableQueue ===
+def scrapeWithDurableQueue(novel_url: str, output_directory: str, chapter_count: int) -> None:
+  """
+  Scrape a novel with a pool that claims chapters from the output directory's durable work queue. Runs in its own
+  process
+
+  Params:
+    novel_url: Url of the fixture site's chapter list
+    output_directory: Directory to save chapters to
+    chapter_count: Chapters the novel has
+  """
+
+  RateLimiter.getForHost(novel_url, createFastRateLimitSettings())
+
+  scraper_pool: ScraperPool = ScraperPool(worker_count=2, scraper_factory=lambda: createScraper(novel_url, use_work_queue=True))
+  scraper_pool.scrape(novel_url, 1, chapter_count, True, output_directory)
+  scraper_pool.close()
+
+
+def test_processes_sharing_a_work_queue_load_each_chapter_once(fixtureSite, tmp_path):
+  output_directory: str = str(tmp_path / "novel")
+  os.makedirs(output_directory)
+
+  context = multiprocessing.get_context("spawn")
+  processes = [
+    context.Process(target=scrapeWithDurableQueue, args=(fixtureSite.getNovelUrl(), output_directory, fixtureSite.getChapterCount()))
+    for _ in range(2)
+  ]
+  for process in processes:
+    process.start()
+  for process in processes:
+    process.join(120)
+    assert process.exitcode == 0
+
+  assert fixtureSite.getChapterHits() == {chapter_num: 1 for chapter_num in range(1, 13)}
+  assert set(readChapterStatuses(output_directory).values()) == {ScrapeManifest.Statuses.COMPLETE}
+  assert not any(filename.endswith(".tmp") for filename in os.listdir(output_directory))
+
+  work_queue: WorkQueue = WorkQueue(output_directory)
+  assert work_queue.getStatusCounts(1, 12)[WorkQueue.Statuses.COMPLETE] == 12
+  work_queue.close()
@@ -0,0 +1,103 @@
+# Imports
+import threading
+import pytest
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+# NOTE: Parsed pages raise selenium's exceptions, so they can stand in for the browser
+pytest.importorskip("selenium")
+
+from src.common.fetch_backends import FetchResult, HttpFetchBackend
+
+
+""" An ordinary page that loads Cloudflare's scripts and has a CAPTCHA on its comment form """
+ORDINARY_PAGE_HTML: str = (
+  "<html><head><title>Chapter 12</title>"
+  "<script src=\"/cdn-cgi/challenge-platform/scripts/jsd/main.js\"></script></head>"
+  "<body><p>Chapter text</p><form><div class=\"g-recaptcha\"></div><div class=\"h-captcha\"></div></form></body></html>"
+)
+
+
+# === Function: createResult ===
+def createResult(page_html: str, status: int = 200, headers: dict[str, str] | None = None) -> FetchResult:
+  """
+  Create a loaded page without requesting it
+
+  Params:
+    page_html: Html of the page
+    status: Http status code
+    headers: Response headers (names are lowercase)
+
+  Returns:
+    FetchResult: The page
+  """
+
+  return FetchResult("http://127.0.0.1/novel/12", status, headers if (headers != None) else {}, page_html, 0.0)
+
+
+# === Class: RedirectHandler ===
+class RedirectHandler(BaseHTTPRequestHandler):
+  """
+  Redirects '/redirect' to '/page' on 'localhost' and records the headers of every request (Path -> headers)
+  """
+
+  requests: dict[str, dict[str, str]] = {}
+
+  def do_GET(self) -> None:
+    RedirectHandler.requests[self.path] = {name.lower(): value for name, value in self.headers.items()}
+
+    if (self.path == "/redirect"):
+      self.send_response(302)
+      self.send_header("Location", f"http://localhost:{self.server.server_port}/page")
+      self.send_header("Content-Length", "0")
+      self.end_headers()
+      return
+
+    body: bytes = b"<html><head><title>Page</title></head></html>"
+    self.send_response(200)
+    self.send_header("Content-Type", "text/html; charset=utf-8")
+    self.send_header("Content-Length", str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+  def log_message(self, *args) -> None:
+    pass
+
+
+def test_redirect_to_another_host_drops_cookies_and_validators():
+  server: HTTPServer = HTTPServer(("127.0.0.1", 0), RedirectHandler)
+  threading.Thread(target=server.serve_forever, daemon=True).start()
+
+  fetch_backend: HttpFetchBackend = HttpFetchBackend()
+  result: FetchResult = fetch_backend.fetch(f"http://127.0.0.1:{server.server_port}/redirect", {"Cookie": "cf_clearance=abc", "If-None-Match": "\"v1\""})
+  fetch_backend.close()
+  server.shutdown()
+  server.server_close()
+
+  assert result.status == 200
+  assert RedirectHandler.requests["/redirect"]["cookie"] == "cf_clearance=abc"
+  assert "cookie" not in RedirectHandler.requests["/page"]
+  assert "if-none-match" not in RedirectHandler.requests["/page"]
+
+
+def test_ordinary_page_with_cloudflare_scripts_is_not_a_challenge():
+  assert not createResult(ORDINARY_PAGE_HTML).isChallenge()
+
+
+def test_challenge_title_is_a_challenge():
+  assert createResult("<html><head><title>\n  Just a moment...\n</title></head></html>", status=200).isChallenge()
+
+
+def test_challenge_header_is_a_challenge():
+  assert createResult("<html></html>", status=403, headers={"cf-mitigated": "challenge"}).isChallenge()
+
+
+def test_challenge_script_only_counts_on_a_refused_request():
+  page_html: str = "<html><head><title>Loading</title><script>window._cf_chl_opt = {};</script></head></html>"
+  assert not createResult(page_html, status=200).isChallenge()
+  assert createResult(page_html, status=503).isChallenge()
+
+
+def test_too_many_requests_is_throttled_not_a_challenge():
+  result: FetchResult = createResult("<html><head><title>Too Many Requests</title></head></html>", status=429)
+  assert not result.isChallenge()
+  assert result.isThrottled()
@@ -0,0 +1,95 @@
+# Imports
+import pytest
+
+# NOTE: Parsed pages raise selenium's exceptions, so they can stand in for the browser
+pytest.importorskip("selenium")
+
+from selenium.common.exceptions import NoSuchElementException
+from src.common.html_document import HtmlDocument, HtmlSelector
+
+
+""" A chapter list and chapter page, shaped like the pages 'cfg/scraper_settings/booktoki.ini' expects """
+PAGE_HTML: str = """
+<html>
+  <head><title> Chapter   3 </title><script>var hidden = "not text";</script></head>
+  <body>
+    <ul class="list-body">
+      <li class="list-item first"><a href="/novel/3" data-num="3">Chapter 3</a></li>
+      <li class="list-item"><a href="/novel/2" data-num="2">Chapter 2</a></li>
+      <li class="list-item last"><a href="/novel/1" data-num="1">Chapter 1</a></li>
+    </ul>
+    <div id="novel_content">
+      <p>First   line</p>
+      <p style="display: none">Hidden line</p>
+      <p>Second<br>line</p>
+    </div>
+    <div class="btn-resource btn-next at-tip"><a href="/novel/4">Next</a></div>
+  </body>
+</html>
+"""
+
+
+# === Function: findHrefs ===
+def findHrefs(document: HtmlDocument, by: str, value: str) -> list[str]:
+  """
+  Find the links a selector matches
+
+  Params:
+    document: Page to search
+    by: Type of selector ("id", "class name", "css selector", "tag name")
+    value: The selector
+
+  Returns:
+    list[str]: 'href' of every matching element, in document order
+  """
+
+  return [element.get_attribute("href") for element in document.find_elements(by, value)]
+
+
+def test_descendant_and_child_combinators():
+  document: HtmlDocument = HtmlDocument(PAGE_HTML)
+
+  assert findHrefs(document, "css selector", "ul.list-body > li.list-item a") == ["/novel/3", "/novel/2", "/novel/1"]
+  assert findHrefs(document, "css selector", "ul > a") == []
+  assert findHrefs(document, "css selector", ".btn-next a") == ["/novel/4"]
+
+
+def test_sibling_combinators_and_pseudo_classes():
+  document: HtmlDocument = HtmlDocument(PAGE_HTML)
+
+  assert findHrefs(document, "css selector", "li.first + li a") == ["/novel/2"]
+  assert findHrefs(document, "css selector", "li.first ~ li a") == ["/novel/2", "/novel/1"]
+  assert findHrefs(document, "css selector", "li:first-child a, li:last-child a") == ["/novel/3", "/novel/1"]
+
+
+def test_attribute_selectors():
+  document: HtmlDocument = HtmlDocument(PAGE_HTML)
+
+  assert findHrefs(document, "css selector", "a[data-num='2']") == ["/novel/2"]
+  assert findHrefs(document, "css selector", 'a[href^="/novel/"][data-num]') == ["/novel/3", "/novel/2", "/novel/1"]
+  assert findHrefs(document, "css selector", 'a[href^="/novel/"]') == ["/novel/3", "/novel/2", "/novel/1", "/novel/4"]
+  assert findHrefs(document, "css selector", "a[href$=4]") == ["/novel/4"]
+
+
+def test_class_name_with_several_classes_needs_all_of_them():
+  document: HtmlDocument = HtmlDocument(PAGE_HTML)
+
+  assert len(document.find_elements("class name", "btn-resource.btn-next")) == 1
+  assert len(document.find_elements("class name", "btn-next.btn-prev")) == 0
+
+
+def test_text_matches_the_browser_layout():
+  document: HtmlDocument = HtmlDocument(PAGE_HTML)
+
+  assert document.title == "Chapter 3"
+  assert document.find_element("id", "novel_content").text == "First line\nSecond\nline"
+
+
+def test_missing_element_raises_like_the_browser():
+  with pytest.raises(NoSuchElementException):
+    HtmlDocument(PAGE_HTML).find_element("css selector", "#comments")
+
+
+def test_xpath_is_left_to_the_browser():
+  with pytest.raises(HtmlSelector.UnsupportedSelectorError):
+    HtmlDocument(PAGE_HTML).find_elements("xpath", "//a")
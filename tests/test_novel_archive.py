@@ -0,0 +1,100 @@
+# Imports
+import os
+import shutil
+from src.common.novel_archive import NovelArchive
+
+
+# === Function: createArchive ===
+def createArchive(output_directory: str, chapter_count: int) -> NovelArchive:
+  """
+  Create an archive with some chapters in a directory
+
+  Params:
+    output_directory: Directory to create the archive in
+    chapter_count: How many chapters to append ('Chapter 1' to 'Chapter <chapter_count>')
+
+  Returns:
+    NovelArchive: The archive
+  """
+
+  archive: NovelArchive = NovelArchive(output_directory)
+  archive.appendMany([(chapter_num, f"Chapter {chapter_num}\n" * 50) for chapter_num in range(1, chapter_count + 1)])
+  return archive
+
+
+def test_saved_chapter_replaces_earlier_copy(tmp_path):
+  archive: NovelArchive = createArchive(str(tmp_path), 3)
+  archive.append(2, "Reprocessed")
+  archive.close()
+
+  archive = NovelArchive(str(tmp_path))
+  assert archive.readChapter(2) == "Reprocessed"
+  assert archive.readChapter(3) == "Chapter 3\n" * 50
+  assert archive.readChapter(4) == None
+  archive.close()
+
+
+def test_lost_index_is_rebuilt_from_records(tmp_path):
+  createArchive(str(tmp_path), 3).close()
+  os.remove(os.path.join(str(tmp_path), "chapters.idx"))
+
+  archive: NovelArchive = NovelArchive(str(tmp_path))
+  assert archive.getChapterNums() == [1, 2, 3]
+  assert archive.readChapter(1) == "Chapter 1\n" * 50
+  archive.close()
+
+
+def test_records_after_the_index_are_recovered(tmp_path):
+  index_path: str = os.path.join(str(tmp_path), "chapters.idx")
+  archive: NovelArchive = createArchive(str(tmp_path), 2)
+  shutil.copy(index_path, index_path + ".old")
+
+  # The scrape stopped after the record was written, before the index was
+  archive.append(3, "Chapter 3")
+  archive.close()
+  os.replace(index_path + ".old", index_path)
+
+  archive = NovelArchive(str(tmp_path))
+  assert archive.getChapterNums() == [1, 2, 3]
+  assert archive.readChapter(3) == "Chapter 3"
+  archive.close()
+
+
+def test_cut_off_record_is_dropped(tmp_path):
+  pack_path: str = os.path.join(str(tmp_path), NovelArchive.ARCHIVE_FILENAME)
+  archive: NovelArchive = createArchive(str(tmp_path), 2)
+  intact_size: int = os.path.getsize(pack_path)
+
+  # The scrape stopped halfway through writing chapter 3's record
+  archive.append(3, "Chapter 3\n" * 50)
+  archive.close()
+  with open(pack_path, "r+b") as f:
+    f.truncate(os.path.getsize(pack_path) - 10)
+  os.remove(os.path.join(str(tmp_path), "chapters.idx"))
+
+  archive = NovelArchive(str(tmp_path))
+  assert archive.getChapterNums() == [1, 2]
+  assert os.path.getsize(pack_path) == intact_size
+
+  # New chapters go after the last whole record
+  archive.append(3, "Chapter 3")
+  assert archive.readChapter(3) == "Chapter 3"
+  archive.close()
+
+
+def test_compact_drops_replaced_records(tmp_path):
+  pack_path: str = os.path.join(str(tmp_path), NovelArchive.ARCHIVE_FILENAME)
+  archive: NovelArchive = createArchive(str(tmp_path), 3)
+  archive.append(1, "Reprocessed")
+  size_before: int = os.path.getsize(pack_path)
+
+  freed_bytes: int = archive.compact()
+  assert freed_bytes > 0
+  assert os.path.getsize(pack_path) == size_before - freed_bytes
+  assert archive.readChapter(1) == "Reprocessed"
+  archive.close()
+
+  archive = NovelArchive(str(tmp_path))
+  assert archive.getChapterNums() == [1, 2, 3]
+  assert archive.readChapter(2) == "Chapter 2\n" * 50
+  archive.close()
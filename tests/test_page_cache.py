@@ -0,0 +1,110 @@
+# Imports
+import os
+import time
+import pytest
+
+# NOTE: Cached pages are parsed like fetched ones, which raise selenium's exceptions
+pytest.importorskip("selenium")
+
+from src.common.page_cache import PageCache
+from src.common.fetch_backends import FetchResult
+
+
+# === Function: createCache ===
+def createCache(directory: str, max_size_kb: float = 1024.0) -> PageCache:
+  """
+  Create a page cache in a directory
+
+  Params:
+    directory: Directory to keep the cache in
+    max_size_kb: Most space the cached pages can use
+
+  Returns:
+    PageCache: The cache
+  """
+
+  settings: PageCache.Settings = PageCache.Settings()
+  settings.mode = PageCache.Modes.ON
+  settings.directory = directory
+  settings.max_size_mb = max_size_kb / 1024.0
+  return PageCache(settings)
+
+
+# === Function: createPage ===
+def createPage(url: str, page_html: str, headers: dict[str, str] | None = None) -> FetchResult:
+  """
+  Create a loaded page without requesting it
+
+  Params:
+    url: Url of the page
+    page_html: Html of the page
+    headers: Response headers (names are lowercase)
+
+  Returns:
+    FetchResult: The page
+  """
+
+  return FetchResult(url, 200, headers if (headers != None) else {}, page_html, 0.0)
+
+
+def test_cached_page_is_revalidated_with_its_validators(tmp_path):
+  page_cache: PageCache = createCache(str(tmp_path))
+  page_cache.put("http://127.0.0.1/novel/1", createPage("http://127.0.0.1/novel/1", "<p>1</p>", {"etag": '"v1"', "last-modified": "Mon, 05 Oct 2026 10:00:00 GMT"}))
+  page_cache.put("http://127.0.0.1/novel/2", createPage("http://127.0.0.1/novel/2", "<p>2</p>"))
+
+  assert page_cache.getRevalidationHeaders("http://127.0.0.1/novel/1") == {"If-None-Match": '"v1"', "If-Modified-Since": "Mon, 05 Oct 2026 10:00:00 GMT"}
+  assert page_cache.getRevalidationHeaders("http://127.0.0.1/novel/2") == {}
+  assert page_cache.getRevalidationHeaders("http://127.0.0.1/novel/3") == {}
+
+
+def test_pages_with_the_same_html_share_one_file(tmp_path):
+  page_cache: PageCache = createCache(str(tmp_path))
+  page_cache.put("http://127.0.0.1/novel/1", createPage("http://127.0.0.1/novel/1", "<p>Same</p>"))
+  page_cache.put("http://127.0.0.1/novel/2", createPage("http://127.0.0.1/novel/2", "<p>Same</p>"))
+
+  assert page_cache.getState()["page_count"] == 2
+  assert sum(len(filenames) for _, _, filenames in os.walk(os.path.join(str(tmp_path), "blobs"))) == 1
+  assert page_cache.get("http://127.0.0.1/novel/2").html == "<p>Same</p>"
+
+
+def test_least_recently_used_page_is_evicted(tmp_path):
+  page_cache: PageCache = createCache(str(tmp_path), max_size_kb=12.0)
+
+  # About 5 KiB per page once gzipped, so only two fit
+  for chapter_num in range(1, 3):
+    page_cache.put(f"http://127.0.0.1/novel/{chapter_num}", createPage(f"http://127.0.0.1/novel/{chapter_num}", os.urandom(5000).hex()))
+    time.sleep(0.01)
+
+  page_cache.get("http://127.0.0.1/novel/1")
+  time.sleep(0.01)
+  page_cache.put("http://127.0.0.1/novel/3", createPage("http://127.0.0.1/novel/3", os.urandom(5000).hex()))
+
+  assert page_cache.get("http://127.0.0.1/novel/2") == None
+  assert page_cache.get("http://127.0.0.1/novel/1") != None
+  assert page_cache.get("http://127.0.0.1/novel/3") != None
+  assert page_cache.getState()["eviction_count"] == 1
+  assert page_cache.getState()["size_bytes"] <= 12 * 1024
+
+
+def test_flushed_index_is_loaded_again(tmp_path):
+  page_cache: PageCache = createCache(str(tmp_path))
+  page_cache.put("http://127.0.0.1/novel/1", createPage("http://127.0.0.1/novel/1", "<p>1</p>"))
+  page_cache.put("http://127.0.0.1/novel/2", createPage("http://127.0.0.1/novel/2", "<p>2</p>"))
+  page_cache.flush()
+
+  reloaded_cache: PageCache = createCache(str(tmp_path))
+  assert reloaded_cache.getState()["page_count"] == 2
+  assert reloaded_cache.get("http://127.0.0.1/novel/2").html == "<p>2</p>"
+
+
+def test_damaged_page_is_forgotten(tmp_path):
+  page_cache: PageCache = createCache(str(tmp_path))
+  page_cache.put("http://127.0.0.1/novel/1", createPage("http://127.0.0.1/novel/1", "<p>1</p>"))
+
+  for directory, _, filenames in os.walk(os.path.join(str(tmp_path), "blobs")):
+    for filename in filenames:
+      with open(os.path.join(directory, filename), "wb") as f:
+        f.write(b"not gzip")
+
+  assert page_cache.get("http://127.0.0.1/novel/1") == None
+  assert page_cache.getState()["page_count"] == 0
@@ -0,0 +1,109 @@
+# Imports
+import pytest
+import src.common.rate_limiter
+from src.common.rate_limiter import RateLimiter
+from src.common.metrics_server import LiveMetrics
+
+
+# === Class: FakeClock ===
+class FakeClock():
+  """
+  Stands in for the 'time' module in the rate limiter, so waits are counted instead of slept
+  """
+
+  def __init__(self) -> None:
+    self.now: float = 1000.0
+
+  def monotonic(self) -> float:
+    return self.now
+
+  def sleep(self, seconds: float) -> None:
+    self.now += seconds
+
+
+# === Fixture: clock ===
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+  """
+  A clock that only moves when a test (or a wait) moves it
+  """
+
+  fake_clock: FakeClock = FakeClock()
+  monkeypatch.setattr(src.common.rate_limiter, "time", fake_clock)
+  return fake_clock
+
+
+# === Function: createLimiter ===
+def createLimiter(rate: float, burst: float, min_rate: float = 0.01, max_rate: float = 100.0) -> RateLimiter:
+  """
+  Create a rate limiter without jitter
+
+  Params:
+    rate: Requests per second to start at
+    burst: Most requests that can be sent back to back
+    min_rate: Slowest the rate can be cut to
+    max_rate: Fastest the rate can be raised to
+
+  Returns:
+    RateLimiter: The limiter
+  """
+
+  settings: RateLimiter.Settings = RateLimiter.Settings()
+  settings.rate = rate
+  settings.burst = burst
+  settings.jitter = 0.0
+  settings.min_rate = min_rate
+  settings.max_rate = max_rate
+  return RateLimiter(settings)
+
+
+def test_burst_is_sent_right_away_then_requests_are_spaced_out(clock):
+  rate_limiter: RateLimiter = createLimiter(rate=2.0, burst=3.0)
+
+  assert [rate_limiter.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+  assert rate_limiter.acquire() == pytest.approx(0.5)
+  assert rate_limiter.acquire() == pytest.approx(0.5)
+  assert clock.now == pytest.approx(1001.0)
+
+
+def test_time_spent_loading_pages_counts_towards_the_wait(clock):
+  rate_limiter: RateLimiter = createLimiter(rate=1.0, burst=1.0)
+  rate_limiter.acquire()
+
+  # Half the wait passed while the page loaded
+  clock.now += 0.5
+  assert rate_limiter.acquire() == pytest.approx(0.5)
+
+  # Tokens never pile up past the burst, however long it's quiet
+  clock.now += 60.0
+  assert rate_limiter.acquire() == 0.0
+  assert rate_limiter.acquire() == pytest.approx(1.0)
+
+
+def test_throttle_cuts_the_rate_and_successes_raise_it_again(clock):
+  rate_limiter: RateLimiter = createLimiter(rate=1.0, burst=5.0, min_rate=0.3, max_rate=1.05)
+
+  rate_limiter.reportThrottled()
+  assert rate_limiter.getRate() == pytest.approx(0.5)
+  assert rate_limiter.getState()["tokens"] <= 0.0
+
+  rate_limiter.reportThrottled()
+  assert rate_limiter.getRate() == pytest.approx(0.3)
+  assert rate_limiter.getState()["throttle_count"] == 2
+
+  for _ in range(RateLimiter._RECOVERY_STREAK):
+    rate_limiter.reportSuccess()
+  assert rate_limiter.getRate() == pytest.approx(0.3 * RateLimiter._RECOVERY_FACTOR)
+
+  for _ in range(RateLimiter._RECOVERY_STREAK * 20):
+    rate_limiter.reportSuccess()
+  assert rate_limiter.getRate() == pytest.approx(1.05)
+
+
+def test_one_limiter_is_shared_per_host(monkeypatch):
+  monkeypatch.setattr(RateLimiter, "_host_limiters", {})
+  monkeypatch.setattr(LiveMetrics, "_gauge_functions", {})
+
+  rate_limiter: RateLimiter = RateLimiter.getForHost("http://127.0.0.1:8000/novel/1")
+  assert RateLimiter.getForHost("http://127.0.0.1:8000/novel/2") is rate_limiter
+  assert RateLimiter.getForHost("http://localhost:8000/novel/1") is not rate_limiter
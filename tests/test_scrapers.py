@@ -0,0 +1,78 @@
+# Imports
+import os
+import json
+import pytest
+
+# NOTE: The scrapers import seleniumbase, even when they only use plain http
+pytest.importorskip("seleniumbase")
+
+from conftest import createScraper, readChapterStatuses
+from src.common.scraper import Scraper
+from src.common.scraper_pool import ScraperPool
+from src.common.scrape_manifest import ScrapeManifest
+
+
+def test_resumed_scrape_without_last_chapter_stops_after_latest_chapter(fixtureSite, tmp_path):
+  output_directory: str = str(tmp_path / "novel")
+  os.makedirs(output_directory)
+
+  scraper: Scraper = createScraper(fixtureSite.getNovelUrl())
+  scraper.scrape(1, 6, True, output_directory)
+  scraper.scrape(1, output_directory=output_directory)
+  scraper.close()
+
+  with open(os.path.join(output_directory, "metrics.jsonl"), "r", encoding="utf-8") as f:
+    failed_lines: list[dict] = [line for line in map(json.loads, f) if (line.get("status") == "failed")]
+
+  assert failed_lines == []
+  assert set(readChapterStatuses(output_directory).values()) == {ScrapeManifest.Statuses.COMPLETE}
+  assert len(readChapterStatuses(output_directory)) == fixtureSite.getChapterCount()
+
+
+def test_pool_resumes_without_loading_saved_chapters(fixtureSite, tmp_path):
+  output_directory: str = str(tmp_path / "novel")
+  os.makedirs(output_directory)
+
+  scraper_pool: ScraperPool = ScraperPool(worker_count=2, scraper_factory=lambda: createScraper(fixtureSite.getNovelUrl()))
+  scraper_pool.scrape(fixtureSite.getNovelUrl(), 1, 6, True, output_directory)
+  scraper_pool.scrape(fixtureSite.getNovelUrl(), 1, 12, True, output_directory)
+  scraper_pool.close()
+
+  assert fixtureSite.getChapterHits() == {chapter_num: 1 for chapter_num in range(1, 13)}
+  assert scraper_pool.getFailedChapters() == []
+  assert all(os.path.exists(os.path.join(output_directory, f"{str(chapter_num).zfill(4)}.txt")) for chapter_num in range(1, 13))
+  assert set(readChapterStatuses(output_directory).values()) == {ScrapeManifest.Statuses.COMPLETE}
+
+
+def test_pool_marks_chapter_that_never_loads_as_failed(fixtureSite, tmp_path):
+  output_directory: str = str(tmp_path / "novel")
+  os.makedirs(output_directory)
+  fixtureSite.setMissingChapters({5})
+
+  scraper_pool: ScraperPool = ScraperPool(worker_count=2, scraper_factory=lambda: createScraper(fixtureSite.getNovelUrl()))
+  scraper_pool.scrape(fixtureSite.getNovelUrl(), 1, 8, True, output_directory)
+  scraper_pool.close()
+
+  assert scraper_pool.getFailedChapters() == [5]
+  assert fixtureSite.getChapterHits()[5] == ScraperPool._MAX_CHAPTER_ATTEMPTS
+  assert readChapterStatuses(output_directory)[5] == ScrapeManifest.Statuses.FAILED
+  assert not os.path.exists(os.path.join(output_directory, "0005.txt"))
+
+
+def test_pool_marks_chapter_failed_when_its_worker_stops(fixtureSite, tmp_path, monkeypatch):
+  output_directory: str = str(tmp_path / "novel")
+  os.makedirs(output_directory)
+
+  scrape_chapter = Scraper.scrapeChapter
+  def scrapeChapter(self, url: str, *args, **kwargs) -> str | None:
+    if (url.endswith("/3")):
+      raise RuntimeError("worker stopped")
+    return scrape_chapter(self, url, *args, **kwargs)
+  monkeypatch.setattr(Scraper, "scrapeChapter", scrapeChapter)
+
+  scraper_pool: ScraperPool = ScraperPool(worker_count=2, scraper_factory=lambda: createScraper(fixtureSite.getNovelUrl()))
+  scraper_pool.scrape(fixtureSite.getNovelUrl(), 1, 6, True, output_directory)
+  scraper_pool.close()
+
+  assert 3 in scraper_pool.getFailedChapters()
+  assert readChapterStatuses(output_directory)[3] == ScrapeManifest.Statuses.FAILED
@@ -0,0 +1,116 @@
+# Imports
+import os
+import zipfile
+import pytest
+from src.common.novel_archive import NovelArchive
+from src.common.volume_exporter import VolumeExporter
+
+
+# === Fixture: novelDirectory ===
+@pytest.fixture
+def novelDirectory(tmp_path, monkeypatch) -> str:
+  """
+  A scraped novel with chapters 1 to 5 in their own files. Archives opened during the test aren't shared with other tests
+  """
+
+  monkeypatch.setattr(NovelArchive, "_directory_archives", {})
+
+  output_directory: str = os.path.join(str(tmp_path), "Novel")
+  os.makedirs(output_directory)
+  for chapter_num in range(1, 6):
+    writeChapter(output_directory, chapter_num, f"Chapter {chapter_num} text")
+
+  return output_directory
+
+
+# === Function: writeChapter ===
+def writeChapter(output_directory: str, chapter_num: int, chapter_text: str) -> None:
+  """
+  Save a chapter the way a scrape does
+
+  Params:
+    output_directory: Directory the novel is saved to
+    chapter_num: Number of the chapter
+    chapter_text: Text of the chapter
+  """
+
+  with open(os.path.join(output_directory, f"{str(chapter_num).zfill(4)}.txt"), "w", encoding="utf-8") as f:
+    f.write(chapter_text)
+
+
+# === Function: createTextExporter ===
+def createTextExporter(output_directory: str, chapters_per_volume: int) -> VolumeExporter:
+  """
+  Create an exporter that only writes text volumes
+
+  Params:
+    output_directory: Directory the novel is saved to
+    chapters_per_volume: How many chapters go in each volume
+
+  Returns:
+    VolumeExporter: The exporter
+  """
+
+  return VolumeExporter(output_directory, chapters_per_volume=chapters_per_volume, formats=(VolumeExporter.Formats.TEXT,), worker_count=2)
+
+
+def test_only_volumes_with_changed_chapters_are_rebuilt(novelDirectory):
+  assert createTextExporter(novelDirectory, 2).export() == [1, 2, 3]
+  assert createTextExporter(novelDirectory, 2).export() == []
+
+  # An update adds to the last volume, a reprocess changes an early one
+  writeChapter(novelDirectory, 6, "Chapter 6 text")
+  assert createTextExporter(novelDirectory, 2).export() == [3]
+  writeChapter(novelDirectory, 1, "Chapter 1 reprocessed text")
+  assert createTextExporter(novelDirectory, 2).export() == [1]
+
+  with open(os.path.join(novelDirectory, "export", "Novel - Volume 001 (0001-0002).txt"), "r", encoding="utf-8") as f:
+    assert f.read() == "Chapter 1\n\nChapter 1 reprocessed text\n\n\nChapter 2\n\nChapter 2 text\n\n\n"
+
+
+def test_missing_volume_file_or_new_settings_rebuild_volumes(novelDirectory):
+  VolumeExporter(novelDirectory, chapters_per_volume=2).export()
+
+  os.remove(os.path.join(novelDirectory, "export", "Novel - Volume 002 (0003-0004).epub"))
+  assert VolumeExporter(novelDirectory, chapters_per_volume=2).export() == [2]
+
+  assert VolumeExporter(novelDirectory, chapters_per_volume=3).export() == [1, 2]
+  assert VolumeExporter(novelDirectory, chapters_per_volume=3).export(rebuild_all=True) == [1, 2]
+
+
+def test_epub_volume_lists_its_chapters(novelDirectory):
+  VolumeExporter(novelDirectory, chapters_per_volume=5, formats=(VolumeExporter.Formats.EPUB,)).export()
+
+  with zipfile.ZipFile(os.path.join(novelDirectory, "export", "Novel - Volume 001 (0001-0005).epub")) as epub:
+    assert epub.namelist()[0] == "mimetype"
+    assert epub.read("mimetype") == b"application/epub+zip"
+
+    assert epub.read("OEBPS/content.opf").decode("utf-8").count("<itemref") == 5
+    for chapter_num in range(1, 6):
+      assert f"Chapter {chapter_num} text" in epub.read(f"OEBPS/chapter_{str(chapter_num).zfill(4)}.xhtml").decode("utf-8")
+
+
+def test_damaged_archive_chapter_is_skipped(novelDirectory):
+  for chapter_num in range(1, 6):
+    os.remove(os.path.join(novelDirectory, f"{str(chapter_num).zfill(4)}.txt"))
+
+  archive: NovelArchive = NovelArchive.getForDirectory(novelDirectory)
+  archive.appendMany([(chapter_num, f"Chapter {chapter_num} text\n" * 20) for chapter_num in range(1, 4)])
+  archive.close()
+
+  # Chapter 2's stored text is overwritten after it was indexed
+  data_offset, stored_size, _, _ = archive._entries["2"]
+  with open(os.path.join(novelDirectory, NovelArchive.ARCHIVE_FILENAME), "r+b") as f:
+    f.seek(data_offset)
+    f.write(b"\0" * stored_size)
+
+  volume_exporter: VolumeExporter = createTextExporter(novelDirectory, 10)
+  assert volume_exporter.export() == [1]
+  assert volume_exporter.getSkippedChapters() == [2]
+
+  with open(os.path.join(novelDirectory, "export", "Novel - Volume 001 (0001-0010).txt"), "r", encoding="utf-8") as f:
+    volume_text: str = f.read()
+  assert "Chapter 1 text" in volume_text
+  assert "Chapter 2 text" not in volume_text
+  assert "Chapter 3 text" in volume_text
+  archive.close()
@@ -0,0 +1,145 @@
+# Imports
+import os
+import json
+import time
+import multiprocessing
+from src.common.work_queue import WorkQueue
+from src.common.scrape_manifest import ScrapeManifest
+
+
+""" Chapters every test queue starts with """
+CHAPTER_COUNT: int = 20
+
+
+# === Function: createQueue ===
+def createQueue(output_directory: str, lease_seconds: float = 600.0, max_attempts: int = 3) -> WorkQueue:
+  """
+  Open a queue in a directory, with every test chapter pending
+
+  Params:
+    output_directory: Directory to open the queue in
+    lease_seconds: Seconds a claimed chapter is kept for its worker
+    max_attempts: How many times a chapter is claimed before it is given up on
+
+  Returns:
+    WorkQueue: The queue
+  """
+
+  work_queue: WorkQueue = WorkQueue(output_directory, lease_seconds=lease_seconds, max_attempts=max_attempts)
+  work_queue.addChapters({chapter_num: f"http://127.0.0.1/novel/{chapter_num}" for chapter_num in range(1, CHAPTER_COUNT + 1)})
+  return work_queue
+
+
+# === Function: claimUntilEmpty ===
+def claimUntilEmpty(output_directory: str, claimed_path: str) -> None:
+  """
+  Claim and complete chapters until none are left, writing the claimed chapter numbers to a file. Runs in its own
+  process
+
+  Params:
+    output_directory: Directory of the shared queue
+    claimed_path: File to write the claimed chapter numbers to (JSON list)
+  """
+
+  work_queue: WorkQueue = WorkQueue(output_directory)
+  claimed_chapter_nums: list[int] = []
+
+  while True:
+    claim: tuple[int, str, int] | None = work_queue.claim(1, CHAPTER_COUNT)
+    if (claim == None):
+      break
+
+    chapter_num, _, _ = claim
+    claimed_chapter_nums.append(chapter_num)
+
+    # Give the other processes a chance to claim in between
+    time.sleep(0.01)
+    work_queue.markCompleteMany([(chapter_num, f"{str(chapter_num).zfill(4)}.txt", f"Chapter {chapter_num}")])
+
+  work_queue.close()
+
+  with open(claimed_path, "w", encoding="utf-8") as f:
+    json.dump(claimed_chapter_nums, f)
+
+
+def test_claimed_chapter_is_not_handed_out_again(tmp_path):
+  work_queue: WorkQueue = createQueue(str(tmp_path))
+
+  first_claim = work_queue.claim(1, CHAPTER_COUNT)
+  second_claim = work_queue.claim(1, CHAPTER_COUNT)
+  assert first_claim[0] != second_claim[0]
+
+  work_queue.markCompleteMany([(first_claim[0], "0001.txt", "text")])
+  counts: dict[str, int] = work_queue.getStatusCounts(1, CHAPTER_COUNT)
+  assert counts[WorkQueue.Statuses.COMPLETE] == 1
+  assert counts[WorkQueue.Statuses.LEASED] == 1
+  assert counts[WorkQueue.Statuses.PENDING] == CHAPTER_COUNT - 2
+
+  work_queue.close()
+
+
+def test_released_chapter_fails_after_max_attempts(tmp_path):
+  work_queue: WorkQueue = createQueue(str(tmp_path), max_attempts=2)
+
+  chapter_num, _, _ = work_queue.claim(1, 1)
+  assert work_queue.release(chapter_num, "fetch")
+
+  assert work_queue.claim(1, 1)[2] == 1
+  assert not work_queue.release(chapter_num, "fetch")
+
+  assert work_queue.claim(1, 1) == None
+  assert work_queue.getStatusCounts(1, 1)[WorkQueue.Statuses.FAILED] == 1
+
+  work_queue.close()
+
+
+def test_expired_lease_is_claimed_again(tmp_path):
+  work_queue: WorkQueue = createQueue(str(tmp_path), lease_seconds=0.1)
+
+  chapter_num, _, _ = work_queue.claim(1, 1)
+  assert work_queue.claim(1, 1) == None
+
+  time.sleep(0.2)
+  assert work_queue.claim(1, 1)[0] == chapter_num
+
+  work_queue.close()
+
+
+def test_sync_manifest_records_complete_chapters(tmp_path):
+  work_queue: WorkQueue = createQueue(str(tmp_path))
+  work_queue.markCompleteMany([(3, "0003.txt", "three"), (4, "0004.txt", "four")])
+
+  manifest: ScrapeManifest = ScrapeManifest.getForDirectory(str(tmp_path))
+  manifest.setAutoSave(False)
+  work_queue.syncManifest(manifest)
+  manifest.setAutoSave(True)
+
+  with open(os.path.join(str(tmp_path), "manifest.json"), "r", encoding="utf-8") as f:
+    chapters: list[dict] = json.load(f)["chapters"]
+  assert sorted(entry["chapter_num"] for entry in chapters if (entry["status"] == ScrapeManifest.Statuses.COMPLETE)) == [3, 4]
+
+  work_queue.close()
+
+
+def test_processes_claim_every_chapter_exactly_once(tmp_path):
+  createQueue(str(tmp_path)).close()
+
+  claimed_paths: list[str] = [os.path.join(str(tmp_path), f"claimed_{i}.json") for i in range(3)]
+  context = multiprocessing.get_context("spawn")
+  processes = [context.Process(target=claimUntilEmpty, args=(str(tmp_path), claimed_path)) for claimed_path in claimed_paths]
+  for process in processes:
+    process.start()
+  for process in processes:
+    process.join(60)
+    assert process.exitcode == 0
+
+  claimed_chapter_nums: list[int] = []
+  for claimed_path in claimed_paths:
+    with open(claimed_path, "r", encoding="utf-8") as f:
+      claimed_chapter_nums.extend(json.load(f))
+
+  assert sorted(claimed_chapter_nums) == list(range(1, CHAPTER_COUNT + 1))
+
+  work_queue: WorkQueue = WorkQueue(str(tmp_path))
+  assert work_queue.getStatusCounts(1, CHAPTER_COUNT)[WorkQueue.Statuses.COMPLETE] == CHAPTER_COUNT
+  work_queue.close()